@@ -0,0 +1,229 @@
+import numpy as np
+import multiprocessing as mp
+
+import Eir.exceptions as e
+from . import export
+
+
+def _runReplicate(args):
+    """
+    Runs one replicate of a model. Lives at module level so that the worker processes can unpickle it.
+
+    Parameters
+    ----------
+
+    args: tuple
+        Contains the model class, the keyword arguments of its constructor, the index of the replicate and the
+        SeedSequence of the replicate.
+
+    Returns
+    -------
+
+    int:
+        The index of the replicate.
+
+    list:
+        The names of the compartments, in the order of the columns of the array.
+
+    ndarray:
+        Array of shape (days + 1, compartments) with the number of people in each compartment on each day.
+    """
+    model, kwargs, index, seedSeq = args
+    # every replicate draws from its own generator, and only the compartment counts are needed, so nothing is
+    # kept in details unless asked for
+    sim = model(rng=np.random.default_rng(seedSeq), **{"record": "none", **kwargs})
+    sim.run(getDetails=False)
+    df = sim.toDataFrame()
+    # drop the Days column
+    return index, list(df.columns[1:]), df.values[:, 1:].astype(float)
+
+
+class Ensemble:
+    """
+    Runs many independent replicates of the same model and stacks their results, so that confidence bands can
+    be computed. Replicates are spread out over a pool of worker processes, and each replicate gets its own
+    random stream spawned from a single np.random.SeedSequence, so the results only depend on the seed and not on
+    how the replicates were scheduled.
+
+    Parameters
+    ----------
+
+    model: class
+        The model to run, such as HubSEIRSVD or PeriodicSEIRSDV.
+
+    replicates: int
+        The number of replicates to run.
+
+    seed: int, optional
+        The entropy of the SeedSequence the random streams are spawned from. Default is None, which picks fresh
+        entropy from the operating system.
+
+    processes: int, optional
+        The number of worker processes. If 1, the replicates are run one after another in this process. Default
+        is None, which uses one process per CPU.
+
+    **kwargs:
+        The keyword arguments passed to the constructor of model. Unless record is given, the replicates are run
+        with record="none", since only their compartment counts are kept. rng can't be given, since the ensemble
+        seeds every replicate itself from seed.
+
+    Attributes
+    ----------
+
+    compartments: list
+        The names of the compartments, in the order of the last axis of results. Only set after run().
+
+    results: ndarray
+        Array of shape (replicates, days + 1, compartments) with the number of people in each compartment on each
+        day of each replicate. Only set after run().
+    """
+    def __init__(self, model, replicates: int, seed=None, processes=None, **kwargs):
+        if type(replicates) != int:
+            raise e.NotIntException(replicates)
+        if replicates < 1:
+            raise e.NegativeValException(replicates)
+        if processes is not None:
+            if type(processes) != int:
+                raise e.NotIntException(processes)
+            if processes < 1:
+                raise e.NegativeValException(processes)
+        # every replicate gets its own random stream from seed, so one given to all of them has no place
+        if "rng" in kwargs:
+            raise ValueError("The ensemble seeds the rng of every replicate from seed. Pass seed instead of rng.")
+        self.model = model
+        self.replicates = replicates
+        self.processes = processes
+        self.kwargs = kwargs
+        self.seedSeq = np.random.SeedSequence(seed)
+        self.compartments = None
+        self.results = None
+
+    def _tasks(self):
+        """Returns the arguments of _runReplicate for every replicate, each with its own spawned SeedSequence."""
+        children = self.seedSeq.spawn(self.replicates)
+        return [(self.model, self.kwargs, i, child) for i, child in enumerate(children)]
+
+    def _store(self, index: int, compartments: list, arr):
+        """Puts the result of one replicate in the stacked array, allocating it on the first result."""
+        if self.results is None:
+            self.compartments = compartments
+            self.results = np.empty((self.replicates,) + arr.shape)
+        self.results[index] = arr
+
+    def run(self):
+        """
+        Runs all of the replicates.
+
+        Returns
+        -------
+
+        ndarray:
+            Array of shape (replicates, days + 1, compartments) with the results of every replicate.
+        """
+        self.results = None
+        tasks = self._tasks()
+        if self.processes == 1:
+            for task in tasks:
+                self._store(*_runReplicate(task))
+            return self.results
+        with mp.Pool(self.processes) as pool:
+            # results are stored as they come in, so finished replicates don't pile up in the workers
+            for result in pool.imap_unordered(_runReplicate, tasks):
+                self._store(*result)
+        return self.results
+
+    def _ranCheck(self):
+        """Makes sure that run() was called before the results are summarized."""
+        if self.results is None:
+            raise e.NotRunException("The ensemble")
+
+    def quantiles(self, q=(0.025, 0.5, 0.975)):
+        """
+        Computes quantiles over the replicates for every day and compartment.
+
+        Parameters
+        ----------
+
+        q: float or list, optional
+            The quantiles to compute, between 0 and 1. Default is (0.025, 0.5, 0.975), which is the median and a
+            95% band.
+
+        Returns
+        -------
+
+        ndarray:
+            Array of shape (len(q), days + 1, compartments), or (days + 1, compartments) if q is a single number.
+        """
+        self._ranCheck()
+        for p in np.atleast_1d(q):
+            if p < 0:
+                raise e.ProbabilityException(p, False)
+            elif p > 1:
+                raise e.ProbabilityException(p, True)
+        return np.quantile(self.results, q, axis=0)
+
+    def mean(self):
+        """Returns the mean over the replicates, as an array of shape (days + 1, compartments)."""
+        self._ranCheck()
+        return self.results.mean(axis=0)
+
+    def toDataFrame(self, q=(0.025, 0.5, 0.975)):
+        """
+        Summarizes the ensemble in a pandas DataFrame with one row per day.
+
+        Parameters
+        ----------
+
+        q: list, optional
+            The quantiles to include. Default is (0.025, 0.5, 0.975).
+
+        Returns
+        -------
+
+        pd.DataFrame
+            Has a Days column, then for every compartment a column with the mean and one with each quantile, named
+            like "Infected mean" and "Infected q0.5".
+        """
+        import pandas as pd
+        self._ranCheck()
+        q = list(np.atleast_1d(q))
+        quants = self.quantiles(q)
+        mean = self.mean()
+        data = {"Days": np.arange(self.results.shape[1])}
+        for j, name in enumerate(self.compartments):
+            data[f"{name} mean"] = mean[:, j]
+            for k, p in enumerate(q):
+                data[f"{name} q{p}"] = quants[k, :, j]
+        return pd.DataFrame(data)
+
+    def toArrow(self):
+        """
+        Puts the results of every replicate in a pyarrow Table. Requires pyarrow.
+
+        Returns
+        -------
+
+        pyarrow.Table
+            Has int32 Replicate and Days columns and an int32 column for every compartment, with one row per day
+            of every replicate.
+        """
+        self._ranCheck()
+        return export.countsTable(["Days"] + self.compartments, self.results, replicates=True)
+
+    def toParquet(self, path: str):
+        """
+        Writes the results to a Parquet dataset partitioned by replicate, as
+        path/counts/Replicate=<replicate>/part-0.parquet. Reading path/counts back with
+        pyarrow.parquet.read_table gives the table of toArrow(). Requires pyarrow.
+
+        Parameters
+        ----------
+
+        path: str
+            The directory the dataset goes in.
+        """
+        self._ranCheck()
+        names = ["Days"] + self.compartments
+        for i, counts in enumerate(self.results):
+            days = np.arange(len(counts))[:, None]
+            export.writeParquet(path, {"counts": export.countsTable(names, np.hstack([days, counts]))}, replicate=i)
@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+
+# Arrow tables and Parquet files of simulation results. pyarrow is optional (pip install Eir[arrow]) and is only
+# imported once a table is asked for, like pandas.
+
+
+def countsTable(names: list, counts, replicates=False):
+    """
+    Builds the Arrow table of the number of people in each compartment on each day.
+
+    Parameters
+    ----------
+
+    names: list
+        The names of the columns, which start with the Days column, as in the DataFrames of the models.
+
+    counts: ndarray
+        Array of shape (days + 1, columns) with the columns of names, or (replicates, days + 1, columns - 1)
+        without the Days column if replicates is True.
+
+    replicates: bool, optional
+        Whether counts has a replicate axis, in which case the table starts with an int32 Replicate column.
+        Default is False.
+
+    Returns
+    -------
+
+    pyarrow.Table:
+        A table with an int32 column for every name.
+    """
+    import pyarrow as pa
+    counts = np.asarray(counts)
+    columns = {}
+    if replicates:
+        n, steps = counts.shape[:2]
+        columns["Replicate"] = np.repeat(np.arange(n, dtype=np.int32), steps)
+        columns[names[0]] = np.tile(np.arange(steps, dtype=np.int32), n)
+        counts = counts.reshape(n * steps, -1)
+        names = names[1:]
+    # the counts are whole numbers kept in float arrays
+    for j, name in enumerate(names):
+        columns[name] = np.rint(counts[:, j]).astype(np.int32)
+    return pa.table(columns)
+
+
+def writeParquet(path: str, tables: dict, replicate=None):
+    """
+    Writes Arrow tables to Parquet files, one file per table.
+
+    Parameters
+    ----------
+
+    path: str
+        The directory the files go in, which is made if it doesn't exist.
+
+    tables: dict
+        The tables by name. Each one is written to path/<name>.parquet.
+
+    replicate: int, optional
+        If given, each table is written to the partition path/<name>/Replicate=<replicate>/part-0.parquet
+        instead, so every replicate can be written on its own and all of them are read back as one table, with a
+        Replicate column, by pyarrow.parquet.read_table(path/<name>). Default is None.
+    """
+    import pyarrow.parquet as pq
+    for name, table in tables.items():
+        if replicate is None:
+            directory, file = path, f"{name}.parquet"
+        else:
+            directory, file = os.path.join(path, name, f"Replicate={int(replicate)}"), "part-0.parquet"
+        os.makedirs(directory, exist_ok=True)
+        pq.write_table(table, os.path.join(directory, file))
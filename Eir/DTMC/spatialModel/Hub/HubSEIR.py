@@ -1,10 +1,9 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
 
 from Eir.DTMC.spatialModel.HubModel import Hub
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
-from Eir.utility import Person, dist, randEvent
+from Eir.utility import randEvents
+from Eir.DTMC.spatialModel.population import Population
 
 
 class HubSEIR(Hub):
@@ -49,7 +48,19 @@ class HubSEIR(Hub):
     
     alpha: float optional
         Constant used in the infect probability generator. Default is 2.0.
-    
+
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -68,22 +79,22 @@ class HubSEIR(Hub):
     popsize: int
         The total size of the population in the simulation. Given by S0 + E0 +I0 + R0 + V0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -97,7 +108,7 @@ class HubSEIR(Hub):
 
     """
     def __init__(self, S0: int, E0: int, I0: int, R0: int, pss: float, rho: float, 
-    gamma: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0):
+    gamma: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         #error checking
         self.intCheck([S0, E0, I0, R0, days])
         self.floatCheck([pss, rho, gamma, side, rstart, w0, alpha, hubConstant])
@@ -105,21 +116,17 @@ class HubSEIR(Hub):
         self.probValCheck([pss, rho, gamma, w0])
 
         super(HubSEIR, self).__init__(popsize=S0+I0+R0, pss=pss, rstart=rstart, alpha=alpha, side=side, S0=S0, I0=I0,
-                 days=days, w0=w0,hubConstant=hubConstant)
+                 days=days, w0=w0,hubConstant=hubConstant, engine=engine, rng=rng, record=record)
         # adjust the popsize
         self.popsize += E0
         # locations in the plane
-        self.locx, self.locy = np.random.random(self.popsize)*self.side, np.random.random(self.popsize)*self.side
+        self.locx, self.locy = self.rng.random(self.popsize)*self.side, self.rng.random(self.popsize)*self.side
         # probability of going from I to R
         self.gamma = gamma
         # initialize the probability of leaving E
         self.rho = rho
         # make the initial R class variable
         self.R0 = R0
-        # create the R collect datastructure
-        self.Rcollect = []
-        # create the E collect datastructure
-        self.Ecollect = []
         self.E0 = E0
         # create numpy arrays to store number of people in each compartment
         self.E = np.zeros(days+1)
@@ -128,40 +135,26 @@ class HubSEIR(Hub):
         # put the initial removed values into the array
         self.R[0] = R0
         # create a Simul_Details object
-        self.details = Simul_Details(days=days, popsize=self.popsize, static=True)
+        self.details = Simul_Details(days=days, popsize=self.popsize, static=True, level=record)
+        # event is whether each person is a super spreader
+        event = randEvents(self.pss, self.popsize, self.rng)
+        # everyone is stored once in the population; the collects are views of its compartments
+        # people are put in S, I, E, R in that order
+        self.population = Population("SIER", [S0, I0, E0, R0], self.locx, self.locy, ss=event)
+        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect = self.population.collects("SEIR")
         for i in range(self.popsize):
-            # event is whether person is a super spreader
-            event = randEvent(self.pss)
-            # susceptible version
-            p1 = Person(self.locx[i], self.locy[i], event)
-            # exposed version
-            p2 = Person(self.locx[i], self.locy[i], event)
-            # infectious version
-            p3 = Person(self.locx[i], self.locy[i], event)
-            # removed version
-            p4 = Person(self.locx[i], self.locy[i], event)
             # depending on the number, say that the person is in S, I, R. Add that state to the Simul_Details object
             if i < S0:
-                p1.isIncluded = True
                 self.details.addStateChange(i, "S", 0)
             elif i < S0 + I0:
-                p3.isIncluded = True
-                
                 self.details.addStateChange(i, "I", 0)
             elif i < S0 + E0 + I0:
-                p2.isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             else:
-                p4.isIncluded = True
                 self.details.addStateChange(i, "R", 0)
-            # add the locations to the Simul_Details object
-            self.details.addLocation(0, (self.locx[i], self.locy[i]))
-            # append the Person objects to the collections
-            self.Scollect.append(p1)
-            self.Ecollect.append(p2)
-            self.Icollect.append(p3)
-            self.Rcollect.append(p4)
-    
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
+
     # run state changes from S to E
     def _StoE(self, day: int):
         """
@@ -180,28 +173,7 @@ class HubSEIR(Hub):
             returns the set contianing the indices of those that whose self.Ecollect[index].isIncluded must be set to True
 
         """
-        # set that keeps track of the indices of people that changed states
-        transfers = set()
-        for count, inf in enumerate(self.Icollect):
-            if not inf.isIncluded:
-                continue
-            for count2, sus in enumerate(self.Scollect):
-                #print("Susceptible Person ", count2)
-                if not sus.isIncluded:
-                    continue
-                # generate the probability of infection
-                prob = self._infect(inf, sus)
-                # generate a random event based on the P(infection)
-                event = randEvent(prob)
-                # if an infection doesn't occur
-                if not event:
-                    continue
-                # remove the person from the susceptible state
-                self.Scollect[count2].isIncluded = False
-                self.details.addTransmission(day, count, count2)
-                # put the person in the transfer set to be made an exposed person
-                transfers.add(count2)
-        return transfers
+        return self._transmission(day, [self.Icollect], self.Scollect)
     # run state changes from E to I
     def _EtoI(self):
         """
@@ -210,20 +182,10 @@ class HubSEIR(Hub):
         Return
         ------
 
-        set:
+        ndarray:
             the indices of people who will be transferred from E compartment to I compartment
         """
-        # set that keeps track of the indices of people that changed states
-        transfers = set()
-        for count, per in enumerate(self.Ecollect):
-            if not per.isIncluded:
-                continue
-            event = randEvent(self.rho)
-            if not event:
-                continue
-            self.Ecollect[count].isIncluded = False
-            transfers.add(count)
-        return transfers
+        return self._changeHelp(self.Ecollect, self.rho)
     
     def _ItoR(self):
         # set that keeps track of the indices of people that changed states
@@ -233,48 +195,37 @@ class HubSEIR(Hub):
         Return
         ------
 
-        set:
+        ndarray:
             the indices of people who will be transferred from I compartment to R compartment
         """
-        transfers = set()
-        for count, inf in enumerate(self.Icollect):
-            if not inf.isIncluded:
-                continue
-            event = randEvent(self.gamma)
-            if not event:
-                continue
-            self.Icollect[count].isIncluded = False
-            transfers.add(count)
-        return transfers
+        return self._changeHelp(self.Icollect, self.gamma)
     
     # run the simulation using
     def run(self, getDetails=True):
-        for i in range(1, self.days + 1):
-            #print("Day: ", i)
-            # run the transfers from different compartments
-            transferSE = self._StoE(i)
-            transferEI = self._EtoI()
-            transferIR = self._ItoR()
-
-            # go after and change the indices in the collection data structure thing
-            for index in transferSE:
-                self.Ecollect[index].isIncluded = True
-                self.details.addStateChange(index, "E", i)
-            for index in transferEI:
-                self.Icollect[index].isIncluded = True
-                self.details.addStateChange(index, "I", i)
-            for index in transferIR:
-                self.Rcollect[index].isIncluded = True
-                self.details.addStateChange(index, "R", i)
-
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSE)
-            self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
-            self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR)
-            self.R[i] = self.R[i-1] + len(transferIR)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
 
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day: ", i)
+        # run the transfers from different compartments
+        transferSE = self._StoE(i)
+        transferEI = self._EtoI()
+        transferIR = self._ItoR()
+
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSE, self.Ecollect, "E", i)
+        self._stateChanger(transferEI, self.Icollect, "I", i)
+        self._stateChanger(transferIR, self.Rcollect, "R", i)
+
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSE)
+        self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
+        self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR)
+        self.R[i] = self.R[i-1] + len(transferIR)
+
     def plot(self):
         """
         Plots all variables on subplots
@@ -285,6 +236,7 @@ class HubSEIR(Hub):
         pyplot.Figure:
             return a fig object that will contian the graphs
         """
+        import matplotlib.pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -315,6 +267,7 @@ class HubSEIR(Hub):
         pd.DataFrame:
             a dataframe containing the people in S, E, I, and R compartments per day.
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -1,9 +1,6 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .HubSEIR import HubSEIR
-from Eir.utility import Person
 class HubSEIRD(HubSEIR):
     """
     Object that represents the Hub Model with compartments S, E, I, R, and D. In this model, E is assumed to not be
@@ -49,7 +46,19 @@ class HubSEIRD(HubSEIR):
     
     alpha: float optional
         Constant used in the infect probability generator. Default is 2.0.
-    
+
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -71,27 +80,27 @@ class HubSEIRD(HubSEIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + E0 + I0 + R0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Dcollect: list
+    Dcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is DEAD. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -105,7 +114,7 @@ class HubSEIRD(HubSEIR):
 
     """
     def __init__(self, S0: int, E0: int, I0: int, R0: int, pss: float, rho: float, 
-        gamma: float, mu: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0):
+        gamma: float, mu: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0, engine="loop", rng=None, record="trajectories"):
 
         #error checking
         self.intCheck([S0, E0, I0, R0, days])
@@ -113,49 +122,45 @@ class HubSEIRD(HubSEIR):
         self.negValCheck([S0, E0, I0, R0, pss, rho, gamma, mu, side, rstart, days, w0, hubConstant, alpha])
         self.probValCheck([pss, rho, gamma, mu, w0])
 
-        super(HubSEIRD, self).__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, side=side, rstart=rstart, alpha=alpha, days=days, hubConstant=hubConstant)
-        self.Dcollect = []
+        super(HubSEIRD, self).__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, side=side, rstart=rstart, alpha=alpha, days=days, hubConstant=hubConstant, engine=engine, rng=rng, record=record)
         self.D = np.zeros(self.days+1)
         self.mu = mu
-
-        for i in range(self.popsize):
-            p = Person(self.locx[i], self.locy[i], self.Scollect[i].ss)
-            self.Dcollect.append(p)
+        # the D compartment starts out empty
+        self.population.addCompartment("D")
+        self.Dcollect = self.population.collect("D")
     
     def _ItoD(self):
         # if the person didn't go to R, test if they go to D
         return self._changeHelp(self.Icollect, self.mu)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days + 1):
-            #print("Day: ", i)
-            # run the transfers from different compartments
-            transferSE = self._StoE(i)
-            transferEI = self._EtoI()
-            transferIR = self._ItoR()
-            # put it after I->R state change bc conditional probability
-            transferID = self._ItoD()
-
-            # go after and change the indices in the collection data structure thing
-            for index in transferSE:
-                self.Ecollect[index].isIncluded = True
-                self.details.addStateChange(index, "E", i)
-            for index in transferEI:
-                self.Icollect[index].isIncluded = True
-                self.details.addStateChange(index, "I", i)
-            for index in transferIR:
-                self.Rcollect[index].isIncluded = True
-                self.details.addStateChange(index, "R", i)
-            self._stateChanger(transferID, self.Dcollect, 'D', i)
-
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSE)
-            self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
-            self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR) - len(transferID)
-            self.R[i] = self.R[i-1] + len(transferIR)
-            self.D[i] = self.D[i-1] + len(transferID)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day: ", i)
+        # run the transfers from different compartments
+        transferSE = self._StoE(i)
+        transferEI = self._EtoI()
+        transferIR = self._ItoR()
+        # put it after I->R state change bc conditional probability
+        transferID = self._ItoD()
+
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSE, self.Ecollect, "E", i)
+        self._stateChanger(transferEI, self.Icollect, "I", i)
+        self._stateChanger(transferIR, self.Rcollect, "R", i)
+        self._stateChanger(transferID, self.Dcollect, 'D', i)
+
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSE)
+        self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
+        self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR) - len(transferID)
+        self.R[i] = self.R[i-1] + len(transferIR)
+        self.D[i] = self.D[i-1] + len(transferID)
     
     def toDataFrame(self):
         """
@@ -167,6 +172,7 @@ class HubSEIRD(HubSEIR):
         pd.DataFrame
             Holds the data of simulation in a DataFrame format.
         """
+        import pandas as pd
         t = np.linspace(0,self.days,self.days+1)
         arr = np.stack([t, self.S, self.E, self.I, self.R, self.D], axis=1)
         df = pd.DataFrame(arr, columns=["Days", "Susceptible", "Exposed", "Infected", "Recovered", "Dead"])
@@ -174,6 +180,7 @@ class HubSEIRD(HubSEIR):
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, recovered, and dead individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
@@ -1,6 +1,4 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .HubSEIR import HubSEIR
 
@@ -49,7 +47,19 @@ class HubSEIRS(HubSEIR):
     
     alpha: float optional
         Constant used in the infect probability generator. Default is 2.0.
-    
+
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -68,22 +78,22 @@ class HubSEIRS(HubSEIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + E0 + I0 + R0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -97,41 +107,45 @@ class HubSEIRS(HubSEIR):
 
     """
     def __init__(self, S0: int, E0: int, I0: int, R0: int, pss: float, rho: float, 
-        gamma: float, kappa: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0):
+        gamma: float, kappa: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         #error checking
         self.intCheck([S0, E0, I0, R0, days])
         self.floatCheck([pss, rho, gamma, kappa, side, rstart, w0, alpha, hubConstant])
         self.negValCheck([S0, E0, I0, R0, pss, rho, gamma, kappa, side, rstart, days, w0, hubConstant, alpha])
         self.probValCheck([pss, rho, gamma, kappa, w0])
-        super(HubSEIRS, self).__init__(S0, E0, I0, R0, pss, rho, gamma, side, rstart, days, w0=w0, hubConstant=hubConstant, alpha=alpha)
+        super(HubSEIRS, self).__init__(S0, E0, I0, R0, pss, rho, gamma, side, rstart, days, w0=w0, hubConstant=hubConstant, alpha=alpha, engine=engine, rng=rng, record=record)
         self.kappa = kappa
     
     def _RtoS(self):
         return self._changeHelp(self.Rcollect, self.kappa)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days + 1):
-            #print("Day: ", i)
-            # run the transfers from different compartments
-            transferSE = self._StoE(i)
-            transferEI = self._EtoI()
-            transferIR = self._ItoR()
-            transferRS = self._RtoS()
-
-            # go after and change the indices in the collection data structure thing
-            self._stateChanger(transferSE, self.Ecollect, "E", i)
-            self._stateChanger(transferEI, self.Icollect, "I", i)
-            self._stateChanger(transferIR, self.Rcollect, "R", i)
-            self._stateChanger(transferRS, self.Scollect, "S", i)
-
-
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSE) + len(transferRS)
-            self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
-            self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR)
-            self.R[i] = self.R[i-1] + len(transferIR) - len(transferRS)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day: ", i)
+        # run the transfers from different compartments
+        transferSE = self._StoE(i)
+        transferEI = self._EtoI()
+        transferIR = self._ItoR()
+        transferRS = self._RtoS()
+
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSE, self.Ecollect, "E", i)
+        self._stateChanger(transferEI, self.Icollect, "I", i)
+        self._stateChanger(transferIR, self.Rcollect, "R", i)
+        self._stateChanger(transferRS, self.Scollect, "S", i)
+
+
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSE) + len(transferRS)
+        self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
+        self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR)
+        self.R[i] = self.R[i-1] + len(transferIR) - len(transferRS)
     
     def plot(self):
         """
@@ -143,6 +157,7 @@ class HubSEIRS(HubSEIR):
         pyplot.Figure:
             return a fig object that will contian the graphs
         """
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -1,8 +1,7 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
-from Eir.utility import randEvent, Person
+from Eir.utility import randEvents
+from Eir.DTMC.spatialModel.population import Population
 
 from.HubSEIR import HubSEIR
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
@@ -55,7 +54,19 @@ class HubSEIRV(HubSEIR):
     
     alpha: float optional
         Constant used in the infect probability generator. Default is 2.0.
-    
+
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -77,27 +88,27 @@ class HubSEIRV(HubSEIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0 + R0 + V0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Vcollect: list
+    Vcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is VACCINATED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -111,7 +122,7 @@ class HubSEIRV(HubSEIR):
 
     """
     def __init__(self, S0: int, E0: int, I0: int, R0: int, V0:int, pss: float, rho: float, 
-        gamma: float, eta: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0, timeDelay=-1):
+        gamma: float, eta: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         # error checking
         # error checking
         self.intCheck([S0, E0, I0, R0, V0, days])
@@ -121,82 +132,67 @@ class HubSEIRV(HubSEIR):
 
         # S->v, given that didn't go to S->E
         super(HubSEIRV, self).__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, side=side, rstart=rstart, alpha=alpha, 
-        days=days)
+        days=days, engine=engine, rng=rng, record=record)
         self.popsize = self.popsize + V0
         self.V = np.zeros(self.days+1)
         self.V[0] = V0
-        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect = [], [], [], []
-        self.Vcollect = []
-        self.locx, self.locy = np.random.random(self.popsize)*side, np.random.random(self.popsize)*side
+        self.locx, self.locy = self.rng.random(self.popsize)*side, self.rng.random(self.popsize)*side
         self.eta = eta
         self.timeDelay = timeDelay
-        self.details = Simul_Details(days, self.popsize, static=True)
+        self.details = Simul_Details(days, self.popsize, static=True, level=record)
 
+        # event is whether each person is a super spreader
+        event = randEvents(pss, self.popsize, self.rng)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SEIRV", [S0, E0, I0, R0, V0], self.locx, self.locy, ss=event)
+        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect = self.population.collects("SEIRV")
         for i in range(self.popsize):
-            event = randEvent(pss)
-            p1 = Person(self.locx[i], self.locy[i], event)
-            p2 = Person(self.locx[i], self.locy[i], event)
-            p3 = Person(self.locx[i], self.locy[i], event)
-            p4 = Person(self.locx[i], self.locy[i], event)
-            p5 = Person(self.locx[i], self.locy[i], event)
             if i< S0:
-                p1.isIncluded=True
                 self.details.addStateChange(i, "S", 0)
             elif i < S0+E0:
-                p2.isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             elif i < S0 + E0 + I0:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "I", 0)
             elif i < S0 + E0 + I0 + R0:
-                p4.isIncluded=True
                 self.details.addStateChange(i, 'R', 0)
             else:
                 self.details.addStateChange(i, "V", 0)
-                p5.isIncluded=True
-            self.Scollect.append(p1)
-            self.Ecollect.append(p2)
-            self.Icollect.append(p3)
-            self.Rcollect.append(p4)
-            self.Vcollect.append(p5)
-            # add location
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
 
     def _StoV(self):
         return self._changeHelp(self.Scollect, self.eta)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days + 1):
-            #print("Day: ", i)
-            # run the transfers from different compartments
-            transferSE = self._StoE(i)
-            transferEI = self._EtoI()
-            transferIR = self._ItoR()
-            transferSV = set()
-            if i > self.timeDelay:
-                transferSV = self._StoV()
-            
-
-            # go after and change the indices in the collection data structure thing
-            for index in transferSE:
-                self.Ecollect[index].isIncluded = True
-                self.details.addStateChange(index, "E", i)
-            for index in transferEI:
-                self.Icollect[index].isIncluded = True
-                self.details.addStateChange(index, "I", i)
-            for index in transferIR:
-                self.Rcollect[index].isIncluded = True
-                self.details.addStateChange(index, "R", i)
-            self._stateChanger(transferSV, self.Vcollect, "V", i)
-
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSE) - len(transferSV)
-            self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
-            self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR)
-            self.R[i] = self.R[i-1] + len(transferIR)
-            self.V[i] = self.V[i-1] + len(transferSV)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day: ", i)
+        # run the transfers from different compartments
+        transferSE = self._StoE(i)
+        transferEI = self._EtoI()
+        transferIR = self._ItoR()
+        transferSV = set()
+        if i > self.timeDelay:
+            transferSV = self._StoV()
+
+
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSE, self.Ecollect, "E", i)
+        self._stateChanger(transferEI, self.Icollect, "I", i)
+        self._stateChanger(transferIR, self.Rcollect, "R", i)
+        self._stateChanger(transferSV, self.Vcollect, "V", i)
+
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSE) - len(transferSV)
+        self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
+        self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR)
+        self.R[i] = self.R[i-1] + len(transferIR)
+        self.V[i] = self.V[i-1] + len(transferSV)
     
     def toDataFrame(self):
         """
@@ -208,6 +204,7 @@ class HubSEIRV(HubSEIR):
         pd.DataFrame:
             a dataframe containing the people in S, E, I, R, and V compartments per day.
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -226,6 +223,7 @@ class HubSEIRV(HubSEIR):
         pyplot.Figure:
             return a fig object that will contian the graphs
         """
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -1,9 +1,6 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .HubSEIRV import HubSEIRV
-from Eir.utility import Person, randEvent
 
 
 class HubSEIRVD(HubSEIRV):
@@ -57,7 +54,19 @@ class HubSEIRVD(HubSEIRV):
     
     alpha: float optional
         Constant used in the infect probability generator. Default is 2.0.
-    
+
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -82,33 +91,33 @@ class HubSEIRVD(HubSEIRV):
     popsize: int
         The total size of the population in the simulation. Given by S0 + E0 + I0 + R0 + V0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Vcollect: list
+    Vcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is VACCINATED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Dcollect: list
-        Vcollect: list
+    Dcollect: Collect
+        Vcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is DEAD. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -122,60 +131,56 @@ class HubSEIRVD(HubSEIRV):
 
     """
     def __init__(self, S0: int, E0: int, I0: int, R0: int, V0:int, pss: float, rho: float, 
-        gamma: float, eta:float, mu: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0, timeDelay=-1):
+        gamma: float, eta:float, mu: float, side: float, rstart:float, days: int, w0=1.0, hubConstant=6**0.5, alpha=2.0, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, E0, I0, R0, V0, days])
         self.floatCheck([pss, rho, gamma, eta, mu, side, rstart, w0, alpha, hubConstant, timeDelay])
         self.negValCheck([S0, E0, I0, R0, pss, rho, gamma, eta, mu, side, rstart, days, w0, hubConstant, alpha])
         self.probValCheck([pss, rho, gamma, eta, mu, w0])
-        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, V0=V0, pss=pss, rho=rho, gamma=gamma, eta=eta, side=side, rstart=rstart, alpha=alpha, days=days, hubConstant=hubConstant, timeDelay=timeDelay)
+        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, V0=V0, pss=pss, rho=rho, gamma=gamma, eta=eta, side=side, rstart=rstart, alpha=alpha, days=days, hubConstant=hubConstant, timeDelay=timeDelay, engine=engine, rng=rng, record=record)
         self.mu = mu
-        self.Dcollect = []
         self.D = np.zeros(self.days+1)
-
-        for i in range(self.popsize):
-            p = Person(self.locx[i], self.locy[i], self.Scollect[i].ss)
-            self.Dcollect.append(p)
+        # the D compartment starts out empty
+        self.population.addCompartment("D")
+        self.Dcollect = self.population.collect("D")
 
 
     def _ItoD(self):
         return self._changeHelp(self.Icollect, self.mu)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days + 1):
-            #print("Day: ", i)
-            # run the transfers from different compartments
-            transferSE = self._StoE(i)
-            transferEI = self._EtoI()
-            transferIR = self._ItoR()
-            transferSV = set()
-            if i > self.timeDelay:
-                transferSV = self._StoV()
-            transferID = self._ItoD()
-            
-
-            # go after and change the indices in the collection data structure thing
-            for index in transferSE:
-                self.Ecollect[index].isIncluded = True
-                self.details.addStateChange(index, "E", i)
-            for index in transferEI:
-                self.Icollect[index].isIncluded = True
-                self.details.addStateChange(index, "I", i)
-            for index in transferIR:
-                self.Rcollect[index].isIncluded = True
-                self.details.addStateChange(index, "R", i)
-            self._stateChanger(transferSV, self.Vcollect, "V", i)
-            self._stateChanger(transferID, self.Dcollect, 'D', i)
-
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSE) - len(transferSV)
-            self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
-            self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR) - len(transferID)
-            self.R[i] = self.R[i-1] + len(transferIR)
-            self.V[i] = self.V[i-1] + len(transferSV)
-            self.D[i] = self.D[i-1] + len(transferID)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day: ", i)
+        # run the transfers from different compartments
+        transferSE = self._StoE(i)
+        transferEI = self._EtoI()
+        transferIR = self._ItoR()
+        transferSV = set()
+        if i > self.timeDelay:
+            transferSV = self._StoV()
+        transferID = self._ItoD()
+
+
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSE, self.Ecollect, "E", i)
+        self._stateChanger(transferEI, self.Icollect, "I", i)
+        self._stateChanger(transferIR, self.Rcollect, "R", i)
+        self._stateChanger(transferSV, self.Vcollect, "V", i)
+        self._stateChanger(transferID, self.Dcollect, 'D', i)
+
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSE) - len(transferSV)
+        self.E[i] = self.E[i-1] +len(transferSE) - len(transferEI)
+        self.I[i] = self.I[i - 1] + len(transferEI) - len(transferIR) - len(transferID)
+        self.R[i] = self.R[i-1] + len(transferIR)
+        self.V[i] = self.V[i-1] + len(transferSV)
+        self.D[i] = self.D[i-1] + len(transferID)
     
     def toDataFrame(self):
         """
@@ -187,12 +192,14 @@ class HubSEIRVD(HubSEIRV):
         pd.DataFrame
             Holds the data of simulation in a DataFrame format.
         """
+        import pandas as pd
         t = np.linspace(0,self.days,self.days+1)
         arr = np.stack([t, self.S, self.E, self.I, self.R, self.D, self.V], axis=1)
         df = pd.DataFrame(arr, columns=["Days", "Susceptible", "Exposed", "Infected", "Recovered", "Dead", "Vaccinated"])
         return df
     
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0,self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5, ax6) = plt.subplots(nrows=6, sharex="all")
         ax1.set_title("Hub Model SEIRDV")
@@ -1,11 +1,7 @@
-
-from matplotlib import pyplot as plt
 import numpy as np
-import pandas as pd
-from multipledispatch import dispatch
 
 from .HubSIS import HubSIS
-from Eir.utility import Person
+from ..population import Population
 import Eir.utility as u
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
@@ -50,7 +46,18 @@ class HubSIR(HubSIS):
     alpha: float optional
         constant used in the P(infection) formula. Default is 2.0.
 
-    
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
     details: Simul_Details
@@ -65,15 +72,15 @@ class HubSIR(HubSIS):
     R : ndarray
         stores the number of people R compartmet on each day.
     
-    Scollect: list
+    Scollect: Collect
         contains the Person objects of everyone in simulation. If an element in Scollect has isIncluded=True,
         that means person is currently in susceptible compartment.
     
-    Icollect: list
+    Icollect: Collect
         contains the Person objects of everyone in simulation. If an element in Icollect has isIncluded=True,
         that means person is currently in infected compartment.
     
-    Rcollect: list
+    Rcollect: Collect
         contains the Person objects of everyone in simulation. If an element in Rcollect has isIncluded=True,
         that means person is currently in removed compartment.
     
@@ -86,75 +93,40 @@ class HubSIR(HubSIS):
 
     """
     def __init__(self, S0: int, I0: int, R0: int, pss: float, rstart: float, side: float, 
-                 days: int, gamma: float, alpha=2.0, w0=1.0,hubConstant=6 ** 0.5):
+                 days: int, gamma: float, alpha=2.0, w0=1.0,hubConstant=6 ** 0.5, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0,days])
         self.floatCheck([pss, gamma, side, rstart, w0, alpha, hubConstant])
         self.negValCheck([S0, I0, R0, pss, gamma, side, rstart, days, w0, hubConstant, alpha])
         self.probValCheck([pss, gamma, w0])
-        super(HubSIR, self).__init__(S0=S0, I0=I0, pss=pss, rstart=rstart, alpha=alpha, days=days, side=side, w0=w0, gamma=gamma, hubConstant=hubConstant)
+        super(HubSIR, self).__init__(S0=S0, I0=I0, pss=pss, rstart=rstart, alpha=alpha, days=days, side=side, w0=w0, gamma=gamma, hubConstant=hubConstant, engine=engine, rng=rng, record=record)
         #print(self.gamma)
         # reconfigure the population size
         self.popsize = S0 + I0 + R0
         #print(self.popsize)
         # initialize the Simul_Details object
-        self.details = Simul_Details(days=days, popsize=int(self.popsize), static=True)
+        self.details = Simul_Details(days=days, popsize=int(self.popsize), static=True, level=record)
 
         self.R0 = R0
         # create new array of locations for all of the individuals in the population
-        self.locx = np.random.random(self.popsize)*side
-        self.locy = np.random.random(self.popsize) * side
+        self.locx = self.rng.random(self.popsize)*side
+        self.locy = self.rng.random(self.popsize) * side
         #print("Leng of locations: ", len(self.locx))
         self.R = np.zeros(days + 1)
         self.R[0] = R0
-        # create the R collection data structure and set the array structures back to undefined array
-        # to undo the effects of the inheritance
-        self.Scollect = []
-        self.Icollect = []
-        self.Rcollect = []
-
-        # initialize the Scollect and Icollect arrays
-        # this loop will make the isIncluded = True for all the susceptible
+        # whether each person is a super spreader
+        ss = u.randEvents(pss, self.popsize, self.rng)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SIR", [S0, I0, R0], self.locx, self.locy, ss=ss)
+        self.Scollect, self.Icollect, self.Rcollect = self.population.collects("SIR")
         for i in range(0, S0):
-            ss = u.randEvent(pss)
-            # create the two person objects, with everything identical except the isIncluded boolean
-            p1 = Person(self.locx[i], self.locy[i], ss, isIncluded=True)
-            p2 = Person(self.locx[i], self.locy[i], ss)
-            p3 = Person(self.locx[i], self.locy[i], ss)
-            # push them to the data structure/ array structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.Rcollect.append(p3)
-            self.details.addLocation(0, (self.locx[i], self.locy[i]))
             self.details.addStateChange(i, "S", 0)
-
-        # this loop will make the isIncluded = True for all the infecteds
         for i in range(S0, S0 + I0):
-            ss = u.randEvent(pss)
-            # create the two person objects, with everything identical except the isIncluded boolean
-            p1 = Person(self.locx[i], self.locy[i], ss)
-            p2 = Person(self.locx[i], self.locy[i], ss, isIncluded=True)
-            p3 = Person(self.locx[i], self.locy[i], ss)
-            # push them to the data structure/ array structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.Rcollect.append(p3)
-            self.details.addLocation(0, (self.locx[i], self.locy[i]))
             self.details.addStateChange(i, "I", 0)
-        # initialize the Rcollect array
         for i in range(S0 + I0, S0 + I0 + R0):
-            ss = u.randEvent(pss)
-            # create the two person objects, with everything identical except the isIncluded boolean
-            p1 = Person(self.locx[i], self.locy[i], ss)
-            p2 = Person(self.locx[i], self.locy[i], ss)
-            p3 = Person(self.locx[i], self.locy[i], ss, isIncluded=True)
-            # push them to the data structure/ array structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.Rcollect.append(p3)
-            # add location at Day 0
-            self.details.addLocation(0, (self.locx[i], self.locy[i]))
             self.details.addStateChange(i, "R", 0)
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
         #print("Initial S0: ", self.S[0], " Initial I0: ", self.I[0], " Initial R0: ", self.R[0])
     # run state changes from I to R
     def _ItoR(self):
@@ -165,23 +137,12 @@ class HubSIR(HubSIS):
         Returns
         -------
 
-        set
+        ndarray:
             Contains indices of those who will be transferred from I to R. For example, if set contains 3, then
             the self.Rollect[3].isIncluded=True and self.Icollect.isIncluded should be set to false within the
             _ItoR() function.
         """
-        # set that keeps track of the indices of people that changed states
-        transfers = set()
-        for count, inf in enumerate(self.Icollect):
-            if not inf.isIncluded:
-                continue
-            #print("infected person ", count)
-            event = u.randEvent(self.gamma)
-            if not event:
-                continue
-            self.Icollect[count].isIncluded = False
-            transfers.add(count)
-        return transfers
+        return self._changeHelp(self.Icollect, self.gamma)
 
     # run the simulation using
     def run(self, getDetails=True):
@@ -202,32 +163,31 @@ class HubSIR(HubSIS):
             This is returned if getDetails=True. It allows the user to more closely examine the particular simulation.
             This includes, transmission chains, state history of particular people, and more. 
         """
-        for i in range(1, self.days + 1):
-            #print("Day ",i, "self.days: ", self.days)
-            # run the transfers from different compartments
-            transferSI = self._StoI(i)
-            transferIr = self._ItoR()
-            # go after and change the indices in the collection data structure thing
-            for index in transferSI:
-                #print("Person ", index)
-                self.Icollect[index].isIncluded = True
-                self.details.addStateChange(index, "I", i)
-            for index in transferIr:
-                #print("Person ", index)
-                self.Rcollect[index].isIncluded = True
-                self.details.addStateChange(index, "R", i)
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSI)
-            self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr)
-            self.R[i] = self.R[i-1] + len(transferIr)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
 
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ",i, "self.days: ", self.days)
+        # run the transfers from different compartments
+        transferSI = self._StoI(i)
+        transferIr = self._ItoR()
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSI, self.Icollect, "I", i)
+        self._stateChanger(transferIr, self.Rcollect, "R", i)
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSI)
+        self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr)
+        self.R[i] = self.R[i-1] + len(transferIr)
+
     # maybe add picking what to plot later
     def plot(self):
         """
         Plots the variables S, I, and R against the number of days. 
         """
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3) = plt.subplots(nrows=3, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -254,6 +214,7 @@ class HubSIR(HubSIS):
         pd.DataFrame:
             a dataframe containing the number of people in S, I, and R compartments per day.
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
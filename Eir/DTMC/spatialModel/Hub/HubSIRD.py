@@ -1,9 +1,6 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .HubSIR import HubSIR
-from Eir.utility import randEvent, Person
 
 class HubSIRD(HubSIR):
     """
@@ -47,7 +44,18 @@ class HubSIRD(HubSIR):
     alpha: float optional
         constant used in the P(infection) formula. Default is 2.0.
 
-    
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
     details: Simul_Details
@@ -65,19 +73,19 @@ class HubSIRD(HubSIR):
     D: ndarray
         stores the number of people in the D compartment on each day.
     
-    Scollect: list
+    Scollect: Collect
         contains the Person objects of everyone in simulation. If an element in Scollect has isIncluded=True,
         that means person is currently in susceptible compartment.
     
-    Icollect: list
+    Icollect: Collect
         contains the Person objects of everyone in simulation. If an element in Icollect has isIncluded=True,
         that means person is currently in infected compartment.
     
-    Rcollect: list
+    Rcollect: Collect
         contains the Person objects of everyone in simulation. If an element in Rcollect has isIncluded=True,
         that means person is currently in removed compartment.
     
-    Dcollect: list
+    Dcollect: Collect
         contains the Person objects of everyone in simulation. If an element in Dcollect has isIncluded=True,
         that means person is currently in removed compartment.
     
@@ -89,18 +97,18 @@ class HubSIRD(HubSIR):
     
 
     """
-    def __init__(self, S0: int, I0: int, R0: int, pss: float, rstart: float, side: float, days: int, gamma: float, mu:float, alpha=2.0, w0=1.0, hubConstant=6 ** 0.5):
+    def __init__(self, S0: int, I0: int, R0: int, pss: float, rstart: float, side: float, days: int, gamma: float, mu:float, alpha=2.0, w0=1.0, hubConstant=6 ** 0.5, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0,days])
         self.floatCheck([pss, gamma, mu, side, rstart, w0, alpha, hubConstant])
         self.negValCheck([S0, I0, R0, pss, gamma, mu, side, rstart, days, w0, hubConstant, alpha])
         self.probValCheck([pss, gamma, mu, w0])
-        super().__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, side=side, days=days, gamma=gamma, alpha=alpha, w0=w0, hubConstant=hubConstant)
+        super().__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, side=side, days=days, gamma=gamma, alpha=alpha, w0=w0, hubConstant=hubConstant, engine=engine, rng=rng, record=record)
         self.mu = mu
         self.D = np.zeros(days+1)
-        self.Dcollect = []
-        for i in range(self.popsize):
-            self.Dcollect.append(Person(self.Scollect[i].x, self.Scollect[i].y, self.Scollect[i].ss))
+        # the D compartment starts out empty
+        self.population.addCompartment("D")
+        self.Dcollect = self.population.collect("D")
     
     def _ItoD(self):
         return self._changeHelp(self.Icollect, self.mu)
@@ -123,24 +131,28 @@ class HubSIRD(HubSIR):
             This is returned if getDetails=True. It allows the user to more closely examine the particular simulation.
             This includes, transmission chains, state history of particular people, and more. 
         """
-        for i in range(1, self.days + 1):
-            #print("Day ",i)
-            # run the transfers from different compartments
-            transferSI = self._StoI(i)
-            transferIr = self._ItoR()
-            transferID = self._ItoD()
-            # go after and change the indices in the collection data structure thing
-            self._stateChanger(transferSI, self.Icollect, "I", i)
-            self._stateChanger(transferIr, self.Rcollect, "R", i)
-            self._stateChanger(transferID, self.Dcollect, "D", i)
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSI)
-            self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr) - len(transferID)
-            self.R[i] = self.R[i-1] + len(transferIr)
-            self.D[i] = self.D[i-1] + len(transferID)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
 
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ",i)
+        # run the transfers from different compartments
+        transferSI = self._StoI(i)
+        transferIr = self._ItoR()
+        transferID = self._ItoD()
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSI, self.Icollect, "I", i)
+        self._stateChanger(transferIr, self.Rcollect, "R", i)
+        self._stateChanger(transferID, self.Dcollect, "D", i)
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSI)
+        self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr) - len(transferID)
+        self.R[i] = self.R[i-1] + len(transferIr)
+        self.D[i] = self.D[i-1] + len(transferID)
+
 
     def toDataFrame(self):
         """
@@ -153,6 +165,7 @@ class HubSIRD(HubSIR):
             DataFrame object containing the number of susceptibles and number of infecteds on each day. 
 
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -163,6 +176,7 @@ class HubSIRD(HubSIR):
     
     def plot(self):
         "Plots the number of susceptible, infected, dead, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
@@ -1,9 +1,6 @@
 import numpy as np
-from matplotlib import pyplot as plt
-import pandas as pd
 
 from .HubSIR import HubSIR
-import Eir.utility as u
 
 
 class HubSIRS(HubSIR):
@@ -52,7 +49,18 @@ class HubSIRS(HubSIR):
     alpha: int
         constant used in the P(infection) formula. Default is 2.0.
 
-    
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
     details: Simul_Details
@@ -67,15 +75,15 @@ class HubSIRS(HubSIR):
     R : ndarray
         stores the number of people R compartmet on each day.
     
-    Scollect: list
+    Scollect: Collect
         contains the Person objects of everyone in simulation. If an element in Scollect has isIncluded=True,
         that means person is currently in susceptible compartment.
     
-    Icollect: list
+    Icollect: Collect
         contains the Person objects of everyone in simulation. If an element in Icollect has isIncluded=True,
         that means person is currently in infected compartment.
     
-    Rcollect: list
+    Rcollect: Collect
         contains the Person objects of everyone in simulation. If an element in Rcollect has isIncluded=True,
         that means person is currently in removed compartment.
     
@@ -87,10 +95,13 @@ class HubSIRS(HubSIR):
     
 
     """
+    # people go back from R to S with probability gamma in this model
+    settled = {"S": "eta", "R": "gamma", "D": None, "V": None}
+
     def __init__(self, pss: float, rstart: float, side: float, S0: int, I0: int, R0: int,
                  days: int,
                  gamma: float, kappa: float, w0=1.0,
-                 hubConstant=6 ** 0.5, alpha=2.0):
+                 hubConstant=6 ** 0.5, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0,days])
         self.floatCheck([pss, gamma, kappa, side, rstart, w0, alpha, hubConstant])
@@ -98,7 +109,7 @@ class HubSIRS(HubSIR):
         self.probValCheck([pss, gamma, kappa, w0])
         self.kappa = kappa
         self.popsize = S0 +I0 + R0
-        super(HubSIRS, self).__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, side=side, days=days, gamma=gamma, alpha=alpha, w0=w0, hubConstant=hubConstant)
+        super(HubSIRS, self).__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, side=side, days=days, gamma=gamma, alpha=alpha, w0=w0, hubConstant=hubConstant, engine=engine, rng=rng, record=record)
 
     # run transfers from R to S
     def _RS(self):
@@ -108,21 +119,11 @@ class HubSIRS(HubSIR):
         Returns
         -------
 
-        set
+        ndarray:
             contains the number people who should get converted from R to S. For example, if the set contains
             3, that means that Scollect[3].isIncluded=True. This step is taken care of in run method.
         """
-        # set that keeps track of the indices of people that changed states
-        transfers = set()
-        for count, inf in enumerate(self.Rcollect):
-            if not inf.isIncluded:
-                continue
-            event = u.randEvent(self.gamma)
-            if not event:
-                continue
-            self.Rcollect[count].isIncluded = False
-            transfers.add(count)
-        return transfers
+        return self._changeHelp(self.Rcollect, self.gamma)
 
     def run(self, getDetails=True):
         """
@@ -143,33 +144,32 @@ class HubSIRS(HubSIR):
             This includes, transmission chains, state history of particular people, and more. 
         """
         # for the days 1 to day
-        for i in range(1, self.days + 1):
-            # run the transfers from different compartments
-            transferSI = self._StoI(i)
-            transferIr = self._ItoR()
-            transferRS = self._RS()
-            # go after and change the indices in the collection data structure thing
-            # S to I
-            for index in transferSI:
-                self.Icollect[index].isIncluded = True
-                self.details.addStateChange(index, "I", i)
-            # I to R
-            for index in transferIr:
-                self.Rcollect[index].isIncluded = True
-                self.details.addStateChange(index, "R", i)
-            # R to S
-            for index in transferRS:
-                self.Scollect[index].isIncluded = True
-                self.details.addStateChange(index, "S", i)
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSI) + len(transferRS)
-            self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr)
-            self.R[i] = self.R[i - 1] + len(transferIr) - len(transferRS)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        # run the transfers from different compartments
+        transferSI = self._StoI(i)
+        transferIr = self._ItoR()
+        transferRS = self._RS()
+        # go after and change the indices in the collection data structure thing
+        # S to I
+        self._stateChanger(transferSI, self.Icollect, "I", i)
+        # I to R
+        self._stateChanger(transferIr, self.Rcollect, "R", i)
+        # R to S
+        self._stateChanger(transferRS, self.Scollect, "S", i)
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSI) + len(transferRS)
+        self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr)
+        self.R[i] = self.R[i - 1] + len(transferIr) - len(transferRS)
     
     def plot(self):
         """Plots the number of people in each compartment each day. """
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3) = plt.subplots(nrows=3, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -1,6 +1,4 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .HubSIRD import HubSIRD
 
@@ -50,7 +48,18 @@ class HubSIRSD(HubSIRD):
     alpha: int
         constant used in the P(infection) formula. Default is 2.0.
 
-    
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
     details: Simul_Details
@@ -68,19 +77,19 @@ class HubSIRSD(HubSIRD):
     D: ndarray
         stores the number of people in D compartment on each day.
     
-    Scollect: list
+    Scollect: Collect
         contains the Person objects of everyone in simulation. If an element in Scollect has isIncluded=True,
         that means person is currently in susceptible compartment.
     
-    Icollect: list
+    Icollect: Collect
         contains the Person objects of everyone in simulation. If an element in Icollect has isIncluded=True,
         that means person is currently in infected compartment.
     
-    Rcollect: list
+    Rcollect: Collect
         contains the Person objects of everyone in simulation. If an element in Rcollect has isIncluded=True,
         that means person is currently in removed compartment.
     
-    Dcollect: list
+    Dcollect: Collect
         contains the Person objects of everyone in simulation. If an element in Rcollect has isIncluded=True,
         that means person is currently in dead compartment.
     
@@ -92,13 +101,13 @@ class HubSIRSD(HubSIRD):
     
 
     """
-    def __init__(self, S0: int, I0: int, R0: int, pss: float, rstart: float, side: float, days: int, gamma: float, kappa:float, mu:float, alpha=2.0, w0=1.0, hubConstant=6 ** 0.5):
+    def __init__(self, S0: int, I0: int, R0: int, pss: float, rstart: float, side: float, days: int, gamma: float, kappa:float, mu:float, alpha=2.0, w0=1.0, hubConstant=6 ** 0.5, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0,days])
         self.floatCheck([pss, gamma, kappa, mu, side, rstart, w0, alpha, hubConstant])
         self.negValCheck([S0, I0, R0, pss, gamma, kappa, mu, side, rstart, days, w0, hubConstant, alpha])
         self.probValCheck([pss, gamma, kappa, mu, w0])
-        super().__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, side=side, days=days, gamma=gamma, mu=mu, alpha=alpha, w0=w0, hubConstant=hubConstant)
+        super().__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, side=side, days=days, gamma=gamma, mu=mu, alpha=alpha, w0=w0, hubConstant=hubConstant, engine=engine, rng=rng, record=record)
         self.kappa = kappa
     
     def _RtoS(self):
@@ -122,28 +131,33 @@ class HubSIRSD(HubSIRD):
             This is returned if getDetails=True. It allows the user to more closely examine the particular simulation.
             This includes, transmission chains, state history of particular people, and more. 
         """
-        for i in range(1, self.days + 1):
-            #print("Day ",i)
-            # run the transfers from different compartments
-            transferSI = self._StoI(i)
-            transferIr = self._ItoR()
-            transferID = self._ItoD()
-            transferRS = self._RtoS()
-            # go after and change the indices in the collection data structure thing
-            self._stateChanger(transferSI, self.Icollect, "I", i)
-            self._stateChanger(transferIr, self.Rcollect, "R", i)
-            self._stateChanger(transferID, self.Dcollect, "D", i)
-            self._stateChanger(transferRS, self.Scollect, "S", i)
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSI) + len(transferRS)
-            self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr) - len(transferID)
-            self.R[i] = self.R[i-1] + len(transferIr) - len(transferRS)
-            self.D[i] = self.D[i-1] + len(transferID)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ",i)
+        # run the transfers from different compartments
+        transferSI = self._StoI(i)
+        transferIr = self._ItoR()
+        transferID = self._ItoD()
+        transferRS = self._RtoS()
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSI, self.Icollect, "I", i)
+        self._stateChanger(transferIr, self.Rcollect, "R", i)
+        self._stateChanger(transferID, self.Dcollect, "D", i)
+        self._stateChanger(transferRS, self.Scollect, "S", i)
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSI) + len(transferRS)
+        self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr) - len(transferID)
+        self.R[i] = self.R[i-1] + len(transferIr) - len(transferRS)
+        self.D[i] = self.D[i-1] + len(transferID)
     
     def plot(self):
         "Plots the number of susceptible, infected, dead, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
@@ -1,6 +1,4 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .HubSIRV import HubSIRV
 
@@ -50,7 +48,18 @@ class HubSIRSV(HubSIRV):
     alpha: int
         constant used in the P(infection) formula. Default is 2.0.
 
-    
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -72,15 +81,15 @@ class HubSIRSV(HubSIRV):
     V: ndarray
         stores the number of people in the V compartment on each day.
     
-    Scollect: list
+    Scollect: Collect
         contains the Person objects of everyone in simulation. If an element in Scollect has isIncluded=True,
         that means person is currently in susceptible compartment.
     
-    Icollect: list
+    Icollect: Collect
         contains the Person objects of everyone in simulation. If an element in Icollect has isIncluded=True,
         that means person is currently in infected compartment.
     
-    Rcollect: list
+    Rcollect: Collect
         contains the Person objects of everyone in simulation. If an element in Rcollect has isIncluded=True,
         that means person is currently in removed compartment.
     
@@ -92,43 +101,48 @@ class HubSIRSV(HubSIRV):
     
 
     """
-    def __init__(self, S0: int, I0: int, R0:int, V0: int, pss: float, gamma: float, kappa: float, eta:float, rstart: float, side: float, days:int, alpha=2, w0=1.0, hubConstant=6**0.5, timeDelay=-1):
+    def __init__(self, S0: int, I0: int, R0:int, V0: int, pss: float, gamma: float, kappa: float, eta:float, rstart: float, side: float, days:int, alpha=2, w0=1.0, hubConstant=6**0.5, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0,V0, days])
         self.floatCheck([pss, gamma, kappa, eta, side, rstart, w0, alpha, hubConstant, timeDelay])
         self.negValCheck([S0, I0, R0, V0, pss, gamma, kappa, eta, side, rstart, days, w0, hubConstant, alpha])
         self.probValCheck([pss, gamma, kappa, eta, w0])
-        super().__init__(S0=S0, I0=I0, R0=R0, V0=V0, pss=pss, gamma=gamma, eta=eta, rstart=rstart, side=side, days=days, alpha=alpha, w0=w0, hubConstant=hubConstant, timeDelay=timeDelay)
+        super().__init__(S0=S0, I0=I0, R0=R0, V0=V0, pss=pss, gamma=gamma, eta=eta, rstart=rstart, side=side, days=days, alpha=alpha, w0=w0, hubConstant=hubConstant, timeDelay=timeDelay, engine=engine, rng=rng, record=record)
         self.kappa = kappa
     
     def _RtoS(self):
         return self._changeHelp(self.Rcollect, self.kappa)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days + 1):
-            #print("Day ",i)
-            # run the transfers from different compartments
-            transferSI = self._StoI(i)
-            transferIr = self._ItoR()
-            transferSV = set()
-            if i > self.timeDelay:
-                transferSV = self._StoV()
-            transferRS = self._RtoS()
-            # go after and change the indices in the collection data structure thing
-            self._stateChanger(transferSI, self.Icollect, "I", i)
-            self._stateChanger(transferIr, self.Rcollect, "R", i)
-            self._stateChanger(transferSV, self.Vcollect, "V", i)
-            self._stateChanger(transferRS, self.Scollect, "S", i)
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSI) - len(transferSV) + len(transferRS)
-            self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr)
-            self.R[i] = self.R[i-1] + len(transferIr) - len(transferRS)
-            self.V[i] = self.V[i-1] + len(transferSV)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ",i)
+        # run the transfers from different compartments
+        transferSI = self._StoI(i)
+        transferIr = self._ItoR()
+        transferSV = set()
+        if i > self.timeDelay:
+            transferSV = self._StoV()
+        transferRS = self._RtoS()
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSI, self.Icollect, "I", i)
+        self._stateChanger(transferIr, self.Rcollect, "R", i)
+        self._stateChanger(transferSV, self.Vcollect, "V", i)
+        self._stateChanger(transferRS, self.Scollect, "S", i)
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSI) - len(transferSV) + len(transferRS)
+        self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr)
+        self.R[i] = self.R[i-1] + len(transferIr) - len(transferRS)
+        self.V[i] = self.V[i-1] + len(transferSV)
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
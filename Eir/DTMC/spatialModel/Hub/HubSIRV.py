@@ -1,9 +1,8 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .HubSIR import HubSIR
-from Eir.utility import Person, randEvent
+from Eir.utility import randEvents
+from Eir.DTMC.spatialModel.population import Population
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
 
@@ -53,7 +52,18 @@ class HubSIRV(HubSIR):
     alpha: int
         constant used in the P(infection) formula. Default is 2.0.
 
-    
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -75,15 +85,15 @@ class HubSIRV(HubSIR):
     V: ndarray
         stores the number of people in the V compartment on each day.
     
-    Scollect: list
+    Scollect: Collect
         contains the Person objects of everyone in simulation. If an element in Scollect has isIncluded=True,
         that means person is currently in susceptible compartment.
     
-    Icollect: list
+    Icollect: Collect
         contains the Person objects of everyone in simulation. If an element in Icollect has isIncluded=True,
         that means person is currently in infected compartment.
     
-    Rcollect: list
+    Rcollect: Collect
         contains the Person objects of everyone in simulation. If an element in Rcollect has isIncluded=True,
         that means person is currently in removed compartment.
     
@@ -95,70 +105,67 @@ class HubSIRV(HubSIR):
     
 
     """
-    def __init__(self, S0: int, I0: int, R0:int, V0: int, pss: float, gamma: float, eta:float, rstart: float, side: float, days:int, alpha=2, w0=1.0, hubConstant=6**0.5, timeDelay=-1):
+    def __init__(self, S0: int, I0: int, R0:int, V0: int, pss: float, gamma: float, eta:float, rstart: float, side: float, days:int, alpha=2, w0=1.0, hubConstant=6**0.5, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0, V0, days])
         self.floatCheck([pss, gamma, eta, side, rstart, w0, alpha, hubConstant, timeDelay])
         self.negValCheck([S0, I0, R0, V0, pss, gamma, eta,side, rstart, days, w0, hubConstant, alpha])
         self.probValCheck([pss, gamma, eta, w0])
-        super().__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, alpha=alpha, side=side, days=days, gamma=gamma, w0=w0, hubConstant=hubConstant)
+        super().__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, alpha=alpha, side=side, days=days, gamma=gamma, w0=w0, hubConstant=hubConstant, engine=engine, rng=rng, record=record)
         self.V0 = V0
         self.V = np.zeros(days+1)
         self.eta = eta
         self.V[0] = V0
         self.popsize += V0
         self.timeDelay = timeDelay
-        self.details = Simul_Details(self.days, self.popsize, static=True)
-        self.Scollect, self.Icollect, self.Rcollect, self.Vcollect = [], [], [], []
+        self.details = Simul_Details(self.days, self.popsize, static=True, level=record)
         if V0 != 0:
-            self.locx = np.random.random(self.popsize)*side
-            self.locy = np.random.random(self.popsize)*side
+            self.locx = self.rng.random(self.popsize)*side
+            self.locy = self.rng.random(self.popsize)*side
+        # event is whether each person is a super spreader
+        event = randEvents(self.pss, self.popsize, self.rng)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SIRV", [S0, I0, R0, V0], self.locx, self.locy, ss=event)
+        self.Scollect, self.Icollect, self.Rcollect, self.Vcollect = self.population.collects("SIRV")
         for i in range(self.popsize):
-            p = []
-            event = randEvent(self.pss)
-            for j in range(4):
-                p.append(Person(self.locx[i], self.locy[i], event))
             if i < S0:
                 self.details.addStateChange(i, "S", 0)
-                p[0].isIncluded=True
             elif i< S0 + I0:
                 self.details.addStateChange(i, "I", 0)
-                p[1].isIncluded=True
             elif i<S0+I0+R0:
                 self.details.addStateChange(i, "R", 0)
-                p[2].isIncluded=True
             else:
                 self.details.addStateChange(i, "V", 0)
-                p[3].isIncluded=True
-            self.Scollect.append(p[0])
-            self.Icollect.append(p[1])
-            self.Rcollect.append(p[2])
-            self.Vcollect.append(p[3])
-            self.details.addLocation(0, (p[1].x,p[1].y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
 
     def _StoV(self):
         return self._changeHelp(self.Scollect, self.eta)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days + 1):
-            #print("Day ",i)
-            # run the transfers from different compartments
-            transferSI = self._StoI(i)
-            transferIr = self._ItoR()
-            transferSV = set()
-            if i > self.timeDelay:
-                transferSV = self._StoV()
-            # go after and change the indices in the collection data structure thing
-            self._stateChanger(transferSI, self.Icollect, "I", i)
-            self._stateChanger(transferIr, self.Rcollect, "R", i)
-            self._stateChanger(transferSV, self.Vcollect, "V", i)
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSI) - len(transferSV)
-            self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr)
-            self.R[i] = self.R[i-1] + len(transferIr)
-            self.V[i] = self.V[i-1] + len(transferSV)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ",i)
+        # run the transfers from different compartments
+        transferSI = self._StoI(i)
+        transferIr = self._ItoR()
+        transferSV = set()
+        if i > self.timeDelay:
+            transferSV = self._StoV()
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSI, self.Icollect, "I", i)
+        self._stateChanger(transferIr, self.Rcollect, "R", i)
+        self._stateChanger(transferSV, self.Vcollect, "V", i)
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSI) - len(transferSV)
+        self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIr)
+        self.R[i] = self.R[i-1] + len(transferIr)
+        self.V[i] = self.V[i-1] + len(transferSV)
     
     def toDataFrame(self):
         """
@@ -171,6 +178,7 @@ class HubSIRV(HubSIR):
             DataFrame object containing the number of susceptibles and number of infecteds on each day. 
 
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -181,6 +189,7 @@ class HubSIRV(HubSIR):
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
@@ -1,10 +1,7 @@
-from matplotlib import pyplot as plt
-from multipledispatch import dispatch
 import numpy as np
-import pandas as pd
 
-from Eir.utility import Person
 from ..HubModel import Hub
+from ..population import Population
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 import Eir.utility as u
 
@@ -47,7 +44,18 @@ class HubSIS(Hub):
     hubConstant: float (optional)
         The factor k multliplied to the rstart if the person is a super spreader.
 
-    
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
     details: Simul_Details
@@ -59,11 +67,11 @@ class HubSIS(Hub):
     I : ndarray
         stores the number of people I compartmet on each day.
     
-    Scollect: list
+    Scollect: Collect
         contains the Person objects of everyone in simulation. If an element in Scollect has isIncluded=True,
         that means person is currently in susceptible compartment.
     
-    Icollect: list
+    Icollect: Collect
         contains the Person objects of everyone in simulation. If an element in Icollect has isIncluded=True,
         that means person is currently in infected compartment.
 
@@ -75,7 +83,7 @@ class HubSIS(Hub):
     """
     def __init__(self, S0: int, I0: int, pss: float, rstart: float, side: float, days: int,
                  gamma: float, w0=1.0,
-                 hubConstant=6 ** 0.5, alpha=2.0):
+                 hubConstant=6 ** 0.5, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, days])
         self.floatCheck([pss, rstart, side, gamma, w0, hubConstant, alpha])
@@ -83,39 +91,25 @@ class HubSIS(Hub):
         self.probValCheck([pss, gamma, w0])
         self.popsize = S0 + I0
         # initialize the Simul_Details object
-        self.details = Simul_Details(days=days, popsize=self.popsize, static=True)
+        self.details = Simul_Details(days=days, popsize=self.popsize, static=True, level=record)
 
         self.gamma = gamma
         # call the super constructor
         super(HubSIS, self).__init__(self.popsize, pss, rstart, alpha, side, S0, I0, days=days, w0=w0,
-                                     hubConstant=hubConstant)
-        # initialize the Scollect and Icollect arrays
-        # this loop will make the isIncluded = True for all the susceptible
+                                     hubConstant=hubConstant, engine=engine, rng=rng, record=record)
+        # whether each person is a super spreader
+        ss = u.randEvents(pss, self.popsize, self.rng)
+        # everyone is stored once in the population; Scollect and Icollect are views of its compartments
+        self.population = Population("SI", [S0, I0], self.locx, self.locy, ss=ss)
+        self.Scollect, self.Icollect = self.population.collects("SI")
         for i in range(0, S0):
-            ss = u.randEvent(pss)
-            # create the two person objects, with everything identical except the isIncluded boolean
-            p1 = Person(self.locx[i], self.locy[i], ss, isIncluded=True)
-            p2 = Person(self.locx[i], self.locy[i], ss)
-            # put the locations in the Simul_Details object
-            self.details.addLocation(0, (self.locx[i], self.locy[i]))
             # put the starting states in Simul_Details
             self.details.addStateChange(i, "S", 0)
-            # push them to the data structure/ array structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-        # this loop will make the isIncluded = True for all the infecteds
         for i in range(S0, S0 + I0):
-            ss = u.randEvent(pss)
-            # put the locations in the Simul_Details object
-            self.details.addLocation(0, (self.locx[i], self.locy[i]))
             # put the starting states in Simul_Details
             self.details.addStateChange(i, "I", 0)
-            # create the two person objects, with everything identical except the isIncluded boolean
-            p1 = Person(self.locx[i], self.locy[i], ss)
-            p2 = Person(self.locx[i], self.locy[i], ss, isIncluded=True)
-            # push them to the data structure/ array structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
         #print("Length of Scollect: ", len(self.Scollect))
 
     # run state changes from S to I
@@ -137,45 +131,14 @@ class HubSIS(Hub):
             Includes the people that will be transferred from S to I. For example, if set inclues the number 3
             then self.Icollect[3].isIncluded = True.
         """
-        # set that keeps track of the indices of people that changed states
-        transfers = set()
-        for count, inf in enumerate(self.Icollect):
-            if not inf.isIncluded:
-                continue
-            for count2, sus in enumerate(self.Scollect):
-                #print("Susceptible Person ", count2)
-                if not sus.isIncluded:
-                    continue
-                # generate the probability of infection
-                prob = self._infect(inf, sus)
-                # generate a random event based on the P(infection)
-                event = u.randEvent(prob)
-                # if an infection doesn't occur
-                if not event:
-                    continue
-                # remove the person from the susceptible state
-                self.Scollect[count2].isIncluded = False
-                self.details.addTransmission(day, count, count2)
-                # put the person in the transfer set to be made an infectious person
-                transfers.add(count2)
-        return transfers
+        return self._transmission(day, [self.Icollect], self.Scollect)
 
     # run state changes from I to S
     def __ItoS(self):
         """
         Takes care of state changes from I to S. Operates independent of location.
         """
-        # set that keeps track of the indices of people that changed states
-        transfers = set()
-        for count, inf in enumerate(self.Icollect):
-            if not inf.isIncluded:
-                continue
-            event = u.randEvent(self.gamma)
-            if not event:
-                continue
-            self.Icollect[count].isIncluded = False
-            transfers.add(count)
-        return transfers
+        return self._changeHelp(self.Icollect, self.gamma)
 
     # run the simulation using
     def run(self, getDetails=True):
@@ -196,29 +159,30 @@ class HubSIS(Hub):
             This is returned if getDetails=True. It allows the user to more closely examine the particular simulation.
             This includes, transmission chains, state history of particular people, and more. 
         """
-        for i in range(1, self.days + 1):
-            #print("Day: ", i)
-            # run the transfers from different compartments
-            transferSI = self._StoI(i)
-            transferIS = self.__ItoS()
-            # go after and change the indices in the collection data structure thing
-            for index in transferSI:
-                self.Icollect[index].isIncluded = True
-                self.details.addStateChange(index, "I", i)
-            for index in transferIS:
-                self.Scollect[index].isIncluded = True
-                self.details.addStateChange(index, "S", i)
-            # change the number of people in each state on the day i by adjusting the previous day's count
-            self.S[i] = self.S[i - 1] - len(transferSI) + len(transferIS)
-            self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIS)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
 
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day: ", i)
+        # run the transfers from different compartments
+        transferSI = self._StoI(i)
+        transferIS = self.__ItoS()
+        # go after and change the indices in the collection data structure thing
+        self._stateChanger(transferSI, self.Icollect, "I", i)
+        self._stateChanger(transferIS, self.Scollect, "S", i)
+        # change the number of people in each state on the day i by adjusting the previous day's count
+        self.S[i] = self.S[i - 1] - len(transferSI) + len(transferIS)
+        self.I[i] = self.I[i - 1] + len(transferSI) - len(transferIS)
+
     # maybe add picking what to plot later
     def plot(self):
         """
         Plots the variables S and I against the number of days. 
         """
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2) = plt.subplots(nrows=2, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -242,6 +206,7 @@ class HubSIS(Hub):
         pd.DataFrame
             Contains the number of susceptibles and infecteds on each day in the simulation.
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -1,8 +1,7 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
-from Eir.utility import Person, randEvent
+from Eir.utility import randEvents
+from ..population import Population
 from ..HubModel import Hub
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
@@ -79,11 +78,20 @@ class Hub_ICUV(Hub):
         timeDelay: float, optional
             The amount of days for which the vaccine rollout is delayed. Checks the day and makes sure that the day > timeDelay before simulating vaccine distribution. Default is -1.
 
+        engine: str, optional
+            How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+        rng: optional
+            What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+        record: str, optional
+            How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people each person infected, "events" also keeps every transmission and state change, and "trajectories" also keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't keep. Default is "trajectories".
+
         Attributes
         ----------
 
-        Scollect, Ecollect, Icollect, Lcollect, ICUcollect, Rcollect, Dcollect, Vcollect: list
-            Lists that contains copies of the Person objects and are used to determine what state each Person is currently in.
+        Scollect, Ecollect, Icollect, Lcollect, ICUcollect, Rcollect, Dcollect, Vcollect: Collect
+            Views of the population that are used to determine what state each Person is currently in.
         
         S, E, I, L, ICU, R, D, V, infectious: ndarray
             Numpy arrays that contain the total number of people in each state on each given day. Infectious people are classified as those in compartment I + those in compartments L.
@@ -97,15 +105,18 @@ class Hub_ICUV(Hub):
 
 
         """
+    # the infectious array adds up I and L, so it stays the same once they do
+    sums = ("infectious",)
+
     def __init__(self, S0:int, E0:int, I0:int, R0:int, V0:int, rho: float, ioda: float,  gamma: float, mu: float, phi: float, chi: float, omega: float, kappa: float, eta: float, rstart: float, 
-        pss: float, side: float, days: int, alpha=2.3, w0=1.0, hubConstant=6**0.5, timeDelay=-1):
+        pss: float, side: float, days: int, alpha=2.3, w0=1.0, hubConstant=6**0.5, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         # error checks
         self.intCheck([S0, E0, I0, R0, V0, days])
         self.floatCheck([rho, ioda, gamma, mu, phi, chi, omega, kappa, eta, rstart, pss, side, alpha, w0, hubConstant, timeDelay])
         self.negValCheck([S0, E0, I0, R0, V0, rstart, side, days, alpha, hubConstant])
         self.probValCheck([rho, ioda, gamma, mu, phi, chi, omega, kappa, eta, w0])
 
-        super().__init__(popsize=S0+I0+R0, pss=pss, rstart=rstart, alpha=alpha, side=side, S0=S0, I0=I0, days=days, w0=w0, hubConstant=hubConstant)
+        super().__init__(popsize=S0+I0+R0, pss=pss, rstart=rstart, alpha=alpha, side=side, S0=S0, I0=I0, days=days, w0=w0, hubConstant=hubConstant, engine=engine, rng=rng, record=record)
         # initialize the numpy arrays
         self.timeDelay = timeDelay
         self.S, self.E, self.I, self.L , self.ICU, self.R, self.D, self.V = np.zeros(self.days+1), np.zeros(self.days+1), np.zeros(self.days+1), np.zeros(self.days+1), np.zeros(self.days+1), np.zeros(self.days+1), np.zeros(self.days+1), np.zeros(self.days+1)
@@ -117,16 +128,7 @@ class Hub_ICUV(Hub):
         # initialize popsize
         self.popsize = S0 + E0 + I0 + R0 +V0
         # create the Siml_Details object
-        self.details = Simul_Details(days=self.days, popsize=self.popsize, static=True)
-        # create the data structures
-        self.Scollect = []
-        self.Ecollect = []
-        self.Icollect = []
-        self.Lcollect = []
-        self.ICUcollect = []
-        self.Rcollect = []
-        self.Dcollect = []
-        self.Vcollect = []
+        self.details = Simul_Details(days=self.days, popsize=self.popsize, static=True, level=record)
         # reinitialize the probabilites
         self.rho = rho
         self.ioda = ioda
@@ -138,57 +140,25 @@ class Hub_ICUV(Hub):
         self.eta = eta
         self.gamma = gamma
         # generate random locaitons in the plane
-        locx, locy= np.random.random(self.popsize) * side, np.random.random(self.popsize) * side
+        locx, locy= self.rng.random(self.popsize) * side, self.rng.random(self.popsize) * side
+        # event is whether each person is a super spreader
+        event = randEvents(self.pss, self.popsize, self.rng)
+        # everyone is stored once in the population instead of once per compartment; the collects are views of it
+        symbols = ["S", "E", "I", "L", "ICU", "R", "D", "V"]
+        self.population = Population(symbols, [S0, E0, I0, 0, 0, R0, 0, V0], locx, locy, ss=event)
+        self.Scollect, self.Ecollect, self.Icollect, self.Lcollect, self.ICUcollect, self.Rcollect, self.Dcollect, self.Vcollect = self.population.collects(symbols)
         for i in range(self.popsize):
-            event = randEvent(self.pss)
-            # S copy
-            p1 = Person(locx[i], locy[i], event)
-            # I copy
-            p2 = Person(locx[i], locy[i], event)
-            # R copy
-            p3 = Person(locx[i], locy[i], event)
-            # D copy
-            p4 = Person(locx[i], locy[i], event)
-            # Ecopy
-            p5 = Person(locx[i], locy[i], event)
-            # Lcopy
-            p6 = Person(locx[i], locy[i], event)
-            # ICU copy
-            p7 = Person(locx[i], locy[i], event)
-            # Vaccine copy
-            p8 = Person(locx[i], locy[i], event)
             # determine what state each person is in at the beginning of the simulation
             if i < S0:
-                p1.isIncluded=True
                 self.details.addStateChange(i, "S", 0)
             elif i < S0 + E0:
-                p5.isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             elif i< S0 + E0 + I0:
-                p2.isIncluded=True
                 self.details.addStateChange(i, "I", 0)
             elif  i< S0 + E0 + I0 + R0:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "R", 0)
             else:
-                p8.isIncluded=True
                 self.details.addStateChange(i, "V", 0)
-            # Susceptible collect
-            self.Scollect.append(p1)
-            # Exposed collect
-            self.Ecollect.append(p5)
-            # Infected collected
-            self.Icollect.append(p2)
-            # Lag compartment collected
-            self.Lcollect.append(p6)
-            # Removed compartment collected
-            self.Rcollect.append(p3)
-            # ICU compartment collect
-            self.ICUcollect.append(p7)
-            # Death compartment collect
-            self.Dcollect.append(p4)
-            # Vaccinated compartment collect
-            self.Vcollect.append(p8)
     
     def _StoE(self, day: int):
         """
@@ -206,37 +176,9 @@ class Hub_ICUV(Hub):
         set:
             Contains the people who need to switch states.
         """
-       # cycle through all of the person objects in Icollect and Scollect and determine who goes to E
-        transferStoE = set()
-        for i, inf in enumerate(self.Icollect):
-            if inf.isIncluded == False:
-                continue
-            for j, sus in enumerate(self.Scollect):
-                if sus.isIncluded==False:
-                    continue
-                w = self._infect(inf, sus)
-                event = randEvent(w)
-                if not event:
-                    continue
-                self.Scollect[j].isIncluded = False
-                self.details.addTransmission(day, i, j)
-                transferStoE.add(j)
-        # same loop for L compartment, as they can also propogate the disease
-        for i, inf in enumerate(self.Lcollect):
-            if inf.isIncluded == False:
-                continue
-            for j, sus in enumerate(self.Scollect):
-                if sus.isIncluded==False:
-                    continue
-                w = self._infect(inf, sus)
-                event = randEvent(w)
-                if not event:
-                    continue
-                self.Scollect[j].isIncluded = False
-                self.details.addTransmission(day, i, j)
-                transferStoE.add(j)
-        return transferStoE
-    
+        # both I and L compartments can propogate the disease
+        return self._transmission(day, [self.Icollect, self.Lcollect], self.Scollect)
+
     def _EtoL(self):
         """
         Takes care of transfers from E to L compartment.
@@ -244,7 +186,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
 
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         
@@ -257,7 +199,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Ecollect, self.rho * (1-self.ioda))
@@ -269,7 +211,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Lcollect, self.phi)
@@ -281,7 +223,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.ICUcollect, self.chi)
@@ -293,7 +235,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.ICUcollect, self.omega)
@@ -305,7 +247,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Icollect, self.gamma)
@@ -317,7 +259,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Icollect, self.mu)
@@ -329,7 +271,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Rcollect, self.kappa)
@@ -341,7 +283,7 @@ class Hub_ICUV(Hub):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Scollect, self.eta)
@@ -363,50 +305,54 @@ class Hub_ICUV(Hub):
         Simul_Details:
             Allows the user to get a more detailed look at the simulation. Only is returned if getDetails is True.
         """
-        for i in range(1, self.days+1):
-            # S to E transmission
-            transferSE = self._StoE(i)
-            transferSV = set()
-            # if the vaccination rollout is ongoing 
-            if i > self.timeDelay:
-                transferSV = self._StoV()
-            # do L first because of how the conditional probabilities are defined
-            transferEL = self._EtoL()
-            transferEI = self._EtoI()
-            transferLICU = self._LtoICU()
-            # do R first because of how the conditional probabilities are defined
-            transferICUR = self._ICUtoR()
-            transferICUD = self._ICUtoD()
-            # do R first because of how conditional probabilities work
-            transferIR = self._ItoR()
-            transferID = self._ItoD()
-            # R to S
-            transferRS = self._RtoS()
-
-            # run the state changes of the people in the sets
-            self._stateChanger(transferSE, self.Ecollect, "E", i)
-            self._stateChanger(transferEL, self.Lcollect, "L", i)
-            self._stateChanger(transferEI, self.Icollect, "I", i)
-            self._stateChanger(transferLICU, self.ICUcollect, "ICU", i)
-            self._stateChanger(transferICUR, self.Rcollect, "R", i)
-            self._stateChanger(transferICUD, self.Dcollect, "D", i)
-            self._stateChanger(transferIR, self.Rcollect, "R", i)
-            self._stateChanger(transferID, self.Dcollect, "D", i)
-            self._stateChanger(transferRS, self.Scollect, "S", i)
-            self._stateChanger(transferSV, self.Vcollect, 'V', i)
-            # adjust the numpy arrays
-            self.S[i] = self.S[i-1] + len(transferRS) - len(transferSE) - len(transferSV)
-            self.E[i] = self.E[i-1] + len(transferSE) - len(transferEL) - len(transferEI)
-            self.I[i] = self.I[i-1] + len(transferEI) - len(transferIR) - len(transferID)
-            self.L[i] = self.L[i-1] + len(transferEL) - len(transferLICU)
-            self.ICU[i] = self.ICU[i-1] + len(transferLICU) - len(transferICUD) - len(transferICUR)
-            self.R[i] = self.R[i-1] + len(transferICUR) - len(transferRS) + len(transferIR)
-            self.D[i] = self.D[i-1] + len(transferID) + len(transferICUD)
-            self.V[i] = self.V[i-1] + len(transferSV)
-            self.infectious[i] = self.I[i] + self.L[i]
+        # run the days that haven't been run yet
+        self._advance(self.days)
         
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        # S to E transmission
+        transferSE = self._StoE(i)
+        transferSV = set()
+        # if the vaccination rollout is ongoing 
+        if i > self.timeDelay:
+            transferSV = self._StoV()
+        # do L first because of how the conditional probabilities are defined
+        transferEL = self._EtoL()
+        transferEI = self._EtoI()
+        transferLICU = self._LtoICU()
+        # do R first because of how the conditional probabilities are defined
+        transferICUR = self._ICUtoR()
+        transferICUD = self._ICUtoD()
+        # do R first because of how conditional probabilities work
+        transferIR = self._ItoR()
+        transferID = self._ItoD()
+        # R to S
+        transferRS = self._RtoS()
+
+        # run the state changes of the people in the sets
+        self._stateChanger(transferSE, self.Ecollect, "E", i)
+        self._stateChanger(transferEL, self.Lcollect, "L", i)
+        self._stateChanger(transferEI, self.Icollect, "I", i)
+        self._stateChanger(transferLICU, self.ICUcollect, "ICU", i)
+        self._stateChanger(transferICUR, self.Rcollect, "R", i)
+        self._stateChanger(transferICUD, self.Dcollect, "D", i)
+        self._stateChanger(transferIR, self.Rcollect, "R", i)
+        self._stateChanger(transferID, self.Dcollect, "D", i)
+        self._stateChanger(transferRS, self.Scollect, "S", i)
+        self._stateChanger(transferSV, self.Vcollect, 'V', i)
+        # adjust the numpy arrays
+        self.S[i] = self.S[i-1] + len(transferRS) - len(transferSE) - len(transferSV)
+        self.E[i] = self.E[i-1] + len(transferSE) - len(transferEL) - len(transferEI)
+        self.I[i] = self.I[i-1] + len(transferEI) - len(transferIR) - len(transferID)
+        self.L[i] = self.L[i-1] + len(transferEL) - len(transferLICU)
+        self.ICU[i] = self.ICU[i-1] + len(transferLICU) - len(transferICUD) - len(transferICUR)
+        self.R[i] = self.R[i-1] + len(transferICUR) - len(transferRS) + len(transferIR)
+        self.D[i] = self.D[i-1] + len(transferID) + len(transferICUD)
+        self.V[i] = self.V[i-1] + len(transferSV)
+        self.infectious[i] = self.I[i] + self.L[i]
         
     def toDataFrame(self):
         """
@@ -418,6 +364,7 @@ class Hub_ICUV(Hub):
         pd.DataFrame:
             Contains the data on number of people in each state and the days it occured.
         """
+        import pandas as pd
         t = np.linspace(0, self.days, self.days+1)
         arr = np.stack([t, self.S, self.E, self.I, self.L, self.infectious, self.ICU, self.R, self.D, self.V], axis=1)
         df = pd.DataFrame(arr, columns=["Days", "Susceptible", "Exposed", "Infectious", "Lag", "Total Infectious", "ICU", "Recovered", "Dead", "Vaccinated"])
@@ -425,6 +372,7 @@ class Hub_ICUV(Hub):
     
     def plot(self):
         """ Plots the number of people in each compartment except for L and I, as those are plotted as "infectious". """
+        from matplotlib import pyplot as plt
         t= np.linspace(0, self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5, ax6, ax7) = plt.subplots(nrows=7, sharex='all')
         ax1.set_ylabel("# Susceptibles")
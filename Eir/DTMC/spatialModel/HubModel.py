@@ -1,6 +1,11 @@
+import numpy as np
+
 from .spatial import Spatial
+from .cellList import CellList
+from . import kernels
 from Eir.utility import Person
 import Eir.utility as u
+import Eir.exceptions as e
 
 # class that operates under the hub model assumptions
 class Hub(Spatial):
@@ -32,11 +37,42 @@ class Hub(Spatial):
     hubConstant: float optional
         The constant used when expanding the spreading radius of a super spreader. 
 
+    engine: str optional
+        How the infection step searches for susceptibles. "loop" checks every infectious/susceptible pair. "grid"
+        puts everyone in a uniform grid whose cells are as big as the largest spreading radius, and only checks the
+        susceptibles in the cells around each infectious person. "vectorized" computes the distances, probabilities
+        and random draws from each infectious person to all current susceptibles as NumPy array operations.
+        "compiled" runs the whole infection step as compiled code when numba is installed, and as the
+        "vectorized" array operations when it isn't. All of them give the same results for the same seed. Default
+        is "loop".
+
+    rng: optional
+        What the random numbers of the simulation are drawn from. None uses the global np.random state, an int or
+        SeedSequence seeds a new np.random.Generator (PCG64), and a Generator is used as is. Default is None.
+
+    record: str optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     """
+    # the engines that can be used in the infection step
+    engines = ("loop", "grid", "vectorized", "compiled")
+    # Strong Infectious models set this to True: super spreaders infect with constant probability w0
+    # inside the normal spreading radius instead of having a larger radius
+    strongInfectious = False
+
     def __init__(self, popsize: int, pss: float, rstart: float, alpha: int, side: float, S0: int, I0: int, days: int, w0=1.0,
-                 hubConstant=6 ** 0.5):
-        super(Hub, self).__init__(popsize, pss, rstart, alpha, side, S0=S0, I0=I0, days=days, w0=w0)
+                 hubConstant=6 ** 0.5, engine="loop", rng=None, record="trajectories"):
+        super(Hub, self).__init__(popsize, pss, rstart, alpha, side, S0=S0, I0=I0, days=days, w0=w0, rng=rng)
         self.hubConstant = hubConstant
+        self.engineCheck(engine)
+        self.engine = engine
+        # how much of the simulation the subclasses keep in their Simul_Details
+        self.record = record
+        # the grid is built lazily the first time it is needed, once the population exists
+        self._grid = None
 
     def _infect(self, inf: Person, sus: Person):
         """
@@ -74,8 +110,183 @@ class Hub(Spatial):
             # use the formula: w(r) = w0 * (1-r/rn)^alpha
             return self.w0 * (1 - r / r0) ** self.alpha
         
-    def _changeHelp(self, collect:list, prob: float):
-        return u.static_prob_help(collect, prob)
+    def _infectArray(self, inf: Person, r):
+        """
+        Vectorized version of _infect. Generates the infection probabilities of infectious person inf for
+        susceptibles at the distances r.
+
+        Parameters
+        ----------
+
+        inf: Person
+            The infectious person.
+
+        r: ndarray
+            The distances between inf and the susceptibles.
+
+        Returns
+        -------
+
+        ndarray
+            The probabilities that inf infects each of the susceptibles.
+        """
+        r0 = self.rstart
+        # the hub model assumes super spreaders reach further
+        if inf.ss and not self.strongInfectious:
+            r0 *= self.hubConstant
+        w = np.zeros(len(r))
+        inRange = r <= r0
+        if inf.ss and self.strongInfectious:
+            # the strong infectious model assumes super spreaders have a constant probability in range
+            w[inRange] = self.w0
+        else:
+            # use the formula: w(r) = w0 * (1-r/r0)^alpha
+            w[inRange] = self.w0 * (1 - r[inRange] / r0) ** self.alpha
+        return w
+
+    def _spreadRadius(self):
+        """Returns the largest distance over which an infectious person can infect someone."""
+        if self.pss > 0 and not self.strongInfectious:
+            return self.rstart * max(1.0, self.hubConstant)
+        return self.rstart
+
+    def _getPositions(self, collect):
+        """Returns the arrays of the x and y coordinates of everyone in the population that collect is a view of."""
+        return collect.population.x, collect.population.y
+
+    def _candidates(self, inf: Person, susCollect):
+        """
+        Returns the indices of the susceptibles that inf could possibly infect, in increasing order.
+
+        Parameters
+        ----------
+
+        inf: Person
+            The infectious person.
+
+        susCollect: Collect
+            The view of the susceptible compartment.
+        """
+        if self.engine == "loop":
+            return susCollect.members().tolist()
+        if self._grid is None:
+            # static models never move, so the grid only has to be built once
+            xs, ys = self._getPositions(susCollect)
+            self._grid = CellList(xs, ys, self._spreadRadius(), self.side)
+        near = self._grid.query(inf.x, inf.y)
+        # only keep the people that are still susceptible
+        return near[susCollect.mask()[near]].tolist()
+
+    def _transmission(self, day: int, infCollects: list, susCollect: list):
+        """
+        Runs the infection step: every infectious person gets a chance to infect every susceptible within their
+        spreading radius. Susceptibles that get infected are removed from susCollect right away.
+
+        Parameters
+        ----------
+
+        day: int
+            The day that the infections are happening on. Used for the transmissions in Simul_Details.
+
+        infCollects: list
+            The views of the compartments whose people can spread the disease, such as Icollect.
+
+        susCollect: Collect
+            The view of the susceptible compartment.
+
+        Returns
+        -------
+
+        set:
+            The indices of the people who got infected.
+        """
+        if self.engine == "vectorized":
+            return self._transmissionVectorized(day, infCollects, susCollect)
+        if self.engine == "compiled":
+            return self._transmissionCompiled(day, infCollects, susCollect)
+        transfers = set()
+        for infCollect in infCollects:
+            for count in infCollect.members().tolist():
+                inf = infCollect[count]
+                for count2 in self._candidates(inf, susCollect):
+                    sus = susCollect[count2]
+                    # generate the probability of infection
+                    prob = self._infect(inf, sus)
+                    # generate a random event based on the P(infection)
+                    if not u.randEvent(prob, self.rng):
+                        continue
+                    # remove the person from the susceptible state
+                    sus.isIncluded = False
+                    self.details.addTransmission(day, count, count2)
+                    transfers.add(count2)
+        return transfers
+
+    def _transmissionVectorized(self, day: int, infCollects: list, susCollect: list):
+        """
+        Same as _transmission, except that for each infectious person the distances, infection probabilities and
+        random events for every current susceptible are generated at once with NumPy. Only susceptibles with a
+        nonzero probability get a random number, in increasing order, which is what randEvent does in the loop.
+        """
+        xs, ys = self._getPositions(susCollect)
+        # indices of everyone currently in the susceptible compartment
+        sus = susCollect.members()
+        transfers = set()
+        for infCollect in infCollects:
+            for count in infCollect.members().tolist():
+                inf = infCollect[count]
+                if len(sus) == 0:
+                    return transfers
+                # distances from the infectious person to all the susceptibles
+                r = ((xs[sus] - inf.x) ** 2 + (ys[sus] - inf.y) ** 2) ** 0.5
+                w = self._infectArray(inf, r)
+                inRange = w > 0
+                candidates, w = sus[inRange], w[inRange]
+                if len(candidates) == 0:
+                    continue
+                # one random number per susceptible in range
+                infected = candidates[self.rng.random(len(candidates)) < w]
+                if len(infected) == 0:
+                    continue
+                # remove the people from the susceptible state
+                susCollect.exclude(infected)
+                for count2 in infected.tolist():
+                    self.details.addTransmission(day, count, count2)
+                    transfers.add(count2)
+                # the newly infected can't be infected again by the next infectious person
+                sus = sus[~np.isin(sus, infected)]
+        return transfers
+
+    def _transmissionCompiled(self, day: int, infCollects: list, susCollect: list):
+        """
+        Same as _transmission, except that the distances, infection probabilities and random events of every
+        infectious/susceptible pair are handled by kernels.infections, in one call for the whole step.
+        """
+        pop = susCollect.population
+        # the infectious people in the order the loop goes through them
+        infectors = np.concatenate([infCollect.members() for infCollect in infCollects])
+        ss = pop.ss[infectors].astype(bool)
+        radius = np.full(len(infectors), float(self.rstart))
+        if not self.strongInfectious:
+            # the hub model assumes super spreaders reach further
+            radius[ss] *= self.hubConstant
+        # the strong infectious model assumes super spreaders have a constant probability in range
+        constant = ss & self.strongInfectious
+        susceptible = susCollect.mask()
+        src, dst = kernels.infections(pop.x, pop.y, infectors, radius, constant, susceptible, self.w0, self.alpha,
+                                      self.rng)
+        # remove the people from the susceptible state
+        susCollect.exclude(dst)
+        for count, count2 in zip(src.tolist(), dst.tolist()):
+            self.details.addTransmission(day, count, count2)
+        return set(dst.tolist())
+
+    def engineCheck(self, engine: str):
+        """Makes sure that the engine is one the model supports."""
+        if engine not in self.engines:
+            raise e.EngineException(engine, self.engines)
+
+    def _changeHelp(self, collect, prob: float):
+        return u.static_prob_help(collect, prob, self.rng)
 
     # used to run the state changes
     def _stateChanger(self, values: set, collect: list, symbol: str, day:int):
@@ -85,11 +296,11 @@ class Hub(Spatial):
         Parameters
         ----------
 
-        values: set
-            values contains all of the indices of the people who need to be set to isIncluded=True in the collect list
+        values: set or ndarray
+            values contains all of the indices of the people who need to be put in the compartment of collect
         
-        collect: list
-            The particular list of Person objects that are going to be modified.
+        collect: Collect
+            The view of the compartment the people are going to.
         
         symbol: str 
             The string representing the particular state that is going to. Used for details.
@@ -97,7 +308,7 @@ class Hub(Spatial):
         day: int
             The day on which the transfer happened. Used for details.
         """
-        for index in values:
-            #print("Index: ", index)
-            collect[index].isIncluded = True
-            self.details.addStateChange(index, symbol, day)
\ No newline at end of file
+        # put everyone in the compartment at once
+        indices = np.fromiter(values, dtype=np.int64, count=len(values))
+        collect.include(indices)
+        self.details.addStateChanges(indices, symbol, day)
\ No newline at end of file
@@ -1,13 +1,10 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from math import cos, sin, pi
+from math import pi
 
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 from Eir.DTMC.spatialModel.randomMovement.randMove import RandMove
-import Eir.exceptions as e
-from Eir.utility import Person2 as Person
-from Eir.utility import randEvent, dist
+from Eir.DTMC.spatialModel.population import Population
+from Eir.utility import randEvent
 
 class PeriodicICUV(RandMove):
     """
@@ -91,11 +88,24 @@ class PeriodicICUV(RandMove):
         std: float optional
             Default is pi/2. The standard deviation which is used for the distribution of thetas when movement occurs.
 
+        legacyOrbit: bool optional
+            Default is True. Earlier versions advanced the angle of each person twice a day, which is kept by default so seeded simulations give the same results.
+            If False, the angle is advanced once a day by the draw from the theta distribution.
+
+        engine: str optional
+            How the infection step finds the susceptibles near each infectious person. One of "loop" or "grid". Default is "loop".
+
+        rng: optional
+            What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+        record: str, optional
+            How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people each person infected, "events" also keeps every transmission and state change, and "trajectories" also keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't keep. Default is "trajectories".
+
         Attributes
         ----------
 
-        Scollect, Ecollect, Icollect, Lcollect, ICUcollect, Rcollect, Dcollect, Vcollect: list
-            Lists that contains copies of the Person objects and are used to determine what state each Person is currently in.
+        Scollect, Ecollect, Icollect, Lcollect, ICUcollect, Rcollect, Dcollect, Vcollect: Collect
+            Views of the population that are used to determine what state each Person is currently in.
         
         S, E, I, L, ICU, R, D, V, infectious: ndarray
             Numpy arrays that contain the total number of people in each state on each given day. Infectious people are classified as those in compartment I + those in compartments L.
@@ -107,10 +117,13 @@ class PeriodicICUV(RandMove):
         toDataFrame(): method
             After running the 'run' method, toDataFrame will convert the numpy arrays to a pandas DataFrame and return it.
     """
-
+    # _StoE draws a second random number for every infection, which the compiled infection step doesn't do
+    engines = ("loop", "grid")
+    # the infectious array adds up I and L, so it stays the same once they do
+    sums = ("infectious",)
     
     def __init__(self, S0:int, E0:int, I0:int, R0:int, V0:int, rho: float, ioda: float,  gamma: float, mu: float, phi: float, chi: float, omega: float, kappa: float, eta: float, move_R: float, sigma_R: float, spread_r: float, 
-        sigma_r: float, side: float, days: int, alpha=2.3, w0=1.0, timeDelay=-1, k=5, std=pi/2):
+        sigma_r: float, side: float, days: int, alpha=2.3, w0=1.0, timeDelay=-1, k=5, std=pi/2, legacyOrbit=True, engine="loop", rng=None, record="trajectories"):
         # error checks
         
         self.intCheck([S0, E0, I0, R0, V0, days])
@@ -120,7 +133,9 @@ class PeriodicICUV(RandMove):
         # map the mean period factor and std dev
         self.k=k; self.std = std
         # call super constructor
-        super().__init__(planeSize=side, move_r=move_R, spread_r=spread_r, w0=w0)
+        super().__init__(planeSize=side, move_r=move_R, spread_r=spread_r, w0=w0, engine=engine, rng=rng, record=record)
+        # whether the angle is advanced twice a day like earlier versions did
+        self.legacyOrbit = legacyOrbit
         # initialize class varaibles and arrays
         self.days = days
         self.S, self.E, self.I, self.L, self.ICU, self.R, self.D, self.V = np.zeros(days+1), np.zeros(days+1), np.zeros(days+1), np.zeros(days+1), np.zeros(days+1), np.zeros(days+1), np.zeros(days+1), np.zeros(days+1)
@@ -128,16 +143,7 @@ class PeriodicICUV(RandMove):
         self.infectious = np.zeros(self.days+1)
         self.timeDelay = timeDelay
         self.popsize = S0 + E0 + I0 + R0 + V0
-        self.details = Simul_Details(days=self.days, popsize=self.popsize)
-        # create the data structures
-        self.Scollect = []
-        self.Ecollect = []
-        self.Icollect = []
-        self.Lcollect = []
-        self.ICUcollect = []
-        self.Rcollect = []
-        self.Dcollect = []
-        self.Vcollect = []
+        self.details = Simul_Details(days=self.days, popsize=self.popsize, level=record)
         # reinitialize the probabilites
         self.rho = rho
         self.ioda = ioda
@@ -149,38 +155,25 @@ class PeriodicICUV(RandMove):
         self.eta = eta
         self.gamma = gamma
         # generate random locaitons in the plane
-        locx, locy= np.random.random(self.popsize) * side, np.random.random(self.popsize) * side
-        spreading_r = np.random.normal(spread_r, sigma_r, self.popsize)
-        mvnt = np.random.normal(move_R, sigma_R, self.popsize)
-        theta = np.random.normal(2*pi/k, std, self.popsize)
+        locx, locy= self.rng.random(self.popsize) * side, self.rng.random(self.popsize) * side
+        spreading_r = self.rng.normal(spread_r, sigma_r, self.popsize)
+        mvnt = self.rng.normal(move_R, sigma_R, self.popsize)
+        theta = self.rng.normal(2*pi/k, std, self.popsize)
+        # everyone is stored once in the population instead of once per compartment; the collects are views of it
+        symbols = ["S", "E", "I", "L", "ICU", "R", "D", "V"]
+        self.population = Population(symbols, [S0, E0, I0, 0, 0, self.popsize - S0 - E0 - I0, 0, 0], locx, locy, r0=spreading_r, R=mvnt, theta=theta)
+        self.Scollect, self.Ecollect, self.Icollect, self.Lcollect, self.ICUcollect, self.Rcollect, self.Dcollect, self.Vcollect = self.population.collects(symbols)
         for i in range(self.popsize):
-            # person objects are stored in order [S, E, I, L, ICU, R, D, V]
-            person = []
-            for j in range(8):
-                p = Person(locx[i], locy[i], mvnt[i], spreading_r[i], theta[i])
-                person.append(p)
-                self.details.addLocation(0, (p.x, p.y))
             if i < S0:
-                person[0].isIncluded=True
                 self.details.addStateChange(i, "S", 0)
             elif i < S0 + E0:
-                person[1].isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             elif i < S0 + E0 + I0:
-                person[2].isIncluded=True
                 self.details.addStateChange(i, "I", 0)
             else:
-                person[5].isIncluded=True
                 self.details.addStateChange(i, "R", 0)
-            # add the Person objects to the collections
-            self.Scollect.append(person[0])
-            self.Ecollect.append(person[1])
-            self.Icollect.append(person[2])
-            self.Lcollect.append(person[3])
-            self.ICUcollect.append(person[4])
-            self.Rcollect.append(person[5])
-            self.Dcollect.append(person[6])
-            self.Vcollect.append(person[7])
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
     
     def _StoE(self, day: int):
@@ -201,28 +194,26 @@ class PeriodicICUV(RandMove):
         """
        # cycle through all of the person objects in Icollect and Scollect and determine who goes to E
         transferStoE = set()
-        for i, inf in enumerate(self.Icollect):
-            if inf.isIncluded == False:
-                continue
-            for j, sus in enumerate(self.Scollect):
-                if sus.isIncluded==False:
-                    continue
+        # people have moved since the last infection step
+        self._buildGrid(self.Scollect)
+        for i in self.Icollect.members().tolist():
+            inf = self.Icollect[i]
+            for j in self._candidates(inf, self.Scollect):
+                sus = self.Scollect[j]
                 w = self._infect(inf, sus)
-                event = randEvent(w)
+                event = randEvent(w, self.rng)
                 if not event:
                     continue
                 self.Scollect[j].isIncluded = False
                 self.details.addTransmission(day, i, j)
                 transferStoE.add(j)
         # same loop for L compartment, as they can also propogate the disease
-        for i, inf in enumerate(self.Lcollect):
-            if inf.isIncluded == False:
-                continue
-            for j, sus in enumerate(self.Scollect):
-                if sus.isIncluded==False:
-                    continue
+        for i in self.Lcollect.members().tolist():
+            inf = self.Lcollect[i]
+            for j in self._candidates(inf, self.Scollect):
+                sus = self.Scollect[j]
                 w = self._infect(inf, sus)
-                event = randEvent(w)
+                event = randEvent(w, self.rng)
                 if not event:
                     continue
                 self.Scollect[j].isIncluded = False
@@ -237,7 +228,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
 
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         
@@ -250,7 +241,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Ecollect, self.rho * (1-self.ioda))
@@ -262,7 +253,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Lcollect, self.phi)
@@ -274,7 +265,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.ICUcollect, self.chi)
@@ -286,7 +277,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.ICUcollect, self.omega)
@@ -298,7 +289,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Icollect, self.gamma)
@@ -310,7 +301,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Icollect, self.mu)
@@ -322,7 +313,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Rcollect, self.kappa)
@@ -334,7 +325,7 @@ class PeriodicICUV(RandMove):
         Returns
         -------
         
-        set:
+        ndarray:
             Contains the people who need to switch states.
         """
         return self._changeHelp(self.Scollect, self.eta)
@@ -353,22 +344,13 @@ class PeriodicICUV(RandMove):
             Contains all of the collection data structures that will be cycled through for the moves. This allows for easy object-oriented design.
         """
         # generate the random thetas from a normal distribution
-        thetas = np.random.normal(2*pi/self.k, self.std, self.popsize)
+        thetas = self.rng.normal(2*pi/self.k, self.std, self.popsize)
 
-        for index, person in enumerate(collects[0]):
-            # adjust the theta current theta values in the object
-            collects[0][index].theta += thetas[index]
-            # adjust the x,y coordinate using polar coordinates
-            # conduct the boundary check at the same time
-            x = self._boundaryCheck(person.h + person.R * cos(collects[0][index].theta))
-            y = self._boundaryCheck(person.k + person.R * sin(collects[0][index].theta))
-            # add the new location to the Simul_Details object
-            self.details.addLocation(day, (x,y))
-            # change the x, y coordinates of every copy of person index in the other collections
-            for j, collect in enumerate(collects):
-                collects[j][index].x = x
-                collects[j][index].y = y
-                collects[j][index].theta += thetas[index]
+        # every collect is a view of the same population, so everyone is moved at once
+        pop = collects[0].population
+        x, y = pop.orbit(thetas[:pop.popsize], self.planeSize, advances=2 if self.legacyOrbit else 1)
+        # add the day's locations to the Simul_Details object
+        self.details.addLocations(day, x, y)
     
     def run(self, getDetails=True):
         """
@@ -386,52 +368,56 @@ class PeriodicICUV(RandMove):
         Simul_Details:
             Allows the user to get a more detailed look at the simulation. Only is returned if getDetails is True.
         """
-        for i in range(1, self.days+1):
-            # S to E transmission
-            transferSE = self._StoE(i)
-            transferSV = set()
-            # if the vaccination rollout is ongoing 
-            if i > self.timeDelay:
-                transferSV = self._StoV()
-            # do L first because of how the conditional probabilities are defined
-            transferEL = self._EtoL()
-            transferEI = self._EtoI()
-            transferLICU = self._LtoICU()
-            # do R first because of how the conditional probabilities are defined
-            transferICUR = self._ICUtoR()
-            transferICUD = self._ICUtoD()
-            # do R first because of how conditional probabilities work
-            transferIR = self._ItoR()
-            transferID = self._ItoD()
-            # R to S
-            transferRS = self._RtoS()
-
-            # run the state changes of the people in the sets
-            self._stateChanger(transferSE, self.Ecollect, "E", i)
-            self._stateChanger(transferEL, self.Lcollect, "L", i)
-            self._stateChanger(transferEI, self.Icollect, "I", i)
-            self._stateChanger(transferLICU, self.ICUcollect, "ICU", i)
-            self._stateChanger(transferICUR, self.Rcollect, "R", i)
-            self._stateChanger(transferICUD, self.Dcollect, "D", i)
-            self._stateChanger(transferIR, self.Rcollect, "R", i)
-            self._stateChanger(transferID, self.Dcollect, "D", i)
-            self._stateChanger(transferRS, self.Scollect, "S", i)
-            self._stateChanger(transferSV, self.Vcollect, 'V', i)
-            # adjust the numpy arrays
-            self.S[i] = self.S[i-1] + len(transferRS) - len(transferSE) - len(transferSV)
-            self.E[i] = self.E[i-1] + len(transferSE) - len(transferEL) - len(transferEI)
-            self.I[i] = self.I[i-1] + len(transferEI) - len(transferIR) - len(transferID)
-            self.L[i] = self.L[i-1] + len(transferEL) - len(transferLICU)
-            self.ICU[i] = self.ICU[i-1] + len(transferLICU) - len(transferICUD) - len(transferICUR)
-            self.R[i] = self.R[i-1] + len(transferICUR) - len(transferRS) + len(transferIR)
-            self.D[i] = self.D[i-1] + len(transferID) + len(transferICUD)
-            self.V[i] = self.V[i-1] + len(transferSV)
-            self.infectious[i] = self.I[i] + self.L[i]
-
-            self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Lcollect, self.ICUcollect, self.Rcollect, self.Dcollect, self.Vcollect])
+        # run the days that haven't been run yet
+        self._advance(self.days)
         
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        # S to E transmission
+        transferSE = self._StoE(i)
+        transferSV = set()
+        # if the vaccination rollout is ongoing 
+        if i > self.timeDelay:
+            transferSV = self._StoV()
+        # do L first because of how the conditional probabilities are defined
+        transferEL = self._EtoL()
+        transferEI = self._EtoI()
+        transferLICU = self._LtoICU()
+        # do R first because of how the conditional probabilities are defined
+        transferICUR = self._ICUtoR()
+        transferICUD = self._ICUtoD()
+        # do R first because of how conditional probabilities work
+        transferIR = self._ItoR()
+        transferID = self._ItoD()
+        # R to S
+        transferRS = self._RtoS()
+
+        # run the state changes of the people in the sets
+        self._stateChanger(transferSE, self.Ecollect, "E", i)
+        self._stateChanger(transferEL, self.Lcollect, "L", i)
+        self._stateChanger(transferEI, self.Icollect, "I", i)
+        self._stateChanger(transferLICU, self.ICUcollect, "ICU", i)
+        self._stateChanger(transferICUR, self.Rcollect, "R", i)
+        self._stateChanger(transferICUD, self.Dcollect, "D", i)
+        self._stateChanger(transferIR, self.Rcollect, "R", i)
+        self._stateChanger(transferID, self.Dcollect, "D", i)
+        self._stateChanger(transferRS, self.Scollect, "S", i)
+        self._stateChanger(transferSV, self.Vcollect, 'V', i)
+        # adjust the numpy arrays
+        self.S[i] = self.S[i-1] + len(transferRS) - len(transferSE) - len(transferSV)
+        self.E[i] = self.E[i-1] + len(transferSE) - len(transferEL) - len(transferEI)
+        self.I[i] = self.I[i-1] + len(transferEI) - len(transferIR) - len(transferID)
+        self.L[i] = self.L[i-1] + len(transferEL) - len(transferLICU)
+        self.ICU[i] = self.ICU[i-1] + len(transferLICU) - len(transferICUD) - len(transferICUR)
+        self.R[i] = self.R[i-1] + len(transferICUR) - len(transferRS) + len(transferIR)
+        self.D[i] = self.D[i-1] + len(transferID) + len(transferICUD)
+        self.V[i] = self.V[i-1] + len(transferSV)
+        self.infectious[i] = self.I[i] + self.L[i]
+
+        self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Lcollect, self.ICUcollect, self.Rcollect, self.Dcollect, self.Vcollect])
         
     def toDataFrame(self):
         """
@@ -443,6 +429,7 @@ class PeriodicICUV(RandMove):
         pd.DataFrame:
             Contains the data on number of people in each state and the days it occured.
         """
+        import pandas as pd
         t = np.linspace(0, self.days, self.days+1)
         arr = np.stack([t, self.S, self.E, self.I, self.L, self.infectious, self.ICU, self.R, self.D, self.V], axis=1)
         df = pd.DataFrame(arr, columns=["Days", "Susceptible", "Exposed", "Infectious", "Lag", "Total Infectious", "ICU", "Recovered", "Dead", "Vaccinated"])
@@ -450,6 +437,7 @@ class PeriodicICUV(RandMove):
     
     def plot(self):
         """ Plots the number of people in each compartment except for L and I, as those are plotted as "infectious". """
+        from matplotlib import pyplot as plt
         t= np.linspace(0, self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5, ax6, ax7) = plt.subplots(nrows=7, sharex='all')
         ax1.set_ylabel("# Susceptibles")
@@ -1,54 +1,47 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from math import pi, cos, sin
+from math import pi
 
 
 from ..randomMovement.randMoveSEIRD import RandMoveSEIRD
-from Eir.utility import Person2 as Person
-from Eir.utility import dist, randEvent
+from Eir.DTMC.spatialModel.population import Population
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
 class PeriodicSEIRD(RandMoveSEIRD):
 
     def __init__(self, S0:int, E0:int, I0:int, R0:int, rho: float, gamma: float, mu: float, planeSize: float, move_r: float, sigma_R: float, 
-        spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, k=5, std=pi/2):
+        spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, k=5, std=pi/2, legacyOrbit=True, engine="loop", rng=None, record="trajectories"):
         self.floatCheck(k, std)
         self.negValCheck(k, std)
         super().__init__(S0=S0, E0=E0, I0=I0, R0=0, rho=rho, gamma=gamma, mu=mu, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,
-        days=days, w0=w0, alpha=alpha)
+        days=days, w0=w0, alpha=alpha, engine=engine, rng=rng, record=record)
+        # whether the angle is advanced twice a day like earlier versions did
+        self.legacyOrbit = legacyOrbit
         # map them to class variables
         self.k, self.std = k, std   
 
         #create a new Simul_Details object
-        self.details = Simul_Details(self.days, self.popsize)
+        self.details = Simul_Details(self.days, self.popsize, level=record)
 
         # create data structures
-        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Dcollect = [], [], [], [], []
         self.D = np.zeros(days+1)
-        loc_x, loc_y, spreading_r, movement_r = np.random.random(self.popsize)*planeSize, np.random.random(self.popsize)*planeSize, np.random.normal(spread_r, sigma_r, self.popsize), np.random.normal(move_r, sigma_r, self.popsize)
+        loc_x, loc_y, spreading_r, movement_r = self.rng.random(self.popsize)*planeSize, self.rng.random(self.popsize)*planeSize, self.rng.normal(spread_r, sigma_r, self.popsize), self.rng.normal(move_r, sigma_r, self.popsize)
         # initialize the population
+        # starting angle of everyone on their circle of motion
+        theta = self.rng.normal(2*pi/k, std, self.popsize)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SEIRD", [S0, E0, I0, self.popsize - S0 - E0 - I0, 0], loc_x, loc_y, r0=spreading_r, R=movement_r, theta=theta)
+        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Dcollect = self.population.collects("SEIRD")
         for i in range(self.popsize):
-            theta = np.random.normal(2*pi/k, std)
-            p1, p2, p3, p4, p5 = Person(loc_x[i], loc_y[i], movement_r[i], spreading_r[i], theta=theta), Person(loc_x[i], loc_y[i], movement_r[i], spreading_r[i], theta=theta), Person(loc_x[i], loc_y[i], movement_r[i], spreading_r[i], theta=theta), Person(loc_x[i], loc_y[i], movement_r[i], spreading_r[i], theta=theta), Person(loc_x[i], loc_y[i], movement_r[i], spreading_r[i], theta=theta)
             if i < S0:
-                p1.isIncluded=True
                 self.details.addStateChange(i, "S", 0)
             elif i < S0+E0:
-                p2.isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             elif i < S0+E0+I0:
                 self.details.addStateChange(i, "I", 0)
-                p3.isIncluded=True
             else:
                 self.details.addStateChange(i, "R", 0)
-                p4.isIncluded=True
-            self.Scollect.append(p1)
-            self.Ecollect.append(p2)
-            self.Icollect.append(p3)
-            self.Rcollect.append(p4)
-            self.Dcollect.append(p5)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
     # eventually do it for every person in each collection array; will be implemented in the sublcasses
     def _move(self, day: int, collects: list):
@@ -64,25 +57,17 @@ class PeriodicSEIRD(RandMoveSEIRD):
             Contains all of the collection data structures that will be cycled through for the moves. This allows for easy object-oriented design.
         """
         # generate the random thetas from a normal distribution
-        thetas = np.random.normal(2*pi/self.k, self.std, self.popsize)
+        thetas = self.rng.normal(2*pi/self.k, self.std, self.popsize)
 
-        for index, person in enumerate(collects[0]):
-            # adjust the theta current theta values in the object
-            collects[0][index].theta += thetas[index]
-            # adjust the x,y coordinate using polar coordinates
-            # conduct the boundary check at the same time
-            x = self._boundaryCheck(person.h + person.R * cos(collects[0][index].theta))
-            y = self._boundaryCheck(person.k + person.R * sin(collects[0][index].theta))
-            # add the new location to the Simul_Details object
-            self.details.addLocation(day, (x,y))
-            # change the x, y coordinates of every copy of person index in the other collections
-            for j, collect in enumerate(collects):
-                collects[j][index].x = x
-                collects[j][index].y = y
-                collects[j][index].theta += thetas[index]
+        # every collect is a view of the same population, so everyone is moved at once
+        pop = collects[0].population
+        x, y = pop.orbit(thetas[:pop.popsize], self.planeSize, advances=2 if self.legacyOrbit else 1)
+        # add the day's locations to the Simul_Details object
+        self.details.addLocations(day, x, y)
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, recovered, and dead individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
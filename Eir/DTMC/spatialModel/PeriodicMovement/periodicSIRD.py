@@ -1,60 +1,44 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from math import pi, cos, sin
+from math import pi
 
 from ..randomMovement.randMoveSIRD import RandMoveSIRD
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
-from Eir.utility import Person2 as Person
-from Eir.utility import randEvent, dist
+from Eir.DTMC.spatialModel.population import Population
 
 class PeriodicSIRD(RandMoveSIRD):
-    def __init__(self, S0:int, I0:int, R0:int, gamma:float, mu:float, planeSize:float, move_r:float, sigma_R:float, spread_r:float, sigma_r:float, days:int, w0=1.0, alpha=2.0, k=5, std=pi/2):
+    def __init__(self, S0:int, I0:int, R0:int, gamma:float, mu:float, planeSize:float, move_r:float, sigma_R:float, spread_r:float, sigma_r:float, days:int, w0=1.0, alpha=2.0, k=5, std=pi/2, legacyOrbit=True, engine="loop", rng=None, record="trajectories"):
         self.floatCheck(k, std)
         self.negValCheck(k, std)
 
-        super().__init__(S0, I0, R0, gamma, mu, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0=w0, alpha=alpha)
+        super().__init__(S0, I0, R0, gamma, mu, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0=w0, alpha=alpha, engine=engine, rng=rng, record=record)
+        # whether the angle is advanced twice a day like earlier versions did
+        self.legacyOrbit = legacyOrbit
 
         self.k = k
         self.std = std
 
-        self.details = Simul_Details(days=days, popsize=self.popsize)
-        self.Scollect, self.Icollect, self.Rcollect = [], [], []
-        self.Dcollect = []
-        spreading_r = np.random.normal(spread_r, sigma_r, self.popsize)
-        mvnt = np.random.normal(move_r, sigma_r, self.popsize)
+        self.details = Simul_Details(days=days, popsize=self.popsize, level=record)
+        spreading_r = self.rng.normal(spread_r, sigma_r, self.popsize)
+        mvnt = self.rng.normal(move_r, sigma_r, self.popsize)
         # generate the random x, y locations with every position within the plane being equally likely
-        loc_x = np.random.random(self.popsize) * planeSize
-        loc_y = np.random.random(self.popsize) * planeSize
+        loc_x = self.rng.random(self.popsize) * planeSize
+        loc_y = self.rng.random(self.popsize) * planeSize
 
-        # create the special objects:
+        # starting angle of everyone on their circle of motion
+        theta = self.rng.normal(2*pi/k, std, self.popsize)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SIRD", [S0, I0, R0, 0], loc_x, loc_y, r0=spreading_r, R=mvnt, theta=theta)
+        self.Scollect, self.Icollect, self.Rcollect, self.Dcollect = self.population.collects("SIRD")
         for i in range(self.popsize):
-            theta = np.random.normal(2*pi/k, std)
-            # create the person object
-            # for this model, the people will move with random radius R each timestep
-            # therefore, the R component can be made 0, as that is only relevant for the 
-            # periodic mobility model
-            p1 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta)
-            p2 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta) 
-            p3 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta)
-            p4 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta)
-            self.details.addLocation(0, (loc_x[i], loc_y[i]))       
-            # if the person is in the susceptible objects created
+            # record which compartment the person starts in
             if i < S0:
-                p1.isIncluded = True
                 self.details.addStateChange(i, "S", 0)
             elif S0 <= i < S0+I0:
-                p2.isIncluded = True
                 self.details.addStateChange(i, "I", 0)
             else:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "R", 0)
-            # append them to the data structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.Rcollect.append(p3)
-            self.Dcollect.append(p4)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
     def _move(self, day: int, collects: list):
         """
@@ -69,25 +53,17 @@ class PeriodicSIRD(RandMoveSIRD):
             Contains all of the collection data structures that will be cycled through for the moves. This allows for easy object-oriented design.
         """
         # generate the random thetas from a normal distribution
-        thetas = np.random.normal(2*pi/self.k, self.std, self.popsize)
+        thetas = self.rng.normal(2*pi/self.k, self.std, self.popsize)
 
-        for index, person in enumerate(collects[0]):
-            # adjust the theta current theta values in the object
-            collects[0][index].theta += thetas[index]
-            # adjust the x,y coordinate using polar coordinates
-            # conduct the boundary check at the same time
-            x = self._boundaryCheck(person.h + person.R * cos(collects[0][index].theta))
-            y = self._boundaryCheck(person.k + person.R * sin(collects[0][index].theta))
-            # add the new location to the Simul_Details object
-            self.details.addLocation(day, (x,y))
-            # change the x, y coordinates of every copy of person index in the other collections
-            for j, collect in enumerate(collects):
-                collects[j][index].x = x
-                collects[j][index].y = y
-                collects[j][index].theta += thetas[index]
+        # every collect is a view of the same population, so everyone is moved at once
+        pop = collects[0].population
+        x, y = pop.orbit(thetas[:pop.popsize], self.planeSize, advances=2 if self.legacyOrbit else 1)
+        # add the day's locations to the Simul_Details object
+        self.details.addLocations(day, x, y)
 
     def plot(self):
         "Plots the number of susceptible, infected, dead, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
@@ -1,62 +1,43 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from math import cos, sin, pi
+from math import pi
 
 from ..randomMovement.randMoveSIRDV import RandMoveSIRDV
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
-from Eir.utility import randEvent, dist
-from Eir.utility import Person2 as Person
+from Eir.DTMC.spatialModel.population import Population, startCounts
 
 class PeriodicSIRDV(RandMoveSIRDV):
 
-    def __init__(self, S0:int, I0:int, R0:int, V0:int, gamma:float, mu:float, eta:float, planeSize:float, move_r:float, sigma_R:float, spread_r:float, sigma_r:float, days:int, w0=1.0, alpha=2.0, timeDelay=-1, k=5, std=pi/2):
+    def __init__(self, S0:int, I0:int, R0:int, V0:int, gamma:float, mu:float, eta:float, planeSize:float, move_r:float, sigma_R:float, spread_r:float, sigma_r:float, days:int, w0=1.0, alpha=2.0, timeDelay=-1, k=5, std=pi/2, legacyOrbit=True, engine="loop", rng=None, record="trajectories"):
         self.floatCheck(k, std)
         self.negValCheck(k, std)
-        super().__init__(S0, I0, R0, V0, gamma, mu, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0=w0, alpha=alpha, timeDelay=timeDelay)
+        super().__init__(S0, I0, R0, V0, gamma, mu, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0=w0, alpha=alpha, timeDelay=timeDelay, engine=engine, rng=rng, record=record)
+        # whether the angle is advanced twice a day like earlier versions did
+        self.legacyOrbit = legacyOrbit
 
         self.k=k; self.std=std
-        self.details = Simul_Details(days, self.popsize)
-        self.Dcollect = []
-        self.Scollect, self.Icollect, self.Rcollect, self.Vcollect = [], [], [], []
-        spreading_r = np.random.normal(spread_r, sigma_r, S0+I0)
+        self.details = Simul_Details(days, self.popsize, level=record)
+        spreading_r = self.rng.normal(spread_r, sigma_r, S0+I0)
         # generate the random x, y locations with every position within the plane being equally likely
-        loc_x = np.random.random(S0+I0) * planeSize
-        loc_y = np.random.random(S0+I0) * planeSize
-        mvnt = np.random.normal(move_r, sigma_r, self.popsize)
-        # create the special objects:
+        loc_x = self.rng.random(S0+I0) * planeSize
+        loc_y = self.rng.random(S0+I0) * planeSize
+        mvnt = self.rng.normal(move_r, sigma_r, self.popsize)
+        # starting angle of everyone on their circle of motion
+        theta = self.rng.normal(2*pi/k, std, self.popsize)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SIRVD", startCounts([S0, I0, R0, None, 0], self.popsize), loc_x, loc_y, r0=spreading_r, R=mvnt, theta=theta)
+        self.Scollect, self.Icollect, self.Rcollect, self.Vcollect, self.Dcollect = self.population.collects("SIRVD")
         for i in range(self.popsize):
-            theta = np.random.normal(2*pi/k, std)
-            # create the person object
-            # for this model, the people will move with random radius R each timestep
-            # therefore, the R component can be made 0, as that is only relevant for the 
-            # periodic mobility model
-            p1 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta)
-            p2 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta) 
-            p3 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta)
-            p4 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta)
-            p5 = Person(loc_x[i], loc_y[i], mvnt[i], spreading_r[i], theta=theta)
-            self.details.addLocation(0, (loc_x[i], loc_y[i]))       
-            # if the person is in the susceptible objects created
+            # record which compartment the person starts in
             if i < S0:
-                p1.isIncluded = True
                 self.details.addStateChange(i, "S", 0)
             elif S0 <= i < S0+I0:
-                p2.isIncluded = True
                 self.details.addStateChange(i, "I", 0)
             elif i < S0 +I0 + R0:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "R", 0)
             else:
-                p4.isIncluded=True
                 self.details.addStateChange(i, "V", 0)
-            # append them to the data structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.Rcollect.append(p3)
-            self.Vcollect.append(p4)
-            self.Dcollect.append(p5)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
     def _move(self, day: int, collects: list):
         """
@@ -71,24 +52,16 @@ class PeriodicSIRDV(RandMoveSIRDV):
             Contains all of the collection data structures that will be cycled through for the moves. This allows for easy object-oriented design.
         """
         # generate the random thetas from a normal distribution
-        thetas = np.random.normal(2*pi/self.k, self.std, self.popsize)
+        thetas = self.rng.normal(2*pi/self.k, self.std, self.popsize)
 
-        for index, person in enumerate(collects[0]):
-            # adjust the theta current theta values in the object
-            collects[0][index].theta += thetas[index]
-            # adjust the x,y coordinate using polar coordinates
-            # conduct the boundary check at the same time
-            x = self._boundaryCheck(person.h + person.R * cos(collects[0][index].theta))
-            y = self._boundaryCheck(person.k + person.R * sin(collects[0][index].theta))
-            # add the new location to the Simul_Details object
-            self.details.addLocation(day, (x,y))
-            # change the x, y coordinates of every copy of person index in the other collections
-            for j, collect in enumerate(collects):
-                collects[j][index].x = x
-                collects[j][index].y = y
-                collects[j][index].theta += thetas[index]
+        # every collect is a view of the same population, so everyone is moved at once
+        pop = collects[0].population
+        x, y = pop.orbit(thetas[:pop.popsize], self.planeSize, advances=2 if self.legacyOrbit else 1)
+        # add the day's locations to the Simul_Details object
+        self.details.addLocations(day, x, y)
     
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -1,13 +1,15 @@
 import numpy as np
-from matplotlib import pyplot as plt
 
 from ..Hub.HubSEIR import HubSEIR
-from Eir.utility import Person, randEvent, dist
+from Eir.utility import Person, dist
 
 class StrongInfSEIR(HubSEIR):
 
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
     def __init__(self, S0: int, E0: int, I0: int, R0: int, pss: float, rho: float, 
-        gamma: float, side: float, rstart:float, days: int, w0=0.7, alpha=2.0):
+        gamma: float, side: float, rstart:float, days: int, w0=0.7, alpha=2.0, engine="loop", rng=None, record="trajectories"):
 
         #error checking
         self.intCheck([S0, E0, I0, R0, days])
@@ -15,7 +17,7 @@ class StrongInfSEIR(HubSEIR):
         self.negValCheck([S0, E0, I0, R0, pss, rho, gamma, side, rstart, days, w0, alpha])
         self.probValCheck([pss, rho, gamma, w0])
 
-        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, side=side, rstart=rstart, alpha=alpha, days=days, w0=w0, hubConstant=1)
+        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, side=side, rstart=rstart, alpha=alpha, days=days, w0=w0, hubConstant=1, engine=engine, rng=rng, record=record)
     
     def _infect(self, inf: Person, sus: Person):
         """
@@ -44,6 +46,7 @@ class StrongInfSEIR(HubSEIR):
         pyplot.Figure:
             return a fig object that will contian the graphs
         """
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
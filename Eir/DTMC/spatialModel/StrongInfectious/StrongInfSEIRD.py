@@ -1,14 +1,15 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from ..Hub.HubSEIRD import HubSEIRD
 from Eir.utility import Person, dist
 
 class StrongInfSEIRD(HubSEIRD):
 
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
     def __init__(self, S0: int, E0: int, I0: int, R0: int, pss: float, rho: float, 
-        gamma: float, mu: float, side: float, rstart:float, days: int, w0=0.7, alpha=2.0):
+        gamma: float, mu: float, side: float, rstart:float, days: int, w0=0.7, alpha=2.0, engine="loop", rng=None, record="trajectories"):
 
         #error checking
         self.intCheck([S0, E0, I0, R0, days])
@@ -16,7 +17,7 @@ class StrongInfSEIRD(HubSEIRD):
         self.negValCheck([S0, E0, I0, R0, pss, rho, gamma, mu, side, rstart, days, w0, alpha])
         self.probValCheck([pss, rho, gamma, mu, w0])
 
-        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, mu=mu, side=side, rstart=rstart, alpha=alpha, days=days, w0=w0, hubConstant=1)
+        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, mu=mu, side=side, rstart=rstart, alpha=alpha, days=days, w0=w0, hubConstant=1, engine=engine, rng=rng, record=record)
     
     def _infect(self, inf: Person, sus: Person):
         """
@@ -37,6 +38,7 @@ class StrongInfSEIRD(HubSEIRD):
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, recovered, and dead individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
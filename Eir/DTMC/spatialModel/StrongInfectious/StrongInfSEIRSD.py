@@ -1,13 +1,15 @@
 import numpy as np
-from matplotlib import pyplot as plt
 
 from ..Hub.HubSEIRSD import HubSEIRSD
-from Eir.utility import randEvent, Person, dist
+from Eir.utility import Person, dist
 
 class StrongInfSEIRSD(HubSEIRSD):
 
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
     def __init__(self, S0: int, E0: int, I0: int, R0: int, pss: float, rho: float, 
-        gamma: float, kappa: float, mu: float, side: float, rstart:float,  days: int, w0=1.0, alpha=2.0):
+        gamma: float, kappa: float, mu: float, side: float, rstart:float,  days: int, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
 
         #error checking
         self.intCheck([S0, E0, I0, R0, days])
@@ -15,7 +17,7 @@ class StrongInfSEIRSD(HubSEIRSD):
         self.negValCheck([S0, E0, I0, R0, pss, rho, gamma, kappa, mu, side, rstart, days, w0, alpha])
         self.probValCheck([pss, rho, gamma, kappa, mu, w0])
 
-        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, kappa=kappa, mu=mu, side=side, rstart=rstart, alpha=alpha, days=days, w0=w0, hubConstant=1)
+        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, pss=pss, rho=rho, gamma=gamma, kappa=kappa, mu=mu, side=side, rstart=rstart, alpha=alpha, days=days, w0=w0, hubConstant=1, engine=engine, rng=rng, record=record)
     
     # the only assumption that changes in the strong infectious model is the formula for infection probability
     def _infect(self, inf: Person, sus: Person):
@@ -33,6 +35,7 @@ class StrongInfSEIRSD(HubSEIRSD):
         return self.w0 * (1 - r / r0) ** self.alpha
 
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -1,14 +1,15 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
-from Eir.utility import dist, Person, randEvent
+from Eir.utility import dist, Person
 from ..Hub.HubSEIRSV import HubSEIRSV
 
 class StrongInfSEIRSV(HubSEIRSV):
 
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
     def __init__(self, S0: int, E0: int, I0: int, R0: int, V0:int, pss: float, rho: float, 
-        gamma: float, eta: float, kappa:float, side: float, rstart:float, days: int, w0=0.7, timeDelay=-1, alpha=2.0):
+        gamma: float, eta: float, kappa:float, side: float, rstart:float, days: int, w0=0.7, timeDelay=-1, alpha=2.0, engine="loop", rng=None, record="trajectories"):
 
         # error checking
         self.intCheck([S0, E0, I0, R0, V0, days])
@@ -17,7 +18,7 @@ class StrongInfSEIRSV(HubSEIRSV):
         self.probValCheck([pss, rho, gamma, kappa, eta, w0])
         
         super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, V0=V0, pss=pss, rho=rho, 
-        gamma=gamma, eta=eta, kappa=kappa, side=side, rstart=rstart, alpha=alpha, days=days, w0=w0, hubConstant=1, timeDelay=timeDelay)
+        gamma=gamma, eta=eta, kappa=kappa, side=side, rstart=rstart, alpha=alpha, days=days, w0=w0, hubConstant=1, timeDelay=timeDelay, engine=engine, rng=rng, record=record)
 
 
     def _infect(self, inf: Person, sus: Person):
@@ -47,6 +48,7 @@ class StrongInfSEIRSV(HubSEIRSV):
         pyplot.Figure:
             return a fig object that will contian the graphs
         """
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
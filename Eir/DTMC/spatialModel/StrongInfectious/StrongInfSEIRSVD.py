@@ -1,15 +1,16 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
-from Eir.utility import dist, Person, randEvent
+from Eir.utility import dist, Person
 from ..Hub.HubSEIRSVD import HubSEIRSVD
 
 
 class StrongInfSEIRSVD(HubSEIRSVD):
 
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
     def __init__(self, S0: int, E0: int, I0: int, R0: int, V0:int, pss: float, rho: float, 
-        gamma: float, kappa: float, eta:float, mu: float, side: float, rstart:float, days: int, w0=0.7, timeDelay=-1, alpha=2.0):
+        gamma: float, kappa: float, eta:float, mu: float, side: float, rstart:float, days: int, w0=0.7, timeDelay=-1, alpha=2.0, engine="loop", rng=None, record="trajectories"):
 
         # error checking
         self.intCheck([S0, E0, I0, R0, V0, days])
@@ -18,7 +19,7 @@ class StrongInfSEIRSVD(HubSEIRSVD):
         self.probValCheck([pss, rho, gamma, kappa, eta, mu,w0])
 
         super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, V0=V0, pss=pss, rho=rho, 
-        gamma=gamma, kappa=kappa, eta=eta, mu=mu, side=side, rstart=rstart, days=days, w0=w0, timeDelay=timeDelay, alpha=alpha)
+        gamma=gamma, kappa=kappa, eta=eta, mu=mu, side=side, rstart=rstart, days=days, w0=w0, timeDelay=timeDelay, alpha=alpha, engine=engine, rng=rng, record=record)
 
     def _infect(self, inf: Person, sus: Person):
         """
@@ -38,6 +39,7 @@ class StrongInfSEIRSVD(HubSEIRSVD):
         return self.w0 * (1 - r / r0) ** self.alpha
     
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0,self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5, ax6) = plt.subplots(nrows=6, sharex="all")
         ax1.set_title("Strong Infectious Model SEIRSDV")
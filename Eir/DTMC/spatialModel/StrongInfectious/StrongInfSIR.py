@@ -1,5 +1,4 @@
 import numpy as np
-from matplotlib import pyplot as plt
 
 
 from Eir.DTMC.spatialModel.Hub.HubSIR import HubSIR
@@ -7,13 +6,16 @@ from Eir.utility import Person
 from Eir.utility import dist
 
 class StrongInfSIR(HubSIR):
-    def __init__(self, pss: float, rstart: float, side: float, S0: int, I0: int, R0: int, days: int, gamma: float, w0=.7, alpha=2.0):
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
+    def __init__(self, pss: float, rstart: float, side: float, S0: int, I0: int, R0: int, days: int, gamma: float, w0=.7, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0,days])
         self.floatCheck([pss, gamma, side, rstart, w0, alpha])
         self.negValCheck([S0, I0, R0, pss, gamma, side, rstart, days, w0, alpha])
         self.probValCheck([pss, gamma, w0])
-        super(StrongInfSIR, self).__init__(pss=pss, rstart=rstart, alpha=alpha, side=side, S0=S0, I0=I0, R0=R0, days=days, gamma=gamma, w0=w0, hubConstant=1)
+        super(StrongInfSIR, self).__init__(pss=pss, rstart=rstart, alpha=alpha, side=side, S0=S0, I0=I0, R0=R0, days=days, gamma=gamma, w0=w0, hubConstant=1, engine=engine, rng=rng, record=record)
     
 
     def _infect(self, inf: Person, sus: Person):
@@ -31,6 +33,7 @@ class StrongInfSIR(HubSIR):
         return self.w0 * (1 - r / r0) ** self.alpha
     
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3) = plt.subplots(nrows=3, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
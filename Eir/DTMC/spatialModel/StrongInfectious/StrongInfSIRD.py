@@ -1,19 +1,20 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
-from Eir.utility import dist, Person, randEvent
+from Eir.utility import dist, Person
 from ..Hub.HubSIRD import HubSIRD
 
 class StrongInfSIRD(HubSIRD):
 
-    def __init__(self, S0: int, I0: int, R0: int, pss: float, rstart: float, side: float, days: int, gamma: float, mu:float, alpha=2.0, w0=1.0):
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
+    def __init__(self, S0: int, I0: int, R0: int, pss: float, rstart: float, side: float, days: int, gamma: float, mu:float, alpha=2.0, w0=1.0, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0,days])
         self.floatCheck([pss, gamma, mu, side, rstart, w0, alpha])
         self.negValCheck([S0, I0, R0, pss, gamma, mu, side, rstart, days, w0, alpha])
         self.probValCheck([pss, gamma, mu, w0])
-        super().__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, side=side, days=days, gamma=gamma, mu=mu, alpha=alpha, w0=w0, hubConstant=1)
+        super().__init__(S0=S0, I0=I0, R0=R0, pss=pss, rstart=rstart, side=side, days=days, gamma=gamma, mu=mu, alpha=alpha, w0=w0, hubConstant=1, engine=engine, rng=rng, record=record)
 
     def _infect(self, inf: Person, sus: Person):
         """
@@ -34,6 +35,7 @@ class StrongInfSIRD(HubSIRD):
     
     def plot(self):
         "Plots the number of susceptible, infected, dead, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
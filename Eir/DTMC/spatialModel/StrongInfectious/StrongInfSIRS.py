@@ -1,18 +1,19 @@
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 
 from Eir.DTMC.spatialModel.Hub.HubSIRS import HubSIRS
-from Eir.utility import dist, randEvent, Person
+from Eir.utility import dist, Person
 
 class StrongInfSIRS(HubSIRS):
-    def __init__(self, pss: float, rstart: float, side: float, S0: int, I0: int, R0: int, days:int, gamma: float, kappa: float, w0=.7, alpha=2.0):
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
+    def __init__(self, pss: float, rstart: float, side: float, S0: int, I0: int, R0: int, days:int, gamma: float, kappa: float, w0=.7, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0,days])
         self.floatCheck([pss, gamma, kappa, side, rstart, w0, alpha])
         self.negValCheck([S0, I0, R0, pss, gamma, kappa, side, rstart, days, w0, alpha])
         self.probValCheck([pss, gamma, kappa, w0])
-        super(StrongInfSIRS, self).__init__(pss=pss, rstart=rstart, alpha=alpha, side=side, S0=S0, I0=I0, R0=R0, days=days, gamma=gamma, kappa=kappa, w0=w0, hubConstant=1)
+        super(StrongInfSIRS, self).__init__(pss=pss, rstart=rstart, alpha=alpha, side=side, S0=S0, I0=I0, R0=R0, days=days, gamma=gamma, kappa=kappa, w0=w0, hubConstant=1, engine=engine, rng=rng, record=record)
 
     def _infect(self, inf: Person, sus: Person):
         # compute the distance between two Person objects
@@ -29,6 +30,7 @@ class StrongInfSIRS(HubSIRS):
         return self.w0 * (1 - r / r0) ** self.alpha
     
     def plot(self):
+        import matplotlib.pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3) = plt.subplots(nrows=3, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
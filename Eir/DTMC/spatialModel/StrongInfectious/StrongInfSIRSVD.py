@@ -1,20 +1,21 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
-from Eir.utility import dist, Person, randEvent
+from Eir.utility import dist, Person
 from ..Hub.HubSIRSVD import HubSIRSVD
 
 
 class StrongInfSIRSVD(HubSIRSVD):
 
-    def __init__(self, S0: int, I0: int, R0:int, V0: int, pss: float, gamma: float, kappa: float, eta:float, mu:float, rstart: float, side: float, days:int, alpha=2.0, w0=0.7, timeDelay=-1):
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
+    def __init__(self, S0: int, I0: int, R0:int, V0: int, pss: float, gamma: float, kappa: float, eta:float, mu:float, rstart: float, side: float, days:int, alpha=2.0, w0=0.7, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, R0, V0, days])
         self.floatCheck([pss, gamma, kappa, eta, mu, side, rstart, w0, alpha, timeDelay])
         self.negValCheck([S0, I0, R0, V0, pss, gamma, kappa, eta, mu, side, rstart, days, w0, alpha])
         self.probValCheck([pss, gamma, kappa, eta, mu, w0])
-        super().__init__(S0=S0, I0=I0, R0=R0, V0=V0, pss=pss, gamma=gamma, kappa=kappa, eta=eta, mu=mu, rstart=rstart, side=side, days=days, alpha=alpha, w0=w0, hubConstant=1, timeDelay=timeDelay)
+        super().__init__(S0=S0, I0=I0, R0=R0, V0=V0, pss=pss, gamma=gamma, kappa=kappa, eta=eta, mu=mu, rstart=rstart, side=side, days=days, alpha=alpha, w0=w0, hubConstant=1, timeDelay=timeDelay, engine=engine, rng=rng, record=record)
 
     def _infect(self, inf: Person, sus: Person):
         """
@@ -34,6 +35,7 @@ class StrongInfSIRSVD(HubSIRSVD):
         return self.w0 * (1 - r / r0) ** self.alpha
 
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
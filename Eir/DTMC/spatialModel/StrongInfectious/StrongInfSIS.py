@@ -4,8 +4,11 @@ from Eir.utility import dist
 
 
 class StrongInfSIS(HubSIS):
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
     def __init__(self, pss: float, rstart: float, side: float, S0: int, I0: int, days: int,
-                 gamma: float, w0=1.0, alpha=2.0):
+                 gamma: float, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         # error checking
         self.intCheck([S0, I0, days])
         self.floatCheck([pss, rstart, side, gamma, w0, alpha])
@@ -14,7 +17,7 @@ class StrongInfSIS(HubSIS):
         # call the super constructor
         super(StrongInfSIS, self).__init__(pss=pss, rstart=rstart, alpha=alpha, side=side, S0=S0, I0=I0, days=days,
                                            gamma=gamma, w0=w0,
-                                           hubConstant=0)
+                                           hubConstant=0, engine=engine, rng=rng, record=record)
 
     # the only assumption that changes in the strong infectious model is the formula for infection probability
     def _infect(self, inf: Person, sus: Person):
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 from ..Hub.Hub_ICUV import Hub_ICUV
 from Eir.utility import Person, dist
@@ -74,11 +73,20 @@ class StrongInf_ICUV(Hub_ICUV):
         timeDelay: float, optional
             The amount of days for which the vaccine rollout is delayed. Checks the day and makes sure that the day > timeDelay before simulating vaccine distribution. Default is -1.
 
+        engine: str, optional
+            How the infection step finds the susceptibles near each infectious person. One of "loop", "grid", "vectorized" or "compiled". Default is "loop".
+
+        rng: optional
+            What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+        record: str, optional
+            How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people each person infected, "events" also keeps every transmission and state change, and "trajectories" also keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't keep. Default is "trajectories".
+
         Attributes
         ----------
 
-        Scollect, Ecollect, Icollect, Lcollect, ICUcollect, Rcollect, Dcollect, Vcollect: list
-            Lists that contains copies of the Person objects and are used to determine what state each Person is currently in.
+        Scollect, Ecollect, Icollect, Lcollect, ICUcollect, Rcollect, Dcollect, Vcollect: Collect
+            Views of the population that are used to determine what state each Person is currently in.
         
         S, E, I, L, ICU, R, D, V, infectious: ndarray
             Numpy arrays that contain the total number of people in each state on each given day. Infectious people are classified as those in compartment I + those in compartments L.
@@ -92,15 +100,18 @@ class StrongInf_ICUV(Hub_ICUV):
 
 
         """
+    # super spreaders are intrinsically more infectious rather than reaching further
+    strongInfectious = True
+
     def __init__(self, S0:int, E0:int, I0:int, R0:int, V0:int, rho: float, ioda: float,  gamma: float, mu: float, phi: float, chi: float, omega: float, kappa: float, eta: float, rstart: float, 
-        pss: float, side: float, days: int, alpha=2.3, w0=.70, timeDelay=-1):
+        pss: float, side: float, days: int, alpha=2.3, w0=.70, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         # error checks
         self.intCheck([S0, E0, I0, R0, V0, days])
         self.floatCheck([rho, ioda, gamma, mu, phi, chi, omega, kappa, eta, rstart, pss, side, alpha, w0, timeDelay])
         self.negValCheck([S0, E0, I0, R0, V0, rstart, side, days, alpha])
         self.probValCheck([rho, ioda, gamma, mu, phi, chi, omega, kappa, eta, w0])
         # call the super constructor
-        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, V0=V0, rho=rho, ioda=ioda, gamma=gamma, mu=mu, omega=omega, phi =phi, chi=chi, kappa=kappa, eta=eta, rstart=rstart, pss=pss, side=side, days=days, w0=w0, hubConstant=1, timeDelay=timeDelay)
+        super().__init__(S0=S0, E0=E0, I0=I0, R0=R0, V0=V0, rho=rho, ioda=ioda, gamma=gamma, mu=mu, omega=omega, phi =phi, chi=chi, kappa=kappa, eta=eta, rstart=rstart, pss=pss, side=side, days=days, w0=w0, hubConstant=1, timeDelay=timeDelay, engine=engine, rng=rng, record=record)
 
     def _infect(self, inf: Person, sus: Person):
         """
@@ -121,6 +132,7 @@ class StrongInf_ICUV(Hub_ICUV):
     
     def plot(self):
         """ Plots the number of people in each compartment except for L and I, as those are plotted as "infectious". """
+        import matplotlib.pyplot as plt
         t= np.linspace(0, self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5, ax6, ax7) = plt.subplots(nrows=7, sharex='all')
         ax1.set_ylabel("# Susceptibles")
@@ -0,0 +1,114 @@
+import math
+import numpy as np
+
+
+class CellList:
+    """
+    Uniform grid (cell list) over the (x,y) coordinates of the people in a spatial model. The plane is cut into
+    square cells whose side is at least the largest spreading radius, so every person that can be reached by an
+    infectious individual lies in the 3x3 block of cells around that individual.
+
+    Parameters
+    ----------
+
+    x: ndarray
+        The x-coordinates of every person in the simulation.
+
+    y: ndarray
+        The y-coordinates of every person in the simulation.
+
+    cellSize: float
+        The side length of one cell. Should be the maximum spreading radius of the model.
+
+    side: float
+        The length of one side of the square plane that the people are confined to.
+
+    maxCells: int, optional
+        The maximum number of cells along one side of the plane. Keeps the grid from exploding in size when
+        the spreading radius is tiny compared to the plane. Default is 1024.
+
+    Attributes
+    ----------
+
+    ncells: int
+        The number of cells along one side of the plane.
+
+    order: ndarray
+        The indices of the people sorted by the cell they are in.
+
+    starts: ndarray
+        starts[c] is the position in order where the people of cell c begin; they end at starts[c+1].
+    """
+    def __init__(self, x, y, cellSize: float, side: float, maxCells=1024):
+        self.side = side
+        # round the number of cells down so that a cell is never smaller than the spreading radius
+        self.ncells = int(maxCells) if cellSize <= 0 else int(math.floor(side / cellSize))
+        self.ncells = max(1, min(int(maxCells), self.ncells))
+        self.cellSize = side / self.ncells if side > 0 else 1.0
+        self.build(x, y)
+
+    def _cellCoords(self, x, y):
+        """Returns the (column, row) of the cell containing each of the given coordinates."""
+        cx = np.clip(np.floor_divide(x, self.cellSize).astype(np.int64), 0, self.ncells - 1)
+        cy = np.clip(np.floor_divide(y, self.cellSize).astype(np.int64), 0, self.ncells - 1)
+        return cx, cy
+
+    def build(self, x, y):
+        """
+        (Re)builds the grid for the given coordinates. Static models only need to do this once, while
+        movement models rebuild it every day after people move.
+
+        Parameters
+        ----------
+
+        x: ndarray
+            The x-coordinates of every person in the simulation.
+
+        y: ndarray
+            The y-coordinates of every person in the simulation.
+        """
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        cx, cy = self._cellCoords(x, y)
+        cellIds = cx * self.ncells + cy
+        # stable sort so people inside a cell stay in increasing order
+        self.order = np.argsort(cellIds, kind="stable")
+        self.starts = np.searchsorted(cellIds[self.order], np.arange(self.ncells * self.ncells + 1))
+
+    def query(self, x: float, y: float, radius=None):
+        """
+        Returns the indices of everyone in the block of cells around the point (x,y).
+
+        Parameters
+        ----------
+
+        x: float
+            x-coordinate of the point.
+
+        y: float
+            y-coordinate of the point.
+
+        radius: float, optional
+            The distance around the point that has to be covered. The block is made as many cells wide as needed
+            to cover it, which lets each person use their own spreading radius. Default is None, which is the
+            3x3 block of cells around the point.
+
+        Returns
+        -------
+
+        ndarray:
+            The indices of the people close enough to the point to be within one cell size of it (or within radius),
+            sorted in increasing order so that random draws happen in the same order as a full scan would.
+        """
+        if radius is not None and radius < 0:
+            return np.empty(0, dtype=np.int64)
+        # number of cells on each side of the point's cell that have to be looked at
+        reach = 1 if radius is None else max(1, int(math.ceil(radius / self.cellSize)))
+        cx, cy = self._cellCoords(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        cx, cy = int(cx), int(cy)
+        chunks = []
+        for i in range(max(0, cx - reach), min(self.ncells, cx + reach + 1)):
+            # cells in the same column are contiguous, so grab the whole run of rows at once
+            lo = i * self.ncells + max(0, cy - reach)
+            hi = i * self.ncells + min(self.ncells - 1, cy + reach)
+            chunks.append(self.order[self.starts[lo]:self.starts[hi + 1]])
+        return np.sort(np.concatenate(chunks))
@@ -0,0 +1,197 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# True when the infection step can run as compiled code. numba is optional; without it the same step runs as
+# NumPy array operations, which give the same results.
+compiled = numba is not None
+
+
+def _pairs(x, y, infectors, radius, constant, susceptible, sus, w0, alpha, draws, start, src, dst, found):
+    """
+    Runs the infection step for infectors[start:] on a buffer of random numbers, one infectious person at a time.
+    Stops early when the buffer might not have enough numbers left for the next infectious person.
+
+    Returns
+    -------
+
+    int:
+        The index in infectors of the first infectious person that wasn't processed.
+
+    int:
+        The number of random numbers used from draws.
+
+    int:
+        The number of (infector, infectee) pairs in src and dst.
+    """
+    used = 0
+    # the number of people that are still susceptible, which bounds the draws of the next infectious person
+    left = 0
+    for j in sus:
+        if susceptible[j]:
+            left += 1
+    for k in range(start, len(infectors)):
+        if left == 0:
+            return len(infectors), used, found
+        if len(draws) - used < left:
+            return k, used, found
+        i = infectors[k]
+        r0 = radius[k]
+        for j in sus:
+            if not susceptible[j]:
+                continue
+            r = ((x[i] - x[j]) ** 2 + (y[i] - y[j]) ** 2) ** 0.5
+            if r > r0:
+                continue
+            if constant[k]:
+                w = w0
+            else:
+                # use the formula: w(r) = w0 * (1-r/r0)^alpha
+                w = w0 * (1.0 - r / r0) ** alpha
+            # like randEvent, only people with a chance of being infected use up a random number
+            if not w > 0:
+                continue
+            infected = draws[used] < w
+            used += 1
+            if infected:
+                susceptible[j] = False
+                left -= 1
+                src[found] = i
+                dst[found] = j
+                found += 1
+    return len(infectors), used, found
+
+
+if compiled:
+    _pairs = numba.njit(cache=True, nogil=True)(_pairs)
+
+
+def _getState(rng):
+    """Returns the state of rng, the np.random module, a Generator or a RandomState."""
+    if isinstance(rng, np.random.Generator):
+        return rng.bit_generator.state
+    return rng.get_state()
+
+
+def _setState(rng, state):
+    """Puts rng back in a state from _getState."""
+    if isinstance(rng, np.random.Generator):
+        rng.bit_generator.state = state
+    else:
+        rng.set_state(state)
+
+
+def _infectionsCompiled(x, y, infectors, radius, constant, susceptible, w0, alpha, rng):
+    sus = np.flatnonzero(susceptible)
+    src = np.empty(len(sus), dtype=np.int64)
+    dst = np.empty(len(sus), dtype=np.int64)
+    found, start = 0, 0
+    # room for every susceptible to be in range of a couple of infectious people before the buffer is refilled
+    size = max(2 * len(sus), 1024)
+    while start < len(infectors):
+        # the kernel can't draw from rng, so it gets a buffer of numbers drawn ahead. rng is then moved on by only
+        # the numbers that were used, so the draws after the infection step are the same as with the other engines
+        state = _getState(rng)
+        draws = rng.random(size)
+        start, used, found = _pairs(x, y, infectors, radius, constant, susceptible, sus, float(w0), float(alpha),
+                                    draws, start, src, dst, found)
+        _setState(rng, state)
+        if used:
+            rng.random(used)
+    return src[:found], dst[:found]
+
+
+def _infectionsNumpy(x, y, infectors, radius, constant, susceptible, w0, alpha, rng):
+    sus = np.flatnonzero(susceptible)
+    src, dst = [], []
+    for k, i in enumerate(infectors.tolist()):
+        if len(sus) == 0:
+            break
+        # distances from the infectious person to all the susceptibles
+        r = ((x[sus] - x[i]) ** 2 + (y[sus] - y[i]) ** 2) ** 0.5
+        inRange = r <= radius[k]
+        if constant[k]:
+            w = np.full(np.count_nonzero(inRange), float(w0))
+        else:
+            # use the formula: w(r) = w0 * (1-r/r0)^alpha
+            w = w0 * (1 - r[inRange] / radius[k]) ** alpha
+        candidates = sus[inRange]
+        # like randEvent, only people with a chance of being infected use up a random number
+        candidates, w = candidates[w > 0], w[w > 0]
+        if len(candidates) == 0:
+            continue
+        infected = candidates[rng.random(len(candidates)) < w]
+        if len(infected) == 0:
+            continue
+        susceptible[infected] = False
+        src.append(np.full(len(infected), i))
+        dst.append(infected)
+        # the newly infected can't be infected again by the next infectious person
+        sus = sus[susceptible[sus]]
+    if not src:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(src).astype(np.int64), np.concatenate(dst).astype(np.int64)
+
+
+def infections(x, y, infectors, radius, constant, susceptible, w0: float, alpha: float, rng, useCompiled=True):
+    """
+    Runs the pairwise infection step shared by the Hub, Strong Infectious and Random Movement models. Every
+    infectious person, in order, gets a chance to infect every person that is still susceptible, in increasing
+    order of index. The random numbers are used the same way as by the loop over randEvent in the models, so a
+    seeded simulation gives the same results with any engine.
+
+    Parameters
+    ----------
+
+    x: ndarray
+        The x coordinates of everyone in the population.
+
+    y: ndarray
+        The y coordinates of everyone in the population.
+
+    infectors: ndarray
+        The indices of the infectious people, in the order they get to infect.
+
+    radius: ndarray
+        The spreading radius of each of the infectious people.
+
+    constant: ndarray
+        bool array that is True for the infectious people that infect with constant probability w0 inside their
+        radius, like the super spreaders of the Strong Infectious model.
+
+    susceptible: ndarray
+        bool array that is True for everyone that is susceptible. The people who get infected are set to False.
+
+    w0: float
+        The probability of infection at distance 0.
+
+    alpha: float
+        The exponent of the infection probability w(r) = w0 * (1-r/r0)^alpha.
+
+    rng:
+        What the random numbers are drawn from, as returned by makeRng.
+
+    useCompiled: bool, optional
+        If True and numba is installed, runs the step as compiled code. Otherwise runs it with NumPy. Default is
+        True.
+
+    Returns
+    -------
+
+    ndarray:
+        The indices of the infectious person of every infection.
+
+    ndarray:
+        The indices of the people who got infected, in the same order.
+    """
+    x = np.ascontiguousarray(x, dtype=float)
+    y = np.ascontiguousarray(y, dtype=float)
+    infectors = np.ascontiguousarray(infectors, dtype=np.int64)
+    radius = np.ascontiguousarray(np.broadcast_to(radius, infectors.shape), dtype=float)
+    constant = np.ascontiguousarray(np.broadcast_to(constant, infectors.shape), dtype=np.bool_)
+    if useCompiled and compiled:
+        return _infectionsCompiled(x, y, infectors, radius, constant, susceptible, w0, alpha, rng)
+    return _infectionsNumpy(x, y, infectors, radius, constant, susceptible, w0, alpha, rng)
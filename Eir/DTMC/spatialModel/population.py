@@ -0,0 +1,318 @@
+import copy
+
+import numpy as np
+
+
+def startCounts(counts: list, popsize: int):
+    """
+    Returns the starting number of people in each compartment when popsize people are assigned in order, the way
+    the constructors of the models that leave R0 or V0 out of their popsize assign them: the first counts[0]
+    people go in the first compartment, the next counts[1] in the second and so on, until there is no one left,
+    and everyone who is left over goes in the compartment whose count is None.
+
+    Parameters
+    ----------
+
+    counts: list
+        The number of people asked for in each compartment, in the order of the symbols of the Population. One of
+        them is None.
+
+    popsize: int
+        The number of people there are.
+
+    Returns
+    -------
+
+    list:
+        The counts to make the Population with, which add up to popsize.
+    """
+    left = popsize
+    starts = []
+    for count in counts:
+        take = 0 if count is None else min(count, left)
+        starts.append(take)
+        left -= take
+    starts[counts.index(None)] = left
+    return starts
+
+
+class Population:
+    """
+    Struct-of-arrays store for everyone in a spatial model. Every attribute of the people (coordinates, radii,
+    super spreader flag, ...) is kept once in a flat NumPy array indexed by the person's number, and the compartment
+    each person is in is kept as a single integer state code instead of one Person object per compartment.
+
+    Parameters
+    ----------
+
+    symbols: str or list
+        The symbols of the compartments of the model, such as "SIR" or ["S", "E", "I", "L", "ICU", "R", "D", "V"].
+
+    counts: list
+        The starting number of people in each compartment, in the same order as symbols. People are assigned in
+        order, so persons 0 ... counts[0]-1 start in symbols[0], the next counts[1] people in symbols[1] and so on.
+
+    x: ndarray
+        The starting x-coordinate of every person.
+
+    y: ndarray
+        The starting y-coordinate of every person.
+
+    ss: ndarray, optional
+        Whether each person is a super spreader. Default is nobody.
+
+    r0: ndarray, optional
+        The spreading radius of each person. Default is 0.
+
+    R: ndarray, optional
+        The movement radius of each person. Default is 0.
+
+    theta: ndarray, optional
+        The starting angle of each person on their circle of periodic motion. If given, the centers h, k of the
+        circles are computed the same way Person2 does it. Default is 0.
+
+    Attributes
+    ----------
+
+    popsize: int
+        The number of people.
+
+    state: ndarray
+        The state code of each person, which is the index of their compartment in symbols. People who have left
+        a compartment but haven't been put in their next one yet have the code TRANSIT.
+
+    h: ndarray
+        x-coordinate of the center of each person's periodic motion.
+
+    k: ndarray
+        y-coordinate of the center of each person's periodic motion.
+    """
+    # state code of someone who was taken out of a compartment and is waiting to be put in the next one
+    TRANSIT = -1
+    # the arrays that change while a simulation runs; the others are set once when the population is made
+    changing = ("state", "x", "y", "theta")
+
+    def __init__(self, symbols, counts: list, x, y, ss=None, r0=None, R=None, theta=None):
+        self.symbols = list(symbols)
+        # look up table from compartment symbol to state code
+        self.codes = {symbol: code for code, symbol in enumerate(self.symbols)}
+        self.popsize = int(sum(counts))
+        n = self.popsize
+        # copy the coordinates, since moving models change them in place
+        self.x = np.array(x[:n], dtype=float)
+        self.y = np.array(y[:n], dtype=float)
+        self.ss = np.zeros(n, dtype=bool) if ss is None else np.array(ss[:n], dtype=bool)
+        self.r0 = np.zeros(n) if r0 is None else np.array(r0[:n], dtype=float)
+        self.R = np.zeros(n) if R is None else np.array(R[:n], dtype=float)
+        self.theta = np.zeros(n) if theta is None else np.array(theta[:n], dtype=float)
+        # h,k is the center of the periodic motion
+        self.h = self.x - self.R * np.cos(self.theta)
+        self.k = self.y - self.R * np.sin(self.theta)
+        # everyone starts in the compartment given by counts
+        self.state = np.repeat(np.arange(len(self.symbols), dtype=np.int8), counts)
+
+    def __len__(self):
+        return self.popsize
+
+    def fork(self):
+        """
+        Returns a copy of the population that can change on its own. The arrays that change while a simulation runs
+        are copied, and the others are shared with this population as read-only views, which costs no memory.
+        """
+        forked = copy.copy(self)
+        forked.symbols = list(self.symbols)
+        forked.codes = dict(self.codes)
+        for name, value in vars(self).items():
+            if not isinstance(value, np.ndarray):
+                continue
+            if name in self.changing:
+                value = value.copy()
+            else:
+                value = value.view()
+                value.flags.writeable = False
+            setattr(forked, name, value)
+        return forked
+
+    def code(self, symbol: str):
+        """Returns the state code of the compartment symbol."""
+        return self.codes[symbol]
+
+    def addCompartment(self, symbol: str):
+        """Adds an empty compartment, for subclasses that have more compartments than their parent model."""
+        if symbol not in self.codes:
+            self.codes[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+
+    def included(self, symbol: str):
+        """Returns a boolean array that is True for the people in compartment symbol."""
+        return self.state == self.codes[symbol]
+
+    def members(self, symbol: str):
+        """Returns the indices of the people in compartment symbol, in increasing order."""
+        return np.flatnonzero(self.state == self.codes[symbol])
+
+    def count(self, symbol: str):
+        """Returns the number of people in compartment symbol."""
+        return int(np.count_nonzero(self.state == self.codes[symbol]))
+
+    def counts(self):
+        """Returns a dictionary with the number of people in every compartment."""
+        # shift by one so that people in transit land in bin 0
+        totals = np.bincount(self.state.astype(np.int64) + 1, minlength=len(self.symbols) + 1)
+        return {symbol: int(totals[code + 1]) for symbol, code in self.codes.items()}
+
+    def add(self, indices, symbol: str):
+        """Puts the people at indices in compartment symbol."""
+        self.state[np.asarray(indices, dtype=np.int64)] = self.codes[symbol]
+
+    def remove(self, indices, symbol: str):
+        """Takes the people at indices out of compartment symbol. People who aren't in it are left alone."""
+        indices = np.asarray(indices, dtype=np.int64)
+        indices = indices[self.state[indices] == self.codes[symbol]]
+        self.state[indices] = self.TRANSIT
+
+    def orbit(self, thetas, side: float, advances=2):
+        """
+        Moves everyone along their circle of periodic motion, for one day or a block of days at once. Each day,
+        the angle of every person is advanced by their entry of thetas, their position is put at h + R cos(theta),
+        k + R sin(theta) and clipped to the plane, and then the angle is advanced again if advances is 2.
+
+        Parameters
+        ----------
+
+        thetas: ndarray
+            The change in angle of every person. Either one day of changes with shape (popsize,) or a block of days
+            with shape (days, popsize).
+
+        side: float
+            The length of one side of the square plane that the people are confined to.
+
+        advances: int, optional
+            How many times the angle is advanced per day. Earlier versions of the periodic models advanced it twice,
+            which is kept as the default so seeded simulations don't change. Default is 2.
+
+        Returns
+        -------
+
+        ndarray:
+            The x-coordinates of everyone after each day, with the same shape as thetas.
+
+        ndarray:
+            The y-coordinates of everyone after each day, with the same shape as thetas.
+        """
+        thetas = np.asarray(thetas, dtype=float)
+        days = thetas.reshape(-1, self.popsize)
+        xs, ys = np.empty(days.shape), np.empty(days.shape)
+        for day, step in enumerate(days):
+            self.theta += step
+            # position on the circle, kept within the plane
+            np.clip(self.h + self.R * np.cos(self.theta), 0, side, out=xs[day])
+            np.clip(self.k + self.R * np.sin(self.theta), 0, side, out=ys[day])
+            for _ in range(advances - 1):
+                self.theta += step
+        # everyone ends up at their position on the last day
+        self.x[:], self.y[:] = xs[-1], ys[-1]
+        return xs.reshape(thetas.shape), ys.reshape(thetas.shape)
+
+    def collect(self, symbol: str):
+        """Returns the Collect view of compartment symbol."""
+        return Collect(self, symbol)
+
+    def collects(self, symbols):
+        """Returns the Collect views of every compartment in symbols, in order."""
+        return [Collect(self, symbol) for symbol in symbols]
+
+
+class Collect:
+    """
+    List-like view of one compartment of a Population. Stands in for the old Scollect, Icollect, ... lists of
+    Person objects: indexing and iterating gives Member objects whose isIncluded is True when the person is in
+    the compartment.
+
+    Parameters
+    ----------
+
+    population: Population
+        The population the view is of.
+
+    symbol: str
+        The symbol of the compartment.
+    """
+    def __init__(self, population: Population, symbol: str):
+        self.population = population
+        self.symbol = symbol
+        # codes never change once a compartment exists, so look it up once
+        self.code = population.code(symbol)
+
+    def __len__(self):
+        return self.population.popsize
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self.population.popsize
+        if not 0 <= index < self.population.popsize:
+            raise IndexError(index)
+        return Member(self.population, int(index), self.code)
+
+    def __iter__(self):
+        population, code = self.population, self.code
+        for index in range(population.popsize):
+            yield Member(population, index, code)
+
+    def mask(self):
+        """Returns a boolean array that is True for the people in the compartment."""
+        return self.population.included(self.symbol)
+
+    def members(self):
+        """Returns the indices of the people in the compartment, in increasing order."""
+        return self.population.members(self.symbol)
+
+    def count(self):
+        """Returns the number of people in the compartment."""
+        return self.population.count(self.symbol)
+
+    def include(self, indices):
+        """Puts the people at indices in the compartment."""
+        self.population.add(indices, self.symbol)
+
+    def exclude(self, indices):
+        """Takes the people at indices out of the compartment."""
+        self.population.remove(indices, self.symbol)
+
+
+class Member:
+    """
+    One person as seen from a Collect. Has the same attributes as the Person objects, but reads and writes them
+    straight from the arrays of the Population.
+    """
+    __slots__ = ("_population", "_index", "_code")
+
+    def __init__(self, population: Population, index: int, code: int):
+        self._population = population
+        self._index = index
+        self._code = code
+
+    @property
+    def isIncluded(self):
+        return bool(self._population.state[self._index] == self._code)
+
+    @isIncluded.setter
+    def isIncluded(self, value: bool):
+        if value:
+            self._population.state[self._index] = self._code
+        elif self._population.state[self._index] == self._code:
+            self._population.state[self._index] = Population.TRANSIT
+
+
+def _column(name: str):
+    """Makes a property that reads and writes the Member's entry in the Population array name."""
+    def getter(self):
+        return self._population.__dict__[name][self._index]
+
+    def setter(self, value):
+        self._population.__dict__[name][self._index] = value
+    return property(getter, setter)
+
+
+for _name in ("x", "y", "ss", "r0", "R", "theta", "h", "k"):
+    setattr(Member, _name, _column(_name))
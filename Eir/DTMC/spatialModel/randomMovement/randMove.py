@@ -1,15 +1,17 @@
 import numpy as np
-import pandas as pd
 import math
 import Eir.utility as u
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
+from Eir.DTMC.spatialModel.cellList import CellList
+from Eir.DTMC.spatialModel import kernels
+from Eir.DTMC.spatialModel.streaming import Streaming
 from Eir.utility import static_prob_help
 import Eir.exceptions as e
 
 # not to be confused with the person object that is used in the Hub/Strong Infectious Model
 from Eir.utility import Person1 as Person
 
-class RandMove():
+class RandMove(Streaming):
     """
     Abstract class that isn't meant to be instantiated. Base class for all concrete randMove objects.
 
@@ -31,8 +33,29 @@ class RandMove():
     alpha: float, optional
         Constant used in the _infect method. Default value is 2.0. 
 
+    engine: str, optional
+        How the infection step searches for susceptibles. "loop" checks every infectious/susceptible pair. "grid"
+        puts everyone in a uniform grid that is rebuilt every day after people move, and only checks the
+        susceptibles in the cells within each infectious person's own spreading radius. "compiled" runs the whole
+        infection step as compiled code when numba is installed, and as NumPy array operations when it isn't. All
+        of them give the same results for the same seed. Default is "loop".
+
+    rng: optional
+        What the random numbers of the simulation are drawn from. None uses the global np.random state, an int or
+        SeedSequence seeds a new np.random.Generator (PCG64), and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     """
-    def __init__(self, planeSize, move_r, spread_r, w0, alpha=2.0):
+    # the engines that can be used in the infection step
+    engines = ("loop", "grid", "compiled")
+    def __init__(self, planeSize, move_r, spread_r, w0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
+        # where the random numbers of this simulation come from
+        self.rng = u.makeRng(rng)
         # size of the plane
         self.planeSize = planeSize
         # mean movement radius
@@ -46,7 +69,13 @@ class RandMove():
         # pop size. This will typically be intialized for the subclasses, but make it a number for now
         self.popsize = 100
         # Simul_Details object
-        self.details = Simul_Details(0, self.popsize)
+        self.details = Simul_Details(0, self.popsize, level=record)
+        self.engineCheck(engine)
+        self.engine = engine
+        # how much of the simulation is kept in details
+        self.record = record
+        # the grid is rebuilt at the start of every infection step, since people move every day
+        self._grid = None
 
     # determine whether an infection event has occured
     def _infect(self, inf: Person, sus: Person):
@@ -76,7 +105,7 @@ class RandMove():
         # compute the probability given that r is within range
         w = self.w0 * (1.0 - r/inf.r0)**self.alpha
         # generate a random infection event based on the probability of infection
-        inf_event = u.randEvent(w)
+        inf_event = u.randEvent(w, self.rng)
         # return the event
         return inf_event
 
@@ -94,9 +123,117 @@ class RandMove():
             Contains all of the collection data structures that will be cycled through for the moves. This allows for easy object-oriented design.
         """
         # generate the correct number of movement radii
-        movement_r = np.random.normal(self.move_R, self.sigma_R, self.popsize)
+        movement_r = self.rng.normal(self.move_R, self.sigma_R, self.popsize)
         # generate the random thetas
-        thetas = np.random.uniform(low=0, high=2*math.pi, size=self.popsize)
+        thetas = self.rng.uniform(low=0, high=2*math.pi, size=self.popsize)
+
+    def _buildGrid(self, susCollect):
+        """
+        Rebuilds the grid over the current positions of everyone in the population. Called at the start of each
+        infection step when the engine is "grid".
+
+        Parameters
+        ----------
+
+        susCollect: Collect
+            The view of the susceptible compartment.
+        """
+        if self.engine != "grid":
+            return
+        pop = susCollect.population
+        # cells as big as the mean spreading radius; people with bigger radii look at more cells around them
+        cellSize = self.spread_r if self.spread_r > 0 else float(pop.r0.max(initial=0))
+        if self._grid is None:
+            self._grid = CellList(pop.x, pop.y, cellSize, self.planeSize)
+        else:
+            self._grid.build(pop.x, pop.y)
+
+    def _candidates(self, inf: Person, susCollect):
+        """
+        Returns the indices of the susceptibles that inf could possibly infect, in increasing order.
+
+        Parameters
+        ----------
+
+        inf: Person
+            The infectious person.
+
+        susCollect: Collect
+            The view of the susceptible compartment.
+        """
+        if self.engine == "loop":
+            return susCollect.members().tolist()
+        near = self._grid.query(inf.x, inf.y, inf.r0)
+        # only keep the people that are still susceptible
+        return near[susCollect.mask()[near]].tolist()
+
+    def _transmission(self, day: int, infCollects: list, susCollect):
+        """
+        Runs the infection step: every infectious person gets a chance to infect every susceptible within their
+        own spreading radius. Susceptibles that get infected are removed from susCollect right away.
+
+        Parameters
+        ----------
+
+        day: int
+            The day that the infections are happening on. Used for the transmissions in Simul_Details.
+
+        infCollects: list
+            The views of the compartments whose people can spread the disease, such as Icollect.
+
+        susCollect: Collect
+            The view of the susceptible compartment.
+
+        Returns
+        -------
+
+        set:
+            The indices of the people who got infected.
+        """
+        if self.engine == "compiled":
+            return self._transmissionCompiled(day, infCollects, susCollect)
+        transfers = set()
+        # people have moved since the last infection step
+        self._buildGrid(susCollect)
+        for infCollect in infCollects:
+            # only go through the people who are infected
+            for count in infCollect.members().tolist():
+                inf = infCollect[count]
+                # only go through the people who are still in the susceptible bin and close enough to be infected
+                for index in self._candidates(inf, susCollect):
+                    sus = susCollect[index]
+                    # if there is a successful infection
+                    if self._infect(inf, sus):
+                        # add the index to the transfer set to be transferred later
+                        transfers.add(index)
+                        # change the status to be not included in S collection
+                        sus.isIncluded = False
+                        # adjust the state change in the Simul_Details object
+                        self.details.addTransmission(day, count, index)
+        return transfers
+
+    def _transmissionCompiled(self, day: int, infCollects: list, susCollect):
+        """
+        Same as _transmission, except that the distances, infection probabilities and random events of every
+        infectious/susceptible pair are handled by kernels.infections, in one call for the whole step.
+        """
+        pop = susCollect.population
+        # the infectious people in the order the loop goes through them
+        infectors = np.concatenate([infCollect.members() for infCollect in infCollects])
+        susceptible = susCollect.mask()
+        # everyone spreads over their own radius, with the probability falling off with the distance
+        src, dst = kernels.infections(pop.x, pop.y, infectors, pop.r0[infectors], False, susceptible, self.w0,
+                                      self.alpha, self.rng)
+        # remove the people from the susceptible state
+        susCollect.exclude(dst)
+        for count, index in zip(src.tolist(), dst.tolist()):
+            self.details.addTransmission(day, count, index)
+        return set(dst.tolist())
+
+    def engineCheck(self, engine: str):
+        """Makes sure that the engine is one the model supports."""
+        if engine not in self.engines:
+            raise e.EngineException(engine, self.engines)
 
     # apply this check to every x and y coordinate to make sure they're always within the plane
     def _boundaryCheck(self, coordinate):
@@ -124,18 +261,18 @@ class RandMove():
         return coordinate
     
     # used to run the state changes
-    def _stateChanger(self, values: set, collect: list, symbol: str, day:int):
+    def _stateChanger(self, values: set, collect, symbol: str, day:int):
         """
         Takes care of the state changes to a particular state. 
 
         Parameters
         ----------
 
-        values: set
-            values contains all of the indices of the people who need to be set to isIncluded=True in the collect list
+        values: set or ndarray
+            values contains all of the indices of the people who need to be put in the compartment of collect
         
-        collect: list
-            The particular list of Person objects that are going to be modified.
+        collect: Collect
+            The view of the compartment the people are going to.
         
         symbol: str 
             The string representing the particular state that is going to. Used for details.
@@ -143,25 +280,31 @@ class RandMove():
         day: int
             The day on which the transfer happened. Used for details.
         """
-        for index in values:
-            #print("Index: ", index)
-            collect[index].isIncluded = True
-            self.details.addStateChange(index, symbol, day)
+        # put everyone in the compartment at once
+        indices = np.fromiter(values, dtype=np.int64, count=len(values))
+        collect.include(indices)
+        self.details.addStateChanges(indices, symbol, day)
     
-    def _changeHelp(self, collect: list, prob: float):
+    def _changeHelp(self, collect, prob: float):
         """
         Used in order to determine who goes from collect state to another using probability prob. 
 
         Parameters
         ----------
 
-        collect:list
-            collect is a list of Person objects. Edits in place because passes a reference.
+        collect: Collect
+            The view of the compartment people are leaving. Edits in place because passes a reference.
     
         prob: float
             The probability of a Person object going from one state to another
+
+        Returns
+        -------
+
+        ndarray:
+            int array with the indices of the people who need to switch states.
         """
-        return static_prob_help(collect, prob)
+        return static_prob_help(collect, prob, self.rng)
 
     def negValCheck(self, *args):
         """
@@ -1,9 +1,6 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
-from Eir.utility import randEvent
-from Eir.utility import Person1 as Person
+from Eir.DTMC.spatialModel.population import Population
 from .randMoveSIR import RandMoveSIR
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
@@ -67,6 +64,18 @@ class RandMoveSEIR(RandMoveSIR):
     alpha: float optional
         A constant used in the _infect() method. The greater the constant, the greater the infection probability. Default is 2.0.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -85,22 +94,22 @@ class RandMoveSEIR(RandMoveSIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -115,14 +124,14 @@ class RandMoveSEIR(RandMoveSIR):
 
     """
     def __init__(self, S0:int, E0:int, I0:int, R0:int, rho: float, gamma: float, planeSize: float, move_r: float, sigma_R: float, 
-    spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0):
+    spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         # error checks
         self.intCheck([S0, E0, I0, R0, days])
         self.floatCheck(rho, gamma, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha)
         self.negValCheck(S0, E0, I0, R0, rho, gamma, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([rho, gamma, w0])
         
-        super(RandMoveSEIR, self).__init__(S0=S0, I0=I0, R0=R0, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r, days=days, w0=w0,alpha=alpha)
+        super(RandMoveSEIR, self).__init__(S0=S0, I0=I0, R0=R0, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r, days=days, w0=w0,alpha=alpha, engine=engine, rng=rng, record=record)
         # rho is the E->I
         self.rho=rho
         # create the numpy array for exposed
@@ -131,35 +140,26 @@ class RandMoveSEIR(RandMoveSIR):
         self.popsize = S0 + E0 + I0 + R0
         #print("Population: ", self.popsize)
         # reinstantiate the Simul_Details object
-        self.details = Simul_Details(days=days, popsize=self.popsize)
+        self.details = Simul_Details(days=days, popsize=self.popsize, level=record)
         # create the collection data structures
-        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect = [], [], [], []
         # random x,y locations for the start of the simulation
-        loc_x, loc_y = np.random.random(self.popsize) * self.planeSize, np.random.random(self.popsize) * self.planeSize
-        spreading_r = np.random.normal(spread_r, sigma_r, self.popsize)
+        loc_x, loc_y = self.rng.random(self.popsize) * self.planeSize, self.rng.random(self.popsize) * self.planeSize
+        spreading_r = self.rng.normal(spread_r, sigma_r, self.popsize)
 
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SEIR", [S0, E0, I0, R0], loc_x, loc_y, r0=spreading_r)
+        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect = self.population.collects("SEIR")
         for i in range(self.popsize):
-            p1 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p2 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p3 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p4 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
             if i < S0:
-                p1.isIncluded = True
                 self.details.addStateChange(i, "S", 0)
             elif S0 <= i < S0 + E0:
-                p2.isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             elif S0 + E0 <= i < S0 + E0 + I0:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "I", 0)
             else:
-                p4.isIncluded=True
                 self.details.addStateChange(i, "R", 0)
-            self.Scollect.append(p1)
-            self.Ecollect.append(p2)
-            self.Icollect.append(p3)
-            self.Rcollect.append(p4)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
     # essentially the same function, except those who are infected will go to E not I. Simply return set of all infected people.
     # _StoI() also adds the transmission data as to who infected who, so that doesn't need to be written again.
@@ -171,23 +171,27 @@ class RandMoveSEIR(RandMoveSIR):
         return self._changeHelp(self.Ecollect, self.rho)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days+1):
-            StoE = self._StoE(i)
-            EtoI = self._EtoI()
-            ItoR = self._ItoR()
-            self._stateChanger(StoE, self.Ecollect, "E", i)
-            self._stateChanger(EtoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect])
-            self.S[i] = self.S[i-1] - len(StoE)
-            self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
-            self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR)
-            self.R[i] = self.R[i-1] + len(ItoR)
+        # run the days that haven't been run yet
+        self._advance(self.days)
             
 
         if getDetails:
             return self.details
 
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        StoE = self._StoE(i)
+        EtoI = self._EtoI()
+        ItoR = self._ItoR()
+        self._stateChanger(StoE, self.Ecollect, "E", i)
+        self._stateChanger(EtoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect])
+        self.S[i] = self.S[i-1] - len(StoE)
+        self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
+        self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR)
+        self.R[i] = self.R[i-1] + len(ItoR)
+
     def toDataFrame(self):
         """
         Gives user access to pandas dataframe with amount of people in each state on each day.
@@ -199,6 +203,7 @@ class RandMoveSEIR(RandMoveSIR):
             DataFrame object containing the number of susceptibles and number of infecteds on each day. 
 
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -209,6 +214,7 @@ class RandMoveSEIR(RandMoveSIR):
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
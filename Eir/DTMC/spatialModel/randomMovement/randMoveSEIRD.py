@@ -1,10 +1,8 @@
 import numpy as np
-from matplotlib import pyplot as plt
-import pandas as pd
 
 from .randMoveSEIR import RandMoveSEIR
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
-from Eir.utility import Person1 as Person
+from Eir.DTMC.spatialModel.population import Population
 class RandMoveSEIRD(RandMoveSEIR):
     """
     Class that simulates the random movement model with an SEIRD model. People in the Exposed compartment are presumed to not be able to propogate infection.
@@ -67,6 +65,18 @@ class RandMoveSEIRD(RandMoveSEIR):
     alpha: float optional
         A constant used in the _infect() method. The greater the constant, the greater the infection probability. Default is 2.0
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -88,27 +98,27 @@ class RandMoveSEIRD(RandMoveSEIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Dcollect: list
+    Dcollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is DEAD. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -122,7 +132,7 @@ class RandMoveSEIRD(RandMoveSEIR):
     """
 
     def __init__(self, S0:int, E0:int, I0:int, R0:int, rho: float, gamma: float, mu, planeSize: float, move_r: float, sigma_R: float, 
-        spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0):
+        spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         # error checks
         self.intCheck([S0, E0, I0, R0, days])
         self.floatCheck(rho, gamma, mu, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha)
@@ -130,32 +140,25 @@ class RandMoveSEIRD(RandMoveSEIR):
         self.probValCheck([rho, gamma, w0, mu])
         self.mu = mu
         super(RandMoveSEIRD, self).__init__(S0=S0, E0=E0, I0=I0, R0=0, rho=rho, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,
-        days=days)
-        self.details = Simul_Details(days=days, popsize=self.popsize)
-        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Dcollect = [], [], [], [], []
+        days=days, engine=engine, rng=rng, record=record)
+        self.details = Simul_Details(days=days, popsize=self.popsize, level=record)
         self.D = np.zeros(days+1)
-        loc_x, loc_y, spreading_r = np.random.random(self.popsize)*planeSize, np.random.random(self.popsize)*planeSize, np.random.normal(spread_r, sigma_r, self.popsize)
+        loc_x, loc_y, spreading_r = self.rng.random(self.popsize)*planeSize, self.rng.random(self.popsize)*planeSize, self.rng.normal(spread_r, sigma_r, self.popsize)
         # initialize the population
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SEIRD", [S0, E0, I0, self.popsize - S0 - E0 - I0, 0], loc_x, loc_y, r0=spreading_r)
+        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Dcollect = self.population.collects("SEIRD")
         for i in range(self.popsize):
-            p1, p2, p3, p4, p5 = Person(loc_x[i], loc_y[i], 0, spreading_r[i]), Person(loc_x[i], loc_y[i], 0, spreading_r[i]), Person(loc_x[i], loc_y[i], 0, spreading_r[i]), Person(loc_x[i], loc_y[i], 0, spreading_r[i]), Person(loc_x[i], loc_y[i], 0, spreading_r[i])
             if i < S0:
-                p1.isIncluded=True
                 self.details.addStateChange(i, "S", 0)
             elif i < S0+E0:
-                p2.isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             elif i < S0+E0+I0:
                 self.details.addStateChange(i, "I", 0)
-                p3.isIncluded=True
             else:
                 self.details.addStateChange(i, "R", 0)
-                p4.isIncluded=True
-            self.Scollect.append(p1)
-            self.Ecollect.append(p2)
-            self.Icollect.append(p3)
-            self.Rcollect.append(p4)
-            self.Dcollect.append(p5)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
         #print(len(self.Scollect))
 
     def _ItoD(self):
@@ -165,7 +168,7 @@ class RandMoveSEIRD(RandMoveSEIR):
         Returns
         -------
 
-        set: 
+        ndarray:
             Contains the indices of the people who will be transferred from I to D.
         """
         return self._changeHelp(self.Icollect, self.mu)
@@ -173,29 +176,33 @@ class RandMoveSEIRD(RandMoveSEIR):
     def run(self, getDetails=True):
         #print("(", self.S[0], ",",self.E[0],",", self.I[0],",", self.R[0], ",", self.D[0], ")")
         
-        for i in range(1, self.days+1):
-            # run the state changes and get the transfer sets
-            StoE = self._StoE(i)
-            EtoI = self._EtoI()
-            ItoR = self._ItoR()
-            ItoD = self._ItoD()
-            # change the states of those in the transfer sets
-            self._stateChanger(StoE, self.Ecollect, "E", i)
-            self._stateChanger(EtoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(ItoD, self.Dcollect, "D", i)
-            # modify the numbers
-            self.S[i] = self.S[i-1] - len(StoE)
-            self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
-            self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD)
-            #print("I[i-1]: ", self.I[i], " EtoI: ", len(EtoI), " ItoR: ", len(ItoR), " ItoD: ", len(ItoD), "I[i]: ", self.I[i], "Sum: ", self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD))
-            self.R[i] = self.R[i-1] + len(ItoR)
-            self.D[i] = self.D[i-1] + len(ItoD)
-            # move everyone except dead compartment
-            self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect])
-            #print("i: ", i, "(", self.S[i], ",",self.E[i],",", self.I[i],",", self.R[i], ",", self.D[i], ")")
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        # run the state changes and get the transfer sets
+        StoE = self._StoE(i)
+        EtoI = self._EtoI()
+        ItoR = self._ItoR()
+        ItoD = self._ItoD()
+        # change the states of those in the transfer sets
+        self._stateChanger(StoE, self.Ecollect, "E", i)
+        self._stateChanger(EtoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(ItoD, self.Dcollect, "D", i)
+        # modify the numbers
+        self.S[i] = self.S[i-1] - len(StoE)
+        self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
+        self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD)
+        #print("I[i-1]: ", self.I[i], " EtoI: ", len(EtoI), " ItoR: ", len(ItoR), " ItoD: ", len(ItoD), "I[i]: ", self.I[i], "Sum: ", self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD))
+        self.R[i] = self.R[i-1] + len(ItoR)
+        self.D[i] = self.D[i-1] + len(ItoD)
+        # move everyone except dead compartment
+        self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect])
+        #print("i: ", i, "(", self.S[i], ",",self.E[i],",", self.I[i],",", self.R[i], ",", self.D[i], ")")
     
     def toDataFrame(self):
         """
@@ -207,6 +214,7 @@ class RandMoveSEIRD(RandMoveSEIR):
         pd.DataFrame
             Holds the data of simulation in a DataFrame format.
         """
+        import pandas as pd
         t = np.linspace(0,self.days,self.days+1)
         arr = np.stack([t, self.S, self.E, self.I, self.R, self.D], axis=1)
         df = pd.DataFrame(arr, columns=["Days", "Susceptible", "Exposed", "Infected", "Recovered", "Dead"])
@@ -214,6 +222,7 @@ class RandMoveSEIRD(RandMoveSEIR):
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, recovered, and dead individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
@@ -1,9 +1,7 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .randMoveSEIRD import RandMoveSEIRD
-from Eir.utility import Person1 as Person
+from Eir.DTMC.spatialModel.population import Population, startCounts
 
 class RandMoveSEIRDV(RandMoveSEIRD):
     """
@@ -73,6 +71,18 @@ class RandMoveSEIRDV(RandMoveSEIRD):
     timeDelay: float optional
         The time delay in vaccine rollout. Vaccine rollout begins when the number of days passed is greater than timeDelay. Default is -1.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -97,32 +107,32 @@ class RandMoveSEIRDV(RandMoveSEIRD):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Dcollect: list
+    Dcollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is DEAD. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Vcollect: list
+    Vcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is VACCINATED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -136,79 +146,72 @@ class RandMoveSEIRDV(RandMoveSEIRD):
     
     """
     def __init__(self, S0:int, E0:int, I0:int, R0:int, V0: int, rho: float, gamma: float, mu: float, eta:float, planeSize: float, move_r: float, sigma_R: float, 
-        spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, timeDelay=-1):
+        spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         self.intCheck([S0, E0, I0, R0, V0, days])
         self.floatCheck(rho, gamma, mu, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha, timeDelay)
         self.negValCheck(S0, E0, I0, R0, V0, rho, gamma, mu, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([rho, gamma, w0, mu, eta])
         super(RandMoveSEIRDV, self).__init__(S0=S0, E0=E0, I0=I0, R0=0, rho=rho, gamma=gamma, mu=mu, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,
-        days=days)
+        days=days, engine=engine, rng=rng, record=record)
         self.eta = eta
         self.timeDelay = timeDelay
-        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect, self.Dcollect = [], [], [], [], [], []
         self.popsize += V0
         self.V = np.zeros(self.days+1)
-        loc_x, loc_y, spreading_r = np.random.random(self.popsize)*planeSize, np.random.random(self.popsize)*planeSize, np.random.normal(spread_r, sigma_r, self.popsize)
+        loc_x, loc_y, spreading_r = self.rng.random(self.popsize)*planeSize, self.rng.random(self.popsize)*planeSize, self.rng.normal(spread_r, sigma_r, self.popsize)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SEIRVD", startCounts([S0, E0, I0, R0, None, 0], self.popsize), loc_x, loc_y, r0=spreading_r)
+        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect, self.Dcollect = self.population.collects("SEIRVD")
         for i in range(self.popsize):
-            persons = []
-            for j in range(6):
-                persons.append(Person(loc_x[i], loc_y[i], 0, spreading_r[i]))
             if i < S0:
-                persons[0].isIncluded=True
                 self.details.addStateChange(i, "S", 0)
             elif i< S0 + E0:
-                persons[1].isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             elif i< S0 + E0 + I0:
-                persons[2].isIncluded=True
                 self.details.addStateChange(i, "I", 0)
             elif i< S0 + E0 + I0 + R0:
-                persons[3].isIncluded=True
                 self.details.addStateChange(i, "R", 0)
             else:
-                persons[4].isIncluded=True
                 self.details.addStateChange(i, "V", 0)
-            self.Scollect.append(persons[0])
-            self.Ecollect.append(persons[1])
-            self.Icollect.append(persons[2])
-            self.Rcollect.append(persons[3])
-            self.Vcollect.append(persons[4])
-            self.Dcollect.append(persons[5])
-            self.details.addLocation(0, (persons[0].x, persons[0].y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
     def _StoV(self):
         return self._changeHelp(self.Scollect, self.eta)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days+1):
-            # run the state changes and get the transfer sets
-            StoE = self._StoE(i)
-            StoV = set()
-            if i > self.timeDelay:
-                StoV = self._StoV()
-            EtoI = self._EtoI()
-            ItoR = self._ItoR()
-            ItoD = self._ItoD()
-            # change the states of those in the transfer sets
-            self._stateChanger(StoE, self.Ecollect, "E", i)
-            self._stateChanger(EtoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(ItoD, self.Dcollect, "D", i)
-            self._stateChanger(StoV, self.Vcollect, "V", i)
-            # modify the numbers
-            self.S[i] = self.S[i-1] - len(StoE) - len(StoV)
-            self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
-            self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD)
-            #print("I[i-1]: ", self.I[i], " EtoI: ", len(EtoI), " ItoR: ", len(ItoR), " ItoD: ", len(ItoD), "I[i]: ", self.I[i], "Sum: ", self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD))
-            self.R[i] = self.R[i-1] + len(ItoR)
-            self.V[i] = self.V[i-1] + len(StoV)
-            self.D[i] = self.D[i-1] + len(ItoD)
-            # move everyone except dead compartment
-            self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect])
-            #print("i: ", i, "(", self.S[i], ",",self.E[i],",", self.I[i],",", self.R[i], ",", self.D[i], ")")
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
 
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        # run the state changes and get the transfer sets
+        StoE = self._StoE(i)
+        StoV = set()
+        if i > self.timeDelay:
+            StoV = self._StoV()
+        EtoI = self._EtoI()
+        ItoR = self._ItoR()
+        ItoD = self._ItoD()
+        # change the states of those in the transfer sets
+        self._stateChanger(StoE, self.Ecollect, "E", i)
+        self._stateChanger(EtoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(ItoD, self.Dcollect, "D", i)
+        self._stateChanger(StoV, self.Vcollect, "V", i)
+        # modify the numbers
+        self.S[i] = self.S[i-1] - len(StoE) - len(StoV)
+        self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
+        self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD)
+        #print("I[i-1]: ", self.I[i], " EtoI: ", len(EtoI), " ItoR: ", len(ItoR), " ItoD: ", len(ItoD), "I[i]: ", self.I[i], "Sum: ", self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD))
+        self.R[i] = self.R[i-1] + len(ItoR)
+        self.V[i] = self.V[i-1] + len(StoV)
+        self.D[i] = self.D[i-1] + len(ItoD)
+        # move everyone except dead compartment
+        self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect])
+        #print("i: ", i, "(", self.S[i], ",",self.E[i],",", self.I[i],",", self.R[i], ",", self.D[i], ")")
+
     def toDataFrame(self):
         """
         Convert the data to a dataframe.
@@ -219,12 +222,14 @@ class RandMoveSEIRDV(RandMoveSEIRD):
         pd.DataFrame
             Holds the data of simulation in a DataFrame format.
         """
+        import pandas as pd
         t = np.linspace(0,self.days,self.days+1)
         arr = np.stack([t, self.S, self.E, self.I, self.R, self.D, self.V], axis=1)
         df = pd.DataFrame(arr, columns=["Days", "Susceptible", "Exposed", "Infected", "Recovered", "Dead", "Vaccinated"])
         return df
     
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0,self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5, ax6) = plt.subplots(nrows=6, sharex="all")
         ax1.set_title("Random Movement SEIRDV")
@@ -1,6 +1,4 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .randMoveSEIRDV import RandMoveSEIRDV
 
@@ -72,6 +70,18 @@ class RandMoveSEIRSDV(RandMoveSEIRDV):
     alpha: float optional
         A constant used in the _infect() method. The greater the constant, the greater the infection probability. Default is 2.0
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -96,32 +106,32 @@ class RandMoveSEIRSDV(RandMoveSEIRDV):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Dcollect: list
+    Dcollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is DEAD. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Vcollect: list
+    Vcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is VACCINATED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -134,52 +144,57 @@ class RandMoveSEIRSDV(RandMoveSEIRDV):
     
     """
     def __init__(self, S0:int, E0:int, I0:int, R0:int, V0: int, rho: float, gamma: float, mu: float, eta:float, kappa: float, planeSize: float, move_r: float, sigma_R: float, 
-        spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, timeDelay=-1):
+        spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         # error checks
         self.intCheck([S0, E0, I0, R0, V0, days])
         self.floatCheck(rho, gamma, mu, kappa, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha, timeDelay)
         self.negValCheck(S0, E0, I0, R0, V0, rho, gamma, mu, kappa, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([rho, gamma, mu, kappa, eta, w0])
         super(RandMoveSEIRSDV, self).__init__(S0=S0, E0=E0, I0=I0, R0=0, V0=V0, rho=rho, gamma=gamma, mu=mu, eta=eta, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,
-        days=days)
+        days=days, engine=engine, rng=rng, record=record)
         self.kappa = kappa
     
     def _RtoS(self):
         return self._changeHelp(self.Rcollect, self.kappa)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days+1):
-            # run the state changes and get the transfer sets
-            StoE = self._StoE(i)
-            StoV = set()
-            if i > self.timeDelay:
-                StoV = self._StoV()
-            EtoI = self._EtoI()
-            ItoR = self._ItoR()
-            ItoD = self._ItoD()
-            RtoS = self._RtoS()
-            # change the states of those in the transfer sets
-            self._stateChanger(StoE, self.Ecollect, "E", i)
-            self._stateChanger(EtoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(ItoD, self.Dcollect, "D", i)
-            self._stateChanger(StoV, self.Vcollect, "V", i)
-            self._stateChanger(RtoS, self.Scollect, "S", i)
-            # modify the numbers
-            self.S[i] = self.S[i-1] - len(StoE) - len(StoV) + len(RtoS)
-            self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
-            self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD)
-            #print("I[i-1]: ", self.I[i], " EtoI: ", len(EtoI), " ItoR: ", len(ItoR), " ItoD: ", len(ItoD), "I[i]: ", self.I[i], "Sum: ", self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD))
-            self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
-            self.V[i] = self.V[i-1] + len(StoV)
-            self.D[i] = self.D[i-1] + len(ItoD)
-            # move everyone except dead compartment
-            self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect])
-            #print("i: ", i, "(", self.S[i], ",",self.E[i],",", self.I[i],",", self.R[i], ",", self.D[i], ")")
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        # run the state changes and get the transfer sets
+        StoE = self._StoE(i)
+        StoV = set()
+        if i > self.timeDelay:
+            StoV = self._StoV()
+        EtoI = self._EtoI()
+        ItoR = self._ItoR()
+        ItoD = self._ItoD()
+        RtoS = self._RtoS()
+        # change the states of those in the transfer sets
+        self._stateChanger(StoE, self.Ecollect, "E", i)
+        self._stateChanger(EtoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(ItoD, self.Dcollect, "D", i)
+        self._stateChanger(StoV, self.Vcollect, "V", i)
+        self._stateChanger(RtoS, self.Scollect, "S", i)
+        # modify the numbers
+        self.S[i] = self.S[i-1] - len(StoE) - len(StoV) + len(RtoS)
+        self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
+        self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD)
+        #print("I[i-1]: ", self.I[i], " EtoI: ", len(EtoI), " ItoR: ", len(ItoR), " ItoD: ", len(ItoD), "I[i]: ", self.I[i], "Sum: ", self.I[i-1] + len(EtoI) - len(ItoR) - len(ItoD))
+        self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
+        self.V[i] = self.V[i-1] + len(StoV)
+        self.D[i] = self.D[i-1] + len(ItoD)
+        # move everyone except dead compartment
+        self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect])
+        #print("i: ", i, "(", self.S[i], ",",self.E[i],",", self.I[i],",", self.R[i], ",", self.D[i], ")")
     
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0,self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5, ax6) = plt.subplots(nrows=6, sharex="all")
         ax1.set_title("Random Movement SEIRSDV")
@@ -1,10 +1,7 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .randMoveSEIR import RandMoveSEIR
-from Eir.utility import randEvent
-from Eir.utility import Person1 as Person
+from Eir.DTMC.spatialModel.population import Population, startCounts
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
 
@@ -76,6 +73,18 @@ class RandMoveSEIRV(RandMoveSEIR):
     timeDelay: int optional
         Default is -1. Represents the number of days that vaccine rollout should be delayed. If <=0, there is no vaccine rollout delay.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -97,27 +106,27 @@ class RandMoveSEIRV(RandMoveSEIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + E0 + I0 + R0 + V0
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with integers [0, popsize). 
     
-    Ecollect: list
+    Ecollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is EXPOSED. Has a total of popsize Person objects,
         with integers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with integers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with integers [0, popsize).
     
-    Vcollect: list
+    Vcollect: Collect
         Used to keep track of the states each Person object is in. If copy of Person object has isIncluded==True, the the person is VACCINATED. 
         Has a total of popsize Person objects, with integers [0,popsize).
 
@@ -129,13 +138,13 @@ class RandMoveSEIRV(RandMoveSEIR):
     """
 
     def __init__(self, S0:int, E0:int, I0:int, R0:int, V0: int, rho: float, gamma: float, eta:float, planeSize: float, move_r: float, sigma_R: float, 
-    spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, timeDelay=-1):
+    spread_r: float, sigma_r: float, days:int, w0=1.0, alpha=2.0, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         self.intCheck([S0, E0, I0, R0, V0, days])
         self.floatCheck(rho, gamma, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha, timeDelay)
         self.negValCheck(S0, E0, I0, R0, V0, rho, gamma, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([rho, gamma, eta, w0])
         super(RandMoveSEIRV, self).__init__(S0=S0, E0=E0, I0=I0, R0=0, rho=rho, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,
-        days=days)
+        days=days, engine=engine, rng=rng, record=record)
         # probability of S->V given that not S->E
         self.eta = eta
         # the time delay of vaccine rollout
@@ -143,66 +152,58 @@ class RandMoveSEIRV(RandMoveSEIR):
         # the total size of the population
         self.popsize += V0
         # Simul_Details object
-        self.details = Simul_Details(self.days, self.popsize)
+        self.details = Simul_Details(self.days, self.popsize, level=record)
         # reinstantiate the collect structures
-        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect = [], [], [], [], []
         # stores the number of vaccinated people on each day.
         self.V = np.zeros(days+1)
         self.V[0] = V0
-        loc_x, loc_y, spreading_r = np.random.random(self.popsize)*planeSize, np.random.random(self.popsize)*planeSize, np.random.normal(spread_r, sigma_r, self.popsize)
+        loc_x, loc_y, spreading_r = self.rng.random(self.popsize)*planeSize, self.rng.random(self.popsize)*planeSize, self.rng.normal(spread_r, sigma_r, self.popsize)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SEIRV", startCounts([S0, E0, I0, R0, None], self.popsize), loc_x, loc_y, r0=spreading_r)
+        self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect = self.population.collects("SEIRV")
         for i in range(self.popsize):
-            p1 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p2 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p3 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p4 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p5 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])            
             if i < S0:
-                p1.isIncluded=True
                 self.details.addStateChange(i, "S", 0)
             elif i< S0+E0:
-                p2.isIncluded=True
                 self.details.addStateChange(i, "E", 0)
             elif i< S0+E0+I0:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "I", 0)
             elif i< S0+E0+I0+R0:
-                p4.isIncluded=True
                 self.details.addStateChange(i, "R", 0)
             else:
-                p5.isIncluded=True
                 self.details.addStateChange(i, "V", 0)
-            self.Scollect.append(p1)
-            self.Ecollect.append(p2)
-            self.Icollect.append(p3)
-            self.Rcollect.append(p4)
-            self.Vcollect.append(p5)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
     def _StoV(self):
         return self._changeHelp(self.Scollect, self.eta)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days+1):
-            StoE = self._StoE(i)
-            StoV = set()
-            if i > self.timeDelay:
-                StoV = self._StoV()
-            EtoI = self._EtoI()
-            ItoR = self._ItoR()
-            self._stateChanger(StoE, self.Ecollect, "E", i)
-            self._stateChanger(EtoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(StoV, self.Vcollect, "V", i)
-            self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect])
-            self.S[i] = self.S[i-1] - len(StoE) - len(StoV)
-            self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
-            self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR)
-            self.R[i] = self.R[i-1] + len(ItoR)
-            self.V[i] = self.V[i-1] + len(StoV)
+        # run the days that haven't been run yet
+        self._advance(self.days)
             
 
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        StoE = self._StoE(i)
+        StoV = set()
+        if i > self.timeDelay:
+            StoV = self._StoV()
+        EtoI = self._EtoI()
+        ItoR = self._ItoR()
+        self._stateChanger(StoE, self.Ecollect, "E", i)
+        self._stateChanger(EtoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(StoV, self.Vcollect, "V", i)
+        self._move(i, [self.Scollect, self.Ecollect, self.Icollect, self.Rcollect, self.Vcollect])
+        self.S[i] = self.S[i-1] - len(StoE) - len(StoV)
+        self.E[i] = self.E[i-1] + len(StoE) - len(EtoI)
+        self.I[i] = self.I[i-1] + len(EtoI) - len(ItoR)
+        self.R[i] = self.R[i-1] + len(ItoR)
+        self.V[i] = self.V[i-1] + len(StoV)
     
     def toDataFrame(self):
         """
@@ -215,6 +216,7 @@ class RandMoveSEIRV(RandMoveSEIR):
             DataFrame object containing the number of susceptibles and number of infecteds on each day. 
 
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -225,6 +227,7 @@ class RandMoveSEIRV(RandMoveSEIR):
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
@@ -1,12 +1,7 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-import math
 
-import Eir.utility as u
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
-# not to be confused with the person object that is used in the Hub/Strong Infectious Model
-from Eir.utility import Person1 as Person
+from Eir.DTMC.spatialModel.population import Population
 from Eir.DTMC.spatialModel.randomMovement.randMoveSIS import RandMoveSIS
 
 class RandMoveSIR(RandMoveSIS):
@@ -63,6 +58,18 @@ class RandMoveSIR(RandMoveSIS):
     alpha: float optional
         A constant used in the _infect() method. The greater the constant, the greater the infection probability. Default is 2.0.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -78,17 +85,17 @@ class RandMoveSIR(RandMoveSIS):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0 + R0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -102,49 +109,36 @@ class RandMoveSIR(RandMoveSIS):
      """
 
     def __init__(self, S0:int, I0:int, R0:int, gamma:float, planeSize:float, move_r:float, sigma_R:float, spread_r:float, sigma_r: float,
-    days:int, w0=1.0, alpha=2.0):
+    days:int, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         self.intCheck([S0, I0, R0, days])
         self.floatCheck(gamma, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha)
         self.negValCheck(S0, I0, R0, gamma, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([gamma, w0])
         super(RandMoveSIR, self).__init__(S0=S0, I0=I0, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,
-        days=days, w0=w0, alpha=alpha)
+        days=days, w0=w0, alpha=alpha, engine=engine, rng=rng, record=record)
         self.R0 = R0
         self.R = np.zeros(days+1)
         self.R[0] = R0
         self.popsize += self.R0
         # redirect details object to point to another object to delete copies in inheritance
-        self.details = Simul_Details(days, self.popsize)
-        self.Scollect, self.Icollect, self.Rcollect = [], [], []
-        spreading_r = np.random.normal(spread_r, sigma_r, S0+I0+R0)
+        self.details = Simul_Details(days, self.popsize, level=record)
+        spreading_r = self.rng.normal(spread_r, sigma_r, S0+I0+R0)
         # generate the random x, y locations with every position within the plane being equally likely
-        loc_x = np.random.random(S0+I0+R0) * planeSize
-        loc_y = np.random.random(S0+I0+R0) * planeSize
-        # create the special objects:
+        loc_x = self.rng.random(S0+I0+R0) * planeSize
+        loc_y = self.rng.random(S0+I0+R0) * planeSize
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SIR", [S0, I0, R0], loc_x, loc_y, r0=spreading_r)
+        self.Scollect, self.Icollect, self.Rcollect = self.population.collects("SIR")
         for i in range(self.popsize):
-            # create the person object
-            # for this model, the people will move with random radius R each timestep
-            # therefore, the R component can be made 0, as that is only relevant for the 
-            # periodic mobility model
-            p1 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p2 = Person(loc_x[i], loc_y[i], 0, spreading_r[i]) 
-            p3 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            self.details.addLocation(0, (loc_x[i], loc_y[i]))       
-            # if the person is in the susceptible objects created
+            # record which compartment the person starts in
             if i < S0:
-                p1.isIncluded = True
                 self.details.addStateChange(i, "S", 0)
             elif S0 <= i < S0+I0:
-                p2.isIncluded = True
                 self.details.addStateChange(i, "I", 0)
             else:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "R", 0)
-            # append them to the data structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.Rcollect.append(p3)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
 
     def _ItoR(self):
@@ -154,10 +148,10 @@ class RandMoveSIR(RandMoveSIS):
         Return
         ------
 
-        set:
+        ndarray:
             contains the indices of people who should get transferred from I to R compartment.
         """
-        # set that contains the indices for transfering from I to S
+        # indices of the people transfering from I to S
         return self._changeHelp(self.Icollect, self.gamma)
 
     def run(self, getDetails=True):
@@ -181,24 +175,28 @@ class RandMoveSIR(RandMoveSIS):
         """
 
         # for all the days in the simulation
-        for i in range(1, self.days+1):
-            #print("Day ", i)
-            #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
-            # run the state changes
-            StoI = self._StoI(i)
-            ItoR = self._ItoR()
-            # change the indices of the transfers
-            self._stateChanger(StoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            
-            # make everyone move randomly
-            self._move(i, [self.Scollect, self.Icollect, self.Rcollect])
-            # change the values in the arrays
-            self.S[i] = self.S[i-1] - len(StoI)
-            self.I[i] = self.I[i-1] + len(StoI) - len(ItoR)
-            self.R[i] = self.R[i-1] + len(ItoR)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ", i)
+        #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
+        # run the state changes
+        StoI = self._StoI(i)
+        ItoR = self._ItoR()
+        # change the indices of the transfers
+        self._stateChanger(StoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+
+        # make everyone move randomly
+        self._move(i, [self.Scollect, self.Icollect, self.Rcollect])
+        # change the values in the arrays
+        self.S[i] = self.S[i-1] - len(StoI)
+        self.I[i] = self.I[i-1] + len(StoI) - len(ItoR)
+        self.R[i] = self.R[i-1] + len(ItoR)
     
     def toDataFrame(self):
         """
@@ -211,6 +209,7 @@ class RandMoveSIR(RandMoveSIS):
             DataFrame object containing the number of susceptibles and number of infecteds on each day. 
 
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -223,6 +222,7 @@ class RandMoveSIR(RandMoveSIS):
     def plot(self):
         
         "Plots the number of susceptible and infected individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3) = plt.subplots(nrows=3, sharex='all')
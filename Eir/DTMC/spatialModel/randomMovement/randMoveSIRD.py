@@ -1,9 +1,7 @@
 import numpy as np
-from matplotlib import pyplot as plt
-import pandas as pd
 
 from .randMoveSIR import RandMoveSIR
-from Eir.utility import Person1 as Person
+from Eir.DTMC.spatialModel.population import Population
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
 class RandMoveSIRD(RandMoveSIR):
@@ -63,6 +61,18 @@ class RandMoveSIRD(RandMoveSIR):
     alpha: float optional
         A constant used in the _infect() method. The greater the constant, the greater the infection probability. Default is 2.0.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -81,22 +91,22 @@ class RandMoveSIRD(RandMoveSIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0 + R0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Dcollect: list
+    Dcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is DEAD. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -108,48 +118,32 @@ class RandMoveSIRD(RandMoveSIR):
         history of each person, and more.
     
      """
-    def __init__(self, S0, I0, R0, gamma, mu, planeSize, move_r:float, sigma_R:float, spread_r:float, sigma_r: float, days:int, w0=1.0, alpha=2.0):
+    def __init__(self, S0, I0, R0, gamma, mu, planeSize, move_r:float, sigma_R:float, spread_r:float, sigma_r: float, days:int, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         self.intCheck([S0, I0, R0, days])
         self.floatCheck(gamma, mu, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha)
         self.negValCheck(S0, I0, R0, gamma, mu, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([gamma, mu, w0])
         # I->D if not I->R
         self.mu = mu
-        super(RandMoveSIRD, self).__init__(S0=S0, I0=I0, R0=R0, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,days=days)
-        self.details = Simul_Details(self.days, self.popsize)
-        self.Dcollect = []
-        self.Scollect, self.Icollect, self.Rcollect = [], [], []
-        spreading_r = np.random.normal(spread_r, sigma_r, S0+I0)
+        super(RandMoveSIRD, self).__init__(S0=S0, I0=I0, R0=R0, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,days=days, engine=engine, rng=rng, record=record)
+        self.details = Simul_Details(self.days, self.popsize, level=record)
+        spreading_r = self.rng.normal(spread_r, sigma_r, S0+I0)
         # generate the random x, y locations with every position within the plane being equally likely
-        loc_x = np.random.random(S0+I0) * planeSize
-        loc_y = np.random.random(S0+I0) * planeSize
-        # create the special objects:
+        loc_x = self.rng.random(S0+I0) * planeSize
+        loc_y = self.rng.random(S0+I0) * planeSize
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SIRD", [S0, I0, R0, 0], loc_x, loc_y, r0=spreading_r)
+        self.Scollect, self.Icollect, self.Rcollect, self.Dcollect = self.population.collects("SIRD")
         for i in range(self.popsize):
-            # create the person object
-            # for this model, the people will move with random radius R each timestep
-            # therefore, the R component can be made 0, as that is only relevant for the 
-            # periodic mobility model
-            p1 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p2 = Person(loc_x[i], loc_y[i], 0, spreading_r[i]) 
-            p3 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p4 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            self.details.addLocation(0, (loc_x[i], loc_y[i]))       
-            # if the person is in the susceptible objects created
+            # record which compartment the person starts in
             if i < S0:
-                p1.isIncluded = True
                 self.details.addStateChange(i, "S", 0)
             elif S0 <= i < S0+I0:
-                p2.isIncluded = True
                 self.details.addStateChange(i, "I", 0)
             else:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "R", 0)
-            # append them to the data structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.Rcollect.append(p3)
-            self.Dcollect.append(p4)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
         self.D = np.zeros(days+1)
     
     def _ItoD(self):
@@ -176,27 +170,31 @@ class RandMoveSIRD(RandMoveSIR):
         """
 
         # for all the days in the simulation
-        for i in range(1, self.days+1):
-            #print("Day ", i)
-            #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
-            # run the state changes
-            StoI = self._StoI(i)
-            ItoR = self._ItoR()
-            ItoD = self._ItoD()
-            # change the indices of the transfers
-            self._stateChanger(StoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(ItoD, self.Dcollect, "D", i)
-            
-            # make everyone move randomly, don't move dead people
-            self._move(i, [self.Scollect, self.Icollect, self.Rcollect])
-            # change the values in the arrays
-            self.S[i] = self.S[i-1] - len(StoI)
-            self.I[i] = self.I[i-1] + len(StoI) - len(ItoR) - len(ItoD)
-            self.R[i] = self.R[i-1] + len(ItoR)
-            self.D[i] = self.D[i-1] + len(ItoD)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ", i)
+        #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
+        # run the state changes
+        StoI = self._StoI(i)
+        ItoR = self._ItoR()
+        ItoD = self._ItoD()
+        # change the indices of the transfers
+        self._stateChanger(StoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(ItoD, self.Dcollect, "D", i)
+
+        # make everyone move randomly, don't move dead people
+        self._move(i, [self.Scollect, self.Icollect, self.Rcollect])
+        # change the values in the arrays
+        self.S[i] = self.S[i-1] - len(StoI)
+        self.I[i] = self.I[i-1] + len(StoI) - len(ItoR) - len(ItoD)
+        self.R[i] = self.R[i-1] + len(ItoR)
+        self.D[i] = self.D[i-1] + len(ItoD)
         
     def toDataFrame(self):
         """
@@ -209,6 +207,7 @@ class RandMoveSIRD(RandMoveSIR):
             DataFrame object containing the number of susceptibles and number of infecteds on each day. 
 
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -219,6 +218,7 @@ class RandMoveSIRD(RandMoveSIR):
     
     def plot(self):
         "Plots the number of susceptible, infected, dead, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
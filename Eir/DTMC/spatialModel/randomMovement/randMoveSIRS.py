@@ -1,8 +1,6 @@
 import numpy as np
-from matplotlib import pyplot as plt
 
 from .randMoveSIR import RandMoveSIR
-import Eir.utility as u
 
 class RandMoveSIRS(RandMoveSIR):
     """
@@ -61,6 +59,18 @@ class RandMoveSIRS(RandMoveSIR):
     alpha: float optional
         A constant used in the _infect() method. The greater the constant, the greater the infection probability.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -76,17 +86,17 @@ class RandMoveSIRS(RandMoveSIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -100,13 +110,13 @@ class RandMoveSIRS(RandMoveSIR):
      """
 
     def __init__(self, S0:int, I0:int, R0:int, gamma:float, kappa:float, planeSize:float, move_r:float, sigma_R:float, spread_r:float, sigma_r: float,
-    days:int, w0=1.0, alpha=2.0):
+    days:int, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         self.intCheck([S0, I0, R0, days])
         self.floatCheck(gamma, kappa, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha)
         self.negValCheck(S0, I0, R0, gamma, kappa, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([gamma, kappa, w0])
         super(RandMoveSIRS, self).__init__(S0=S0, I0=I0, R0=R0, gamma=gamma, planeSize=planeSize,move_r=move_r, sigma_R=sigma_R, spread_r=spread_r,sigma_r=sigma_r,
-        days=days, w0=w0, alpha=alpha)
+        days=days, w0=w0, alpha=alpha, engine=engine, rng=rng, record=record)
         self.kappa = kappa
 
     def _RtoS(self):
@@ -116,36 +126,41 @@ class RandMoveSIRS(RandMoveSIR):
         Return
         ------
 
-        set:
-            set contains the indices of person object who should go from R -> S. Eventually will loop through set to change the isIncluded attributes of Scollect.
+        ndarray:
+            contains the indices of the people who should go from R -> S. Eventually will loop through them to put them in Scollect.
         """
         return self._changeHelp(self.Rcollect, self.kappa)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days+1):
-            #print("Day ", i)
-            #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
-            # run the state changes
-            StoI = self._StoI(i)
-            ItoR = self._ItoR()
-            RtoS = self._RtoS()
-            # change the indices of the transfers
-            self._stateChanger(StoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(RtoS, self.Scollect, "S", i)
-            # make everyone move randomly
-            self._move(i, [self.Scollect, self.Icollect, self.Rcollect])
-            # change the values in the arrays
-            self.S[i] = self.S[i-1] - len(StoI) + len(RtoS)
-            self.I[i] = self.I[i-1] + len(StoI) - len(ItoR)
-            self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ", i)
+        #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
+        # run the state changes
+        StoI = self._StoI(i)
+        ItoR = self._ItoR()
+        RtoS = self._RtoS()
+        # change the indices of the transfers
+        self._stateChanger(StoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(RtoS, self.Scollect, "S", i)
+        # make everyone move randomly
+        self._move(i, [self.Scollect, self.Icollect, self.Rcollect])
+        # change the values in the arrays
+        self.S[i] = self.S[i-1] - len(StoI) + len(RtoS)
+        self.I[i] = self.I[i-1] + len(StoI) - len(ItoR)
+        self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
     
     # maybe add picking what to plot later
     def plot(self):
         
         "Plots the number of susceptible and infected individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3) = plt.subplots(nrows=3, sharex='all')
@@ -1,10 +1,6 @@
 import numpy as np
-from matplotlib import pyplot as plt
-import pandas as pd
 
 from .randMoveSIRD import RandMoveSIRD
-from Eir.utility import Person1 as Person
-from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
 class RandMoveSIRSD(RandMoveSIRD):
     """
@@ -66,6 +62,18 @@ class RandMoveSIRSD(RandMoveSIRD):
     alpha: float optional
         A constant used in the _infect() method. The greater the constant, the greater the infection probability. Default is 2.0.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -84,22 +92,22 @@ class RandMoveSIRSD(RandMoveSIRD):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0 + R0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Dcollect: list
+    Dcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is DEAD. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -111,14 +119,14 @@ class RandMoveSIRSD(RandMoveSIRD):
         history of each person, and more.
     
      """
-    def __init__(self, S0, I0, R0, gamma, mu, kappa, planeSize, move_r:float, sigma_R:float, spread_r:float, sigma_r: float, days:int, w0=1.0, alpha=2.0):
+    def __init__(self, S0, I0, R0, gamma, mu, kappa, planeSize, move_r:float, sigma_R:float, spread_r:float, sigma_r: float, days:int, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         self.intCheck([S0, I0, R0, days])
         self.floatCheck(gamma, kappa, mu, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha)
         self.negValCheck(S0, I0, R0, gamma, kappa, mu, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([gamma, kappa, mu, w0])
         self.kappa = kappa
         super(RandMoveSIRSD, self).__init__(S0=S0, I0=I0, R0=R0, gamma=gamma, mu=mu, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r,
-        days=days)
+        days=days, engine=engine, rng=rng, record=record)
 
     def _RtoS(self):
         return self._changeHelp(self.Rcollect, self.kappa)
@@ -144,32 +152,37 @@ class RandMoveSIRSD(RandMoveSIRD):
         """
 
         # for all the days in the simulation
-        for i in range(1, self.days+1):
-            #print("Day ", i)
-            #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
-            # run the state changes
-            StoI = self._StoI(i)
-            ItoR = self._ItoR()
-            ItoD = self._ItoD()
-            RtoS = self._RtoS()
-            # change the indices of the transfers
-            self._stateChanger(StoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(ItoD, self.Dcollect, "D", i)
-            self._stateChanger(RtoS, self.Scollect, "S", i)
-            
-            # make everyone move randomly, don't move dead people
-            self._move(i, [self.Scollect, self.Icollect, self.Rcollect])
-            # change the values in the arrays
-            self.S[i] = self.S[i-1] - len(StoI) + len(RtoS)
-            self.I[i] = self.I[i-1] + len(StoI) - len(ItoR) - len(ItoD)
-            self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
-            self.D[i] = self.D[i-1] + len(ItoD)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ", i)
+        #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
+        # run the state changes
+        StoI = self._StoI(i)
+        ItoR = self._ItoR()
+        ItoD = self._ItoD()
+        RtoS = self._RtoS()
+        # change the indices of the transfers
+        self._stateChanger(StoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(ItoD, self.Dcollect, "D", i)
+        self._stateChanger(RtoS, self.Scollect, "S", i)
+
+        # make everyone move randomly, don't move dead people
+        self._move(i, [self.Scollect, self.Icollect, self.Rcollect])
+        # change the values in the arrays
+        self.S[i] = self.S[i-1] - len(StoI) + len(RtoS)
+        self.I[i] = self.I[i-1] + len(StoI) - len(ItoR) - len(ItoD)
+        self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
+        self.D[i] = self.D[i-1] + len(ItoD)
     
     def plot(self):
         "Plots the number of susceptible, infected, dead, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
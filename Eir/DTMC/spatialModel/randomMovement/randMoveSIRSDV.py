@@ -1,6 +1,4 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
 from .randMoveSIRDV import RandMoveSIRDV
 
@@ -71,7 +69,19 @@ class RandMoveSIRSDV(RandMoveSIRDV):
         A constant used in the _infect() method. The greater the constant, the greater the infection probability. Default is 2.0.
     
     timeDelay: float optional
-        Default is -1.0. After days > timeDelay, vaccinations will begin rolling out with probaiblity eta. 
+        Default is -1.0. After days > timeDelay, vaccinations will begin rolling out with probaiblity eta.
+
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
 
     Attributes
     ----------
@@ -94,27 +104,27 @@ class RandMoveSIRSDV(RandMoveSIRDV):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0 + R0 + V0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Dcollect: list
+    Dcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is DEAD. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Vcollect: list
+    Vcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is VACCINATED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -126,12 +136,12 @@ class RandMoveSIRSDV(RandMoveSIRDV):
         history of each person, and more.
     
      """
-    def __init__(self, S0, I0, R0, V0, gamma, mu, eta, kappa, planeSize, move_r:float, sigma_R:float, spread_r:float, sigma_r: float, days:int, w0=1.0, alpha=2.0, timeDelay=-4):
+    def __init__(self, S0, I0, R0, V0, gamma, mu, eta, kappa, planeSize, move_r:float, sigma_R:float, spread_r:float, sigma_r: float, days:int, w0=1.0, alpha=2.0, timeDelay=-4, engine="loop", rng=None, record="trajectories"):
         self.intCheck([S0, I0, R0, V0, days])
         self.floatCheck(gamma, mu, eta, kappa, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha, timeDelay)
         self.negValCheck(S0, I0, R0, V0, gamma, mu, eta, kappa, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([gamma, mu, eta, kappa, w0])
-        super(RandMoveSIRSDV, self).__init__(S0=S0, I0=I0, R0=R0, V0=V0, gamma=gamma, mu=mu, eta=eta, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r, days=days, timeDelay=4)
+        super(RandMoveSIRSDV, self).__init__(S0=S0, I0=I0, R0=R0, V0=V0, gamma=gamma, mu=mu, eta=eta, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r, days=days, timeDelay=4, engine=engine, rng=rng, record=record)
         self.kappa = kappa
     
     def _RtoS(self):
@@ -158,36 +168,41 @@ class RandMoveSIRSDV(RandMoveSIRDV):
         """
 
         # for all the days in the simulation
-        for i in range(1, self.days+1):
-            #print("Day ", i)
-            #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
-            # run the state changes
-            StoI = self._StoI(i)
-            StoV = set()
-            if i > self.timeDelay:
-                StoV = self._StoV()
-            ItoR = self._ItoR()
-            ItoD = self._ItoD()
-            RtoS = self._RtoS()
-            # change the indices of the transfers
-            self._stateChanger(StoI, self.Icollect, "I", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(ItoD, self.Dcollect, "D", i)
-            self._stateChanger(StoV, self.Vcollect, "V", i)
-            self._stateChanger(RtoS, self.Scollect, "S", i)
-            
-            # make everyone move randomly, don't move dead people
-            self._move(i, [self.Scollect, self.Icollect, self.Rcollect, self.Vcollect])
-            # change the values in the arrays
-            self.S[i] = self.S[i-1] - len(StoI) - len(StoV) + len(RtoS)
-            self.I[i] = self.I[i-1] + len(StoI) - len(ItoR) - len(ItoD)
-            self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
-            self.V[i] = self.V[i-1] + len(StoV)
-            self.D[i] = self.D[i-1] + len(ItoD)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ", i)
+        #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
+        # run the state changes
+        StoI = self._StoI(i)
+        StoV = set()
+        if i > self.timeDelay:
+            StoV = self._StoV()
+        ItoR = self._ItoR()
+        ItoD = self._ItoD()
+        RtoS = self._RtoS()
+        # change the indices of the transfers
+        self._stateChanger(StoI, self.Icollect, "I", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(ItoD, self.Dcollect, "D", i)
+        self._stateChanger(StoV, self.Vcollect, "V", i)
+        self._stateChanger(RtoS, self.Scollect, "S", i)
+
+        # make everyone move randomly, don't move dead people
+        self._move(i, [self.Scollect, self.Icollect, self.Rcollect, self.Vcollect])
+        # change the values in the arrays
+        self.S[i] = self.S[i-1] - len(StoI) - len(StoV) + len(RtoS)
+        self.I[i] = self.I[i-1] + len(StoI) - len(ItoR) - len(ItoD)
+        self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
+        self.V[i] = self.V[i-1] + len(StoV)
+        self.D[i] = self.D[i-1] + len(ItoD)
     
     def plot(self):
+        from matplotlib import pyplot as plt
         t = np.linspace(0,self.days, self.days+1)
         fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(nrows=5, sharex='all')
         ax1.plot(t, self.S, label="Susceptible", color='r')
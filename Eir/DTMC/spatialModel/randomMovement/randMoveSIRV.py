@@ -1,9 +1,6 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 
-from Eir.utility import randEvent
-from Eir.utility import Person1 as Person
+from Eir.DTMC.spatialModel.population import Population
 from .randMoveSIR import RandMoveSIR
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
 
@@ -71,6 +68,18 @@ class RandMoveSIRV(RandMoveSIR):
     timeDelay: int optional
         The time delay before the vaccine rollout. Default value is 0. If the day is greater than the time delay, then vaccine rollout will begin.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -89,22 +98,22 @@ class RandMoveSIRV(RandMoveSIR):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0 + R0 + V0
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
 
-    Vcollect: list
+    Vcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is VACCINATED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
@@ -117,14 +126,14 @@ class RandMoveSIRV(RandMoveSIR):
     """
     
     def __init__(self, S0, I0, R0, V0, eta, gamma, planeSize, move_r:float, sigma_R:float, spread_r:float, sigma_r: float,
-    days:int, w0=1.0, alpha=2.0, timeDelay=-1):
+    days:int, w0=1.0, alpha=2.0, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
 
         self.intCheck([S0, I0, R0, V0, days])
         self.floatCheck(gamma, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha, timeDelay)
         self.negValCheck(S0, I0, R0, V0, gamma, eta, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([gamma, eta, w0])
 
-        super(RandMoveSIRV, self).__init__(S0=S0, I0=I0, R0=R0, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r, days=days, w0=w0, alpha=alpha)
+        super(RandMoveSIRV, self).__init__(S0=S0, I0=I0, R0=R0, gamma=gamma, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r, days=days, w0=w0, alpha=alpha, engine=engine, rng=rng, record=record)
         # P(S->V|not S->E)
         self.eta = eta
         self.V0 = V0
@@ -134,32 +143,23 @@ class RandMoveSIRV(RandMoveSIR):
 
         self.popsize = S0 + I0 + R0 + V0
         # reinitialize the details Simul_Details object
-        self.details = Simul_Details(days=days, popsize=self.popsize)
-        self.Scollect, self.Icollect, self.Rcollect, self.Vcollect = [], [], [], []
-        loc_x, loc_y = np.random.random(self.popsize)*planeSize, np.random.random(self.popsize)*planeSize
-        spreading_r = np.random.normal(spread_r, sigma_r, size=self.popsize)
+        self.details = Simul_Details(days=days, popsize=self.popsize, level=record)
+        loc_x, loc_y = self.rng.random(self.popsize)*planeSize, self.rng.random(self.popsize)*planeSize
+        spreading_r = self.rng.normal(spread_r, sigma_r, size=self.popsize)
+        # everyone is stored once in the population; the collects are views of its compartments
+        self.population = Population("SIRV", [S0, I0, R0, V0], loc_x, loc_y, r0=spreading_r)
+        self.Scollect, self.Icollect, self.Rcollect, self.Vcollect = self.population.collects("SIRV")
         for i in range(self.popsize):
-            p1 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p2 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p3 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p4 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
             if i<S0:
-                p1.isIncluded=True
                 self.details.addStateChange(i, "S", 0)
             elif S0 <= i < S0+I0:
-                p2.isIncluded=True
                 self.details.addStateChange(i, "I", 0)
             elif S0+I0 <= i < S0+I0+R0:
-                p3.isIncluded=True
                 self.details.addStateChange(i, "R", 0)
             else:
-                p4.isIncluded=True
                 self.details.addStateChange(i, "V", 0)
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.Rcollect.append(p3)
-            self.Vcollect.append(p4)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
     
     def _StoV(self):
         """
@@ -168,28 +168,32 @@ class RandMoveSIRV(RandMoveSIR):
         Returns
         -------
 
-        set:
+        ndarray:
             Contains all of the indices representing people who will move from S to V.
         """
         return self._changeHelp(self.Scollect, self.eta)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days+1):
-            StoI = self._StoI(i)
-            StoV = set()
-            if i > self.timeDelay:
-                StoV = self._StoV()
-            ItoR = self._ItoR()
-            self._stateChanger(StoI, self.Icollect, "I", i)
-            self._stateChanger(StoV, self.Vcollect, "V", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._move(i, [self.Scollect, self.Icollect, self.Rcollect, self.Vcollect])
-            self.S[i] = self.S[i-1] - len(StoI) - len(StoV)
-            self.I[i] = self.I[i-1] + len(StoI) - len(ItoR)
-            self.R[i] = self.R[i-1] + len(ItoR)
-            self.V[i] = self.V[i-1] + len(StoV)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        StoI = self._StoI(i)
+        StoV = set()
+        if i > self.timeDelay:
+            StoV = self._StoV()
+        ItoR = self._ItoR()
+        self._stateChanger(StoI, self.Icollect, "I", i)
+        self._stateChanger(StoV, self.Vcollect, "V", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._move(i, [self.Scollect, self.Icollect, self.Rcollect, self.Vcollect])
+        self.S[i] = self.S[i-1] - len(StoI) - len(StoV)
+        self.I[i] = self.I[i-1] + len(StoI) - len(ItoR)
+        self.R[i] = self.R[i-1] + len(ItoR)
+        self.V[i] = self.V[i-1] + len(StoV)
     
     def toDataFrame(self):
         """
@@ -202,6 +206,7 @@ class RandMoveSIRV(RandMoveSIR):
             DataFrame object containing the number of susceptibles and number of infecteds on each day. 
 
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -212,6 +217,7 @@ class RandMoveSIRV(RandMoveSIR):
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
@@ -1,8 +1,6 @@
 import numpy as np
-from matplotlib import pyplot as plt
 
 from .randMoveSIRV import RandMoveSIRV
-from Eir.utility import randEvent
 
 class RandMoveSIRVS(RandMoveSIRV):
     """
@@ -69,6 +67,18 @@ class RandMoveSIRVS(RandMoveSIRV):
     timeDelay: int optional
         The time delay before the vaccine rollout. Default value is 0. If the day is greater than the time delay, then vaccine rollout will begin.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -87,22 +97,22 @@ class RandMoveSIRVS(RandMoveSIRV):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0 + R0 + V0.
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is SUSCEPTIBLE. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
     
-    Rcollect: list
+    Rcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is RECOVERED. Has a total of popsize Person objects,
         with numbers [0, popsize).
 
-    Vcollect: list
+    Vcollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is VACCINATED. Has a total of popsize Person objects,
         with numbers [0, popsize). 
@@ -114,12 +124,12 @@ class RandMoveSIRVS(RandMoveSIRV):
         history of each person, and more.
     """
     def __init__(self, S0: int, I0:int, R0:int, V0:int, eta:float, gamma:float, kappa:float, planeSize:float, move_r:float, sigma_R:float, spread_r:float, sigma_r: float,
-    days:int, w0=1.0, alpha=2.0, timeDelay=-1):
+    days:int, w0=1.0, alpha=2.0, timeDelay=-1, engine="loop", rng=None, record="trajectories"):
         self.intCheck([S0, I0, R0, V0, days])
         self.floatCheck(gamma, eta, kappa, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha, timeDelay)
         self.negValCheck(S0, I0, R0, V0, gamma, eta, kappa, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([gamma, eta, kappa, w0])
-        super(RandMoveSIRVS, self).__init__(S0=S0, I0=I0, R0=R0, V0=V0, gamma=gamma, eta=eta, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r, days=days, timeDelay=timeDelay)
+        super(RandMoveSIRVS, self).__init__(S0=S0, I0=I0, R0=R0, V0=V0, gamma=gamma, eta=eta, planeSize=planeSize, move_r=move_r, sigma_R=sigma_R, spread_r=spread_r, sigma_r=sigma_r, days=days, timeDelay=timeDelay, engine=engine, rng=rng, record=record)
         self.kappa = kappa
     
     def _RtoS(self):
@@ -129,38 +139,43 @@ class RandMoveSIRVS(RandMoveSIRV):
         Returns
         -------
 
-        set:
+        ndarray:
             Contains the indices of people who are supposed to go from R to S
         """
         return self._changeHelp(self.Rcollect, self.kappa)
     
     def run(self, getDetails=True):
-        for i in range(1, self.days+1):
-            StoI = self._StoI(i)
-            StoV = set()
-            if i > self.timeDelay:
-                StoV = self._StoV()
-            ItoR = self._ItoR()
-            RtoS = self._RtoS()
-            self._stateChanger(StoI, self.Icollect, "I", i)
-            self._stateChanger(StoV, self.Vcollect, "V", i)
-            self._stateChanger(ItoR, self.Rcollect, "R", i)
-            self._stateChanger(RtoS, self.Scollect, "S", i)
-            self._move(i, [self.Scollect, self.Icollect, self.Rcollect, self.Vcollect])
-            self.S[i] = self.S[i-1] - len(StoI) - len(StoV) + len(RtoS)
-            self.I[i] = self.I[i-1] + len(StoI) - len(ItoR)
-            self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
-            self.V[i] = self.V[i-1] + len(StoV)
-            #print("Populatoin:" ,self.popsize)
-            #print("S: ", self.S[i], "I: ", self.I[i], "R: ", self.R[i], "V: ", self.V[i])
-            #assert self.S[i] + self.I[i] + self.R[i] + self.V[i] == self.popsize
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
+
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        StoI = self._StoI(i)
+        StoV = set()
+        if i > self.timeDelay:
+            StoV = self._StoV()
+        ItoR = self._ItoR()
+        RtoS = self._RtoS()
+        self._stateChanger(StoI, self.Icollect, "I", i)
+        self._stateChanger(StoV, self.Vcollect, "V", i)
+        self._stateChanger(ItoR, self.Rcollect, "R", i)
+        self._stateChanger(RtoS, self.Scollect, "S", i)
+        self._move(i, [self.Scollect, self.Icollect, self.Rcollect, self.Vcollect])
+        self.S[i] = self.S[i-1] - len(StoI) - len(StoV) + len(RtoS)
+        self.I[i] = self.I[i-1] + len(StoI) - len(ItoR)
+        self.R[i] = self.R[i-1] + len(ItoR) - len(RtoS)
+        self.V[i] = self.V[i-1] + len(StoV)
+        #print("Populatoin:" ,self.popsize)
+        #print("S: ", self.S[i], "I: ", self.I[i], "R: ", self.R[i], "V: ", self.V[i])
+        #assert self.S[i] + self.I[i] + self.R[i] + self.V[i] == self.popsize
     
 
     
     def plot(self):
         "Plots the number of susceptible, exposed, infected, and recovered individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(nrows=4, sharex='all')
@@ -1,13 +1,9 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 import math
 
-import Eir.utility as u
 from Eir.DTMC.spatialModel.simul_details import Simul_Details
-# not to be confused with the person object that is used in the Hub/Strong Infectious Model
-from Eir.utility import Person1 as Person
 from .randMove import RandMove
+from ..population import Population
 
 
 class RandMoveSIS(RandMove):
@@ -61,6 +57,18 @@ class RandMoveSIS(RandMove):
     alpha: float optional
         A constant used in the _infect() method. The greater the constant, the greater the infection probability.
 
+    engine: str optional
+        How the infection step finds the susceptibles near each infectious person. One of "loop", "grid" or "compiled". Default is "loop".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    record: str, optional
+        How much of the simulation is kept in details. "none" keeps nothing, "counts" only counts how many people
+        each person infected, "events" also keeps every transmission and state change, and "trajectories" also
+        keeps everyone's location on every day. Lower levels skip the allocation and logging of what they don't
+        keep. Default is "trajectories".
+
     Attributes
     ----------
 
@@ -73,12 +81,12 @@ class RandMoveSIS(RandMove):
     popsize: int
         The total size of the population in the simulation. Given by S0 + I0
         
-    Scollect: list
+    Scollect: Collect
         Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is susceptible. Has a total of popsize Person objects,
         with numbers [0, popsize). 
     
-    Icollect: list
+    Icollect: Collect
          Used to keep track of the states each Person object is in. If the copy of a Person object has 
         isIncluded == True, then the person is INFECTED. Has a total of popsize Person objects,
         with numbers [0, popsize).
@@ -92,15 +100,15 @@ class RandMoveSIS(RandMove):
      """
 
     def __init__(self, S0:int, I0:int, gamma:float, planeSize:float, move_r:float, sigma_R:float, spread_r:float, sigma_r: float,
-    days:int, w0=1.0, alpha=2.0):
+    days:int, w0=1.0, alpha=2.0, engine="loop", rng=None, record="trajectories"):
         # error checks
         self.intCheck([S0, I0, days])
         self.floatCheck(gamma, planeSize, move_r, sigma_R, spread_r, sigma_r, w0, alpha)
         self.negValCheck(S0, I0, gamma, planeSize, move_r, sigma_R, spread_r, sigma_r, days, w0, alpha)
         self.probValCheck([gamma, w0])
         # call to super constructor
-        super(RandMoveSIS, self).__init__(planeSize, move_r, spread_r, w0=w0)
-        self.details = Simul_Details(days=days, popsize=S0+I0)
+        super(RandMoveSIS, self).__init__(planeSize, move_r, spread_r, w0=w0, engine=engine, rng=rng, record=record)
+        self.details = Simul_Details(days=days, popsize=S0+I0, level=record)
         # standard deviation of movement radius
         self.sigma_R = sigma_R
         # total population size
@@ -113,33 +121,21 @@ class RandMoveSIS(RandMove):
         self.S, self.I = np.zeros(days+1), np.zeros(days+1)
         # initialize day 0 to have the starting susceptibles and infecteds
         self.S[0], self.I[0] = S0, I0
-        # generate the special collections that hold the Person objects
-        self.Scollect = []
-        self.Icollect = []
-        spreading_r = np.random.normal(spread_r, sigma_r, S0+I0)
+        spreading_r = self.rng.normal(spread_r, sigma_r, S0+I0)
         # generate the random x, y locations
-        loc_x = np.random.random(S0+I0) * planeSize
-        loc_y = np.random.random(S0+I0) * planeSize
-        # create the special objects:
+        loc_x = self.rng.random(S0+I0) * planeSize
+        loc_y = self.rng.random(S0+I0) * planeSize
+        # everyone is stored once in the population; Scollect and Icollect are views of its compartments
+        self.population = Population("SI", [S0, I0], loc_x, loc_y, r0=spreading_r)
+        self.Scollect, self.Icollect = self.population.collects("SI")
         for i in range(self.popsize):
-            # create the person object
-            # for this model, the people will move with random radius R each timestep
-            # therefore, the R component can be made 0, as that is only relevant for the 
-            # periodic mobility model
-            p1 = Person(loc_x[i], loc_y[i], 0, spreading_r[i])
-            p2 = Person(loc_x[i], loc_y[i], 0, spreading_r[i]) 
-            self.details.addLocation(0, (loc_x[i], loc_y[i]))       
-            # if the person is in the susceptible objects created
+            # record which compartment the person starts in
             if i < S0:
-                p1.isIncluded = True
                 self.details.addStateChange(i, "S", 0)
             elif S0 <= i < S0+I0:
-                p2.isIncluded = True
                 self.details.addStateChange(i, "I", 0)
-            # append them to the data structure
-            self.Scollect.append(p1)
-            self.Icollect.append(p2)
-            self.details.addLocation(0, (p1.x, p1.y))
+        # everyone's location on day 0, in person order
+        self.details.addLocations(0, self.population.x, self.population.y)
 
     # helps _move method with boundary checks
     
@@ -159,24 +155,18 @@ class RandMoveSIS(RandMove):
             inheritance. 
         """
         # generate the correct number of movement radii
-        movement_r = np.random.normal(self.move_r, self.sigma_R, self.popsize)
+        movement_r = self.rng.normal(self.move_r, self.sigma_R, self.popsize)
         # generate the random thetas
-        thetas = np.random.uniform(low=0, high=2*math.pi, size=self.popsize)
-        # looping through everyone and moving them; same person coordinates in Scollect and Icoolect,
-        # so which array is looped through doesn't matter
-        for index, person in enumerate(collects[0]):
-            # adjust the x,y coordinate using polar coordinates
-            # conduct the boundary check at the same time
-            x = self._boundaryCheck(person.x + movement_r[index] * math.cos(thetas[index]))
-            y = self._boundaryCheck(person.y + movement_r[index] * math.sin(thetas[index]))
-            # add the new location to the Simul_Details object
-            self.details.addLocation(day, (x,y))
-            # change the x, y coordinates
-            for j, collect in enumerate(collects):
-                collects[j][index].x = x
-                collects[j][index].y = y
-            #self.Scollect[index].x, self.Icollect[index].x = x, x
-            #self.Scollect[index].y, self.Icollect[index].y = y, y
+        thetas = self.rng.uniform(low=0, high=2*math.pi, size=self.popsize)
+        # every collect is a view of the same population, so the coordinates only have to change once
+        pop = collects[0].population
+        n = pop.popsize
+        # adjust every x,y coordinate at once using polar coordinates
+        # conduct the boundary check at the same time by clipping to the plane
+        pop.x[:] = np.clip(pop.x + movement_r[:n] * np.cos(thetas[:n]), 0, self.planeSize)
+        pop.y[:] = np.clip(pop.y + movement_r[:n] * np.sin(thetas[:n]), 0, self.planeSize)
+        # add the day's locations to the Simul_Details object
+        self.details.addLocations(day, pop.x, pop.y)
     
     # deal with transfers from S to I compartments
     def _StoI(self, day: int):
@@ -189,32 +179,11 @@ class RandMoveSIS(RandMove):
         day: int
             The day that the state chagne is for. Used to log information in the details class variable
         """
-        #print("I've been called!")
-        # set containing the indices for transfers
-        transfers = set()
-        for count, inf in enumerate(self.Icollect):
-            # if the person isn't infected, check the next person
-            if inf.isIncluded == False:
-                continue
-            for index, sus in enumerate(self.Scollect):
-                # if the person isn't in the susceptible bin
-                if sus.isIncluded == False:
-                    continue
-                event = self._infect(inf, sus)
-                # if there is a successful infection
-                if event:
-                    #print("Infection")
-                    # add the index to the transfer set to be transferred later
-                    transfers.add(index)
-                    # change the status to be not included in S collection
-                    self.Scollect[index].isIncluded = False
-                    # adjust the state change in the Simul_Details object
-                    self.details.addTransmission(day, count, index)
-        return transfers
+        return self._transmission(day, [self.Icollect], self.Scollect)
     
     def _ItoS(self):
         """Takes care of running state changes from I compartment to S compartment """
-        # set that contains the indices for transfering from I to S
+        # indices of the people transfering from I to S
         return self._changeHelp(self.Icollect, self.gamma)
     
     # run the simulation
@@ -238,23 +207,27 @@ class RandMoveSIS(RandMove):
             by utilizing the Simul_Details object. 
         """
         # for all the days in the simulation
-        for i in range(1, self.days+1):
-            #print("Day ", i)
-            #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
-            # run the state changes
-            StoI = self._StoI(i)
-            ItoS = self._ItoS()
-            # change the indices of the transfers
-            self._stateChanger(values=StoI, collect=self.Icollect, symbol="I", day=i)
-            self._stateChanger(values=ItoS, collect=self.Scollect, symbol="S", day=i)
-            # make everyone move randomly
-            self._move(i, [self.Scollect, self.Icollect])
-            # change the values in the arrays
-            self.S[i] = self.S[i-1] - len(StoI) + len(ItoS)
-            self.I[i] = self.I[i-1] + len(StoI) - len(ItoS)
+        # run the days that haven't been run yet
+        self._advance(self.days)
         if getDetails:
             return self.details
 
+    def _step(self, i: int):
+        """Runs day i of the simulation."""
+        #print("Day ", i)
+        #print("Location: (", self.Scollect[0].x, ",", self.Scollect[0].y, ").")
+        # run the state changes
+        StoI = self._StoI(i)
+        ItoS = self._ItoS()
+        # change the indices of the transfers
+        self._stateChanger(values=StoI, collect=self.Icollect, symbol="I", day=i)
+        self._stateChanger(values=ItoS, collect=self.Scollect, symbol="S", day=i)
+        # make everyone move randomly
+        self._move(i, [self.Scollect, self.Icollect])
+        # change the values in the arrays
+        self.S[i] = self.S[i-1] - len(StoI) + len(ItoS)
+        self.I[i] = self.I[i-1] + len(StoI) - len(ItoS)
+
     # switch everything to a dataframe
     def toDataFrame(self):
         """
@@ -270,6 +243,7 @@ class RandMoveSIS(RandMove):
             DataFrame object containing the number of susceptibles and number of infecteds on each day. 
 
         """
+        import pandas as pd
         # create the linspaced numpy array
         t = np.linspace(0, self.days, self.days + 1)
         # create a 2D array with the days and susceptible and infected arrays
@@ -282,6 +256,7 @@ class RandMoveSIS(RandMove):
     def plot(self):
         
         "Plots the number of susceptible and infected individuals on the y-axis and the number of days on the x-axis."
+        from matplotlib import pyplot as plt
 
         t = np.linspace(0, self.days, self.days + 1)
         fig, (ax1, ax2) = plt.subplots(nrows=2, sharex='all')
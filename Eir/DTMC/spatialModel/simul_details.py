@@ -1,8 +1,8 @@
 # stores the class containing more detailed informaiton about transmission in spatial models
+import copy
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
 import Eir.exceptions as e
+from Eir.DTMC.spatialModel.transmissionTree import TransmissionTree
 """
 
 
@@ -24,25 +24,41 @@ class Simul_Details():
     
     static: optional bool
         Used to detect whether the spatial object is static
+
+    level: optional str
+        How much of the simulation is recorded. "none" records nothing, "counts" only counts how many people
+        each person infected, "events" also records every transmission and state change, and "trajectories"
+        also records the location of everyone on every day. What a level doesn't record is neither allocated
+        nor logged. Default is "trajectories".
     
     Attributes
     ----------
     transmissions: dictionary
         holds a list with a key "days" and values of tuples in the form of (infectious person, susceptible), 
         where infectious person and susceptible are numbers representing the people in the simulation. 
+        Built on access from a growable int32 table with one (day, infectious, susceptible) row per transmission.
     
-    locations: list<list>
-        holds the (x,y) coordinates of every person in the simulation on different days. You can access
-        the tuple location in the form of locations[day][personNumber]. For example, to access the 
-        (x,y) location of person 5 on day 16, you'd look in locations[16][5]. If the model type is static,
-        then simply look at locations[0] for a full list of the locations of the individuals in the simulation. 
+    locations: ndarray
+        float32 array of shape (days+1, popsize, 2) that holds the (x,y) coordinates of every person in the
+        simulation on different days. You can access the location in the form of locations[day][personNumber].
+        For example, to access the (x,y) location of person 5 on day 16, you'd look in locations[16][5]. If the
+        model type is static, then the array only has day 0, so simply look at locations[0] for the locations of
+        the individuals in the simulation. 
     
     stateChanges: list
         holds the time and state change for every person in the simulation. In order to access the state
         history of person 5, you'd look at stateChanges[5]. The state changes are represented as tuples with
         the first element being the number day the state change occured, and the second element being a string
         representing the state which the person went to. For example, a state change tuple as (16,"S") would 
-        mean that on day 16, a person transferred to state "S". 
+        mean that on day 16, a person transferred to state "S". Built on access from a growable int32 table
+        with one (person, day, state code) row per state change.
+
+    states: list
+        the state symbols that have been recorded. The state code of a state change is the index of its symbol.
+
+    newTransmissions: list
+        the (infectious person, susceptible) tuples of the transmissions of the last simulated day, kept at every
+        record level. The model empties it before it runs each day.
     
     Methods
     -------
@@ -72,7 +88,15 @@ class Simul_Details():
         transmissions. For example, for a tuple (6, [1,6,32]), this would mean that persons 1, 6, and 32 each delivered
         6 transmissions throughout the simulation. The list returned by sortedTransmissions() is sorted from highest
         to lowest. 
+
+    secondaryCases()
+        Returns an array with the number of people each person infected, indexed by person number. The counts
+        are kept up to date as transmissions are added, so this doesn't scan the transmissions.
     
+    transmissionTree()
+        Returns a TransmissionTree built from the recorded transmissions, which answers who infected whom,
+        generation and offspring distributions, subtree sizes and serial intervals with array lookups.
+
     plotTransmissions(bins=None)
         Returns a Figure object and displays a histogram with number of transmissions on the x-axis and
         the number of people who made that many transmissions on the y-axis. If bins=None, then the 
@@ -82,36 +106,110 @@ class Simul_Details():
 
     """
 
-    def __init__(self, days: int, popsize : int, static=False):
+    # the record levels, from least to most recorded
+    levels = ("none", "counts", "events", "trajectories")
+
+    def __init__(self, days: int, popsize : int, static=False, level="trajectories"):
+        if level not in self.levels:
+            raise e.RecordException(level, self.levels)
+        self.level = level
+        rank = self.levels.index(level)
         # boolean value to autodetect if it is static
         self.static = static
         # popsize is the size of the population
-        self.popsize = popsize
+        self.popsize = int(popsize)
         # number of days the simulation goes for
         self.days = days
-        # Dictionary that stores the day as key and the transmission chain 
-        # as value
-        self.transmissions = {}
-        # initialize the values of transmission
-        for i in range(1, days+1):
-            self.transmissions[i] = []
-
-        # 2D array that will hold the locations of persons 0 ... n-1
-        # from days 0 to self.days
-        self.locations = []
-        # putting arrays in the locations big array
-        for i in range(days+1):
-            self.locations.append([])
-        
-        # Contains a 2D array that will contain the day when someone changed
-        # state
-
-        self.stateChanges = []
-        # this is the number of rows
+        # transmission events, one (day, infectious, susceptible) row each
+        self._transmits = _EventTable(3, 1024 if rank >= 2 else 0)
+        # index from infectious person to the (susceptible, day) pairs of the people they infected
+        self._infected = {}
+        # number of people each person infected, kept up to date as transmissions come in
+        self._secondary = np.zeros(self.popsize if rank >= 1 else 0, dtype=np.int64)
+        # state change events, one (person, day, state code) row each
+        self._changes = _EventTable(3, 1024 if rank >= 2 else 0)
+        # the state symbols seen so far; the state code of a change is the index of its symbol in here
+        self.states = []
+        self._stateCodes = {}
+        # static models only ever have their day 0 locations recorded
+        rows = 1 if static else days + 1
+        if rank < 3:
+            rows = 0
+        # locations[day, person] is the (x,y) coordinate of person on day
+        self.locations = np.zeros((rows, self.popsize, 2), dtype=np.float32)
+        # number of people whose location has been added on each day
+        self._located = np.zeros(rows, dtype=np.int64)
+        # people sorted by person number for personHistory, rebuilt whenever new state changes come in
+        self._historyIndex = None
+        # transmission tree from the last call of transmissionTree(), with the number of transmissions it was built from
+        self._tree = None
+        # the transmissions of the day being simulated, whatever the record level
+        self.newTransmissions = []
+        self._bindLevel()
+
+    # the add methods that a record level can replace on the instance
+    _adds = ("addLocation", "addLocations", "addStateChange", "addStateChanges", "addTransmission")
+
+    def _bindLevel(self):
+        """Replaces the add methods of what the record level doesn't record with ones that do nothing."""
+        rank = self.levels.index(self.level)
+        if rank < 3:
+            self.addLocation = self.addLocations = self._skip
+        if rank < 2:
+            self.addStateChange = self.addStateChanges = self._skip
+            self.addTransmission = self._countTransmission if rank == 1 else self._bufferTransmission
+
+    def _skip(self, *args):
+        """Stands in for the add methods of what the record level doesn't record."""
+
+    def _requires(self, level: str):
+        """Makes sure that the record level records what level does."""
+        if self.levels.index(self.level) < self.levels.index(level):
+            raise e.NotRecordedException(level, self.level)
+
+    def _arrays(self):
+        """Returns everything recorded so far as a dictionary of arrays, which is what checkpoints keep."""
+        return {
+            "popsize": np.array(self.popsize),
+            "transmits": self._transmits.view(),
+            "changes": self._changes.view(),
+            "secondary": self._secondary,
+            "states": np.array(self.states, dtype=str),
+            "locations": self.locations,
+            "located": self._located,
+        }
+
+    def _load(self, arrays: dict):
+        """Replaces everything recorded so far with the arrays of _arrays()."""
+        self.popsize = int(arrays["popsize"])
+        transmits, changes = arrays["transmits"], arrays["changes"]
+        self._transmits = _EventTable(3, len(transmits))
+        self._transmits.extend(transmits)
+        self._changes = _EventTable(3, len(changes))
+        self._changes.extend(changes)
+        # the index from infectious person to the people they infected is rebuilt from the transmissions
+        self._infected = {}
+        for day, inf, sus in transmits.tolist():
+            self._infected.setdefault(inf, []).append((sus, day))
+        self._secondary = arrays["secondary"]
+        self.states = arrays["states"].tolist()
+        self._stateCodes = {state: code for code, state in enumerate(self.states)}
+        self.locations = arrays["locations"]
+        self._located = arrays["located"]
+        self._historyIndex = None
+        self._tree = None
+        self.newTransmissions = []
+
+    def _fork(self):
+        """Returns a copy of the details that records on its own from here on."""
+        forked = copy.copy(self)
+        # the add methods on the instance are bound to this object, so the fork binds its own
+        for name in self._adds:
+            forked.__dict__.pop(name, None)
+        forked._bindLevel()
+        forked._load({name: np.copy(value) for name, value in self._arrays().items()})
+        return forked
 
-        for i in range(int(popsize)):
-            self.stateChanges.append([])  
-    
     def _isPersonHere(self, u: int):
         """Checks to makes sure that the Person exists in the simulation."""
         if not 0 <= u < self.popsize:
@@ -126,13 +224,26 @@ class Simul_Details():
         if not 0 <= day <= self.days:
             raise e.DayOutOfRange
     
-    # Add the tuples of locations to the locations 2D array
+    def _fit(self, n: int):
+        """Widens the locations array if more than popsize people are recorded, which only happens when a model
+        made its details before knowing its full population size."""
+        if n > self.popsize:
+            wider = np.zeros((self.locations.shape[0], n, 2), dtype=np.float32)
+            wider[:, :self.popsize] = self.locations
+            self.locations = wider
+            self.popsize = n
+        if n > len(self._secondary):
+            self._secondary = np.pad(self._secondary, (0, n - len(self._secondary)))
+
+    # Add the tuples of locations to the locations array
     # day is the current day of the simulation, location
     # is a tuple containing the x,y coordinate of the person
 
     def addLocation(self, day: int, location: tuple):
         """
-        Add the tuple containing (x,y) coordiante to the locations 2D list.
+        Add the tuple containing (x,y) coordiante to the locations array. Locations are added in order of the
+        person number, so the nth location added on a day is the location of person n. Raises LocationException
+        if everyone's location was already added on day.
 
         Parameters
         ----------
@@ -143,8 +254,48 @@ class Simul_Details():
         location: tuple
             contains two floats, representing (x,y) coordinates of a particular person
         """
-        self.locations[day].append(location)
+        if day >= len(self._located):
+            return
+        u = self._located[day]
+        # one more location than there are people means a person was added twice, which would shift everyone after
+        if u >= self.popsize:
+            raise e.LocationException(day, self.popsize)
+        self.locations[day, u] = location
+        self._located[day] = u + 1
+
+    def addLocations(self, day: int, x, y):
+        """
+        Add the (x,y) coordinates of everyone in the simulation for a given day at once.
+
+        Parameters
+        ----------
+
+        day: int
+            the day for of the locations added.
+
+        x: ndarray
+            the x-coordinates of persons 0 ... n-1 on that day.
+
+        y: ndarray
+            the y-coordinates of persons 0 ... n-1 on that day.
+        """
+        if day >= len(self._located):
+            return
+        n = len(x)
+        self._fit(n)
+        # one slice for the whole day; the models move people in place, so this copies
+        self.locations[day, :n, 0] = x
+        self.locations[day, :n, 1] = y
+        self._located[day] = self.popsize
     
+    def _stateCode(self, state: str):
+        """Returns the code of state, giving it a new one the first time it is seen."""
+        code = self._stateCodes.get(state)
+        if code is None:
+            code = self._stateCodes[state] = len(self.states)
+            self.states.append(state)
+        return code
+
     # add a state change for person number "u"
     # change will be in pair format, with first element being the day
     # and second being a letter representing state change
@@ -165,19 +316,106 @@ class Simul_Details():
         day: int
             the day which the person changed states
         """
-        pair = (day, state)
-        # for person u, append to their array the time of state change and state it became
-        self.stateChanges[u].append(pair)
-    
+        self._changes.append((u, day, self._stateCode(state)))
+
+    def addStateChanges(self, indices, state: str, day: int):
+        """
+        Add the same state change for many people at once.
+
+        Parameters
+        ----------
+
+        indices: ndarray
+            the people whose state change is being added, in the order they changed.
+
+        state: string
+            the string representation of the state which the people are going to
+
+        day: int
+            the day which the people changed states
+        """
+        indices = np.asarray(indices)
+        rows = np.empty((len(indices), 3), dtype=np.int32)
+        rows[:, 0] = indices
+        rows[:, 1] = day
+        rows[:, 2] = self._stateCode(state)
+        self._changes.extend(rows)
+
+    @property
+    def stateChanges(self):
+        """The state history of every person as a list of lists of (day, state) tuples, built from the event
+        table. Prefer personHistory() for a single person."""
+        self._requires("events")
+        history = [[] for _ in range(self.popsize)]
+        for u, day, code in self._changes.view().tolist():
+            if u < self.popsize:
+                history[u].append((day, self.states[code]))
+        return history
+
+    def toArrow(self, positions=False):
+        """
+        Puts what was recorded in pyarrow Tables, straight from the event arrays. Requires pyarrow.
+
+        Parameters
+        ----------
+
+        positions: bool, optional
+            Whether to include a table with the location of everyone on every day. Needs record="trajectories",
+            while the other tables need at least record="events". Default is False.
+
+        Returns
+        -------
+
+        dict:
+            "transmissions" has int32 Day, Infectious and Susceptible columns with one row per transmission.
+            "stateChanges" has int32 Person and Day columns and a dictionary encoded State column with one row per
+            state change. If positions is True, "positions" has int32 Day and Person columns and float32 x and y
+            columns, with one row per person for every day whose locations were recorded.
+        """
+        import pyarrow as pa
+        self._requires("trajectories" if positions else "events")
+        transmits, changes = self._transmits.view(), self._changes.view()
+        tables = {
+            "transmissions": pa.table({
+                "Day": np.ascontiguousarray(transmits[:, 0]),
+                "Infectious": np.ascontiguousarray(transmits[:, 1]),
+                "Susceptible": np.ascontiguousarray(transmits[:, 2]),
+            }),
+            "stateChanges": pa.table({
+                "Person": np.ascontiguousarray(changes[:, 0]),
+                "Day": np.ascontiguousarray(changes[:, 1]),
+                "State": pa.DictionaryArray.from_arrays(np.ascontiguousarray(changes[:, 2]),
+                                                        pa.array(self.states, type=pa.string())),
+            }),
+        }
+        if positions:
+            # only the days that have been recorded so far
+            days = np.flatnonzero(self._located).astype(np.int32)
+            locations = self.locations[days]
+            n = locations.shape[1]
+            tables["positions"] = pa.table({
+                "Day": np.repeat(days, n),
+                "Person": np.tile(np.arange(n, dtype=np.int32), len(days)),
+                "x": locations[:, :, 0].ravel(),
+                "y": locations[:, :, 1].ravel(),
+            })
+        return tables
+
     # helper function for personHistory
     def _getMovementHistoryHelp(self, u:int):
-        movementHistory = []
-        if self.static:
-            movementHistory.append(self.locations[0][u])
-            return movementHistory
-        for day, loc in enumerate(self.locations):
-            movementHistory.append(loc[u])
-        return movementHistory
+        # one (x,y) tuple per day; static models only have day 0
+        return [tuple(loc) for loc in self.locations[:, u].tolist()]
+
+    def _personChanges(self, u: int):
+        """Returns the rows of the state change table that belong to person u, in the order they were added."""
+        table = self._changes.view()
+        # sort the table by person once and reuse it until more changes come in
+        if self._historyIndex is None or self._historyIndex[0] != len(table):
+            order = np.argsort(table[:, 0], kind="stable")
+            self._historyIndex = (len(table), order, table[order, 0])
+        _, order, people = self._historyIndex
+        lo, hi = np.searchsorted(people, [u, u + 1])
+        return table[order[lo:hi]]
 
     
     # get the history of a person, with states and times
@@ -206,20 +444,61 @@ class Simul_Details():
             only if movement=True. Returns a list of tuples representing (x,y) positions of person u
             on every day. 
         """
+        self._requires("trajectories" if movement else "events")
         # exception handling
         self._intCheck([u])
         self._isPersonHere(u)
         
+        history = [(day, self.states[code]) for _, day, code in self._personChanges(u).tolist()]
         if movement:
-            return self.stateChanges[u], self._getMovementHistoryHelp(u)
-        return self.stateChanges[u]
+            return history, self._getMovementHistoryHelp(u)
+        return history
     
     def addTransmission(self, day: int, inf: int, sus: int):
-        # create a tuple containing the infectious number in [0], susceptible turned infectious in [1]
-        transmission = (inf, sus)
-        temp = self.transmissions[day]
-        temp.append(transmission)
-        self.transmissions[day] = temp
+        # one row with the day, the infectious number and the susceptible turned infectious
+        self._transmits.append((day, inf, sus))
+        # keep the index of the infectious person and their count up to date
+        self._infected.setdefault(inf, []).append((sus, day))
+        self._countTransmission(day, inf, sus)
+
+    def _countTransmission(self, day: int, inf: int, sus: int):
+        """Adds one to the number of people inf infected."""
+        if inf >= len(self._secondary):
+            self._secondary = np.pad(self._secondary, (0, inf + 1 - len(self._secondary)))
+        self._secondary[inf] += 1
+        self._bufferTransmission(day, inf, sus)
+
+    def _bufferTransmission(self, day: int, inf: int, sus: int):
+        """Keeps the transmission in newTransmissions, which every record level does."""
+        self.newTransmissions.append((inf, sus))
+
+    @property
+    def transmissions(self):
+        """The transmissions as a dictionary from day to a list of (infectious, susceptible) tuples, built from
+        the event table."""
+        self._requires("events")
+        transmissions = {i: [] for i in range(1, self.days+1)}
+        for day, inf, sus in self._transmits.view().tolist():
+            transmissions.setdefault(day, []).append((inf, sus))
+        return transmissions
+
+    def _transmitCounts(self):
+        """Returns an array with the number of transmissions made by each person."""
+        return self._secondary.astype(float)
+
+    def secondaryCases(self):
+        """
+        Returns the number of people each person infected.
+
+        Returns
+        -------
+
+        ndarray:
+            int array indexed by person number. The array is kept by the details object, so copy it before
+            changing it.
+        """
+        self._requires("counts")
+        return self._secondary
     
     # return the transmission dictionary, with days as the key
     def getTransmissionHistory(self):
@@ -233,6 +512,7 @@ class Simul_Details():
         dictionary
             returns the class variable "transmissions"
         """
+        self._requires("events")
         return self.transmissions
     
     # get the specific transmission history of a single person
@@ -253,22 +533,13 @@ class Simul_Details():
             person u infected them, respectively. For example, (9, 3) means that person u infected person 9 on
             day 3. 
         """
+        self._requires("events")
         # exception handling
         self._intCheck([u])
         self._isPersonHere(u)
 
-        history = []
-        for i in range(1, self.days+1):
-            # get the tranmission history on day i
-            transmits = self.transmissions[i]
-            # for each tuple in the transmission history on day i
-            for j in transmits:
-            # if the infectious person is person number u
-                if j[0] == u:
-                    #print("Pair:", j)
-                    # append the susceptible person that was infected, and the day that it happened
-                    history.append((j[1], i))
-        return history
+        # copied, so that changing the returned list doesn't change the index
+        return list(self._infected.get(u, ()))
     
     # return the transmission history on a specific day
     def transmissionHistoryOnDay(self, day: int):
@@ -287,10 +558,12 @@ class Simul_Details():
             a list containing tuples, the first element being the infectious individual, the second element
             representing the susceptible individual who was infected
         """
+        self._requires("events")
         # exception handling
         self._intCheck([day])
         self._isDayHere(day)
-        return self.transmissions[day]
+        table = self._transmits.view()
+        return [(inf, sus) for _, inf, sus in table[table[:, 0] == day].tolist()]
     
     # return a sort list of tuples from greatest to smallest, with first element being person "n"
     # with m transmissions
@@ -305,44 +578,40 @@ class Simul_Details():
         list:
             a list containing tuples of two elements. 
         """
+        self._requires("counts")
         # list containing the sorted  
         sortedTrans = []
-        # creates the array of population size that stores number of tranmissions of each person
-        transmits = np.zeros(self.popsize)
-        # calculate the transmissions
-
-        # for each day
-        for i in range(1, self.days+1):
-            # get the tranmissions history
-            numTrans = self.transmissions[i]
-            # for each tuple in the list, add one to the infectious person represented in the tuple
-            for j in numTrans:
-                transmits[j[0]] += 1
+        # the number of tranmissions of each person
+        transmits = self._transmitCounts()
         
-        transDict = {}
-        # map the number of tranmissions with the people who transmitted
-        for i, val in enumerate(transmits):
-            if not transDict.get(val):
-                transDict[val] = [i]
-                continue
-            temp = transDict[val]
-            temp.append(i)
-            transDict[val] = temp
-        # sort in descending order
-        transmits[::-1].sort()
-        # create a final list to return, containing tuples
+        # people sorted from most to fewest transmissions, in increasing person number within a count
+        order = np.argsort(-transmits, kind="stable")
+        counts = transmits[order]
+        # split the people wherever the count changes
+        starts = np.flatnonzero(np.diff(counts, prepend=np.nan) != 0)
         # tuples of format (# of transmissions, list of people who had that many transmissions)
-        # set to see if the value val has already been appended to the sortedTrans list
-        seen = set()
-        for val in transmits:
-            # if it has already been added
-            if val in seen:
-                continue
-            tup = (val, transDict[val])
-            sortedTrans.append(tup)
-            seen.add(val)
+        for val, people in zip(counts[starts], np.split(order, starts[1:])):
+            sortedTrans.append((val, people.tolist()))
         return sortedTrans
     
+    def transmissionTree(self):
+        """
+        Builds the transmission forest of the simulation from the recorded transmissions. The forest is kept and
+        only rebuilt once more transmissions have been added.
+
+        Returns
+        -------
+
+        TransmissionTree:
+            The forest, with the parent, generation and subtree size of every person and the serial interval of
+            every edge.
+        """
+        self._requires("events")
+        count = len(self._transmits)
+        if self._tree is None or self._tree[0] != count:
+            self._tree = (count, TransmissionTree(self._transmits.view(), self.popsize))
+        return self._tree[1]
+
     def plotTransmissions(self, bins=None):
         """
         Plots a histogram of the number of transmissions on the x, and number of people who had
@@ -362,34 +631,76 @@ class Simul_Details():
         fig: matplotlib.pytplot.figure
             A figure object that contains the histogram. 
         """
+        from matplotlib import pyplot as plt
+        self._requires("counts")
         if bins is None:
             bins = 10
-        # creates the array of population size that stores number of tranmissions of each person
-        transmits = np.zeros(self.popsize)
-        # calculate the transmissions
-
-        # for each day
-        for i in range(1, self.days+1):
-            # get the tranmissions history
-            numTrans = self.transmissions[i]
-            # for each tuple in the list, add one to the infectious person represented in the tuple
-            for j in numTrans:
-                transmits[j[0]] += 1
+        # the number of tranmissions of each person
+        transmits = self._transmitCounts()
         fig = plt.hist(transmits, bins=bins, edgecolor='black')
         plt.show()
         return fig
-    
 
 
+class _EventTable:
+    """
+    Growable int32 table of events, one row per event. Rows are written into a preallocated array whose capacity
+    doubles when it fills up. Single events are first kept in a short list and written in batches, since writing
+    one row of a NumPy array at a time is slower than appending to a list.
 
+    Parameters
+    ----------
 
-        
-
-    
-
-    
-    
-    
-
+    columns: int
+        The number of integers in each event.
 
-    
+    capacity: int, optional
+        The number of rows allocated up front. Default is 1024.
+    """
+    # number of single events kept in the list before they are written to the array
+    BATCH = 4096
+
+    def __init__(self, columns: int, capacity=1024):
+        self._rows = np.empty((capacity, columns), dtype=np.int32)
+        self._size = 0
+        self._pending = []
+
+    def __len__(self):
+        return self._size + len(self._pending)
+
+    def _reserve(self, n: int):
+        """Makes room for n more rows."""
+        needed = self._size + n
+        if needed > len(self._rows):
+            capacity = max(needed, 2 * len(self._rows))
+            rows = np.empty((capacity, self._rows.shape[1]), dtype=np.int32)
+            rows[:self._size] = self._rows[:self._size]
+            self._rows = rows
+
+    def _flush(self):
+        """Writes the pending single events to the array."""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._write(np.array(pending, dtype=np.int32))
+
+    def _write(self, rows):
+        self._reserve(len(rows))
+        self._rows[self._size:self._size + len(rows)] = rows
+        self._size += len(rows)
+
+    def append(self, row: tuple):
+        """Adds one event."""
+        self._pending.append(row)
+        if len(self._pending) >= self.BATCH:
+            self._flush()
+
+    def extend(self, rows):
+        """Adds an array of events at once."""
+        # keep the events in the order they were added
+        self._flush()
+        self._write(rows)
+
+    def view(self):
+        """Returns the events added so far, as a (events, columns) array that shares memory with the table."""
+        self._flush()
+        return self._rows[:self._size]
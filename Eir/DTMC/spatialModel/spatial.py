@@ -1,14 +1,12 @@
-from matplotlib import pyplot as plt
 import numpy as np
-import pandas as pd
 from Eir.utility import Person
 import Eir.utility as u
-import multiprocessing as mp
 
 import Eir.exceptions as e
+from .streaming import Streaming
 
 
-class Spatial:
+class Spatial(Streaming):
     """
         Abstract Class used to for static spatial models. 
 
@@ -52,9 +50,15 @@ class Spatial:
         locy: ndarray
             a numpy array with length of popsize that contains randomly generated points for the y-coordinates
             of every person.
+
+        rng: optional
+            what the random numbers of the simulation are drawn from. None uses the global np.random state, an int
+            or SeedSequence seeds a new np.random.Generator, and a Generator is used as is. Default is None.
     """
-    def __init__(self, popsize: int, pss: float, rstart: float, alpha: int, side: float, S0: int, I0: int, days: int, w0=1.0):
+    def __init__(self, popsize: int, pss: float, rstart: float, alpha: int, side: float, S0: int, I0: int, days: int, w0=1.0, rng=None):
         
+        # where the random numbers of this simulation come from
+        self.rng = u.makeRng(rng)
         # the total size of the closed population
         self.popsize = popsize
         # the probability that a person is a super spreader
@@ -79,8 +83,8 @@ class Spatial:
         self.S[0], self.I[0] = S0, I0
         # create an array of correspond x and y coordinates for popsize number of people
         # the infected person will be at locx[0] and locy[0]
-        self.locx = np.random.rand(popsize) * side
-        self.locy = np.random.rand(popsize) * side
+        self.locx = self.rng.random(popsize) * side
+        self.locy = self.rng.random(popsize) * side
 
 
 
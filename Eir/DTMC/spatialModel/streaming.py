@@ -0,0 +1,379 @@
+import copy
+import json
+
+import numpy as np
+
+import Eir.exceptions as e
+import Eir.utility as u
+from .. import export
+from .population import Collect
+
+
+def _rngKind(rng):
+    """Returns what kind of generator rng is, which is what its state can be put back into."""
+    if isinstance(rng, np.random.Generator):
+        return f"Generator({type(rng.bit_generator).__name__})"
+    return "RandomState"
+
+
+def _rngState(rng):
+    """Returns the state of rng, the np.random module, a Generator or a RandomState, as a JSON string."""
+    if isinstance(rng, np.random.Generator):
+        state = rng.bit_generator.state
+    else:
+        state = rng.get_state(legacy=False)
+    # the key of the Mersenne Twister is an array, which is written out as a list with its dtype
+    return json.dumps(state, default=lambda a: {"array": a.tolist(), "dtype": str(a.dtype)})
+
+
+def _forkRng(rng):
+    """Returns a copy of rng that draws the same numbers from here on without changing rng."""
+    if rng is np.random:
+        # the global state can't be copied into another module, so the copy is a RandomState in the same state
+        forked = np.random.RandomState()
+        forked.set_state(np.random.get_state())
+        return forked
+    return copy.deepcopy(rng)
+
+
+def _setRngState(rng, text: str):
+    """Puts rng back in a state from _rngState."""
+    def decode(d: dict):
+        return np.array(d["array"], dtype=d["dtype"]) if set(d) == {"array", "dtype"} else d
+    state = json.loads(text, object_hook=decode)
+    if isinstance(rng, np.random.Generator):
+        rng.bit_generator.state = state
+    else:
+        rng.set_state(state)
+
+
+class Streaming:
+    """
+    Runs a spatial model one day at a time. Base class of the Hub, Strong Infectious, Random Movement and Periodic
+    Movement models, which implement _step(day) to run a single day. run() runs all the days that are left, and
+    iterate() runs them one at a time and hands back a snapshot of every day as it goes.
+
+    Attributes
+    ----------
+
+    day: int
+        The last day that has been simulated. 0 before the simulation starts.
+
+    Once no one can change compartment anymore, which happens when an outbreak dies out in a model without waning
+    immunity or vaccination, every day left is the same as the last one. The days left are then filled in with the
+    counts of the last day instead of being simulated, unless the model moves its people and their location on
+    every day is being recorded. Once an outbreak is over in a model that does have waning immunity or
+    vaccination, only the flows from R to S and from S to V are left, so the days left only run those flows
+    instead of the whole day, without moving anyone or looking for infections. A moving model at
+    record="trajectories", or one run by iterate(positions=True), simulates every day in full.
+
+    saveCheckpoint() saves the state of a simulation part way through, and loadCheckpoint() carries it on from
+    there, in the same process or another one. fork() copies the model part way through, so scenarios can carry
+    on from a shared start.
+    """
+    day = 0
+    # the compartments that people only leave through the flow of the given parameter, or never leave if it is None.
+    # People leave every other compartment, such as E, I, L and ICU, after some time whatever the parameters are
+    settled = {"S": "eta", "R": "kappa", "D": None, "V": None}
+    # the compartment the people who leave a settled compartment go to
+    targets = {"S": "V", "R": "S"}
+    # count arrays that aren't a compartment but add some of them up, and stay the same when they do
+    sums = ()
+    # the parameters a fork can change: the rates of the flows between compartments, the day vaccination starts on,
+    # how infectious people are and the engine. The others went into where people are and their radii when the
+    # model was built
+    forkable = ("rho", "ioda", "gamma", "mu", "phi", "chi", "omega", "kappa", "eta", "timeDelay", "w0", "alpha",
+                "engine")
+    # the forkable parameters that are probabilities
+    rates = ("rho", "ioda", "gamma", "mu", "phi", "chi", "omega", "kappa", "eta", "w0")
+
+    def _step(self, i: int):
+        """Runs day i of the simulation. Implemented by the models."""
+        pass
+
+    def _absorbed(self):
+        """Returns whether no one can change compartment anymore after the last simulated day."""
+        for symbol in self.population.symbols:
+            if getattr(self, symbol)[self.day] == 0:
+                continue
+            if symbol not in self.settled:
+                return False
+            # people in S or R still move on if the model vaccinates or has waning immunity
+            rate = self.settled[symbol]
+            if rate is not None and getattr(self, rate, 0) > 0:
+                return False
+        return True
+
+    def _infectionFree(self):
+        """Returns whether everyone is in a settled compartment after the last simulated day, so no one can be
+        infected anymore and only the flows out of S and R are left."""
+        return all(getattr(self, symbol)[self.day] == 0 for symbol in self.population.symbols
+                   if symbol not in self.settled)
+
+    def _settle(self, i: int):
+        """Runs day i of a simulation that is infection free, which only has the flows out of the settled
+        compartments left. No one moves, and the flows draw the same random numbers as in _step."""
+        for name in self.population.symbols + list(self.sums):
+            counts = getattr(self, name)
+            counts[i] = counts[i - 1]
+        transfers = []
+        # S to V is drawn before R to S, as in _step, so no one who goes back to S is vaccinated on the same day
+        for symbol, rate in self.settled.items():
+            if rate is None or not hasattr(self, rate):
+                continue
+            # vaccines only go out after the rollout starts
+            if rate == "eta" and i <= self.timeDelay:
+                continue
+            transfers.append((symbol, self._changeHelp(getattr(self, symbol + "collect"), getattr(self, rate))))
+        for symbol, transfer in transfers:
+            target = self.targets[symbol]
+            self._stateChanger(transfer, getattr(self, target + "collect"), target, i)
+            getattr(self, symbol)[i] -= len(transfer)
+            getattr(self, target)[i] += len(transfer)
+
+    def _fill(self, day: int):
+        """Carries the counts of the last simulated day over to every day up to and including day."""
+        for name in self.population.symbols + list(self.sums):
+            counts = getattr(self, name)
+            counts[self.day + 1:day + 1] = counts[self.day]
+        self.day = day
+
+    def _advance(self, day: int, positions=False):
+        """
+        Runs the days after the last simulated day up to and including day. If positions is True, the locations of
+        the people are needed on every day, so the days are simulated in full even once no one can be infected.
+        """
+        details = self.details
+        # without movement, or without anyone looking at where people are, nothing is lost by skipping a day
+        skip = details.static or (details.level != "trajectories" and not positions)
+        for i in range(self.day + 1, day + 1):
+            # details only keeps the transmissions of the day being run for iterate()
+            details.newTransmissions.clear()
+            if skip and self._absorbed():
+                self._fill(day)
+                return
+            if skip and self._infectionFree():
+                self._settle(i)
+            else:
+                self._step(i)
+            self.day = i
+
+    def fork(self, rng=None, **params):
+        """
+        Returns a copy of the model on the last simulated day, which carries on on its own with run() or iterate().
+        Several forks of a model that has run up to some day compare scenarios from that day on without running
+        the days before it again. The arrays that change as the simulation runs, what Simul_Details has recorded
+        so far and the random number generator are copied, and the people's radii and other arrays that don't
+        change are shared read-only. Forks share nothing that changes, so they can run in separate threads or
+        processes.
+
+        Parameters
+        ----------
+
+        rng: optional
+            What the fork draws its random numbers from, as in the constructor. None continues with a copy of the
+            random number generator of the model, so a fork without parameters simulates the same days the model
+            would. If the model draws from the global np.random state, the fork gets a np.random.RandomState in the
+            same state. Default is None.
+
+        **params:
+            New values of parameters of the model, such as eta=.05 or timeDelay=20. Only the parameters in forkable
+            that the model has can be changed.
+
+        Returns
+        -------
+
+        Same class as the model:
+            The fork.
+        """
+        for name, value in params.items():
+            if name not in self.forkable or not hasattr(self, name):
+                raise e.ParameterException(name, [p for p in self.forkable if hasattr(self, p)])
+            if name == "engine":
+                self.engineCheck(value)
+                continue
+            if type(value) != int and type(value) != float:
+                raise e.NotFloatException(value)
+            if name in self.rates:
+                self.probValCheck([value])
+            elif name == "alpha" and value < 0:
+                raise e.NegativeValException(value)
+        forked = copy.copy(self)
+        # the arrays of the model, such as the counts, are copied
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray):
+                setattr(forked, name, value.copy())
+        forked.population = self.population.fork()
+        forked.details = self.details._fork()
+        # the compartment views have to look at the fork's population
+        for name, value in vars(self).items():
+            if isinstance(value, Collect):
+                setattr(forked, name, forked.population.collect(value.symbol))
+        forked.rng = _forkRng(self.rng) if rng is None else u.makeRng(rng)
+        # the grid of the grid engine is built again for the fork's population
+        if hasattr(self, "_grid"):
+            forked._grid = None
+        for name, value in params.items():
+            setattr(forked, name, value)
+        return forked
+
+    def saveCheckpoint(self, path: str):
+        """
+        Saves the state of the simulation on the last simulated day to a compressed .npz file: the count arrays,
+        the people's coordinates and compartments, the state of the random number generator and everything
+        Simul_Details has recorded so far. The parameters of the model aren't saved.
+
+        Parameters
+        ----------
+
+        path: str
+            The file the checkpoint is written to. ".npz" is added to it if it doesn't end with it already.
+        """
+        pop = self.population
+        arrays = {
+            "model": np.array(type(self).__name__),
+            "popsize": np.array(pop.popsize),
+            "days": np.array(self.days),
+            "record": np.array(self.details.level),
+            "rng": np.array(_rngKind(self.rng)),
+            "day": np.array(self.day),
+            "rngState": np.array(_rngState(self.rng)),
+            "population.symbols": np.array(pop.symbols, dtype=str),
+        }
+        # the count arrays and any other array of the model, and every array of the population
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray):
+                arrays["model." + name] = value
+        for name, value in vars(pop).items():
+            if isinstance(value, np.ndarray):
+                arrays["population." + name] = value
+        for name, value in self.details._arrays().items():
+            arrays["details." + name] = value
+        np.savez_compressed(path, **arrays)
+
+    def loadCheckpoint(self, path: str):
+        """
+        Loads a checkpoint from saveCheckpoint into the model, which then carries on from the day it was saved on
+        with run() or iterate(). The model has to be of the same class, population size, number of days, record
+        level and kind of random number generator as the one that saved it; its other parameters may differ, so
+        several scenarios can carry on from the same checkpoint. If the model draws from the global np.random
+        state, loading the checkpoint sets the global state.
+
+        Parameters
+        ----------
+
+        path: str
+            The .npz file with the checkpoint.
+        """
+        with np.load(path) as data:
+            arrays = {name: data[name] for name in data.files}
+        pop = self.population
+        expected = [("model", type(self).__name__), ("popsize", pop.popsize), ("days", self.days),
+                    ("record", self.details.level), ("rng", _rngKind(self.rng))]
+        for name, value in expected:
+            saved = arrays[name].item()
+            if saved != value:
+                raise e.CheckpointException(name, saved, value)
+        symbols = arrays["population.symbols"].tolist()
+        if symbols != pop.symbols:
+            raise e.CheckpointException("compartments", "".join(symbols), "".join(pop.symbols))
+        for key, value in arrays.items():
+            owner, _, name = key.partition(".")
+            if owner == "model":
+                setattr(self, name, value)
+            elif owner == "population" and name != "symbols":
+                setattr(pop, name, value)
+        self.details._load({key[8:]: value for key, value in arrays.items() if key.startswith("details.")})
+        _setRngState(self.rng, arrays["rngState"].item())
+        self.day = int(arrays["day"])
+        # the people may be somewhere else now, so the grid of the grid engine is built again
+        if hasattr(self, "_grid"):
+            self._grid = None
+
+    def toArrow(self, positions=False):
+        """
+        Puts the results of the simulation in pyarrow Tables with int32 and float32 columns. Requires pyarrow.
+
+        Parameters
+        ----------
+
+        positions: bool, optional
+            Whether to include the location of everyone on every day, which needs record="trajectories". Default
+            is False.
+
+        Returns
+        -------
+
+        dict:
+            "counts" has the columns of toDataFrame() as int32 columns. If the record level keeps events, there
+            are also the "transmissions" and "stateChanges" tables of Simul_Details.toArrow(), and "positions" if
+            positions is True.
+        """
+        df = self.toDataFrame()
+        tables = {"counts": export.countsTable(list(df.columns), df.to_numpy())}
+        details = self.details
+        if positions or details.levels.index(details.level) >= details.levels.index("events"):
+            tables.update(details.toArrow(positions))
+        return tables
+
+    def toParquet(self, path: str, positions=False, replicate=None):
+        """
+        Writes the tables of toArrow() to Parquet files in the directory path, as path/counts.parquet,
+        path/transmissions.parquet and so on. Requires pyarrow.
+
+        Parameters
+        ----------
+
+        path: str
+            The directory the files go in.
+
+        positions: bool, optional
+            Whether to include the location of everyone on every day, which needs record="trajectories". Default
+            is False.
+
+        replicate: int, optional
+            If given, the files go in the Replicate=<replicate> partition of every table instead, as
+            path/counts/Replicate=<replicate>/part-0.parquet, so many runs of a model can be written to the same
+            directory and read back as one table with pyarrow.parquet.read_table(path/counts). Default is None.
+        """
+        export.writeParquet(path, self.toArrow(positions), replicate)
+
+    def _snapshot(self, transmissions: list, positions: bool):
+        """Returns the snapshot of the current day that iterate() yields."""
+        pop = self.population
+        snapshot = {
+            "day": self.day,
+            "counts": pop.counts(),
+            "transmissions": np.array(transmissions, dtype=np.int64).reshape(-1, 2),
+        }
+        if positions:
+            snapshot["x"], snapshot["y"] = pop.x.copy(), pop.y.copy()
+        return snapshot
+
+    def iterate(self, positions=False):
+        """
+        Runs the simulation one day at a time, as a generator. Yields the state of the current day first, which is
+        day 0 before the simulation starts, and then the state after each day that is left. Nothing is kept from
+        one day to the next beyond what the record level of the model keeps, so with record="none" a long run
+        takes the same memory on its last day as on its first. Stopping the loop early leaves the model on the
+        last day it yielded, and run() or iterate() carry on from there.
+
+        Parameters
+        ----------
+
+        positions: bool, optional
+            If True, every snapshot also has copies of everyone's coordinates. Default is False.
+
+        Yields
+        ------
+
+        dict:
+            The snapshot of a day, with keys "day"; "counts", a dict with the number of people in every compartment
+            by its symbol; "transmissions", an int array of shape (infections, 2) with the infectious person and the
+            newly infected person of every transmission of the day; and "x" and "y" if positions is True.
+        """
+        yield self._snapshot([], positions)
+        while self.day < self.days:
+            self._advance(self.day + 1, positions)
+            # details keeps the transmissions of the day that was just run, whatever its record level
+            yield self._snapshot(self.details.newTransmissions, positions)
@@ -0,0 +1,183 @@
+import numpy as np
+
+import Eir.exceptions as e
+
+
+class TransmissionTree:
+    """
+    Transmission forest of a simulation, built once from the transmissions recorded in Simul_Details. Each person
+    who took part in a transmission is a node, and the parent of a person is whoever gave them their first
+    recorded infection. People who transmitted before they were ever infected in the simulation were infected at
+    the start, and are the roots of the trees. Later reinfections, which happen in models like SIS and SIRS, stay
+    in transmissions but are not edges of the tree.
+
+    Parameters
+    ----------
+
+    transmissions: ndarray
+        int array of shape (transmissions, 3) with one (day, infectious, susceptible) row per transmission, in the
+        order they happened.
+
+    popsize: int
+        The number of people in the simulation.
+
+    Attributes
+    ----------
+
+    parent: ndarray
+        The person who infected each person, or -1 for the roots and for people who are not in the forest.
+
+    infectionDay: ndarray
+        The day each person was first infected. 0 for the roots and -1 for people who are not in the forest.
+
+    generation: ndarray
+        The number of infections between each person and the root of their tree, which is 0 for the roots. -1 for
+        people who are not in the forest.
+
+    size: ndarray
+        The number of people in the subtree of each person, counting themselves, which is everyone whose chain of
+        infection goes back to them. 0 for people who are not in the forest.
+
+    root: ndarray
+        The root of the tree of each person, or -1 for people who are not in the forest.
+
+    edges: ndarray
+        int array of shape (edges, 3) with the (day, infectious, susceptible) rows that make up the tree.
+
+    serialInterval: ndarray
+        For each row of edges, the number of days between the infection of the infectious person and the
+        infection of the susceptible person.
+    """
+    def __init__(self, transmissions, popsize: int):
+        transmissions = np.asarray(transmissions, dtype=np.int64).reshape(-1, 3)
+        self.popsize = popsize
+        self.transmissions = transmissions
+        _, inf, sus = transmissions.T
+        rows = np.arange(len(transmissions))
+        # row of the first time each person shows up as infectious and as susceptible
+        never = len(transmissions)
+        firstOut = np.full(popsize, never)
+        firstIn = np.full(popsize, never)
+        np.minimum.at(firstOut, inf, rows)
+        np.minimum.at(firstIn, sus, rows)
+        # a row is in the tree if it is the first infection of the susceptible person and they hadn't already
+        # transmitted, which would mean that they were infected at the start
+        inTree = (firstIn[sus] == rows) & (firstOut[sus] > rows)
+        self.edges = transmissions[inTree]
+        self.parent = np.full(popsize, -1, dtype=np.int64)
+        self.parent[self.edges[:, 2]] = self.edges[:, 1]
+        # the roots transmitted before anyone infected them
+        isRoot = (self.parent < 0) & (firstOut < never)
+        member = isRoot | (self.parent >= 0)
+        self.infectionDay = np.where(isRoot, 0, -1)
+        self.infectionDay[self.edges[:, 2]] = self.edges[:, 0]
+        self.serialInterval = self.edges[:, 0] - self.infectionDay[self.edges[:, 1]]
+        self.generation = self._depths()
+        self.generation[~member] = -1
+        self.root = np.where(member, np.arange(popsize), -1)
+        self.size = member.astype(np.int64)
+        # generation by generation, the roots are passed down and the subtree sizes are added up
+        order = np.argsort(self.generation, kind="stable")
+        bounds = np.searchsorted(self.generation[order], np.arange(1, self.generation.max(initial=0) + 2))
+        levels = np.split(order, bounds)[1:-1]
+        for level in levels:
+            self.root[level] = self.root[self.parent[level]]
+        for level in reversed(levels):
+            np.add.at(self.size, self.parent[level], self.size[level])
+
+    def _depths(self):
+        """Returns the number of ancestors of every person, by pointer jumping along the parent array."""
+        depth = (self.parent >= 0).astype(np.int64)
+        ancestor = self.parent.copy()
+        # every round doubles the distance that ancestor points up the tree
+        while True:
+            m = np.flatnonzero(ancestor >= 0)
+            if not len(m):
+                return depth
+            up = ancestor[m]
+            depth[m] += depth[up]
+            ancestor[m] = ancestor[up]
+
+    def _isPersonHere(self, u: int):
+        if not 0 <= u < self.popsize:
+            raise e.PersonNotFound(u)
+
+    def infector(self, u: int):
+        """
+        Returns who infected person u.
+
+        Parameters
+        ----------
+
+        u: int
+            The person whose infector is returned.
+
+        Returns
+        -------
+
+        int:
+            The person who first infected u, or -1 if u is a root or not in the forest.
+        """
+        self._isPersonHere(u)
+        return int(self.parent[u])
+
+    def ancestors(self, u: int):
+        """
+        Returns the chain of infection of person u.
+
+        Parameters
+        ----------
+
+        u: int
+            The person whose chain of infection is returned.
+
+        Returns
+        -------
+
+        list:
+            The people who infected u, then whoever infected them and so on, up to the root of the tree.
+        """
+        self._isPersonHere(u)
+        chain = []
+        u = self.parent[u]
+        while u >= 0:
+            chain.append(int(u))
+            u = self.parent[u]
+        return chain
+
+    def roots(self):
+        """Returns the people at the root of each tree, in increasing order."""
+        return np.flatnonzero(self.root == np.arange(self.popsize))
+
+    def offspring(self):
+        """Returns the number of people each person gave their first infection to, indexed by person number."""
+        return np.bincount(self.edges[:, 1], minlength=self.popsize)
+
+    def generationDistribution(self):
+        """Returns an array whose entry g is the number of people in generation g."""
+        return np.bincount(self.generation[self.generation >= 0])
+
+    def offspringDistribution(self):
+        """Returns an array whose entry k is the number of people in the forest with k offspring."""
+        return np.bincount(self.offspring()[self.generation >= 0])
+
+    def edgeList(self):
+        """
+        Exports the forest as an edge list.
+
+        Returns
+        -------
+
+        ndarray:
+            The infectious person of every edge.
+
+        ndarray:
+            The susceptible person of every edge.
+
+        ndarray:
+            The day of every edge.
+
+        ndarray:
+            The serial interval of every edge.
+        """
+        return self.edges[:, 1].copy(), self.edges[:, 2].copy(), self.edges[:, 0].copy(), self.serialInterval.copy()
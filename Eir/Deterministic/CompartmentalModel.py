@@ -1,8 +1,6 @@
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from multipledispatch import dispatch
 import Eir.exceptions as e
+import Eir.Deterministic.solvers as solvers
 
 # sources:
 # https://www.ncbi.nlm.nih.gov/pmc/articles/PMC5348083/
@@ -17,33 +15,75 @@ class CompartmentalModel:
         assert I0 >= 0
         self.S0 = S0
         self.I0 = I0
+        # the ODE solver and its options, such as rtol and atol for rk45
+        self.method = "euler"
+        self.solverOptions = {}
 
-    @dispatch()
-    def _deriv(self):
+    # right hand side of the ODEs: takes the time and the state, with the compartments along the first axis, and
+    # returns a tuple with the derivative of every compartment. Only indexes y, so y can be a list of floats as
+    # well as an array
+    def _rhs(self, t: float, y):
         pass
 
-    @dispatch(float)
-    # runs the Euler's Method
-    def _update(self, dt: float):
+    # the starting values of the state vector, in the same order as the compartments
+    def _start(self):
         pass
 
-    # creates the arrays & starting items, then calls _update() to run Euler's Method
-    # then returns the completed arrays
+    # the flows of the ODEs as (from, to) pairs of compartment indices, used by the stochastic engine
+    transitions = []
+
+    # the rate at which each person in the from compartment of every transition makes it, in the order of
+    # transitions. The flows of _rhs() are these rates times the number of people in the from compartments
+    def _hazards(self, y):
+        pass
+
+    def changeMethod(self, method: str, **options):
+        """
+        Changes the ODE solver used by run() and accumulate().
+
+        Parameters
+        ----------
+
+        method: str
+            "euler" for forward Euler with step dt, "rk4" for the 4th order Runge-Kutta method with step dt, or
+            "rk45" for the adaptive Dormand-Prince method, which picks its own steps and reports the solution every
+            dt days from its dense output.
+
+        **options:
+            Passed on to the solver, such as rtol and atol for rk45.
+        """
+        if method not in solvers.methods:
+            raise e.SolverException(method, solvers.methods)
+        self.method = method
+        self.solverOptions = options
+
+    # integrates the ODEs from the starting state y0, reporting the state every dt days. rhs is the right hand side,
+    # which is _rhs() unless given
+    def _integrate(self, y0: list, days: float, dt: float, rhs=None):
+        rhs = self._rhs if rhs is None else rhs
+        # total number of iterations that will be run, the starting value at time 0 is added by the solver
+        steps = int(days / dt + 1) - 1
+        # the solver is picked once per run: a single set of parameters runs Euler's method on plain floats
+        if self.method == "euler" and np.ndim(y0) == 1:
+            return solvers.floatEuler(rhs, y0, dt, steps)
+        return solvers.solve(rhs, y0, dt, steps, method=self.method, **self.solverOptions)
+
+    # solves the ODEs from the starting items with _integrate(), then returns the arrays of every compartment
     def _simulate(self, days: int, dt: float):
         pass
 
-    @dispatch(int, float, bool)
     def run(self, days: int, dt: float, plot=True):
         pass
 
+    # numpy scalars pass the checks as well, but bools don't
     def intCheck(self, vals: list):
         for val in vals:
-            if type(val) != int:
+            if type(val) == bool or not isinstance(val, (int, np.integer)):
                 raise e.NotIntException(val)
 
     def floatCheck(self, vals: list):
         for val in vals:
-            if type(val) != int and type(val) != float:
+            if type(val) == bool or not isinstance(val, (int, float, np.integer, np.floating)):
                 raise e.NotFloatException(val)
 
     def negValCheck(self, vals: list):
@@ -1,8 +1,5 @@
 from .SIR import SIR
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from multipledispatch import dispatch
 
 
 # Flow of the Compartmental Model'
@@ -37,6 +34,9 @@ class SEIR(SIR):
 
     """
 
+    # names of the compartments, in the order of the state vector
+    compartments = ["Susceptible", "Exposed", "Infected", "Removed"]
+
     def __init__(self, beta, rho, gamma, S0, E0, I0, R0):
         self.intCheck([S0, E0, I0, R0])
         self.floatCheck([beta, rho, gamma, S0, E0, I0, R0])
@@ -56,67 +56,40 @@ class SEIR(SIR):
     def changeRho(self, x: float):
         self.rho = x
 
-    @dispatch(float, float, float)
-    def _deriv(self, s, e, i):
+    def _rhs(self, t, y):
         """
         Calculates the derivatives
 
         Parameters
         ----------
-        s: float
-            The current number of susceptible individuals at the time the derivative is taken, as according to ODEs.
-
-        e: float
-            The current number of exposed individuals at the time derivative is taken, as according to ODEs.
+        t: float
+            The time the derivatives are taken at. The ODEs don't depend on it.
 
-        i: float
-            The current number of infected individuals at the time derivative is taken, as according to ODEs.
+        y: ndarray
+            The current number of susceptible, exposed, infected and removed individuals, as according to ODEs.
 
         Returns
         -------
 
         tuple:
-            contains the derivatives S, E, I, and R arrays.
+            contains the derivatives of S, E, I, and R.
 
         """
-        x = self.beta * s * i / self.N
-        y = self.rho * e
-        z = self.gamma * i
-        return -x, x - y, y - z, z
-
-    @dispatch(float, np.ndarray, np.ndarray, np.ndarray, np.ndarray)
-    def _update(
-        self, dt: float, S: np.ndarray, E: np.ndarray, I: np.ndarray, R: np.ndarray
-    ):
-        """
-        Uses Euler's method to update the array values.
-
-        Parameters
-        ----------
-
-        dt: float
-            The small differential used for Euler's method
+        x = self.beta * y[0] * y[2] / self.N
+        z = self.rho * y[1]
+        w = self.gamma * y[2]
+        return -x, x - z, z - w, w
 
-        S: ndarray
-            The array that will hold the S values
+    # the starting values of the state vector
+    def _start(self):
+        return [self.S0, self.E0, self.I0, self.R0]
 
-        E: ndarray
-            The array that will hold the E values
+    # S -> E, E -> I and I -> R
+    transitions = [(0, 1), (1, 2), (2, 3)]
 
-        I: ndarray
-            The array that will hold the I values
-
-        R: ndarray
-            The array that will hold the R values
-
-        """
-        for i in range(1, len(S)):
-            f = self._deriv(S[i - 1], E[i - 1], I[i - 1])
-            S[i] = S[i - 1] + dt * f[0]
-            E[i] = E[i - 1] + dt * f[1]
-            I[i] = I[i - 1] + dt * f[2]
-            R[i] = R[i - 1] + dt * f[3]
-        return S, E, I, R
+    # per person rates of the transitions, on the state vector (s, e, i, r)
+    def _hazards(self, y):
+        return self.beta * y[2] / self.N, self.rho, self.gamma
 
     def _simulate(self, days: int, dt: float):
         """
@@ -129,7 +102,7 @@ class SEIR(SIR):
             The number of days to be simulated.
 
         dt: float
-            The differential used for Euler's method.
+            The step size of the solver, or the spacing of the reported values for rk45.
 
         Returns
         -------
@@ -148,14 +121,8 @@ class SEIR(SIR):
         """
         self.floatCheck([days, dt])
         self.negValCheck([days, dt])
-        # total number of iterations that will be run + the starting value at time 0
-        size = int(days / dt + 1)
-        # create the arrays to store the different values
-        S, E, I, R = np.zeros(size), np.zeros(size), np.zeros(size), np.zeros(size)
-        # initialize the arrays
-        S[0], E[0], I[0], R[0] = self.S0, self.E0, self.I0, self.R0
-        # run the Euler's Method
-        S, E, I, R = self._update(dt, S, E, I, R)
+        # solve from the starting values, one row per time step
+        S, E, I, R = self._integrate(self._start(), days, dt).T
         return S, E, I, R
 
     def _includeVar(self, sx: bool, ex: bool, ix: bool, rx: bool):
@@ -218,6 +185,7 @@ class SEIR(SIR):
             Only if plot=True
 
         """
+        import pandas as pd
         self.floatCheck([days, dt])
         self.negValCheck([days, dt])
         # creates evenly spaced array that spans day 0 to the day wanted
@@ -229,6 +197,7 @@ class SEIR(SIR):
         df = pd.DataFrame.from_dict(data=data1)
         # if the plot boolean is true aka they want a plot to be shown
         if plot:
+            from matplotlib import pyplot as plt
             # determine what should be plotted
             included = self._includeVar(Sbool, Ebool, Ibool, Rbool)
             # create the plot & label the x and y axis
@@ -265,6 +234,7 @@ class SEIR(SIR):
         pd.DataFrame
             Contains information of the simulation.
         """
+        import pandas as pd
         self.floatCheck([days, dt])
         self.negValCheck([days, dt])
         t = np.linspace(0, days, int(days / dt) + 1)
@@ -295,6 +265,7 @@ class SEIR(SIR):
         # convert to dataframe
         df = pd.DataFrame(data=data1, columns=labels)
         if plot:
+            from matplotlib import pyplot as plt
             # do some plotting
             df.plot(x="Days", y=["Total Cases"])
             plt.xlabel("Days")
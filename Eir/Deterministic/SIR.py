@@ -1,8 +1,5 @@
 from Eir.Deterministic.CompartmentalModel import CompartmentalModel
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from multipledispatch import dispatch
 
 
 class SIR(CompartmentalModel):
@@ -30,6 +27,9 @@ class SIR(CompartmentalModel):
 
     """
 
+    # names of the compartments, in the order of the state vector
+    compartments = ["Susceptible", "Infected", "Removed"]
+
     def __init__(self, beta: float, gamma: float, S0: int, I0: int, R0: int):
         # run error checks
         self.intCheck([S0, I0, R0])
@@ -68,37 +68,30 @@ class SIR(CompartmentalModel):
     def changeGamma(self, x: float):
         self.gamma = x
 
-    # computes the derivatives at a particular point, given the beta/gamma of object and current s and i values
-    @dispatch(float, float)
-    def _deriv(self, s, i):
+    # right hand side of the ODEs, on the state vector (s, i, r)
+    def _rhs(self, t, y):
         # x is the amount of leaving S compartment and entering I
-        x = self.beta * s * i / self.N
-        # y is the amount leaving I compartment and entering R compartment
-        y = self.gamma * i
-        return -x, x - y, y
-
-    # runs Euler's Method
-    @dispatch(float, np.ndarray, np.ndarray, np.ndarray)
-    def _update(self, dt, S, I, R):
-        # for all the days that ODE will be solved
-        for i in range(1, len(S)):
-            f = self._deriv(S[i - 1], I[i - 1])
-            S[i] = S[i - 1] + dt * f[0]
-            I[i] = I[i - 1] + dt * f[1]
-            R[i] = R[i - 1] + dt * f[2]
-        return S, I, R
+        x = self.beta * y[0] * y[1] / self.N
+        # z is the amount leaving I compartment and entering R compartment
+        z = self.gamma * y[1]
+        return -x, x - z, z
+
+    # the starting values of the state vector
+    def _start(self):
+        return [self.S0, self.I0, self.R0]
+
+    # S -> I and I -> R
+    transitions = [(0, 1), (1, 2)]
+
+    # per person rates of the transitions, on the state vector (s, i, r)
+    def _hazards(self, y):
+        return self.beta * y[1] / self.N, self.gamma
 
-    # combines the Euler's Method with all initialization and stuff and runs full simulation
-    # days is the number of days being simulated, dt is the step size for Euler's method
+    # combines the ODE solver with all initialization and stuff and runs full simulation
+    # days is the number of days being simulated, dt is the step size for the solver
     def _simulate(self, days: int, dt: float):
-        # total number of iterations that will be run + the starting value at time 0
-        size = int(days / dt + 1)
-        # create the arrays to store the different values
-        S, I, R = np.zeros(size), np.zeros(size), np.zeros(size)
-        # initialize the arrays
-        S[0], I[0], R[0] = self.S0, self.I0, self.R0
-        # run the Euler's Method
-        S, I, R = self._update(dt, S, I, R)
+        # solve from the starting values, one row per time step
+        S, I, R = self._integrate(self._start(), days, dt).T
         return S, I, R
 
     def _includeVar(self, sx: bool, ix: bool, rx: bool):
@@ -116,6 +109,7 @@ class SIR(CompartmentalModel):
         return labels
 
     def run(self, days: int, dt: float, plot=True, Sbool=True, Ibool=True, Rbool=True):
+        import pandas as pd
         self.floatCheck([days, dt])
         self.negValCheck([days, dt])
         # creates evenly spaced array that spans day 0 to the day wanted
@@ -127,6 +121,7 @@ class SIR(CompartmentalModel):
         df = pd.DataFrame.from_dict(data=data1)
         # if the plot boolean is true aka they want a plot to be shown
         if plot:
+            from matplotlib import pyplot as plt
             # determine what should be plotted
             included = self._includeVar(Sbool, Ibool, Rbool)
             # create the plot & label the x and y axis
@@ -142,6 +137,7 @@ class SIR(CompartmentalModel):
 
     # plot an accumulation function of total cases
     def accumulate(self, days: int, dt: float, plot=True):
+        import pandas as pd
         self.floatCheck([days, dt])
         self.negValCheck([days, dt])
         t = np.linspace(0, days, int(days / dt) + 1)
@@ -164,6 +160,7 @@ class SIR(CompartmentalModel):
         # convert to dataframe
         df = pd.DataFrame(data=data1, columns=labels)
         if plot:
+            from matplotlib import pyplot as plt
             # do some plotting
             df.plot(x="Days", y=["Total Cases"])
             plt.xlabel("Days")
@@ -173,7 +170,7 @@ class SIR(CompartmentalModel):
         return df
 
     # create everything as a percentage of the total population, given a dataframe
-    def normalizeDataFrame(self, df: pd.DataFrame):
+    def normalizeDataFrame(self, df):
         """
         Divide all of the columns by the total population in order to get numbers as a proportion of population.
 
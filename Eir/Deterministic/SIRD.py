@@ -1,8 +1,5 @@
 from .SIR import SIR
 import numpy as np
-from matplotlib import pyplot as plt
-from multipledispatch import dispatch
-import pandas as pd
 
 
 class SIRD(SIR):
@@ -31,6 +28,9 @@ class SIRD(SIR):
         Initial number of removeds.
     """
 
+    # names of the compartments, in the order of the state vector
+    compartments = ["Susceptible", "Infected", "Removed", "Deaths"]
+
     # omega is the amount of people that go from I to D
     def __init__(
         self, beta: float, gamma: float, omega: float, S0: int, I0: int, R0: int
@@ -47,49 +47,39 @@ class SIRD(SIR):
     def changeOmega(self, x: float):
         self.omega = x
 
-    @dispatch(float, float, int)
-    # calculate the derivatives; because open pop, feed in the current alive population
-    def _deriv(self, s: float, i: float, n):
+    # calculate the derivatives; because open pop, use the current alive population
+    def _rhs(self, t, y):
+        s, i = y[0], y[1]
+        # the living population, rounded down
+        n = (s + i + y[2]) // 1
         # amount leaving S -> I
         x = self.beta * s * i / n
         # amount leaving I -> R
-        y = self.gamma * i
+        z = self.gamma * i
         # amount leaving I -> D
-        z = self.omega * i
+        w = self.omega * i
         # returns in the order S, I, R, D
-        return -x, x - y - z, y, z
-
-    # run Euler's method
-
-    @dispatch(float, np.ndarray, np.ndarray, np.ndarray, np.ndarray)
-    def _update(self, dt, S, I, R, D) -> tuple:
-        # run Euler's method
-        for i in range(1, len(S)):
-            n = int(S[i - 1] + I[i - 1] + R[i - 1])
-            # get the derivatives at the point before for the Euler's method
-            f = self._deriv(S[i - 1], I[i - 1], n)
-            # computer the Euler's approximation f(x+h) = f(x) + h * (df/dx)
-            S[i] = S[i - 1] + dt * f[0]
-            I[i] = I[i - 1] + dt * f[1]
-            R[i] = R[i - 1] + dt * f[2]
-            D[i] = D[i - 1] + dt * f[3]
-            # remove the deaths from the living population
-            n = n - f[3] * dt
-        return S, I, R, D
+        return -x, x - z - w, z, w
+
+    # the starting values of the state vector
+    def _start(self):
+        return [self.S0, self.I0, self.R0, 0]
+
+    # S -> I, I -> R and I -> D
+    transitions = [(0, 1), (1, 2), (1, 3)]
+
+    # per person rates of the transitions, on the state vector (s, i, r, d)
+    def _hazards(self, y):
+        # the living population, rounded down
+        n = (y[0] + y[1] + y[2]) // 1
+        return self.beta * y[1] / n, self.gamma, self.omega
 
     def _simulate(self, days: int, dt: float):
-        # total number of iterations that will be run + the starting value at time 0
-        size = int(days / dt + 1)
-        # create the arrays to store the different values
-        S, I, R, D = np.zeros(size), np.zeros(size), np.zeros(size), np.zeros(size)
-        # initialize the arrays
-        S[0], I[0], R[0], D[0] = self.S0, self.I0, self.R0, 0
-        # run the Euler's Method
-        S, I, R, D = self._update(dt, S, I, R, D)
+        # solve from the starting values, one row per time step
+        S, I, R, D = self._integrate(self._start(), days, dt).T
         return S, I, R, D
 
     # create the variable labels for the 'run' function
-    @dispatch(bool, bool, bool, bool)
     def _includeVar(self, sx: bool, ix: bool, rx: bool, Dx: bool):
         labels = []
         if sx:
@@ -102,7 +92,6 @@ class SIRD(SIR):
             labels.append("Deaths")
         return labels
 
-    @dispatch(int, float, plot=bool, Sbool=bool, Ibool=bool, Rbool=bool, Dbool=bool)
     def run(
         self,
         days: int,
@@ -113,6 +102,9 @@ class SIRD(SIR):
         Rbool=True,
         Dbool=True,
     ):
+        import pandas as pd
+        self.floatCheck([days, dt])
+        self.negValCheck([days, dt])
         # evenly space the days
         t = np.linspace(0, days, int(days / dt) + 1)
         # run a simulation to get the numpy arrays
@@ -123,6 +115,7 @@ class SIRD(SIR):
         df = pd.DataFrame.from_dict(data=data1)
         # plotting
         if plot:
+            from matplotlib import pyplot as plt
             # retrieve the list of variables that will be plotted
             included = self._includeVar(Sbool, Ibool, Rbool, Dbool)
             fig = df.plot("Days", included)
@@ -134,6 +127,7 @@ class SIRD(SIR):
 
     # plot an accumulation function of total cases
     def accumulate(self, days: int, dt: float, plot=True):
+        import pandas as pd
         self.floatCheck([days, dt])
         self.negValCheck([days, dt])
         t = np.linspace(0, days, int(days / dt) + 1)
@@ -157,6 +151,7 @@ class SIRD(SIR):
         # convert to dataframe
         df = pd.DataFrame(data=data1, columns=labels)
         if plot:
+            from matplotlib import pyplot as plt
             # do some plotting
             df.plot(x="Days", y=["Total Cases"])
             plt.xlabel("Days")
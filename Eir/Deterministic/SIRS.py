@@ -1,8 +1,5 @@
 from .SIR import SIR
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from multipledispatch import dispatch
 
 
 class SIRS(SIR):
@@ -46,74 +43,46 @@ class SIRS(SIR):
     def changeKappa(self, x: float):
         self.kappa = x
 
-    @dispatch(float, float, float)
-    def _deriv(self, s, i, r):
+    # right hand side of the ODEs, on the state vector (s, i, r)
+    def _rhs(self, t, y):
         # doing all of the changes from SIR model
-        a, b, c = super(SIRS, self)._deriv(s, i)
+        a, b, c = super(SIRS, self)._rhs(t, y)
         # compute the people becoming resusceptible from the R compartment
-        k = r * self.kappa
-        # return the values in S, I, R, accumulation format
+        k = y[2] * self.kappa
         return a + k, b, c - k
 
-    # run Euler 's method, when accumulating cases, which is different from usual
-    @dispatch(float, float, float)
-    def _derivAccumulate(self, s, i, r):
+    # S -> I, I -> R and R -> S
+    transitions = [(0, 1), (1, 2), (2, 0)]
+
+    # per person rates of the transitions, on the state vector (s, i, r)
+    def _hazards(self, y):
+        return self.beta * y[1] / self.N, self.gamma, self.kappa
+
+    # right hand side when accumulating cases, on the state vector (s, i, r, cases), which is different from usual:
+    # the resusceptible term used to be computed from the last entry of the zero-filled R array, so it has always
+    # been 0 here, and is left out to keep the accumulated numbers the same
+    def _rhsAccumulate(self, t, y):
         # doing all of the changes from SIR model
-        a, b, c = super(SIRS, self)._deriv(s, i)
-        # compute the people becoming resusceptible from the R compartment
-        k = r * self.kappa
+        a, b, c = super(SIRS, self)._rhs(t, y)
         # return the values in S, I, R, accumulation format
-        return a + k, b, c - k, -a
-        #
-
-    # update function adjusted for accumulation of cases
-    def _updateAccumulate(self, dt, S, I, R, cases):
-        # for all the days that ODE will be solved
-        for i in range(1, len(S)):
-            f = self._derivAccumulate(S[i - 1], I[i - 1], R[-1])
-            S[i] = S[i - 1] + dt * f[0]
-            I[i] = I[i - 1] + dt * f[1]
-            R[i] = R[i - 1] + dt * f[2]
-            cases[i] = cases[i - 1] + dt * f[3]
-        return S, I, R, cases
+        return a, b, c, -a
 
     # _simulate function adjusted for the accumulation of cases
     def _simulateAccumulate(self, days: int, dt: float):
-        # total number of iterations that will be run + the starting value at time 0
-        size = int(days / dt + 1)
-        # create the arrays to store the different values
-        S, I, R, case = np.zeros(size), np.zeros(size), np.zeros(size), np.zeros(size)
-        # initialize the arrays
-        S[0], I[0], R[0], case[0] = self.S0, self.I0, self.R0, self.I0
-        # run the Euler's Method
-        S, I, R, case = self._updateAccumulate(dt, S, I, R, cases=case)
+        # the cases start out as the people who are infected
+        y0 = [self.S0, self.I0, self.R0, self.I0]
+        S, I, R, case = self._integrate(y0, days, dt, rhs=self._rhsAccumulate).T
         return S, I, R, case
 
-    # runs Euler's Method
-    @dispatch(float, np.ndarray, np.ndarray, np.ndarray)
-    def _update(self, dt, S, I, R) -> tuple:
-        # for all the days that ODE will be solved
-        for i in range(1, len(S)):
-            f = self._deriv(S[i - 1], I[i - 1], R[i - 1])
-            S[i] = S[i - 1] + dt * f[0]
-            I[i] = I[i - 1] + dt * f[1]
-            R[i] = R[i - 1] + dt * f[2]
-        return S, I, R
-
-    # does the work of initializing arrays and then updating the arrays using Euler's method
+    # does the work of solving the ODEs from the starting values
     def _simulate(self, days: int, dt: float):
-        # total number of iterations that will be run + the starting value at time 0
-        size = int(days / dt + 1)
-        # create the arrays to store the different values
-        S, I, R = np.zeros(size), np.zeros(size), np.zeros(size)
-        # initialize the arrays
-        S[0], I[0], R[0] = self.S0, self.I0, self.R0
-        # run the Euler's Method
-        S, I, R = self._update(dt, S, I, R)
+        # one row per time step
+        S, I, R = self._integrate(self._start(), days, dt).T
         return S, I, R
 
     # function uses to determine the total number of cases cumulatively
     def accumulate(self, days: int, dt: float, plot=True):
+        import pandas as pd
         self.floatCheck([days, dt])
         self.negValCheck([days, dt])
         # create a linrange object
@@ -131,6 +100,7 @@ class SIRS(SIR):
         # turn into dataframe
         df = pd.DataFrame.from_dict(data=data1)
         if plot:
+            from matplotlib import pyplot as plt
             # do some plotting
             df.plot(x="Days", y=["Total Cases"])
             plt.xlabel("Days")
@@ -1,8 +1,5 @@
 from .SIR import SIR
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from multipledispatch import dispatch
 
 
 # Flow of the Compartmental Model:
@@ -36,6 +33,9 @@ class SIRV(SIR):
         Initial vaccinated at the start of the simulation.
     """
 
+    # names of the compartments, in the order of the state vector
+    compartments = ["Susceptible", "Infected", "Removed", "Vaccinated"]
+
     def __init__(self, beta, gamma, eta, S0, I0, R0, V0):
         self.intCheck([S0, I0, R0, V0])
         self.floatCheck([beta, gamma, eta])
@@ -53,41 +53,34 @@ class SIRV(SIR):
     def changeEta(self, x: int):
         self.eta = x
 
-    def _deriv(self, s, i):
+    # right hand side of the ODEs, on the state vector (s, i, r, v)
+    def _rhs(self, t, y):
+        s, i = y[0], y[1]
         # amount of people going from S -> I
         x = self.beta * s * i / self.N
         # amount of people going from I -> R
-        y = self.gamma * i
+        z = self.gamma * i
         # amount of people going from S -> V
-        z = self.eta * s
-        return -x - z, x - y, y, z
-
-    @dispatch(float, np.ndarray, np.ndarray, np.ndarray, np.ndarray)
-    def _update(self, dt: float, S, I, R, V):
-        # run Euler's Method
-        for i in range(1, len(S)):
-            # get the derivatives at a point before
-            f = self._deriv(S[i - 1], I[i - 1])
-            # compute the euler's method: f(x+h) = f(x) + h * (df/dx)
-            S[i] = S[i - 1] + dt * f[0]
-            I[i] = I[i - 1] + dt * f[1]
-            R[i] = R[i - 1] + dt * f[2]
-            V[i] = V[i - 1] + dt * f[3]
-        return S, I, R, V
+        w = self.eta * s
+        return -x - w, x - z, z, w
+
+    # the starting values of the state vector
+    def _start(self):
+        return [self.S0, self.I0, self.R0, self.V0]
+
+    # S -> I, I -> R and S -> V
+    transitions = [(0, 1), (1, 2), (0, 3)]
+
+    # per person rates of the transitions, on the state vector (s, i, r, v)
+    def _hazards(self, y):
+        return self.beta * y[1] / self.N, self.gamma, self.eta
 
     def _simulate(self, days: int, dt: float):
-        # total number of iterations that will be run + the starting value at time 0
-        size = int(days / dt + 1)
-        # create the arrays to store the different values
-        S, I, R, V = np.zeros(size), np.zeros(size), np.zeros(size), np.zeros(size)
-        # initialize the arrays
-        S[0], I[0], R[0], V[0] = self.S0, self.I0, self.R0, self.V0
-        # run the Euler's Method
-        S, I, R, V = self._update(dt, S, I, R, V)
+        # solve from the starting values, one row per time step
+        S, I, R, V = self._integrate(self._start(), days, dt).T
         return S, I, R, V
 
     # include the variables that will be plotted in the run function
-    @dispatch(bool, bool, bool, bool)
     def _includeVar(self, sx: bool, ix: bool, rx: bool, vx):
         labels = []
         if sx:
@@ -100,7 +93,6 @@ class SIRV(SIR):
             labels.append("Vaccinated")
         return labels
 
-    @dispatch(int, float, plot=bool, Sbool=bool, Ibool=bool, Rbool=bool, Vbool=bool)
     def run(
         self,
         days: int,
@@ -111,6 +103,9 @@ class SIRV(SIR):
         Rbool=True,
         Vbool=True,
     ):
+        import pandas as pd
+        self.floatCheck([days, dt])
+        self.negValCheck([days, dt])
         # evenly space the days
         t = np.linspace(0, days, int(days / dt) + 1)
         # run a simulation and get the numpy arrays
@@ -127,6 +122,7 @@ class SIRV(SIR):
         df = pd.DataFrame.from_dict(data=data1)
         # plotting
         if plot:
+            from matplotlib import pyplot as plt
             # retrieve the list of variables that will be plotted
             included = self._includeVar(Sbool, Ibool, Rbool, Vbool)
             fig = df.plot("Days", included)
@@ -137,6 +133,7 @@ class SIRV(SIR):
         return df
 
     def accumulate(self, days: int, dt: float, plot=True):
+        import pandas as pd
         self.floatCheck([days, dt])
         self.negValCheck([days, dt])
         t = np.linspace(0, days, int(days / dt) + 1)
@@ -167,6 +164,7 @@ class SIRV(SIR):
         # convert to dataframe
         df = pd.DataFrame(data=data1, columns=labels)
         if plot:
+            from matplotlib import pyplot as plt
             # do some plotting
             df.plot(x="Days", y=["Total Cases"])
             plt.xlabel("Days")
@@ -1,8 +1,5 @@
 from .CompartmentalModel import CompartmentalModel
 import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from multipledispatch import dispatch
 
 # Flow of the Compartmental Model:
 # S -> I - > S
@@ -28,6 +25,9 @@ class SIS(CompartmentalModel):
 
     """
 
+    # names of the compartments, in the order of the state vector
+    compartments = ["Susceptible", "Infected"]
+
     def __init__(self, beta, gamma, S0, I0):
         self.intCheck([S0, I0])
         self.floatCheck([beta, gamma, S0, I0])
@@ -42,30 +42,26 @@ class SIS(CompartmentalModel):
         # population size
         self.N = S0 + I0
 
-    @dispatch(float, float)
-    def _deriv(self, s: float, i: float):
-        x = self.beta * s * i / self.N
-        y = self.gamma * i
-        return -x + y, x - y
-
-    @dispatch(float, np.ndarray, np.ndarray)
-    def _update(self, dt, S1, I1):
-        S, I = S1, I1
-        for i in range(1, len(S)):
-            f = self._deriv(S[i - 1], I[i - 1])
-            S[i] = S[i - 1] + dt * f[0]
-            I[i] = I[i - 1] + dt * f[1]
-        return S, I
+    # right hand side of the ODEs, on the state vector (s, i)
+    def _rhs(self, t, y):
+        x = self.beta * y[0] * y[1] / self.N
+        z = self.gamma * y[1]
+        return -x + z, x - z
+
+    # the starting values of the state vector
+    def _start(self):
+        return [self.S0, self.I0]
+
+    # S -> I and I -> S
+    transitions = [(0, 1), (1, 0)]
+
+    # per person rates of the transitions, on the state vector (s, i)
+    def _hazards(self, y):
+        return self.beta * y[1] / self.N, self.gamma
 
     def _simulate(self, days: int, dt: float):
-        # total number of iterations that will be run + the starting value at time 0
-        size = int(days / dt + 1)
-        # create the arrays to store the different values
-        S, I = np.zeros(size), np.zeros(size)
-        # initialize the arrays
-        S[0], I[0] = self.S0, self.I0
-        # run the Euler's Method
-        S, I = self._update(dt, S, I)
+        # solve from the starting values, one row per time step
+        S, I = self._integrate(self._start(), days, dt).T
         return S, I
 
     # method that determines variables to be included in the plot
@@ -77,8 +73,10 @@ class SIS(CompartmentalModel):
             labels.append("Infected")
         return labels
 
-    @dispatch(int, float, plot=True, Sbool=True, Ibool=True)
     def run(self, days: int, dt: float, plot=True, Sbool=True, Ibool=True):
+        import pandas as pd
+        self.floatCheck([days, dt])
+        self.negValCheck([days, dt])
         # evenly space the days
         t = np.linspace(0, days, int(days / dt) + 1)
         # run a simulation and get the S and I arrays
@@ -89,6 +87,7 @@ class SIS(CompartmentalModel):
         df = pd.DataFrame.from_dict(data=data1)
         # plotting
         if plot:
+            from matplotlib import pyplot as plt
             # retrieve the list of variables that will be plotted
             included = self._includeVar(Sbool, Ibool)
             fig = df.plot("Days", included)
@@ -0,0 +1,254 @@
+import numpy as np
+
+# The solvers integrate dy/dt = f(t, y) on the grid t0, t0 + dt, ..., t0 + steps*dt. f takes the time and the
+# state as an ndarray with the compartments along the first axis, and returns the derivatives in the same shape,
+# or as a sequence with one entry per compartment, so a state with extra axes (for example a batch of parameter
+# sets) is integrated all at once.
+
+# the solvers that can be picked by name
+methods = ("euler", "rk4", "rk45")
+
+# Dormand-Prince 5(4) tableau
+_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+]
+# weights of the 5th order solution
+_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+# difference between the 5th and the embedded 4th order solution, for the error estimate
+_E = np.array([71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+# coefficients of the 4th order interpolant inside each step, used for the dense output
+_P = np.array([
+    [1, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200 / 32700410799, -68118460800 / 10900136933, 87487479700 / 32700410799],
+    [0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+    [0, 127303824393 / 49829197408, -318862633887 / 49829197408, 701980252875 / 199316789632],
+    [0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+    [0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+])
+
+
+def euler(f, y0, dt: float, steps: int, t0=0.0):
+    """
+    Integrates with the forward Euler method.
+
+    Parameters
+    ----------
+
+    f: callable
+        The right hand side f(t, y) of the ODEs.
+
+    y0: ndarray
+        The state at t0.
+
+    dt: float
+        The step size.
+
+    steps: int
+        The number of steps.
+
+    t0: float, optional
+        The starting time. Default is 0.
+
+    Returns
+    -------
+
+    ndarray:
+        Array of shape (steps + 1,) + y0.shape with the state after every step, starting with y0.
+    """
+    y = np.array(y0, dtype=float)
+    Y = np.empty((steps + 1,) + y.shape)
+    Y[0] = y
+    for n in range(steps):
+        # f(x+h) = f(x) + h * (df/dx)
+        y = y + dt * np.asarray(f(t0 + n * dt, y))
+        Y[n + 1] = y
+    return Y
+
+
+def floatEuler(f, y0, dt: float, steps: int, t0=0.0):
+    """
+    Integrates with the forward Euler method like euler(), for a state with only the compartment axis. The state is
+    kept in Python floats, so f gets it as a list of floats and has to return a sequence of floats, and a step costs
+    a few float operations instead of a handful of numpy calls on tiny arrays. The results are the same as euler()
+    to the last bit. Takes the same parameters and returns the same array as euler().
+    """
+    y = [float(val) for val in y0]
+    rows = [y]
+    for n in range(steps):
+        y = [val + dt * d for val, d in zip(y, f(t0 + n * dt, y))]
+        rows.append(y)
+    return np.array(rows).reshape(steps + 1, len(y))
+
+
+def rk4(f, y0, dt: float, steps: int, t0=0.0):
+    """
+    Integrates with the classic 4th order Runge-Kutta method. Takes the same parameters and returns the same
+    array as euler().
+    """
+    y = np.array(y0, dtype=float)
+    Y = np.empty((steps + 1,) + y.shape)
+    Y[0] = y
+    for n in range(steps):
+        t, y = t0 + n * dt, Y[n]
+        k1 = np.asarray(f(t, y))
+        k2 = np.asarray(f(t + dt / 2, y + dt / 2 * k1))
+        k3 = np.asarray(f(t + dt / 2, y + dt / 2 * k2))
+        k4 = np.asarray(f(t + dt, y + dt * k3))
+        Y[n + 1] = y + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    return Y
+
+
+class DenseOutput:
+    """
+    Continuous solution of an adaptive integration. Holds the start, size and interpolation coefficients of every
+    accepted step, and evaluates the 4th order interpolant of the step that each requested time falls in.
+    """
+    def __init__(self, ts, hs, ys, Qs):
+        # start time, step size, starting state and interpolation coefficients of every step
+        self.ts = np.asarray(ts)
+        self.hs = np.asarray(hs)
+        self.ys = ys
+        self.Qs = Qs
+
+    def __call__(self, t):
+        """
+        Evaluates the solution.
+
+        Parameters
+        ----------
+
+        t: float or ndarray
+            The times, between the start and the end of the integration.
+
+        Returns
+        -------
+
+        ndarray:
+            The state at every time in t, with the time along the first axis if t is an array.
+        """
+        t = np.asarray(t, dtype=float)
+        times = np.atleast_1d(t)
+        out = np.empty((len(times),) + self.ys[0].shape)
+        # the step that every time falls in
+        steps = np.clip(np.searchsorted(self.ts, times, side="right") - 1, 0, len(self.ts) - 1)
+        for j, (time, step) in enumerate(zip(times, steps)):
+            out[j] = self._eval(step, time)
+        return out if t.ndim else out[0]
+
+    def _eval(self, step: int, time: float):
+        h = self.hs[step]
+        return _interpolate(self.ys[step], h, self.Qs[step], (time - self.ts[step]) / h)
+
+
+def _interpolate(y, h: float, Q, x: float):
+    """Evaluates the interpolant of a step of size h that starts at y, a fraction x into the step."""
+    # x, x^2, x^3, x^4
+    powers = np.cumprod(np.full(4, x))
+    return y + h * np.tensordot(powers, Q, axes=(0, 0))
+
+
+def rk45(f, y0, dt: float, steps: int, t0=0.0, rtol=1e-6, atol=1e-6, dense=False):
+    """
+    Integrates with the adaptive Dormand-Prince 5(4) method. The step size is picked to keep the estimated local
+    error below atol + rtol * |y|, and the solution on the grid is read off the dense output of the steps, so dt
+    only sets where the solution is reported.
+
+    Parameters
+    ----------
+
+    f, y0, dt, steps, t0:
+        The same as for euler().
+
+    rtol: float, optional
+        The relative tolerance. Default is 1e-6.
+
+    atol: float, optional
+        The absolute tolerance. Default is 1e-6.
+
+    dense: bool, optional
+        If True, the DenseOutput of the integration is returned as well. Default is False.
+
+    Returns
+    -------
+
+    ndarray:
+        Array of shape (steps + 1,) + y0.shape with the state on the grid.
+
+    DenseOutput:
+        Only if dense=True. Evaluates the solution at any time of the integration.
+    """
+    y = np.array(y0, dtype=float)
+    tEnd = t0 + steps * dt
+    grid = t0 + dt * np.arange(steps + 1)
+    Y = np.empty((steps + 1,) + y.shape)
+    Y[0] = y
+    ts, hs, ys, Qs = [], [], [], []
+    t = t0
+    K = np.empty((7,) + y.shape)
+    K[0] = f(t, y)
+    h = _firstStep(f, t, y, K[0], rtol, atol, tEnd - t0)
+    # next point of the grid that hasn't been filled in
+    g = 1
+    while t < tEnd and g <= steps:
+        h = min(h, tEnd - t)
+        # try steps until one has a small enough error
+        while True:
+            for s in range(1, 6):
+                K[s] = f(t + _C[s] * h, y + h * np.tensordot(_A[s], K[:s], axes=(0, 0)))
+            yNew = y + h * np.tensordot(_B, K[:6], axes=(0, 0))
+            K[6] = f(t + h, yNew)
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(yNew))
+            err = np.sqrt(np.mean((h * np.tensordot(_E, K, axes=(0, 0)) / scale) ** 2))
+            if err <= 1:
+                break
+            h *= max(0.2, 0.9 * err ** -0.2)
+        Q = np.tensordot(_P, K, axes=(0, 0))
+        ts.append(t); hs.append(h); ys.append(y); Qs.append(Q)
+        # fill in the grid points inside this step from the interpolant
+        while g <= steps and grid[g] <= t + h:
+            Y[g] = _interpolate(y, h, Q, (grid[g] - t) / h)
+            g += 1
+        t, y = t + h, yNew
+        # the last stage is the first stage of the next step
+        K[0] = K[6]
+        h *= min(10, 0.9 * err ** -0.2) if err > 0 else 10
+    # rounding can leave the end of the grid just past the last step, which ends at tEnd
+    Y[g:] = y
+    if dense:
+        return Y, DenseOutput(ts, hs, ys, Qs)
+    return Y
+
+
+def _firstStep(f, t, y, f0, rtol, atol, span):
+    """Picks the first step size from the size of the state and its derivatives."""
+    scale = atol + rtol * np.abs(y)
+    d0 = np.sqrt(np.mean((y / scale) ** 2))
+    d1 = np.sqrt(np.mean((f0 / scale) ** 2))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    h0 = min(h0, span)
+    f1 = np.asarray(f(t + h0, y + h0 * f0))
+    d2 = np.sqrt(np.mean(((f1 - f0) / scale) ** 2)) / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** 0.2
+    return min(100 * h0, h1, span)
+
+
+def solve(f, y0, dt: float, steps: int, method="euler", t0=0.0, **options):
+    """
+    Integrates with the solver called method. Takes the parameters of euler(), and the options are passed on
+    to the solver, such as rtol and atol for rk45.
+    """
+    if method == "euler":
+        return euler(f, y0, dt, steps, t0)
+    if method == "rk4":
+        return rk4(f, y0, dt, steps, t0)
+    return rk45(f, y0, dt, steps, t0, **options)
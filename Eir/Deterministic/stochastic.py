@@ -0,0 +1,183 @@
+import numpy as np
+
+import Eir.exceptions as e
+import Eir.utility as u
+
+# the ways the stochastic model can be simulated
+methods = ("gillespie", "tau")
+
+
+class Stochastic:
+    """
+    Simulates the stochastic version of a deterministic model, where the people in each compartment are whole
+    numbers and the flows of the ODEs happen at random. Every person in the from compartment of a flow makes it at
+    the same per day rate as in the ODEs, so the average of many replicates follows the ODEs for big populations.
+    All the replicates are simulated at once, with the replicates along the last axis of the state.
+
+    Parameters
+    ----------
+
+    model: class
+        The model whose compartments and flows are simulated, such as SIR, SEIR, SIRS, SIRD, SIRV or SIS.
+
+    replicates: int, optional
+        The number of independent runs. Default is 1.
+
+    method: str, optional
+        "gillespie" for the exact stochastic simulation algorithm, which simulates every single event and is meant
+        for small populations. "tau" for tau-leaping, which takes steps of dt days and draws the number of people
+        leaving every compartment in the step from a binomial distribution, so its cost doesn't depend on the size
+        of the population. Default is "tau".
+
+    rng: optional
+        What the random numbers are drawn from. None uses the global np.random state, an int or SeedSequence seeds
+        a new np.random.Generator, and a Generator is used as is. Default is None.
+
+    **kwargs:
+        The parameters of the constructor of model, which go through its checks.
+
+    Attributes
+    ----------
+
+    compartments: list
+        The names of the compartments, in the order of the last axis of results.
+
+    results: ndarray
+        int array of shape (replicates, steps + 1, compartments) with the number of people in each compartment
+        every dt days of each replicate. Only set after run().
+    """
+    def __init__(self, model, replicates=1, method="tau", rng=None, **kwargs):
+        self.sim = model(**kwargs)
+        self.sim.intCheck([replicates])
+        self.sim.negValCheck([replicates])
+        if method not in methods:
+            raise e.SolverException(method, methods)
+        self.replicates = replicates
+        self.method = method
+        self.rng = u.makeRng(rng)
+        self.compartments = list(model.compartments)
+        # the from and to compartment of every transition
+        self.src = np.array([src for src, dst in model.transitions])
+        self.dst = np.array([dst for src, dst in model.transitions])
+        self.days = None
+        self.results = None
+
+    def _hazards(self, y):
+        """Returns the per person rates of the transitions as an array of shape (transitions, replicates)."""
+        H = np.stack([np.broadcast_to(np.asarray(h, dtype=float), y.shape[1:]) for h in self.sim._hazards(y)])
+        # no one is left to infect anyone when a population has died out
+        return np.where(H > 0, H, 0.0)
+
+    def run(self, days: int, dt: float):
+        """
+        Simulates every replicate.
+
+        Parameters
+        ----------
+
+        days: int
+            The number of days being simulated.
+
+        dt: float
+            How often the state is reported, and the step size of tau-leaping.
+
+        Returns
+        -------
+
+        ndarray:
+            int array of shape (replicates, steps + 1, compartments) with the results of every replicate.
+        """
+        self.sim.floatCheck([days, dt])
+        self.sim.negValCheck([days, dt])
+        # the same grid as the run() of the model
+        steps = int(days / dt + 1) - 1
+        y = np.repeat(np.array(self.sim._start(), dtype=np.int64)[:, None], self.replicates, axis=1)
+        if self.method == "gillespie":
+            Y = self._gillespie(y, dt, steps)
+        else:
+            Y = self._tauLeap(y, dt, steps)
+        self.days = days
+        self.results = Y
+        return self.results
+
+    def _tauLeap(self, y, dt: float, steps: int):
+        """Runs tau-leaping with steps of dt from the state y, of shape (compartments, replicates)."""
+        Y = np.empty((self.replicates, steps + 1, len(y)), dtype=np.int64)
+        Y[:, 0] = y.T
+        for n in range(steps):
+            H = self._hazards(y)
+            flows = np.zeros(H.shape, dtype=np.int64)
+            for c in np.unique(self.src):
+                # the transitions out of compartment c compete, so the people leaving are drawn once and then split
+                ks = np.flatnonzero(self.src == c)
+                total = H[ks].sum(axis=0)
+                left = self.rng.binomial(y[c], -np.expm1(-total * dt))
+                rest = total
+                for k in ks[:-1]:
+                    with np.errstate(divide="ignore", invalid="ignore"):
+                        p = np.where(rest > 0, H[k] / rest, 0.0)
+                    flows[k] = self.rng.binomial(left, np.clip(p, 0, 1))
+                    left = left - flows[k]
+                    rest = rest - H[k]
+                flows[ks[-1]] = left
+            # every flow is taken from the state at the start of the step, so no compartment goes negative
+            np.subtract.at(y, self.src, flows)
+            np.add.at(y, self.dst, flows)
+            Y[:, n + 1] = y.T
+        return Y
+
+    def _gillespie(self, y, dt: float, steps: int):
+        """Runs the exact stochastic simulation algorithm from the state y, of shape (compartments, replicates)."""
+        Y = np.empty((self.replicates, steps + 1, len(y)), dtype=np.int64)
+        grid = dt * np.arange(steps + 1)
+        # the time of every replicate, and the next point of the grid it hasn't filled in
+        t = np.zeros(self.replicates)
+        g = np.zeros(self.replicates, dtype=np.int64)
+        active = np.arange(self.replicates)
+        while len(active):
+            ya = y[:, active]
+            # rates of every transition in every replicate that is still running
+            A = self._hazards(ya) * ya[self.src]
+            a0 = A.sum(axis=0)
+            # a replicate that can't change anymore waits forever
+            with np.errstate(divide="ignore"):
+                tNew = t[active] + self.rng.standard_exponential(len(active)) / a0
+            # the state stays the same on the grid points before the next event
+            gNew = np.searchsorted(grid, tNew)
+            counts = gNew - g[active]
+            if counts.any():
+                rows = np.repeat(active, counts)
+                cols = np.arange(counts.sum()) + np.repeat(g[active] - (np.cumsum(counts) - counts), counts)
+                Y[rows, cols] = np.repeat(ya.T, counts, axis=0)
+            g[active] = gNew
+            t[active] = tNew
+            # the replicates that have run past the end, or can't change anymore, are done
+            running = gNew <= steps
+            active, A, a0 = active[running], A[:, running], a0[running]
+            # pick the transition of the event in proportion to its rate
+            k = (np.cumsum(A, axis=0) < self.rng.random(len(active)) * a0).sum(axis=0)
+            k = np.minimum(k, len(A) - 1)
+            y[self.src[k], active] -= 1
+            y[self.dst[k], active] += 1
+        return Y
+
+    def toDataFrame(self):
+        """
+        Puts the results in a long pandas DataFrame, with one row per step of every replicate.
+
+        Returns
+        -------
+
+        pd.DataFrame
+            Has a Replicate column with the index of the replicate, then the Days column and a column for every
+            compartment, like the DataFrame of run() of the model.
+        """
+        import pandas as pd
+        if self.results is None:
+            raise e.NotRunException("The stochastic model")
+        n, steps = self.results.shape[:2]
+        data = {"Replicate": np.repeat(np.arange(n), steps), "Days": np.tile(np.linspace(0, self.days, steps), n)}
+        flat = self.results.reshape(n * steps, -1)
+        for j, name in enumerate(self.compartments):
+            data[name] = flat[:, j]
+        return pd.DataFrame(data)
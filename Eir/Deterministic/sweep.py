@@ -0,0 +1,128 @@
+import numpy as np
+
+import Eir.exceptions as e
+
+
+class Sweep:
+    """
+    Solves a deterministic model for every point of a parameter grid at once. The swept parameters are set on a
+    single model as arrays with one value per point, so the ODE state holds every point in a (compartments,
+    points) array and each step of the solver is a handful of array operations, whatever the number of points.
+
+    Parameters
+    ----------
+
+    model: class
+        The model to sweep, such as SEIR, SIRD or SIRV.
+
+    grid: bool, optional
+        If True, the points are every combination of the swept values. If False, the i-th values of the swept
+        parameters make up the i-th point, so they all need the same number of values. Default is True.
+
+    **kwargs:
+        The parameters of the constructor of model. A list or 1-D array of values sweeps the parameter, and a
+        single number keeps it fixed at every point. Every point goes through the checks of the constructor.
+
+    Attributes
+    ----------
+
+    compartments: list
+        The names of the compartments, in the order of the last axis of results.
+
+    points: pd.DataFrame
+        The values of the swept parameters, with one row per point.
+
+    results: ndarray
+        Array of shape (points, steps + 1, compartments) with the number of people in each compartment at each
+        step of each point. Only set after run().
+    """
+    def __init__(self, model, grid=True, **kwargs):
+        import pandas as pd
+        swept = {name: np.asarray(val) for name, val in kwargs.items() if np.ndim(val) > 0}
+        fixed = {name: val for name, val in kwargs.items() if name not in swept}
+        for name, values in swept.items():
+            if values.ndim != 1 or not len(values):
+                raise e.SweepException(name)
+        if grid:
+            # every combination, with the last parameter changing the fastest
+            columns = [m.ravel() for m in np.meshgrid(*swept.values(), indexing="ij")]
+        else:
+            columns = list(swept.values())
+            for name, values in swept.items():
+                if len(values) != len(columns[0]):
+                    raise e.SweepException(name, len(columns[0]))
+        self.points = pd.DataFrame(dict(zip(swept, columns)), index=range(len(columns[0]) if columns else 1))
+        # run the checks of the constructor on every point
+        names = list(swept)
+        for values in zip(*[col.tolist() for col in columns]) if columns else [()]:
+            self.sim = model(**fixed, **dict(zip(names, values)))
+        # the swept values become arrays on one of the models, which broadcast against the state
+        for name, values in zip(names, columns):
+            setattr(self.sim, name, values)
+        n = len(self.points)
+        # the starting state, with one column per point
+        self.y0 = np.stack([np.broadcast_to(np.asarray(val, dtype=float), (n,)) for val in self.sim._start()])
+        # the population size changes with the starting values
+        self.sim.N = self.y0.sum(axis=0)
+        self.compartments = list(model.compartments)
+        self.days = None
+        self.results = None
+
+    def run(self, days: int, dt: float, method="euler", **options):
+        """
+        Solves the model at every point.
+
+        Parameters
+        ----------
+
+        days: int
+            The number of days being simulated.
+
+        dt: float
+            The step size of the solver, or the spacing of the reported values for rk45.
+
+        method: str, optional
+            The ODE solver, as in changeMethod() of the model. Default is "euler". With "rk45" the step size is
+            shared by all points, and picked from the error over all of them.
+
+        **options:
+            Passed on to the solver, such as rtol and atol for rk45.
+
+        Returns
+        -------
+
+        ndarray:
+            Array of shape (points, steps + 1, compartments) with the results of every point.
+        """
+        self.sim.floatCheck([days, dt])
+        self.sim.negValCheck([days, dt])
+        self.sim.changeMethod(method, **options)
+        # the solver returns (steps + 1, compartments, points)
+        Y = self.sim._integrate(self.y0, days, dt)
+        self.days = days
+        self.results = np.ascontiguousarray(Y.transpose(2, 0, 1))
+        return self.results
+
+    def toDataFrame(self):
+        """
+        Puts the results in a long pandas DataFrame, with one row per step of every point.
+
+        Returns
+        -------
+
+        pd.DataFrame
+            Has a Point column with the index of the point, a column for every swept parameter, a Days column, and
+            a column for every compartment.
+        """
+        import pandas as pd
+        if self.results is None:
+            raise e.NotRunException("The sweep")
+        n, steps = self.results.shape[:2]
+        data = {"Point": np.repeat(np.arange(n), steps)}
+        for name in self.points.columns:
+            data[name] = np.repeat(self.points[name].values, steps)
+        data["Days"] = np.tile(np.linspace(0, self.days, steps), n)
+        flat = self.results.reshape(n * steps, -1)
+        for j, name in enumerate(self.compartments):
+            data[name] = flat[:, j]
+        return pd.DataFrame(data)
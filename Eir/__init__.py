@@ -1,96 +1,120 @@
 # init file for Eir package
 import sys
 import os
+import importlib
 
 path = os.path.dirname(__file__)
 sys.path.insert(0, path)
 
+# The classes of the package, and the modules they live in. A module is only imported the first time one of its
+# classes is used (PEP 562), so import Eir stays cheap, which matters for short-lived worker processes.
+_classes = {
+    # periodic mobility
+    "PeriodicICUV": "Eir.DTMC.spatialModel.PeriodicMovement.periodicICUV",
+    "PeriodicSEIR": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIR",
+    "PeriodicSEIRD": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRD",
+    "PeriodicSEIRDV": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRDV",
+    "PeriodicSEIRS": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRS",
+    "PeriodicSEIRSD": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRSD",
+    "PeriodicSEIRSDV": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRSDV",
+    "PeriodicSEIRV": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRV",
+    "PeriodicSEIRVS": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRVS",
+    "PeriodicSIR": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIR",
+    "PeriodicSIRD": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRD",
+    "PeriodicSIRDV": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRDV",
+    "PeriodicSIRS": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRS",
+    "PeriodicSIRSD": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRSD",
+    "PeriodicSIRSDV": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRSDV",
+    "PeriodicSIRV": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRV",
+    "PeriodicSIRVS": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRVS",
+    "PeriodicSIS": "Eir.DTMC.spatialModel.PeriodicMovement.periodicSIS",
+    # random movement
+    "RandMove": "Eir.DTMC.spatialModel.randomMovement.randMove",
+    "RandMoveSEIR": "Eir.DTMC.spatialModel.randomMovement.randMoveSEIR",
+    "RandMoveSEIRD": "Eir.DTMC.spatialModel.randomMovement.randMoveSEIRD",
+    "RandMoveSEIRDV": "Eir.DTMC.spatialModel.randomMovement.randMoveSEIRDV",
+    "RandMoveSEIRS": "Eir.DTMC.spatialModel.randomMovement.randMoveSEIRS",
+    "RandMoveSEIRSD": "Eir.DTMC.spatialModel.randomMovement.randMoveSEIRSD",
+    "RandMoveSEIRSDV": "Eir.DTMC.spatialModel.randomMovement.randMoveSEIRSDV",
+    "RandMoveSEIRV": "Eir.DTMC.spatialModel.randomMovement.randMoveSEIRV",
+    "RandMoveSEIRVS": "Eir.DTMC.spatialModel.randomMovement.randMoveSEIRVS",
+    "RandMoveSIR": "Eir.DTMC.spatialModel.randomMovement.randMoveSIR",
+    "RandMoveSIRD": "Eir.DTMC.spatialModel.randomMovement.randMoveSIRD",
+    "RandMoveSIRDV": "Eir.DTMC.spatialModel.randomMovement.randMoveSIRDV",
+    "RandMoveSIRS": "Eir.DTMC.spatialModel.randomMovement.randMoveSIRS",
+    "RandMoveSIRSD": "Eir.DTMC.spatialModel.randomMovement.randMoveSIRSD",
+    "RandMoveSIRSDV": "Eir.DTMC.spatialModel.randomMovement.randMoveSIRSDV",
+    "RandMoveSIRV": "Eir.DTMC.spatialModel.randomMovement.randMoveSIRV",
+    "RandMoveSIRVS": "Eir.DTMC.spatialModel.randomMovement.randMoveSIRVS",
+    "RandMoveSIS": "Eir.DTMC.spatialModel.randomMovement.randMoveSIS",
+    # Hub
+    "HubSEIR": "Eir.DTMC.spatialModel.Hub.HubSEIR",
+    "HubSEIRD": "Eir.DTMC.spatialModel.Hub.HubSEIRD",
+    "HubSEIRS": "Eir.DTMC.spatialModel.Hub.HubSEIRS",
+    "HubSEIRSD": "Eir.DTMC.spatialModel.Hub.HubSEIRSD",
+    "HubSEIRSV": "Eir.DTMC.spatialModel.Hub.HubSEIRSV",
+    "HubSEIRSVD": "Eir.DTMC.spatialModel.Hub.HubSEIRSVD",
+    "HubSEIRV": "Eir.DTMC.spatialModel.Hub.HubSEIRV",
+    "HubSEIRVD": "Eir.DTMC.spatialModel.Hub.HubSEIRVD",
+    "HubSIR": "Eir.DTMC.spatialModel.Hub.HubSIR",
+    "HubSIRD": "Eir.DTMC.spatialModel.Hub.HubSIRD",
+    "HubSIRS": "Eir.DTMC.spatialModel.Hub.HubSIRS",
+    "HubSIRSD": "Eir.DTMC.spatialModel.Hub.HubSIRSD",
+    "HubSIRSV": "Eir.DTMC.spatialModel.Hub.HubSIRSV",
+    "HubSIRSVD": "Eir.DTMC.spatialModel.Hub.HubSIRSVD",
+    "HubSIRV": "Eir.DTMC.spatialModel.Hub.HubSIRV",
+    "HubSIRVD": "Eir.DTMC.spatialModel.Hub.HubSIRVD",
+    "HubSIS": "Eir.DTMC.spatialModel.Hub.HubSIS",
+    "Hub_ICUV": "Eir.DTMC.spatialModel.Hub.Hub_ICUV",
+    # Strong Infectious
+    "StrongInfSEIR": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIR",
+    "StrongInfSEIRD": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRD",
+    "StrongInfSEIRS": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRS",
+    "StrongInfSEIRSD": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRSD",
+    "StrongInfSEIRSV": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRSV",
+    "StrongInfSEIRSVD": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRSVD",
+    "StrongInfSEIRV": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRV",
+    "StrongInfSEIRVD": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRVD",
+    "StrongInfSIR": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIR",
+    "StrongInfSIRD": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRD",
+    "StrongInfSIRS": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRS",
+    "StrongInfSIRSD": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRSD",
+    "StrongInfSIRSV": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRSV",
+    "StrongInfSIRSVD": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRSVD",
+    "StrongInfSIRV": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRV",
+    "StrongInfSIRVD": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRVD",
+    "StrongInfSIS": "Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIS",
+    "StrongInf_ICUV": "Eir.DTMC.spatialModel.StrongInfectious.StrongInf_ICUV",
+    # base classes and details of the spatial models
+    "Hub": "Eir.DTMC.spatialModel.HubModel",
+    "Population": "Eir.DTMC.spatialModel.population",
+    "Simul_Details": "Eir.DTMC.spatialModel.simul_details",
+    "Person": "Eir.utility",
+    # ensembles of replicates
+    "Ensemble": "Eir.DTMC.ensemble",
+    # Deterministic
+    "CompartmentalModel": "Eir.Deterministic.CompartmentalModel",
+    "SEIR": "Eir.Deterministic.SEIR",
+    "SIR": "Eir.Deterministic.SIR",
+    "SIRD": "Eir.Deterministic.SIRD",
+    "SIRS": "Eir.Deterministic.SIRS",
+    "SIRV": "Eir.Deterministic.SIRV",
+    "SIS": "Eir.Deterministic.SIS",
+    "Sweep": "Eir.Deterministic.sweep",
+    "Stochastic": "Eir.Deterministic.stochastic",
+}
 
+__all__ = list(_classes)
 
-# periodic mobility imports
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIS import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRVS import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRV import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRSDV import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRSD import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRS import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRDV import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIRD import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRVS import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRV import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRSDV import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRSD import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRS import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRDV import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIS import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIRDV import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIR import *
-from Eir.DTMC.spatialModel.PeriodicMovement.periodicICUV import *
-
-# randomMovement imports
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIS import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIRVS import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIRV import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIRSDV import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIRSD import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIRS import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIRDV import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIRD import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRVS import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRV import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRSDV import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRSD import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRS import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRDV import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSIS import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRDV import *
-from Eir.DTMC.spatialModel.randomMovement.randMoveSEIR import *
-
-# Hub import
-from Eir.DTMC.spatialModel.Hub.HubSIS import *
-from Eir.DTMC.spatialModel.Hub.HubSIRSV import *
-from Eir.DTMC.spatialModel.Hub.HubSIRV import *
-from Eir.DTMC.spatialModel.Hub.HubSIRSVD import *
-from Eir.DTMC.spatialModel.Hub.HubSIRSD import *
-from Eir.DTMC.spatialModel.Hub.HubSIRS import *
-from Eir.DTMC.spatialModel.Hub.HubSIRVD import *
-from Eir.DTMC.spatialModel.Hub.HubSIRD import *
-from Eir.DTMC.spatialModel.Hub.HubSEIRSV import *
-from Eir.DTMC.spatialModel.Hub.HubSEIRV import *
-from Eir.DTMC.spatialModel.Hub.HubSEIRSVD import *
-from Eir.DTMC.spatialModel.Hub.HubSEIRSD import *
-from Eir.DTMC.spatialModel.Hub.HubSEIRS import *
-from Eir.DTMC.spatialModel.Hub.HubSEIRVD import *
-from Eir.DTMC.spatialModel.Hub.HubSIS import *
-from Eir.DTMC.spatialModel.Hub.HubSEIR import *
-from Eir.DTMC.spatialModel.Hub.Hub_ICUV import *
-
-#Strong Infectious
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIS import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRSV import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRV import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRSVD import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRSD import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRS import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRVD import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIRD import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRSV import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRV import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRSVD import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRSD import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIRS import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIS import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSEIR import *
-from Eir.DTMC.spatialModel.StrongInfectious.StrongInf_ICUV import *
-
-#Deterministic
-
-from Eir.Deterministic.SEIR import *
-from Eir.Deterministic.SIR import *
-from Eir.Deterministic.SIRD import *
-from Eir.Deterministic.SIRS import *
-from Eir.Deterministic.SIRV import *
-from Eir.Deterministic.SIS import *
 
+def __getattr__(name):
+    if name not in _classes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_classes[name]), name)
+    # keep it in the package, so that later lookups don't come back here
+    globals()[name] = value
+    return value
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
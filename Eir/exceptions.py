@@ -95,4 +95,189 @@ class PersonNotFound(Exception):
             return "PersonNotFound Exception"
     
 
-        
\ No newline at end of file
+        
+class EngineException(Exception):
+    """ Thrown if the engine passed in to a spatial model is not one of the engines the model supports."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            self.message = args[0]
+            # the engines that are available for the model
+            self.engines = args[1] if len(args) > 1 else None
+        else:
+            self.message = None
+            self.engines = None
+
+    def __str__(self):
+        if self.message and self.engines:
+            return f"{self.message} is not a valid engine. Choose one of: {', '.join(self.engines)}."
+        elif self.message:
+            return f"{self.message} is not a valid engine."
+        else:
+            return "EngineException was raised."
+
+class NotRunException(Exception):
+    """ Thrown if results are asked for before the simulation was run."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            self.message = args[0]
+        else:
+            self.message = None
+
+    def __str__(self):
+        if self.message:
+            return f"{self.message} has to be run before its results can be used."
+        else:
+            return "NotRunException was raised."
+
+class RecordException(Exception):
+    """ Thrown if the record level passed in to a spatial model is not one of the levels Simul_Details supports."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            self.message = args[0]
+            # the levels that are available
+            self.levels = args[1] if len(args) > 1 else None
+        else:
+            self.message = None
+            self.levels = None
+
+    def __str__(self):
+        if self.message and self.levels:
+            return f"{self.message} is not a valid record level. Choose one of: {', '.join(self.levels)}."
+        elif self.message:
+            return f"{self.message} is not a valid record level."
+        else:
+            return "RecordException was raised."
+
+class NotRecordedException(Exception):
+    """ Thrown if details are asked for that the record level of the simulation didn't keep."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            # the level that is needed and the level that was used
+            self.message = args[0]
+            self.level = args[1] if len(args) > 1 else None
+        else:
+            self.message = None
+            self.level = None
+
+    def __str__(self):
+        if self.message and self.level:
+            return f"The simulation was recorded with record=\"{self.level}\". Use at least record=\"{self.message}\" to get these details."
+        elif self.message:
+            return f"Use at least record=\"{self.message}\" to get these details."
+        else:
+            return "NotRecordedException was raised."
+
+class SolverException(Exception):
+    """ Thrown if the ODE solver picked for a deterministic model is not one of the solvers Eir has."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            self.message = args[0]
+            # the solvers that are available
+            self.methods = args[1] if len(args) > 1 else None
+        else:
+            self.message = None
+            self.methods = None
+
+    def __str__(self):
+        if self.message and self.methods:
+            return f"{self.message} is not a valid solver. Choose one of: {', '.join(self.methods)}."
+        elif self.message:
+            return f"{self.message} is not a valid solver."
+        else:
+            return "SolverException was raised."
+
+class SweepException(Exception):
+    """ Thrown if the values of a parameter sweep can't be put together into points."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            # the parameter with the bad values and the number of values that were expected
+            self.message = args[0]
+            self.length = args[1] if len(args) > 1 else None
+        else:
+            self.message = None
+            self.length = None
+
+    def __str__(self):
+        if self.message and self.length:
+            return f"{self.message} should have {self.length} values, the same as the other swept parameters."
+        elif self.message:
+            return f"The values of {self.message} should be a non-empty list or 1-D array."
+        else:
+            return "SweepException was raised."
+
+class CheckpointException(Exception):
+    """ Thrown if a checkpoint is loaded into a model that it wasn't saved from."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            # what doesn't match, with its value in the checkpoint and in the model
+            self.message = args[0]
+            self.saved = args[1] if len(args) > 1 else None
+            self.value = args[2] if len(args) > 2 else None
+        else:
+            self.message = None
+            self.saved = None
+            self.value = None
+
+    def __str__(self):
+        if self.message and self.saved is not None:
+            return f"The checkpoint was saved with {self.message} {self.saved}, but the model has {self.message} {self.value}."
+        elif self.message:
+            return f"The checkpoint doesn't match the {self.message} of the model."
+        else:
+            return "CheckpointException was raised."
+
+class ParameterException(Exception):
+    """ Thrown if a fork of a spatial model is given a parameter that the model doesn't have or can't change part way through."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            self.message = args[0]
+            # the parameters that can be changed
+            self.parameters = args[1] if len(args) > 1 else None
+        else:
+            self.message = None
+            self.parameters = None
+
+    def __str__(self):
+        if self.message and self.parameters:
+            return f"{self.message} can't be changed part way through the simulation. Choose one of: {', '.join(self.parameters)}."
+        elif self.message:
+            return f"{self.message} can't be changed part way through the simulation."
+        else:
+            return "ParameterException was raised."
+
+class LocationException(Exception):
+    """ Thrown if more locations are added on a day than there are people in the simulation."""
+
+    def __init__(self, *args):
+        super().__init__()
+        if args:
+            # the day the location was added on and the number of people
+            self.message = args[0]
+            self.popsize = args[1] if len(args) > 1 else None
+        else:
+            self.message = None
+            self.popsize = None
+
+    def __str__(self):
+        if self.message is not None and self.popsize is not None:
+            return f"The locations of all {self.popsize} people were already added on day {self.message}."
+        elif self.message is not None:
+            return f"The locations of everyone were already added on day {self.message}."
+        else:
+            return "LocationException was raised."
@@ -1,8 +1,33 @@
 import numpy as np
 import math
 
+# turns the rng argument of the models into something to draw random numbers from
+def makeRng(rng=None):
+    """
+    Function to get the random number generator a model draws from.
+
+    Parameters
+    ----------
+
+    rng: optional
+        None uses the global np.random state, like earlier versions did, so np.random.seed keeps working.
+        An int or np.random.SeedSequence seeds a new np.random.Generator (PCG64). A np.random.Generator or
+        np.random.RandomState is used as is.
+
+    Returns
+    -------
+
+    np.random.Generator, np.random.RandomState or the np.random module:
+        Has the random, normal and uniform methods that the models use.
+    """
+    if rng is None:
+        return np.random
+    if isinstance(rng, (np.random.Generator, np.random.RandomState)):
+        return rng
+    return np.random.default_rng(rng)
+
 # generates a random event given a probability p
-def randEvent(p: float):
+def randEvent(p: float, rng=None):
     """
     Function to generate random events.
     
@@ -11,6 +36,9 @@ def randEvent(p: float):
 
     p: float
         The probability of a random event occuring.
+
+    rng: optional
+        What to draw the random number from, as returned by makeRng. Default is None, the global np.random state.
     
     Returns
     -------
@@ -23,7 +51,7 @@ def randEvent(p: float):
         return False
     else:
         # generate a random number
-        x = np.random.rand(1).mean()
+        x = (np.random if rng is None else rng).random(1).mean()
         # if the random number falls within a range that represents the probability of an event occuring
         # return True
         if 0 <= x < p:
@@ -31,6 +59,35 @@ def randEvent(p: float):
         else:
             return False
 
+# generates n random events given a probability p
+def randEvents(p: float, n: int, rng=None):
+    """
+    Function to generate n independent random events at once. Uses the random numbers in the same way as
+    n calls of randEvent(p), so it can replace such a loop without changing the results of a seeded simulation.
+
+    Parameters
+    ----------
+
+    p: float
+        The probability of a random event occuring.
+
+    n: int
+        The number of random events.
+
+    rng: optional
+        What to draw the random numbers from, as returned by makeRng. Default is None, the global np.random state.
+
+    Returns
+    -------
+
+    ndarray:
+        boolean array whose elements are True if that event happened and False if it didn't.
+    """
+    # randEvent doesn't use a random number when there is no chance of an event occuring
+    if p == 0:
+        return np.zeros(n, dtype=bool)
+    return (np.random if rng is None else rng).random(n) < p
+
 
 # Person object that holds whether they are a super spreader or not
 # used in Spatial models Strong Infectious and Hub
@@ -149,28 +206,66 @@ class Person2(Person1):
         # isIncluded
         self.isIncluded = False
 
-def static_prob_help(collect: list, prob: float):
+def probTransitions(state, prob: float, rng=None):
+    """
+    Decides who leaves a compartment, with every person in it leaving independently with probability prob.
+    All of the random numbers are drawn in one call, in the same order as a loop of randEvent calls over the
+    people in increasing index order.
+
+    Parameters
+    ----------
+
+    state: ndarray
+        Boolean state vector of the compartment, True for the people who are in it.
+
+    prob: float
+        The probability of a person going from one state to another.
+
+    rng: optional
+        What to draw the random numbers from, as returned by makeRng. Default is None, the global np.random state.
+
+    Returns
+    -------
+
+    ndarray:
+        int array with the indices of the people who leave the compartment, in increasing order.
+    """
+    # indices of the people in the compartment
+    included = np.flatnonzero(state)
+    # keep the ones whose random event happened
+    return included[randEvents(prob, len(included), rng)]
+
+def static_prob_help(collect, prob: float, rng=None):
     """
     Used in order to determine who goes from collect state to another using probability prob. 
 
     Parameters
     ----------
 
-    collect:list
-        collect is a list of Person objects. Edits in place because passes a reference.
+    collect: Collect or list
+        The view of the compartment, or a list of Person objects. Edits in place because passes a reference.
     
     prob: float
         The probability of a Person object going from one state to another
+
+    rng: optional
+        What to draw the random numbers from, as returned by makeRng. Default is None, the global np.random state.
+
+    Returns
+    -------
+
+    ndarray:
+        int array with the indices of the people who need to switch states.
     """
-    transfers = set()
-    for i, person in enumerate(collect):
-        if not person.isIncluded: 
-            continue
-        event = randEvent(prob)
-        if not event:
-            continue
-        collect[i].isIncluded=False
-        transfers.add(i)
+    # views of a Population already hold the compartment as a state vector
+    if hasattr(collect, "mask"):
+        transfers = probTransitions(collect.mask(), prob, rng)
+        collect.exclude(transfers)
+        return transfers
+    # plain lists of Person objects
+    transfers = probTransitions([person.isIncluded for person in collect], prob, rng)
+    for i in transfers:
+        collect[i].isIncluded = False
     return transfers
 
 # computes the distance between two different Person objects
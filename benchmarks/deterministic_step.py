@@ -0,0 +1,21 @@
+import sys
+import timeit
+
+from Eir.Deterministic.SEIR import SEIR
+from Eir.Deterministic.SIRS import SIRS
+
+# Micro-benchmark of the per-step cost of the deterministic models: one run of 365 days with dt=.01 is 36500
+# steps of Euler's method, so the time of a run divided by the steps is what a single step costs.
+
+days, dt = 365, .01
+steps = int(days / dt)
+# number of timed runs, the fastest one is reported
+repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+cases = [
+    ("SEIR.run", SEIR(1.5, .2, .3, 999999, 0, 1, 0).run),
+    ("SIRS.accumulate", SIRS(1.5, .3, .15, 999999, 1, 0).accumulate),
+]
+for name, fn in cases:
+    t = min(timeit.repeat(lambda: fn(days, dt, plot=False), number=1, repeat=repeat))
+    print(f"{name}({days}, {dt}): {t:.3f} s, {t / steps * 1e6:.2f} us/step")
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+# Import-time benchmark: times `import Eir` and the import of a model in fresh interpreters, which is what every
+# worker process pays before it can start simulating. Pass a number of seconds to fail when import Eir gets slower
+# than that, e.g. python benchmarks/import_time.py 0.5
+
+# number of fresh interpreters per statement, the fastest one is reported
+repeat = 5
+limit = float(sys.argv[1]) if len(sys.argv) > 1 else None
+
+timer = """
+import sys, time
+t = time.perf_counter()
+{}
+t = time.perf_counter() - t
+print(t, int("pandas" in sys.modules), int("matplotlib" in sys.modules))
+"""
+
+statements = [
+    "import Eir",
+    "from Eir import HubSEIR",
+    "from Eir import SEIR",
+]
+failed = False
+for stmt in statements:
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", timer.format(stmt)], capture_output=True, text=True, check=True)
+        runs.append(out.stdout.split())
+    t = min(float(run[0]) for run in runs)
+    pd, plt = runs[0][1:]
+    print(f"{stmt}: {t * 1000:.1f} ms, pandas loaded: {pd == '1'}, matplotlib loaded: {plt == '1'}")
+    if stmt == "import Eir" and limit is not None and t > limit:
+        failed = True
+        print(f"import Eir took longer than {limit} s")
+sys.exit(1 if failed else 0)
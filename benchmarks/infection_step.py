@@ -0,0 +1,43 @@
+import sys
+import time
+
+import numpy as np
+
+from Eir import HubSIR, RandMoveSIR
+import Eir.DTMC.spatialModel.kernels as kernels
+
+# Benchmark of one infection step, the part of a day that compares every infectious person with every susceptible.
+# The population is spread over a plane that keeps the density the same at every size, 1% of it is infectious,
+# and each engine runs the same step from the same seed. Pass the population sizes to time, e.g.
+# python benchmarks/infection_step.py 1000 10000 100000
+
+sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000]
+print(f"numba installed: {kernels.compiled}")
+
+
+def hub(popsize, engine):
+    side = (popsize / 1.6) ** 0.5
+    return HubSIR(pss=.2, rstart=1, side=side, S0=popsize - popsize // 100, I0=popsize // 100, R0=0, days=1,
+                  gamma=.2, engine=engine, rng=0)
+
+
+def randMove(popsize, engine):
+    side = (popsize / 1.6) ** 0.5
+    return RandMoveSIR(popsize - popsize // 100, popsize // 100, 0, .2, side, 1, .2, 1, .2, 1, engine=engine, rng=0)
+
+
+cases = [
+    ("Hub", hub, lambda test: test._transmission(1, [test.Icollect], test.Scollect)),
+    ("RandMove", randMove, lambda test: test._StoI(1)),
+]
+for name, model, step in cases:
+    for popsize in sizes:
+        for engine in model(10, "loop").engines:
+            # the loop engines take minutes on the biggest populations
+            if engine == "loop" and popsize > 10000:
+                continue
+            test = model(popsize, engine)
+            t = time.perf_counter()
+            infected = step(test)
+            t = time.perf_counter() - t
+            print(f"{name} popsize={popsize} engine={engine}: {t:.3f} s, {len(infected)} infected")
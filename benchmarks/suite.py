@@ -0,0 +1,249 @@
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+# Benchmark suite for the model families: times the construction, run() and toDataFrame() of every model for every
+# population size and number of days, and records the peak memory of each case. Every case runs in a fresh
+# interpreter that imports only the classes of its own model, so the peak memory is the case's own and one case
+# can't warm up the next. The memory after the imports is kept as importMB, and peakMB is how far the case grew
+# above it. The results are appended
+# to a JSON history, and compared against a stored baseline, e.g.
+#
+#   python benchmarks/suite.py --save-baseline          # store the baseline on the reference commit
+#   python benchmarks/suite.py                          # later: flag the cases that got slower or bigger
+#   python benchmarks/suite.py --models HubSIR SEIR --sizes 1000 10000 --days 10
+#
+# The exit code is 1 when a case regressed, so the suite can gate a change.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS = os.path.join(HERE, "results")
+
+
+def side(popsize: int):
+    """The side of the plane that keeps the density of the regression tests, 1.6 people per unit area."""
+    return (popsize / 1.6) ** 0.5
+
+
+def seeds(popsize: int):
+    """The starting number of infectious people, 1% of the population."""
+    return max(1, popsize // 100)
+
+
+def hubSIR(model, popsize, days, engine):
+    i0 = seeds(popsize)
+    return model(S0=popsize - i0, I0=i0, R0=0, pss=.2, rstart=3, side=side(popsize), days=days, gamma=.2,
+                  engine=engine, rng=0)
+
+
+def strongInfSEIR(model, popsize, days, engine):
+    i0 = seeds(popsize)
+    return model(S0=popsize - i0, E0=0, I0=i0, R0=0, pss=.2, rho=.3, gamma=.2, side=side(popsize), rstart=3,
+                 days=days, engine=engine, rng=0)
+
+
+def randMoveSEIRD(model, popsize, days, engine):
+    i0 = seeds(popsize)
+    return model(S0=popsize - i0, E0=0, I0=i0, R0=0, rho=.3, gamma=.2, mu=.01, planeSize=side(popsize), move_r=3,
+                 sigma_R=.3, spread_r=1, sigma_r=.25, days=days, engine=engine, rng=0)
+
+
+def periodicICUV(model, popsize, days, engine):
+    i0 = seeds(popsize)
+    return model(S0=popsize - i0, E0=0, I0=i0, R0=0, V0=0, rho=.3, ioda=.3, gamma=.25, mu=0.007, omega=.14, phi=.42,
+                 chi=.15, kappa=.05, eta=.02, spread_r=2, sigma_r=.25, move_R=4, sigma_R=.75, side=side(popsize),
+                 days=days, engine=engine, rng=0)
+
+
+def seir(model, popsize, days, engine):
+    i0 = seeds(popsize)
+    return model(1.5, .2, .3, popsize - i0, 0, i0, 0)
+
+
+def stochasticSEIR(model, base, popsize, days, engine):
+    i0 = seeds(popsize)
+    return model(base, replicates=100, rng=0, beta=1.5, rho=.2, gamma=.3, S0=popsize - i0, E0=0, I0=i0, R0=0)
+
+
+def spatialRun(test, days):
+    test.run()
+
+
+# the models, with the Eir classes they are built from, and how to build them, run them and get their DataFrame.
+# The deterministic models solve with a step of .1 days and their run() already returns the DataFrame
+MODELS = {
+    "HubSIR": (["HubSIR"], hubSIR, spatialRun, lambda test: test.toDataFrame()),
+    "StrongInfSEIR": (["StrongInfSEIR"], strongInfSEIR, spatialRun, lambda test: test.toDataFrame()),
+    "RandMoveSEIRD": (["RandMoveSEIRD"], randMoveSEIRD, spatialRun, lambda test: test.toDataFrame()),
+    "PeriodicICUV": (["PeriodicICUV"], periodicICUV, spatialRun, lambda test: test.toDataFrame()),
+    "SEIR": (["SEIR"], seir, lambda test, days: test.run(days, .1, plot=False), None),
+    "StochasticSEIR": (["Stochastic", "SEIR"], stochasticSEIR, lambda test, days: test.run(days, .1),
+                       lambda test: test.toDataFrame()),
+}
+
+
+def peakMemory():
+    """Returns the peak resident memory of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def runCase(name: str, popsize: int, days: int, engine: str):
+    """Times one case in this process and returns its record."""
+    classes, build, run, frame = MODELS[name]
+    # Eir loads a model's module the first time the class is used, so only this case's classes are loaded
+    eir = importlib.import_module("Eir")
+    classes = [getattr(eir, cls) for cls in classes]
+    # every case ends with a DataFrame, so pandas is loaded before the clock starts and isn't timed as part of it
+    importlib.import_module("pandas")
+    record = {"model": name, "popsize": popsize, "days": days, "engine": engine, "importMB": peakMemory()}
+    t = time.perf_counter()
+    test = build(*classes, popsize, days, engine)
+    record["construct"] = time.perf_counter() - t
+    t = time.perf_counter()
+    run(test, days)
+    record["run"] = time.perf_counter() - t
+    if frame is not None:
+        t = time.perf_counter()
+        frame(test)
+        record["toDataFrame"] = time.perf_counter() - t
+    # what the case itself grew the process by, above the memory of the imports
+    record["peakMB"] = peakMemory() - record["importMB"]
+    return record
+
+
+def measure(name: str, popsize: int, days: int, engine: str, repeat: int):
+    """Runs a case repeat times in fresh interpreters and keeps the fastest time of every stage."""
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", name, str(popsize), str(days),
+                              engine], capture_output=True, text=True)
+        if out.returncode:
+            raise RuntimeError(f"{name} popsize={popsize} days={days} failed:\n{out.stderr}")
+        record = json.loads(out.stdout.strip().splitlines()[-1])
+        if best is None:
+            best = record
+        else:
+            for stage in ("construct", "run", "toDataFrame", "importMB", "peakMB"):
+                if stage in record:
+                    best[stage] = min(best[stage], record[stage])
+    return best
+
+
+def key(record: dict):
+    return f"{record['model']}/{record['popsize']}/{record['days']}/{record['engine']}"
+
+
+def commit():
+    """Returns the commit of the library that is being measured, if it is a git checkout."""
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True)
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def compare(records: list, baseline: dict, tolerance: float, floor: float, memFloor: float):
+    """
+    Returns a line for every stage that got slower, or every case whose memory grew, by more than tolerance
+    compared to the baseline. Stages that take less than floor seconds, and memory below memFloor MB, are too noisy
+    to compare.
+    """
+    previous = {key(record): record for record in baseline["results"]}
+    flagged = []
+    for record in records:
+        old = previous.get(key(record))
+        if old is None:
+            continue
+        for stage in ("construct", "run", "toDataFrame", "importMB", "peakMB"):
+            if stage not in record or stage not in old:
+                continue
+            if max(record[stage], old[stage]) < (memFloor if stage.endswith("MB") else floor):
+                continue
+            if record[stage] > old[stage] * (1 + tolerance):
+                flagged.append(f"REGRESSION {key(record)} {stage}: {old[stage]:.3f} -> {record[stage]:.3f} "
+                               f"({record[stage] / old[stage]:.2f}x)")
+    return flagged
+
+
+def load(path: str, default):
+    if not os.path.exists(path):
+        return default
+    with open(path) as fid:
+        return json.load(fid)
+
+
+def dump(path: str, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as fid:
+        json.dump(data, fid, indent=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the models of Eir.")
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=list(MODELS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000])
+    parser.add_argument("--days", nargs="+", type=int, default=[10, 31])
+    parser.add_argument("--engine", default="grid", help="engine of the spatial models, default grid")
+    parser.add_argument("--repeat", type=int, default=1, help="fresh runs of every case, the fastest is kept")
+    parser.add_argument("--history", default=os.path.join(RESULTS, "history.json"))
+    parser.add_argument("--baseline", default=os.path.join(RESULTS, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=.25, help="allowed slowdown, default .25 for 25%%")
+    parser.add_argument("--floor", type=float, default=.05, help="stages faster than this many seconds are not compared")
+    parser.add_argument("--mem-floor", type=float, default=5, help="memory below this many MB is not compared")
+    parser.add_argument("--case", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        name, popsize, days, engine = args.case
+        print(json.dumps(runCase(name, int(popsize), int(days), engine)))
+        return 0
+
+    records = []
+    for name in args.models:
+        for popsize in args.sizes:
+            for days in args.days:
+                record = measure(name, popsize, days, args.engine, args.repeat)
+                records.append(record)
+                stages = ", ".join(f"{stage} {record[stage]:.3f} s" for stage in ("construct", "run", "toDataFrame")
+                                   if stage in record)
+                print(f"{key(record)}: {stages}, peak {record['peakMB']:.0f} MB above the {record['importMB']:.0f} MB "
+                      f"of its imports", flush=True)
+
+    import numpy
+    entry = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "machine": platform.machine(),
+        "results": records,
+    }
+    history = load(args.history, [])
+    history.append(entry)
+    dump(args.history, history)
+    if args.save_baseline:
+        dump(args.baseline, entry)
+        print(f"Saved the baseline to {args.baseline}")
+        return 0
+    baseline = load(args.baseline, None)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; store one with --save-baseline")
+        return 0
+    flagged = compare(records, baseline, args.tolerance, args.floor, args.mem_floor)
+    for line in flagged:
+        print(line)
+    print(f"{len(flagged)} regressions against the baseline of commit {baseline.get('commit')}")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
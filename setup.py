@@ -23,9 +23,14 @@ setup(
     install_requires=[
         "numpy", 
         "pandas", 
-        "matplotlib", 
-        "multipledispatch"
+        "matplotlib"
         ],
+    extras_require={
+        # the "compiled" engine of the spatial models runs as compiled code with numba, and with NumPy without it
+        "compiled": ["numba"],
+        # toArrow() and toParquet() of the spatial models and ensembles write their results with pyarrow
+        "arrow": ["pyarrow"],
+    },
     packages=find_packages(),
     classifiers=[
         'Intended Audience :: Science/Research',
@@ -22,19 +22,19 @@ class Test_SIRV(unittest.TestCase):
         pd.testing.assert_frame_equal(df2, self.test.accumulate(31, .1, plot=False))
         print("Output test passed")
     
-    #def checkInput(self):
-    #    self.assertRaises(e.NotFloatException, self.test.run, '31', .1, False)
-    #    self.assertRaises(e.NotFloatException, self.test.run, 31, ".1", False)
-    ##    self.assertRaises(e.NegativeValException, self.test.run, -31, 1, False)
-     #   self.assertRaises(e.NegativeValException, self.test.run, 31, -1, False)
-     #   self.assertRaises(e.NotFloatException, self.test.accumulate, '31', .1, False)
-     #   self.assertRaises(e.NotFloatException, self.test.accumulate, 31, ".1", False)
-     #   self.assertRaises(e.NegativeValException, self.test.accumulate, -31, 1, False)
-     #   self.assertRaises(e.NegativeValException, self.test.accumulate, 31, -1, False)
-     #   print("Input test passed")
+    def checkInput(self):
+        self.assertRaises(e.NotFloatException, self.test.run, '31', .1, False)
+        self.assertRaises(e.NotFloatException, self.test.run, 31, ".1", False)
+        self.assertRaises(e.NegativeValException, self.test.run, -31, 1, False)
+        self.assertRaises(e.NegativeValException, self.test.run, 31, -1, False)
+        self.assertRaises(e.NotFloatException, self.test.accumulate, '31', .1, False)
+        self.assertRaises(e.NotFloatException, self.test.accumulate, 31, ".1", False)
+        self.assertRaises(e.NegativeValException, self.test.accumulate, -31, 1, False)
+        self.assertRaises(e.NegativeValException, self.test.accumulate, 31, -1, False)
+        print("Input test passed")
 
 if __name__ == '__main__':
     a = Test_SIRV()
     #a.generateCSV()
     a.checkOutput()
-    # mutliple dispatcher will take care of type errors
\ No newline at end of file
+    a.checkInput()
\ No newline at end of file
@@ -20,19 +20,15 @@ class Test_SIS(unittest.TestCase):
         pd.testing.assert_frame_equal(df, self.result)
         print("Output test passed")
     
-    #def checkInput(self):
-    #    self.assertRaises(e.NotFloatException, self.test.run, '31', .1, False)
-    #    self.assertRaises(e.NotFloatException, self.test.run, 31, ".1", False)
-    #    self.assertRaises(e.NegativeValException, self.test.run, -31, 1, False)
-    #    self.assertRaises(e.NegativeValException, self.test.run, 31, -1, False)
-    #    self.assertRaises(e.NotFloatException, self.test.accumulate, '31', .1, False)
-    #    self.assertRaises(e.NotFloatException, self.test.accumulate, 31, ".1", False)
-    #    self.assertRaises(e.NegativeValException, self.test.accumulate, -31, 1, False)
-    #    self.assertRaises(e.NegativeValException, self.test.accumulate, 31, -1, False)
-    #    print("Input test passed")
+    def checkInput(self):
+        self.assertRaises(e.NotFloatException, self.test.run, '31', .1, False)
+        self.assertRaises(e.NotFloatException, self.test.run, 31, ".1", False)
+        self.assertRaises(e.NegativeValException, self.test.run, -31, 1, False)
+        self.assertRaises(e.NegativeValException, self.test.run, 31, -1, False)
+        print("Input test passed")
 
 if __name__ == '__main__':
     a = Test_SIS()
     #a.generateCSV()
     a.checkOutput()
-    #a.checkInput()
\ No newline at end of file
+    a.checkInput()
\ No newline at end of file
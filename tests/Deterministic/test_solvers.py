@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from Eir.Deterministic.SIR import SIR
+from Eir.Deterministic.SEIR import SEIR
+import Eir.Deterministic.solvers as solvers
+import Eir.exceptions as e
+
+class Test_Solvers(unittest.TestCase):
+
+    def __init__(self):
+        self.test = SIR(1.5, .3, 999999, 1, 0)
+
+    def checkOutput(self):
+        # euler is the default, so the regression CSV still matches
+        pd.testing.assert_frame_equal(pd.read_csv('SIR.csv'), self.test.run(31, .1, plot=False))
+        # the higher order solvers agree with a fine reference on the same days
+        ref = SEIR(1.5, .3, .2, 999999, 0, 1, 0)
+        ref.changeMethod("rk45", rtol=1e-10, atol=1e-8)
+        expected = ref.run(60, 1.0, plot=False)
+        for method, dt in [("rk4", .05), ("rk45", 1.0)]:
+            test = SEIR(1.5, .3, .2, 999999, 0, 1, 0)
+            test.changeMethod(method)
+            df = test.run(60, dt, plot=False).iloc[::int(round(1 / dt))].reset_index(drop=True)
+            assert np.allclose(df.values, expected.values, atol=5, rtol=1e-5)
+            # people are never created or destroyed
+            assert np.allclose(df.values[:, 1:].sum(axis=1), 1000000)
+        print("Output test passed")
+
+    def checkSolvers(self):
+        # exponential decay has a known solution
+        f = lambda t, y: -0.5 * y
+        exact = np.exp(-0.5 * np.arange(101) * .1)
+        assert np.abs(solvers.euler(f, [1.0], .1, 100)[:, 0] - exact).max() < 1e-2
+        assert np.abs(solvers.rk4(f, [1.0], .1, 100)[:, 0] - exact).max() < 1e-7
+        Y, dense = solvers.rk45(f, [1.0], .1, 100, rtol=1e-9, atol=1e-12, dense=True)
+        assert np.abs(Y[:, 0] - exact).max() < 1e-8
+        # the dense output can be evaluated between the grid points
+        assert abs(dense(3.33)[0] - np.exp(-0.5 * 3.33)) < 1e-8
+        # the float loop takes the same steps as the array one
+        g = lambda t, y: [-0.5 * y[0] + 0.1 * y[1], -0.1 * y[1]]
+        assert np.array_equal(solvers.floatEuler(g, [1.0, 2.0], .1, 100), solvers.euler(g, [1.0, 2.0], .1, 100))
+        # extra axes of the state are integrated all at once
+        assert solvers.solve(f, np.ones((1, 4)), .1, 10, method="rk4").shape == (11, 1, 4)
+        print("Solver test passed")
+
+    def checkInput(self):
+        self.assertRaises(e.SolverException, self.test.changeMethod, "rk23")
+        # numpy scalars are numbers like any other, but bools aren't
+        assert len(self.test.run(np.int64(31), np.float64(.1), plot=False)) == 311
+        self.assertRaises(e.NotFloatException, self.test.run, True, .1, False)
+        print("Input test passed")
+
+if __name__ == '__main__':
+    a = Test_Solvers()
+    a.checkOutput()
+    a.checkSolvers()
+    a.checkInput()
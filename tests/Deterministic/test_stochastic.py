@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+
+from Eir import SIR, SEIR, SIRS, SIRD, SIRV, SIS, Stochastic
+import Eir.exceptions as e
+
+class Test_Stochastic(unittest.TestCase):
+
+    def __init__(self):
+        self.models = [
+            (SIR, dict(beta=1.5, gamma=.3, S0=999, I0=1, R0=0)),
+            (SEIR, dict(beta=1.5, rho=.2, gamma=.3, S0=999, E0=0, I0=1, R0=0)),
+            (SIRS, dict(beta=1.5, gamma=.3, kappa=.05, S0=999, I0=1, R0=0)),
+            (SIRD, dict(beta=1.5, gamma=.3, omega=.05, S0=999, I0=1, R0=0)),
+            (SIRV, dict(beta=1.5, gamma=.3, eta=.02, S0=999, I0=1, R0=0, V0=0)),
+            (SIS, dict(beta=1.5, gamma=.3, S0=999, I0=1)),
+        ]
+
+    def checkOutput(self):
+        for model, kwargs in self.models:
+            for method in ["gillespie", "tau"]:
+                test = Stochastic(model, replicates=5, method=method, rng=1, **kwargs)
+                results = test.run(20, .5)
+                assert results.shape == (5, 41, len(model.compartments))
+                # people are whole, never negative, and never created or destroyed
+                assert (results >= 0).all() and (results.sum(axis=2) == 1000).all()
+                assert (results[:, 0] == model(**kwargs)._start()).all()
+                # the same seed gives the same replicates
+                assert np.array_equal(results, Stochastic(model, replicates=5, method=method, rng=1, **kwargs).run(20, .5))
+        # for a big population the mean of the replicates follows the ODEs
+        ode = SEIR(1.5, .2, .3, 999000, 0, 1000, 0).run(30, .01, plot=False).values[::100, 1:]
+        test = Stochastic(SEIR, replicates=10, rng=2, beta=1.5, rho=.2, gamma=.3, S0=999000, E0=0, I0=1000, R0=0)
+        assert np.abs(test.run(30, .01)[:, ::100].mean(axis=0) - ode).max() < 5000
+        df = test.toDataFrame()
+        assert len(df) == 10 * 3001
+        assert list(df.columns) == ["Replicate", "Days"] + SEIR.compartments
+        print("Output test passed")
+
+    def checkInput(self):
+        self.assertRaises(e.SolverException, Stochastic, SIR, method="rk4", beta=1.5, gamma=.3, S0=999, I0=1, R0=0)
+        self.assertRaises(e.NotIntException, Stochastic, SIR, replicates=2.5, beta=1.5, gamma=.3, S0=999, I0=1, R0=0)
+        self.assertRaises(e.NegativeValException, Stochastic, SIR, beta=-1.5, gamma=.3, S0=999, I0=1, R0=0)
+        test = Stochastic(SIR, beta=1.5, gamma=.3, S0=999, I0=1, R0=0)
+        self.assertRaises(e.NotRunException, test.toDataFrame)
+        self.assertRaises(e.NegativeValException, test.run, 31, -.1)
+        print("Input test passed")
+
+if __name__ == '__main__':
+    a = Test_Stochastic()
+    a.checkOutput()
+    a.checkInput()
@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+
+from Eir import SEIR, SIRD, SIRV, Sweep
+import Eir.exceptions as e
+
+class Test_Sweep(unittest.TestCase):
+
+    def __init__(self):
+        self.test = Sweep(SEIR, beta=[1.5, 2.0, 2.5], rho=.2, gamma=[.1, .3], S0=999999, E0=0, I0=1, R0=0)
+
+    def checkOutput(self):
+        results = self.test.run(31, .1)
+        assert results.shape == (6, 311, 4)
+        # every point matches a run of the model on its own
+        for k, (beta, gamma) in enumerate(zip(self.test.points.beta, self.test.points.gamma)):
+            df = SEIR(beta, .2, gamma, 999999, 0, 1, 0).run(31, .1, plot=False)
+            assert np.array_equal(results[k], df.values[:, 1:])
+        df = self.test.toDataFrame()
+        assert len(df) == 6 * 311
+        assert list(df.columns) == ["Point", "beta", "gamma", "Days"] + SEIR.compartments
+        # zipped points, with a swept starting value that changes the population size
+        test = Sweep(SIRD, grid=False, beta=[1.5, 2.0], gamma=.1, omega=[.01, .02], S0=[999, 500], I0=1, R0=0)
+        results = test.run(30, .5)
+        df = SIRD(2.0, .1, .02, 500, 1, 0).run(30, .5, plot=False)
+        assert np.array_equal(results[1], df.values[:, 1:])
+        test = Sweep(SIRV, beta=2.0, gamma=.1, eta=[.01, .02], S0=999, I0=1, R0=0, V0=[0, 10])
+        test.run(30, 1.0, method="rk45")
+        assert np.allclose(test.results.sum(axis=2)[:, -1], [1000, 1010, 1000, 1010])
+        print("Output test passed")
+
+    def checkInput(self):
+        # every point goes through the checks of the model
+        self.assertRaises(e.NegativeValException, Sweep, SEIR, beta=1.5, rho=.2, gamma=[.1, -.5], S0=999, E0=0, I0=1, R0=0)
+        self.assertRaises(AssertionError, Sweep, SIRD, beta=1.5, gamma=[.1, .6], omega=[.1, .5], S0=999, I0=1, R0=0)
+        self.assertRaises(e.SweepException, Sweep, SEIR, grid=False, beta=[1.5, 2.0], rho=.2, gamma=[.1, .2, .3], S0=999, E0=0, I0=1, R0=0)
+        self.assertRaises(e.SweepException, Sweep, SEIR, beta=[], rho=.2, gamma=.1, S0=999, E0=0, I0=1, R0=0)
+        self.assertRaises(e.NotRunException, Sweep(SEIR, beta=[1.5], rho=.2, gamma=.1, S0=999, E0=0, I0=1, R0=0).toDataFrame)
+        print("Input test passed")
+
+if __name__ == '__main__':
+    a = Test_Sweep()
+    a.checkOutput()
+    a.checkInput()
@@ -0,0 +1,3 @@
+echo "Running test for Ensembles:";
+for FILE in *.py; do echo -e $FILE; python3 $FILE; done
+
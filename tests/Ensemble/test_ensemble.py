@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import tempfile
+import unittest
+
+from Eir.DTMC.ensemble import Ensemble
+from Eir.DTMC.spatialModel.Hub.HubSEIRSVD import HubSEIRSVD
+from Eir.DTMC.spatialModel.PeriodicMovement.periodicSIR import PeriodicSIR
+import Eir.exceptions as e
+
+
+class Test_Ensemble(unittest.TestCase):
+
+    def __init__(self):
+        self.kwargs = dict(S0=199, E0=0, I0=1, R0=0, V0=0, pss=.2, rho=.3, gamma=.2, kappa=.05, eta=.02, mu=.01, side=12, rstart=3, days=15)
+        self.test = Ensemble(HubSEIRSVD, 6, seed=2021, processes=1, **self.kwargs)
+        self.test.run()
+
+    def checkOutput(self):
+        # the results only depend on the seed, not on how the replicates were spread over the workers
+        pooled = Ensemble(HubSEIRSVD, 6, seed=2021, processes=2, **self.kwargs)
+        assert np.array_equal(self.test.results, pooled.run())
+        assert self.test.results.shape == (6, 16, 6)
+        # every replicate has its own random stream
+        assert not np.array_equal(self.test.results[0], self.test.results[1])
+        # people are never created or destroyed
+        assert (self.test.results.sum(axis=2) == 200).all()
+        quants = self.test.quantiles([0, .5, 1])
+        assert np.array_equal(quants[0], self.test.results.min(axis=0))
+        assert np.array_equal(quants[2], self.test.results.max(axis=0))
+        df = self.test.toDataFrame()
+        assert list(df.columns[:3]) == ["Days", "Susceptible mean", "Susceptible q0.025"]
+        print("Output test passed")
+
+    def checkMovement(self):
+        test = Ensemble(PeriodicSIR, 3, seed=5, processes=1, S0=99, I0=1, R0=0, gamma=.3, planeSize=10, move_r=3, sigma_R=.3, spread_r=1, sigma_r=.25, days=10)
+        assert test.run().shape == (3, 11, 3)
+        assert test.compartments == ["Susceptible", "Infected", "Removed"]
+        print("Movement test passed")
+
+    def checkParquet(self):
+        table = self.test.toArrow()
+        assert table.column_names == ["Replicate", "Days"] + self.test.compartments
+        assert table.num_rows == 6 * 16
+        # every replicate is its own partition, and reading them back gives the same table
+        with tempfile.TemporaryDirectory() as path:
+            self.test.toParquet(path)
+            back = pq.read_table(path + "/counts").to_pandas()
+        back["Replicate"] = back["Replicate"].astype(np.int32)
+        back = back.sort_values(["Replicate", "Days"]).reset_index(drop=True)[table.column_names]
+        assert back.equals(table.to_pandas())
+        assert np.array_equal(back.values[:, 2:].reshape(self.test.results.shape), self.test.results)
+        print("Parquet test passed")
+
+    def checkInputs(self):
+        self.assertRaises(e.NotIntException, Ensemble, HubSEIRSVD, 6.0, **self.kwargs)
+        self.assertRaises(e.NegativeValException, Ensemble, HubSEIRSVD, 0, **self.kwargs)
+        self.assertRaises(e.NegativeValException, Ensemble, HubSEIRSVD, 2, processes=0, **self.kwargs)
+        self.assertRaises(ValueError, Ensemble, HubSEIRSVD, 2, rng=3, **self.kwargs)
+        self.assertRaises(e.NotRunException, Ensemble(HubSEIRSVD, 2, **self.kwargs).mean)
+        self.assertRaises(e.ProbabilityException, self.test.quantiles, 1.5)
+        print("Input Test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Ensemble()
+    a.checkOutput()
+    a.checkMovement()
+    a.checkParquet()
+    a.checkInputs()
@@ -0,0 +1,36 @@
+import inspect
+import subprocess
+import sys
+import unittest
+
+import Eir
+
+
+class Test_Import(unittest.TestCase):
+    """ Checks that import Eir stays cheap for the worker processes, and that every class can still be reached."""
+
+    def loaded(self, stmt):
+        # the modules that are loaded after stmt runs in a fresh interpreter
+        code = f"import sys\n{stmt}\nprint(' '.join(sys.modules))"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        return set(out.stdout.split())
+
+    def checkOutput(self):
+        # none of the models, and neither pandas nor matplotlib, are imported up front
+        modules = self.loaded("import Eir")
+        assert not {"pandas", "matplotlib", "Eir.DTMC", "Eir.Deterministic"} & modules
+        # importing a model doesn't pull them in either, only asking for a DataFrame or a plot does
+        modules = self.loaded("from Eir import HubSEIR, PeriodicICUV, SEIR, Ensemble")
+        assert not {"pandas", "matplotlib"} & modules
+        assert "Eir.DTMC.spatialModel.Hub.HubSEIR" in modules
+        assert "Eir.DTMC.spatialModel.Hub.HubSIS" not in modules
+        for name in Eir.__all__:
+            assert inspect.isclass(getattr(Eir, name)) and getattr(Eir, name).__name__ == name
+        assert set(Eir.__all__) <= set(dir(Eir))
+        self.assertRaises(AttributeError, getattr, Eir, "HubSEIRX")
+        print("Output test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Import()
+    a.checkOutput()
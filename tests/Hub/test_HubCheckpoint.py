@@ -0,0 +1,79 @@
+import numpy as np
+import os
+import tempfile
+import unittest
+
+from Eir import Hub_ICUV, HubSIR, PeriodicSEIRSDV
+import Eir.exceptions as e
+
+
+class Test_Hub_Checkpoint(unittest.TestCase):
+    """ Checks that a simulation saved part way through and loaded into a new model carries on the same way."""
+
+    def __init__(self):
+        self.hub = dict(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.25, mu=0.007, omega=.14, phi=.42,
+                        chi=.15, kappa=.05, eta=.02, rstart=3, pss=.17, side=25, days=40)
+        self.periodic = dict(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, gamma=.25, mu=.007, kappa=.05, eta=.02,
+                             planeSize=25, move_r=2, sigma_R=.3, spread_r=1, sigma_r=.25, days=40)
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "checkpoint.npz")
+
+    def checkOutput(self):
+        for model, kwargs in [(Hub_ICUV, self.hub), (PeriodicSEIRSDV, self.periodic)]:
+            for rng in [lambda: 3, lambda: np.random.RandomState(3), lambda: None]:
+                np.random.seed(1)
+                full = model(rng=rng(), **kwargs)
+                full.run()
+                np.random.seed(1)
+                test = model(rng=rng(), **kwargs)
+                for snapshot in test.iterate():
+                    if snapshot["day"] == 15:
+                        break
+                test.saveCheckpoint(self.path)
+                # a new model picks up on day 15, whatever its own random numbers would have been
+                np.random.seed(2)
+                test = model(rng=rng(), **kwargs)
+                test.loadCheckpoint(self.path)
+                assert test.day == 15
+                test.run()
+                assert test.toDataFrame().equals(full.toDataFrame())
+                assert test.details.getTransmissionHistory() == full.details.getTransmissionHistory()
+                assert test.details.personHistory(7, movement=True)[0] == full.details.personHistory(7, movement=True)[0]
+                assert np.array_equal(test.details.locations, full.details.locations)
+        print("Output test passed")
+
+    def checkScenarios(self):
+        # scenarios with other vaccination rates carry on from the same warm-up
+        test = Hub_ICUV(rng=4, **self.hub)
+        for snapshot in test.iterate():
+            if snapshot["day"] == 10:
+                break
+        test.saveCheckpoint(self.path)
+        kwargs = dict(self.hub)
+        results = []
+        for eta in [0, .2]:
+            kwargs["eta"] = eta
+            test = Hub_ICUV(rng=5, **kwargs)
+            test.loadCheckpoint(self.path)
+            test.run()
+            results.append(test.toDataFrame())
+        assert results[0][:11].equals(results[1][:11])
+        assert results[0]["Vaccinated"].iloc[-1] < results[1]["Vaccinated"].iloc[-1]
+        print("Scenario test passed")
+
+    def checkInput(self):
+        HubSIR(S0=999, I0=1, R0=0, pss=.2, rstart=3, side=25, days=31, gamma=.2, rng=1).saveCheckpoint(self.path)
+        kwargs = dict(S0=999, I0=1, R0=0, pss=.2, rstart=3, side=25, gamma=.2)
+        self.assertRaises(e.CheckpointException, Hub_ICUV(rng=1, **self.hub).loadCheckpoint, self.path)
+        self.assertRaises(e.CheckpointException, HubSIR(days=30, rng=1, **kwargs).loadCheckpoint, self.path)
+        self.assertRaises(e.CheckpointException, HubSIR(days=31, rng=1, record="none", **kwargs).loadCheckpoint, self.path)
+        self.assertRaises(e.CheckpointException, HubSIR(days=31, **kwargs).loadCheckpoint, self.path)
+        self.dir.cleanup()
+        print("Input test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Hub_Checkpoint()
+    a.checkOutput()
+    a.checkScenarios()
+    a.checkInput()
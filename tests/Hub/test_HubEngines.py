@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from Eir.DTMC.spatialModel.Hub.HubSIS import HubSIS
+from Eir.DTMC.spatialModel.Hub.HubSEIR import HubSEIR
+from Eir.DTMC.spatialModel.Hub.Hub_ICUV import Hub_ICUV
+from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIR import StrongInfSIR
+import Eir.DTMC.spatialModel.kernels as kernels
+import Eir.exceptions as e
+
+
+class Test_Hub_Engines(unittest.TestCase):
+    """ Runs the seeded regression models with the other engines; they have to reproduce the same CSVs."""
+
+    def __init__(self, engine="grid"):
+        self.engine = engine
+
+    def checkOutputs(self):
+        np.random.seed(0)
+        test = HubSIS(S0=999, I0=1, pss=.2, rstart=3, side=25, days=31, gamma=.3, engine=self.engine)
+        test.run()
+        assert test.toDataFrame().equals(pd.read_csv("Hub_SIS.csv"))
+        np.random.seed(83636)
+        test = HubSEIR(S0=999, E0=1, I0=1, R0=0, pss=.23, rho=.2, gamma=.15, side=25, rstart=3, days=31, w0=.73, alpha=2, engine=self.engine)
+        test.run()
+        assert test.toDataFrame().equals(pd.read_csv("HubSEIR.csv"))
+        np.random.seed(0)
+        test = Hub_ICUV(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.25, mu=0.007, omega=.14, phi = .42, chi=.15, kappa=.05, eta=.02, rstart=3, pss=.17, side=25, days=62, engine=self.engine)
+        test.run()
+        assert test.toDataFrame().equals(pd.read_csv("Hub_ICUV.csv"))
+        print(f"Output test passed for engine {self.engine}")
+
+    def checkStrongInf(self):
+        # the Strong Infectious models have no regression CSVs, so compare against the loop engine
+        dfs = []
+        for engine in ["loop", self.engine]:
+            np.random.seed(5)
+            test = StrongInfSIR(pss=.2, rstart=3, side=25, S0=999, I0=1, R0=0, days=31, gamma=.2, engine=engine)
+            test.run()
+            dfs.append(test.toDataFrame())
+        assert dfs[0].equals(dfs[1])
+        print(f"Strong Infectious test passed for engine {self.engine}")
+
+    def checkKernels(self):
+        # the buffered kernel behind the compiled engine and the NumPy fallback infect the same people and leave
+        # the random state in the same place, even when the buffer has to be refilled many times
+        rng = np.random.default_rng(1)
+        x, y = rng.random(3000) * 10, rng.random(3000) * 10
+        infectors = rng.choice(3000, 2000, replace=False)
+        radius, constant = rng.random(2000) * 8, rng.random(2000) < .2
+        results = []
+        for infections in [kernels._infectionsNumpy, kernels._infectionsCompiled]:
+            for gen in [np.random.default_rng(3), np.random.RandomState(3)]:
+                susceptible = np.ones(3000, dtype=bool)
+                susceptible[infectors] = False
+                src, dst = infections(x, y, infectors, radius, constant, susceptible, .05, 2.0, gen)
+                results.append((src, dst, gen.random(3)))
+        for a, b in zip(results[:2], results[2:]):
+            assert all(np.array_equal(u, v) for u, v in zip(a, b))
+        print("Kernel test passed")
+
+    def checkInputs(self):
+        self.assertRaises(e.EngineException, HubSIS, 999, 1, .2, 3, 25, 31, .3, engine="kdtree")
+        self.assertRaises(e.EngineException, StrongInfSIR, .2, 3, 25, 999, 1, 0, 31, .2, engine="")
+        print("Input Test Passed")
+
+
+if __name__ == '__main__':
+    for engine in ["grid", "vectorized", "compiled"]:
+        a = Test_Hub_Engines(engine)
+        a.checkOutputs()
+        a.checkStrongInf()
+        a.checkInputs()
+    a.checkKernels()
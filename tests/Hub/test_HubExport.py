@@ -0,0 +1,69 @@
+import numpy as np
+import os
+import pyarrow as pa
+import pyarrow.parquet as pq
+import tempfile
+import unittest
+
+from Eir import HubSEIRV, RandMoveSIR
+import Eir.exceptions as e
+
+
+class Test_Hub_Export(unittest.TestCase):
+    """ Checks the Arrow tables and Parquet files of a simulation against what it recorded."""
+
+    def __init__(self):
+        self.hub = dict(S0=999, E0=1, I0=1, R0=0, V0=0, pss=.23, rho=.2, gamma=.15, eta=.02, side=25, rstart=3,
+                        days=31, w0=.73, alpha=2)
+
+    def checkOutput(self):
+        test = HubSEIRV(rng=3, **self.hub)
+        test.run()
+        tables = test.toArrow()
+        assert sorted(tables) == ["counts", "stateChanges", "transmissions"]
+        df = test.toDataFrame()
+        counts = tables["counts"]
+        assert counts.column_names == list(df.columns)
+        assert all(t == pa.int32() for t in counts.schema.types)
+        assert np.array_equal(counts.to_pandas().values, df.values)
+        transmissions = tables["transmissions"].to_pandas()
+        assert len(transmissions) == sum(map(len, test.details.transmissions.values()))
+        day = transmissions[transmissions["Day"] == 5]
+        assert list(zip(day["Infectious"], day["Susceptible"])) == test.details.transmissionHistoryOnDay(5)
+        changes = tables["stateChanges"].to_pandas()
+        person = changes[changes["Person"] == 7]
+        assert list(zip(person["Day"], person["State"])) == test.details.personHistory(7)
+        # the files read back to the same tables
+        with tempfile.TemporaryDirectory() as path:
+            test.toParquet(path)
+            assert sorted(os.listdir(path)) == ["counts.parquet", "stateChanges.parquet", "transmissions.parquet"]
+            for name, table in tables.items():
+                assert pq.read_table(os.path.join(path, f"{name}.parquet")).equals(table)
+        print("Output test passed")
+
+    def checkPositions(self):
+        kwargs = dict(S0=99, I0=1, R0=0, gamma=.2, planeSize=10, move_r=1, sigma_R=.2, spread_r=1, sigma_r=.2, days=10)
+        test = RandMoveSIR(rng=4, **kwargs)
+        test.run()
+        positions = test.toArrow(positions=True)["positions"]
+        assert positions.num_rows == 11 * 100
+        assert positions.schema.field("x").type == pa.float32()
+        day = positions.to_pandas().query("Day == 6")
+        assert np.array_equal(day[["x", "y"]].values, test.details.locations[6])
+        # many runs go in the partitions of one dataset
+        with tempfile.TemporaryDirectory() as path:
+            for i in range(3):
+                run = RandMoveSIR(rng=i, record="none", **kwargs)
+                run.run()
+                run.toParquet(path, replicate=i)
+            counts = pq.read_table(os.path.join(path, "counts")).to_pandas()
+        assert len(counts) == 3 * 11 and sorted(counts["Replicate"].astype(int).unique()) == [0, 1, 2]
+        # positions and events need the record level that keeps them
+        self.assertRaises(e.NotRecordedException, RandMoveSIR(rng=1, record="events", **kwargs).toArrow, True)
+        print("Positions test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Hub_Export()
+    a.checkOutput()
+    a.checkPositions()
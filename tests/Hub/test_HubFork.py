@@ -0,0 +1,115 @@
+import numpy as np
+import unittest
+
+from Eir import HubSEIRV, RandMoveSIRV
+import Eir.exceptions as e
+
+
+class Test_Hub_Fork(unittest.TestCase):
+    """ Checks that forks of a model carry on from where it is on their own."""
+
+    def __init__(self):
+        self.hub = dict(S0=999, E0=1, I0=1, R0=0, V0=0, pss=.23, rho=.2, gamma=.15, eta=.02, side=25, rstart=3,
+                        days=31, w0=.73, alpha=2)
+
+    def checkOutput(self):
+        for rng in [5, None]:
+            np.random.seed(1)
+            full = HubSEIRV(rng=rng, **self.hub)
+            full.run()
+            np.random.seed(1)
+            test = HubSEIRV(rng=rng, **self.hub)
+            for snapshot in test.iterate():
+                if snapshot["day"] == 10:
+                    break
+            # forks without new parameters simulate the same days as the model, and don't change it
+            forks = [test.fork(), test.fork()]
+            for fork in forks:
+                fork.run()
+                assert fork.toDataFrame().equals(full.toDataFrame())
+                assert fork.details.getTransmissionHistory() == full.details.getTransmissionHistory()
+            assert test.day == 10 and test.S[11] == 0
+            test.run()
+            assert test.toDataFrame().equals(full.toDataFrame())
+            assert test.details.personHistory(3) == full.details.personHistory(3)
+        # a moving model too
+        kwargs = dict(S0=199, I0=1, R0=0, V0=0, gamma=.2, eta=.05, planeSize=10, move_r=1, sigma_R=.2, spread_r=1,
+                      sigma_r=.2, days=20)
+        full = RandMoveSIRV(rng=2, **kwargs)
+        full.run()
+        test = RandMoveSIRV(rng=2, **kwargs)
+        for snapshot in test.iterate():
+            if snapshot["day"] == 5:
+                break
+        fork = test.fork()
+        fork.run()
+        assert fork.toDataFrame().equals(full.toDataFrame())
+        assert np.array_equal(fork.details.locations, full.details.locations)
+        assert fork.population.r0.base is test.population.r0
+        print("Output test passed")
+
+    def checkScenarios(self):
+        test = HubSEIRV(rng=6, **self.hub)
+        for snapshot in test.iterate():
+            if snapshot["day"] == 10:
+                break
+        # the scenarios share days 0 to 10 and then go their own way
+        low, high = test.fork(eta=0.0), test.fork(eta=.3, rng=7)
+        late = test.fork(timeDelay=20)
+        for fork in [low, high, late]:
+            fork.run()
+        assert low.toDataFrame()[:11].equals(high.toDataFrame()[:11])
+        # no one is vaccinated after day 10 without vaccines, or before day 21 when they come later
+        assert (low.V[10:] == test.V[10]).all() and high.V[-1] > test.V[10]
+        assert (late.V[10:21] == test.V[10]).all()
+        assert test.eta == .02 and test.day == 10
+        print("Scenario test passed")
+
+    def checkRecord(self):
+        # at record="counts" the fork counts its own secondary cases, and the model's stay as they were
+        full = HubSEIRV(rng=5, record="counts", **self.hub)
+        full.run()
+        test = HubSEIRV(rng=5, record="counts", **self.hub)
+        for snapshot in test.iterate():
+            if snapshot["day"] == 5:
+                break
+        before = test.details.secondaryCases().copy()
+        fork = test.fork()
+        fork.run()
+        assert np.array_equal(test.details.secondaryCases(), before)
+        assert np.array_equal(fork.details.secondaryCases(), full.details.secondaryCases())
+        assert fork.details.newTransmissions is not test.details.newTransmissions
+        # a fork made while iterate() is running doesn't send its transmissions to the model's snapshots
+        full = HubSEIRV(rng=5, **self.hub)
+        full.run()
+        test = HubSEIRV(rng=5, **self.hub)
+        stream = test.iterate()
+        for snapshot in stream:
+            if snapshot["day"] == 5:
+                break
+        fork = test.fork()
+        fork.run()
+        assert fork.details.getTransmissionHistory() == full.details.getTransmissionHistory()
+        assert test.details.transmissionHistoryOnDay(6) == []
+        snapshot = next(stream)
+        assert snapshot["day"] == 6
+        assert list(map(tuple, snapshot["transmissions"].tolist())) == test.details.transmissionHistoryOnDay(6)
+        stream.close()
+        print("Record test passed")
+
+    def checkInput(self):
+        test = HubSEIRV(rng=1, **self.hub)
+        self.assertRaises(e.ParameterException, test.fork, kappa=.1)
+        self.assertRaises(e.ParameterException, test.fork, side=10)
+        self.assertRaises(e.ProbabilityException, test.fork, eta=1.5)
+        self.assertRaises(e.NotFloatException, test.fork, gamma="0.3")
+        self.assertRaises(e.EngineException, test.fork, engine="fast")
+        print("Input test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Hub_Fork()
+    a.checkOutput()
+    a.checkScenarios()
+    a.checkRecord()
+    a.checkInput()
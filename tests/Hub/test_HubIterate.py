@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from Eir import HubSEIR, RandMoveSIR, PeriodicICUV
+from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIR import StrongInfSIR
+
+
+class Test_Hub_Iterate(unittest.TestCase):
+    """ Checks that iterate() streams the same simulation as run(), one day at a time."""
+
+    def __init__(self):
+        self.hub = dict(S0=999, E0=1, I0=1, R0=0, pss=.23, rho=.2, gamma=.15, side=25, rstart=3, days=31, w0=.73, alpha=2)
+        self.models = [
+            (HubSEIR, self.hub),
+            (StrongInfSIR, dict(S0=999, I0=1, R0=0, pss=.2, rstart=3, side=25, days=15, gamma=.2)),
+            (RandMoveSIR, dict(S0=199, I0=1, R0=0, gamma=.2, planeSize=10, move_r=1, sigma_R=.2, spread_r=1, sigma_r=.2, days=10)),
+            (PeriodicICUV, dict(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.25, mu=0.007, omega=.14, phi=.42, chi=.15, kappa=.05, eta=.02, spread_r=2, sigma_r=.25, move_R=4, sigma_R=.75, side=33, days=31, timeDelay=15)),
+        ]
+
+    def checkOutput(self):
+        # streaming the regression model gives the regression CSV
+        np.random.seed(83636)
+        test = HubSEIR(**self.hub)
+        snapshots = list(test.iterate())
+        assert test.toDataFrame().equals(pd.read_csv("HubSEIR.csv"))
+        assert [s["day"] for s in snapshots] == list(range(32))
+        for model, kwargs in self.models:
+            full = model(rng=3, **kwargs)
+            full.run()
+            test = model(rng=3, record="none", **kwargs)
+            for snapshot in test.iterate():
+                day = snapshot["day"]
+                # the counts are the ones in the arrays of run(), and the transmissions the ones in its details
+                assert sum(snapshot["counts"].values()) == test.population.popsize
+                assert snapshot["counts"]["S"] == full.S[day]
+                assert list(map(tuple, snapshot["transmissions"].tolist())) == full.details.transmissionHistoryOnDay(day)
+            assert test.toDataFrame().equals(full.toDataFrame())
+        print("Output test passed")
+
+    def checkEarlyStop(self):
+        full = HubSEIR(rng=5, **self.hub)
+        full.run()
+        test = HubSEIR(rng=5, **self.hub)
+        for snapshot in test.iterate(positions=True):
+            if snapshot["day"] == 10:
+                break
+        # the model stays on the last day it yielded, and run() carries on from there
+        assert test.day == 10 and test.S[11] == 0
+        # positions are copies, so they don't change with the model
+        snapshot["x"][:] = -1
+        assert (test.population.x >= 0).all()
+        test.run()
+        assert test.day == 31 and test.toDataFrame().equals(full.toDataFrame())
+        assert test.details.getTransmissionHistory() == full.details.getTransmissionHistory()
+        # nothing is left to iterate but the last day
+        assert [s["day"] for s in test.iterate()] == [31]
+        print("Early stop test passed")
+
+    def checkInterleave(self):
+        full = HubSEIR(rng=5, **self.hub)
+        full.run()
+        # two iterators on the same model take turns simulating the next day, and each sees the transmissions of its own
+        test = HubSEIR(rng=5, record="none", **self.hub)
+        first, second = test.iterate(), test.iterate()
+        next(first), next(second)
+        for day in range(1, 11):
+            snapshot = next(first if day % 2 else second)
+            assert snapshot["day"] == day
+            assert list(map(tuple, snapshot["transmissions"].tolist())) == full.details.transmissionHistoryOnDay(day)
+        # abandoned iterators leave nothing behind in details, and run() records as the model was asked to
+        del first, second
+        assert test.details.addTransmission == test.details._bufferTransmission
+        test.run()
+        assert test.toDataFrame().equals(full.toDataFrame())
+        print("Interleave test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Hub_Iterate()
+    a.checkOutput()
+    a.checkEarlyStop()
+    a.checkInterleave()
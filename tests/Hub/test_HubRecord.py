@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from Eir import HubSEIR, RandMoveSIR
+from Eir.DTMC.spatialModel.StrongInfectious.StrongInfSIR import StrongInfSIR
+import Eir.exceptions as e
+
+
+class Test_Hub_Record(unittest.TestCase):
+    """ Checks that the record levels only change what is kept in details, not the simulation."""
+
+    def __init__(self):
+        self.levels = ["none", "counts", "events", "trajectories"]
+
+    def run(self, model, level, **kwargs):
+        np.random.seed(83636)
+        test = model(record=level, **kwargs)
+        test.run()
+        return test
+
+    def checkOutput(self):
+        hub = dict(S0=999, E0=1, I0=1, R0=0, pss=.23, rho=.2, gamma=.15, side=25, rstart=3, days=31, w0=.73, alpha=2)
+        # the default keeps everything, so the regression CSV still matches
+        full = self.run(HubSEIR, "trajectories", **hub)
+        assert full.toDataFrame().equals(pd.read_csv("HubSEIR.csv"))
+        for level in self.levels[:-1]:
+            assert self.run(HubSEIR, level, **hub).toDataFrame().equals(full.toDataFrame())
+        strong = dict(S0=999, I0=1, R0=0, pss=.2, rstart=3, side=25, days=15, gamma=.2)
+        moving = dict(S0=199, I0=1, R0=0, gamma=.2, planeSize=10, move_r=1, sigma_R=.2, spread_r=1, sigma_r=.2, days=10)
+        for model, kwargs in [(StrongInfSIR, strong), (RandMoveSIR, moving)]:
+            frames = [self.run(model, level, **kwargs).toDataFrame() for level in self.levels]
+            assert all(df.equals(frames[-1]) for df in frames)
+        print("Output test passed")
+
+    def checkLevels(self):
+        moving = dict(S0=199, I0=1, R0=0, gamma=.2, planeSize=10, move_r=1, sigma_R=.2, spread_r=1, sigma_r=.2, days=10)
+        full = self.run(RandMoveSIR, "trajectories", **moving).details
+        # nothing is recorded or allocated
+        none = self.run(RandMoveSIR, "none", **moving).details
+        assert none.locations.size == 0
+        self.assertRaises(e.NotRecordedException, none.secondaryCases)
+        self.assertRaises(e.NotRecordedException, none.transmissionHistoryOnDay, 1)
+        # counts keeps the number of secondary cases, without the events
+        counts = self.run(RandMoveSIR, "counts", **moving).details
+        assert np.array_equal(counts.secondaryCases(), full.secondaryCases())
+        assert counts.sortedTransmissions() == full.sortedTransmissions()
+        self.assertRaises(e.NotRecordedException, counts.personHistory, 0)
+        # events keeps the transmissions and state changes, without the locations
+        events = self.run(RandMoveSIR, "events", **moving).details
+        assert events.getTransmissionHistory() == full.getTransmissionHistory()
+        assert events.personHistory(0) == full.personHistory(0)
+        self.assertRaises(e.NotRecordedException, events.personHistory, 0, True)
+        self.assertRaises(e.RecordException, RandMoveSIR, record="all", **moving)
+        print("Levels test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Hub_Record()
+    a.checkOutput()
+    a.checkLevels()
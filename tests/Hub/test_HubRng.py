@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from Eir.DTMC.spatialModel.Hub.HubSEIRSVD import HubSEIRSVD
+from Eir.DTMC.spatialModel.StrongInfectious.StrongInf_ICUV import StrongInf_ICUV
+
+
+class Test_Hub_Rng(unittest.TestCase):
+    """ Checks that models given their own generator are reproducible and leave the global np.random state alone."""
+
+    def __init__(self):
+        self.models = [
+            lambda rng: HubSEIRSVD(S0=299, E0=0, I0=1, R0=0, V0=0, pss=.2, rho=.3, gamma=.2, kappa=.05, eta=.02, mu=.01, side=15, rstart=3, days=15, rng=rng),
+            lambda rng: StrongInf_ICUV(S0=299, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.25, mu=0.007, omega=.14, phi = .42, chi=.15, kappa=.05, eta=.02, rstart=3, pss=.17, side=15, days=15, rng=rng)]
+
+    def checkOutput(self):
+        for model in self.models:
+            np.random.seed(0)
+            state = np.random.get_state()[1].copy()
+            a, b, c = model(123), model(np.random.default_rng(123)), model(124)
+            for test in (a, b, c):
+                test.run()
+            # the same seed gives the same simulation, whether it is passed as an int or a Generator
+            assert a.toDataFrame().equals(b.toDataFrame())
+            assert not a.toDataFrame().equals(c.toDataFrame())
+            # nothing was drawn from the global state
+            assert np.array_equal(np.random.get_state()[1], state)
+        print("Output test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Hub_Rng()
+    a.checkOutput()
@@ -0,0 +1,55 @@
+import numpy as np
+import unittest
+
+from Eir import HubSEIR
+from Eir.DTMC.spatialModel.transmissionTree import TransmissionTree
+
+
+class Test_Transmission_Tree(unittest.TestCase):
+    """ Checks the transmission forest built from the transmissions of a HubSEIR run."""
+
+    def __init__(self):
+        np.random.seed(35235)
+        self.test = HubSEIR(S0=999, E0=1, I0=1, R0=0, pss=.23, rho=.2, gamma=.15, side=25, rstart=3, days=31, w0=.73, alpha=2)
+        self.test.run()
+        self.sdetails = self.test.details
+        self.tree = self.sdetails.transmissionTree()
+
+    def checkOutput(self):
+        # in an SEIR model nobody is infected twice, so every transmission is an edge of the tree
+        tree = self.tree
+        total = 0
+        for day in range(1, 32):
+            for inf, sus in self.sdetails.transmissionHistoryOnDay(day):
+                assert tree.infector(sus) == inf and tree.infectionDay[sus] == day
+                assert tree.generation[sus] == tree.generation[inf] + 1
+                total += 1
+        assert len(tree.edges) == total
+        assert np.array_equal(tree.offspring(), self.sdetails.secondaryCases())
+        # the subtrees of the roots cover everyone in the forest
+        assert tree.size[tree.roots()].sum() == np.count_nonzero(tree.generation >= 0)
+        assert tree.generationDistribution().sum() == tree.offspringDistribution().sum()
+        # the tree is kept until new transmissions come in
+        assert self.sdetails.transmissionTree() is tree
+        print("Output test passed")
+
+    def checkSmall(self):
+        # 0 and 5 start out infected, and 3 reinfects 0 and 2 later on
+        tree = TransmissionTree([(1, 0, 1), (1, 5, 4), (2, 0, 2), (3, 1, 3), (5, 3, 0), (6, 3, 2)], 7)
+        assert tree.parent.tolist() == [-1, 0, 0, 1, 5, -1, -1]
+        assert tree.generation.tolist() == [0, 1, 1, 2, 1, 0, -1]
+        assert tree.size.tolist() == [4, 2, 1, 1, 1, 2, 0]
+        assert tree.root.tolist() == [0, 0, 0, 0, 5, 5, -1]
+        assert tree.ancestors(3) == [1, 0]
+        assert tree.generationDistribution().tolist() == [2, 3, 1]
+        assert tree.offspringDistribution().tolist() == [3, 2, 1]
+        inf, sus, day, serial = tree.edgeList()
+        assert inf.tolist() == [0, 5, 0, 1] and sus.tolist() == [1, 4, 2, 3]
+        assert day.tolist() == [1, 1, 2, 3] and serial.tolist() == [1, 1, 2, 2]
+        print("Small test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Transmission_Tree()
+    a.checkOutput()
+    a.checkSmall()
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from Eir.DTMC.spatialModel.PeriodicMovement.periodicSEIR import PeriodicSEIR
+from Eir.DTMC.spatialModel.PeriodicMovement.periodicICUV import PeriodicICUV
+import Eir.exceptions as e
+
+
+class Test_Periodic_Engines(unittest.TestCase):
+    """ Runs the seeded regression models with the other engines; they have to reproduce the same CSVs."""
+
+    def __init__(self, engine="grid"):
+        self.engine = engine
+
+    def checkOutputs(self):
+        np.random.seed(35235)
+        test = PeriodicSEIR(999, 0, 2, 0, .25, .3, 25, 3, .3, 1, .25, 31, 1.0, 2.0, engine=self.engine)
+        test.run()
+        assert test.toDataFrame().equals(pd.read_csv("PeriodicSEIR.csv"))
+        if self.engine not in PeriodicICUV.engines:
+            print(f"Output test passed for engine {self.engine}")
+            return
+        np.random.seed(68351937)
+        test = PeriodicICUV(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.25, mu=0.007, omega=.14, phi = .42, chi=.15, kappa=.05, eta=.02, spread_r=2, sigma_r=.25, move_R=4, sigma_R=.75, side=33, days=31, timeDelay=15, engine=self.engine)
+        test.run()
+        assert test.toDataFrame().equals(pd.read_csv("PeriodicICUV.csv"))
+        print(f"Output test passed for engine {self.engine}")
+
+    def checkInputs(self):
+        self.assertRaises(e.EngineException, PeriodicSEIR, 999, 0, 2, 0, .25, .3, 25, 3, .3, 1, .25, 31, 1.0, 2.0, engine="vectorized")
+        self.assertRaises(e.EngineException, PeriodicICUV, S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.25, mu=0.007, omega=.14, phi = .42, chi=.15, kappa=.05, eta=.02, spread_r=2, sigma_r=.25, move_R=4, sigma_R=.75, side=33, days=31, engine="compiled")
+        print("Input Test Passed")
+
+
+if __name__ == '__main__':
+    for engine in ["grid", "compiled"]:
+        a = Test_Periodic_Engines(engine)
+        a.checkOutputs()
+        a.checkInputs()
@@ -0,0 +1,121 @@
+import numpy as np
+import unittest
+
+from Eir import HubSIR, HubSIRS, HubSEIRSV, Hub_ICUV, RandMoveSEIRD, RandMoveSIRS, PeriodicICUV, PeriodicSEIRV
+
+
+class Test_RandMove_Absorbing(unittest.TestCase):
+    """ Checks that the days left after an outbreak dies out are filled in with the same counts simulating them gives."""
+
+    def __init__(self):
+        # outbreaks that die out within days
+        self.hub = dict(S0=999, I0=1, R0=0, pss=.2, rstart=1, side=200, days=61, gamma=.5)
+        self.move = dict(S0=999, E0=0, I0=1, R0=0, rho=.3, gamma=.5, mu=.01, planeSize=200, move_r=3, sigma_R=.3,
+                         spread_r=1, sigma_r=.25, days=61)
+
+    def checkOutput(self):
+        for seed in range(3):
+            # a static model gives the same simulation, down to the random numbers it leaves unused
+            full = HubSIR(rng=seed, **self.hub)
+            full._absorbed = lambda: False
+            full.run()
+            test = HubSIR(rng=seed, **self.hub)
+            test.run()
+            assert test.day == 61 and test.I[-1] == 0
+            assert test.toDataFrame().equals(full.toDataFrame())
+            assert test.details.getTransmissionHistory() == full.details.getTransmissionHistory()
+            assert test.rng.random() == full.rng.random()
+            # a moving model only fills the days in when it doesn't record where everyone is on every day
+            full = RandMoveSEIRD(rng=seed, **self.move)
+            full.run()
+            assert full.details.locations.shape[0] == 62
+            test = RandMoveSEIRD(rng=seed, record="none", **self.move)
+            test.run()
+            assert test.toDataFrame().equals(full.toDataFrame())
+            # the sum arrays are filled in with the compartments
+            kwargs = dict(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.5, mu=0.007, omega=.14, phi=.42,
+                          chi=.15, kappa=0, eta=0, spread_r=1, sigma_r=.25, move_R=4, sigma_R=.75, side=200, days=61)
+            full = PeriodicICUV(rng=seed, **kwargs)
+            full.run()
+            test = PeriodicICUV(rng=seed, record="counts", **kwargs)
+            test.run()
+            assert test.toDataFrame().equals(full.toDataFrame())
+            assert np.array_equal(test.infectious, full.infectious)
+        print("Output test passed")
+
+    def checkWaning(self):
+        # with waning immunity the recovered keep turning susceptible after the outbreak is over
+        test = HubSIRS(kappa=.2, rng=0, **self.hub)
+        test.run()
+        day = np.flatnonzero(test.I == 0)[0]
+        assert test.S[-1] > test.S[day]
+        assert test.S[-1] + test.R[-1] == 1000
+        # people go back to S at gamma in HubSIRS, so it keeps running without kappa too
+        test = HubSIRS(kappa=0.0, rng=0, **self.hub)
+        test.run()
+        assert test.S[-1] > test.S[day]
+        print("Waning test passed")
+
+    def checkSettle(self):
+        # once no one is infectious only R to S and S to V are run, with the random numbers the whole day draws
+        icuv = dict(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.5, mu=0.007, omega=.14, phi=.42, chi=.15,
+                    kappa=.05, eta=.02, rstart=1, pss=.2, side=200, days=61)
+        seirsv = dict(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, gamma=.5, kappa=.05, eta=.02, rstart=1, pss=.2,
+                      side=200, days=61)
+        for model, kwargs in [(Hub_ICUV, icuv), (HubSEIRSV, seirsv)]:
+            full = model(rng=1, **kwargs)
+            full._infectionFree = lambda: False
+            full.run()
+            test = model(rng=1, **kwargs)
+            days = self.settleDays(test)
+            test.run()
+            assert days[-1] == 61
+            assert test.toDataFrame().equals(full.toDataFrame())
+            assert test.details.personHistory(5) == full.details.personHistory(5)
+        # moving models don't move anyone on those days below record="trajectories", and the counts still add up
+        seirv = dict(S0=999, E0=0, I0=1, R0=0, V0=0, rho=.3, gamma=.5, eta=.02, planeSize=200, move_r=3, sigma_R=.3,
+                     spread_r=1, sigma_r=.25, days=61)
+        sirs = dict(S0=999, I0=1, R0=0, gamma=.5, kappa=.1, planeSize=200, move_r=3, sigma_R=.3, spread_r=1,
+                    sigma_r=.25, days=61)
+        for model, kwargs in [(PeriodicSEIRV, seirv), (RandMoveSIRS, sirs)]:
+            test = model(rng=2, record="none", **kwargs)
+            days = self.settleDays(test)
+            test.run()
+            assert days == list(range(days[0], days[-1] + 1))
+            df = test.toDataFrame()
+            assert (df.iloc[:, 1:].sum(axis=1) == 1000).all()
+            assert (df["Infected"].iloc[days[0] - 1:] == 0).all()
+            counts = test.population.counts()
+            assert all(counts[symbol] == getattr(test, symbol)[-1] for symbol in counts)
+            # every day is simulated when everyone's location is recorded
+            test = model(rng=2, **kwargs)
+            days = self.settleDays(test)
+            test.run()
+            assert not days and test.details.locations.shape[0] == 62
+        # the vaccinated keep coming in, and the recovered keep going back to S until there are none left
+        test = PeriodicSEIRV(rng=2, record="none", **seirv)
+        days = self.settleDays(test)
+        test.run()
+        assert days[-1] == 61 and test.V[-1] > test.V[days[0]] and (np.diff(test.V) >= 0).all()
+        test = RandMoveSIRS(rng=2, record="none", **sirs)
+        days = self.settleDays(test)
+        test.run()
+        assert test.R[days[-1]] == 0 and test.S[-1] == 1000
+        print("Settle test passed")
+
+    def settleDays(self, test):
+        """Makes the model keep the days it runs with only the flows out of S and R, and returns the list."""
+        settle = test._settle
+
+        def record(i):
+            record.days.append(i)
+            settle(i)
+        record.days = []
+        test._settle = record
+        return record.days
+
+if __name__ == '__main__':
+    a = Test_RandMove_Absorbing()
+    a.checkOutput()
+    a.checkWaning()
+    a.checkSettle()
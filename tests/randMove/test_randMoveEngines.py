@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from Eir.DTMC.spatialModel.randomMovement.randMoveSIR import RandMoveSIR
+from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRSDV import RandMoveSEIRSDV
+import Eir.exceptions as e
+
+
+class Test_RandMove_Engines(unittest.TestCase):
+    """ Runs the seeded regression models with the other engines; they have to reproduce the same CSVs."""
+
+    def __init__(self, engine="grid"):
+        self.engine = engine
+
+    def checkOutputs(self):
+        np.random.seed(35235)
+        test = RandMoveSIR(999, 2, 0, .3, 25, 3, .3, 1, .25, 31, 1.0, 2.0, engine=self.engine)
+        test.run()
+        assert test.toDataFrame().equals(pd.read_csv("randMoveSIR.csv"))
+        np.random.seed(35235)
+        test = RandMoveSEIRSDV(999, 0, 2, 0, 0, .25, .3, .05, .02, .15, 25, 3, .3, 1, .25, 31, 1.0, 2.0, engine=self.engine)
+        test.run()
+        assert test.toDataFrame().equals(pd.read_csv("randMoveSEIRSDV.csv"))
+        print(f"Output test passed for engine {self.engine}")
+
+    def checkInputs(self):
+        self.assertRaises(e.EngineException, RandMoveSIR, 999, 2, 0, .3, 25, 3, .3, 1, .25, 31, 1.0, 2.0, engine="kdtree")
+        print("Input Test Passed")
+
+
+if __name__ == '__main__':
+    for engine in ["grid", "compiled"]:
+        a = Test_RandMove_Engines(engine)
+        a.checkOutputs()
+        a.checkInputs()
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from Eir.DTMC.spatialModel.randomMovement.randMoveSEIRSDV import RandMoveSEIRSDV
+from Eir.DTMC.spatialModel.PeriodicMovement.periodicICUV import PeriodicICUV
+
+
+class Test_RandMove_Rng(unittest.TestCase):
+    """ Checks that models given their own generator are reproducible and leave the global np.random state alone."""
+
+    def __init__(self):
+        self.models = [
+            lambda rng: RandMoveSEIRSDV(299, 0, 2, 0, 0, .25, .3, .05, .02, .15, 15, 3, .3, 1, .25, 15, 1.0, 2.0, rng=rng),
+            lambda rng: PeriodicICUV(S0=299, E0=0, I0=1, R0=0, V0=0, rho=.3, ioda=.3, gamma=.25, mu=0.007, omega=.14, phi = .42, chi=.15, kappa=.05, eta=.02, spread_r=2, sigma_r=.25, move_R=4, sigma_R=.75, side=15, days=15, rng=rng)]
+
+    def checkOutput(self):
+        for model in self.models:
+            np.random.seed(0)
+            state = np.random.get_state()[1].copy()
+            a, b, c = model(123), model(np.random.default_rng(123)), model(124)
+            for test in (a, b, c):
+                test.run()
+            # the same seed gives the same simulation, whether it is passed as an int or a Generator
+            assert a.toDataFrame().equals(b.toDataFrame())
+            assert not a.toDataFrame().equals(c.toDataFrame())
+            # nothing was drawn from the global state
+            assert np.array_equal(np.random.get_state()[1], state)
+        print("Output test passed")
+
+
+if __name__ == '__main__':
+    a = Test_RandMove_Rng()
+    a.checkOutput()
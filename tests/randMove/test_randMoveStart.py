@@ -0,0 +1,48 @@
+import unittest
+
+from Eir import RandMoveSEIRV, RandMoveSIRDV, RandMoveSEIRDV, PeriodicSEIRV, PeriodicSEIRVS, PeriodicSIRDV, PeriodicSIRSDV
+from Eir import PeriodicSEIRDV, PeriodicSEIRSDV
+
+
+class Test_RandMove_Start(unittest.TestCase):
+    """ Checks that the vaccine models start with everyone in the compartments they are given, when R0 > 0 too."""
+
+    def __init__(self):
+        self.seir = dict(S0=300, E0=2, I0=3, R0=4, V0=5, rho=.3, gamma=.25, eta=.02, planeSize=20, move_r=2,
+                         sigma_R=.3, spread_r=1, sigma_r=.25, days=15)
+        self.sird = dict(S0=300, I0=3, R0=4, V0=5, gamma=.25, mu=.01, eta=.02, planeSize=20, move_r=2, sigma_R=.3,
+                         spread_r=1, sigma_r=.25, days=15)
+
+    def checkOutput(self):
+        # R0 isn't part of popsize in these models, so the people in it are the ones left out, as they always were
+        for model, kwargs in [(RandMoveSEIRV, self.seir), (PeriodicSEIRV, self.seir),
+                              (PeriodicSEIRVS, dict(self.seir, kappa=.1))]:
+            for engine in ["loop", "grid"]:
+                test = model(rng=1, engine=engine, **kwargs)
+                test.run()
+                assert len(test.population) == test.popsize == 310
+                assert test.toDataFrame().iloc[0].tolist() == [0, 300, 2, 3, 0, 5]
+                assert (test.toDataFrame().iloc[:, 1:].sum(axis=1) == 310).all()
+        for model, kwargs in [(RandMoveSIRDV, self.sird), (PeriodicSIRDV, self.sird),
+                              (PeriodicSIRSDV, dict(self.sird, kappa=.1))]:
+            for engine in ["loop", "grid"]:
+                test = model(rng=1, engine=engine, **kwargs)
+                assert len(test.population) == test.popsize == 303
+                assert test.population.count("S") == 300 and test.population.count("I") == 3
+                test.run()
+                assert test.toDataFrame().iloc[0].tolist() == [0, 300, 3, 0, 5, 0]
+        # without anyone vaccinated the people in R0 are left out too
+        test = RandMoveSEIRV(rng=1, **dict(self.seir, E0=0, V0=0))
+        assert test.population.counts() == {"S": 300, "E": 0, "I": 3, "R": 0, "V": 0}
+        kwargs = dict(self.seir, V0=0, mu=.01)
+        for model, kwargs in [(RandMoveSEIRDV, kwargs), (PeriodicSEIRDV, kwargs), (PeriodicSEIRSDV, dict(kwargs, kappa=.1))]:
+            test = model(rng=1, **kwargs)
+            assert test.population.counts() == {"S": 300, "E": 2, "I": 3, "R": 0, "V": 0, "D": 0}
+            test.run()
+            assert test.toDataFrame().iloc[0].tolist() == [0, 300, 2, 3, 0, 0, 0]
+        print("Output test passed")
+
+
+if __name__ == '__main__':
+    a = Test_RandMove_Start()
+    a.checkOutput()
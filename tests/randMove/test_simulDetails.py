@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import unittest
+
+from Eir import RandMoveSIR, PeriodicSIR
+import Eir.exceptions as e
+from Eir.DTMC.spatialModel.simul_details import Simul_Details
+
+
+class Test_Simul_Details(unittest.TestCase):
+    """ Checks the array backed Simul_Details against the transmissions and state changes of a run."""
+
+    def __init__(self):
+        np.random.seed(35235)
+        self.test = RandMoveSIR(300, 5, 0, .2, 15, 1, .2, 1, .2, 20)
+        self.test.run()
+        self.sdetails = self.test.details
+
+    def checkOutput(self):
+        # every transmission shows up on its day and in the history of its infectious person
+        total = 0
+        for day in range(1, 21):
+            for inf, sus in self.sdetails.transmissionHistoryOnDay(day):
+                assert (sus, day) in self.sdetails.personTransmissionHistory(inf)
+                # and the infected person went to I on that day
+                assert (day, "I") in self.sdetails.personHistory(sus)
+                total += 1
+        assert total == sum(len(v) for v in self.sdetails.getTransmissionHistory().values())
+        assert sum(n * len(people) for n, people in self.sdetails.sortedTransmissions()) == total
+        # the state history ends in the compartment the person is in
+        df = self.test.toDataFrame()
+        last = [self.sdetails.personHistory(u)[-1][1] for u in range(305)]
+        assert last.count("I") == df["Infected"].iloc[-1]
+        print("Output test passed")
+
+    def checkLocations(self):
+        # the positions are kept as float32 for every day
+        locations = self.sdetails.locations
+        assert locations.shape == (21, 305, 2) and locations.dtype == np.float32
+        pop = self.test.population
+        assert np.allclose(locations[20, :, 0], pop.x) and np.allclose(locations[20, :, 1], pop.y)
+        _, movement = self.sdetails.personHistory(7, movement=True)
+        assert len(movement) == 21 and movement[20] == tuple(locations[20][7].tolist())
+        # day 0 holds everyone where they start, once each and in person order
+        for model, kwargs in [(RandMoveSIR, {}), (PeriodicSIR, {})]:
+            test = model(S0=300, I0=5, R0=4, gamma=.2, planeSize=15, move_r=1, sigma_R=.2, spread_r=1, sigma_r=.2,
+                         days=20, rng=0, **kwargs)
+            pop = test.population
+            assert np.array_equal(test.details.locations[0], np.c_[pop.x, pop.y].astype(np.float32))
+        print("Locations test passed")
+
+    def checkIndex(self):
+        # the per person index and counts agree with a scan of every day
+        counts = np.zeros(305, dtype=int)
+        history = {}
+        for day in range(1, 21):
+            for inf, sus in self.sdetails.transmissionHistoryOnDay(day):
+                counts[inf] += 1
+                history.setdefault(inf, []).append((sus, day))
+        assert np.array_equal(self.sdetails.secondaryCases(), counts)
+        for u in range(305):
+            assert self.sdetails.personTransmissionHistory(u) == history.get(u, [])
+        # everyone shows up once in the sorted transmissions, with their count
+        for n, people in self.sdetails.sortedTransmissions():
+            assert all(counts[u] == n for u in people) and people == sorted(people)
+        print("Index test passed")
+
+    def checkGrowth(self):
+        # the event tables grow past their starting capacity
+        details = Simul_Details(5, 10)
+        for i in range(5000):
+            details.addStateChange(i % 10, "SI"[i % 2], i % 6)
+            details.addTransmission(1 + i % 5, i % 10, (i + 1) % 10)
+        assert len(details.personHistory(3)) == 500
+        assert len(details.transmissionHistoryOnDay(1)) == 1000
+        # locations added one at a time fill the people in order, and one more than there are people is an error
+        for u in range(10):
+            details.addLocation(0, (u, -u))
+        assert details.locations[0, 9].tolist() == [9, -9]
+        self.assertRaises(e.LocationException, details.addLocation, 0, (10, -10))
+        print("Growth test passed")
+
+
+if __name__ == '__main__':
+    a = Test_Simul_Details()
+    a.checkOutput()
+    a.checkLocations()
+    a.checkIndex()
+    a.checkGrowth()